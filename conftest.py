@@ -33,6 +33,40 @@ from pages.upload_config_page import UploadConfigPage
 from pages.access_config_page import AccessConfigPage
 from pages.ptp_config_page import PTPConfigPage
 from pages.device_capabilities import DeviceCapabilities
+from pages.reachability_watcher import ReachabilityWatcher
+from pages.artifact_store import get_artifact_store
+
+# Plugin modules are imported here before pytest_plugins loads them
+pytest.register_assert_rewrite("plugins")
+from plugins.static_asset_cache import install_static_asset_cache
+from plugins.har_replay import har_context_options, install_har_replay, replay_active
+from plugins.phase_profiler import phase
+from plugins import results_store
+from plugins.error_buffer import fetch_error_buffer, install_error_buffer
+from plugins.failure_tracing import checkpoint, finish_failure_tracing, install_failure_tracing
+from plugins.session_keepalive import keep_session_alive, release_session
+from plugins.device_health import device_circuit_open
+from plugins.shared_browser import (
+    DEVICE_BROWSER_ARGS,
+    connect_shared_browser,
+    ensure_connected,
+)
+
+pytest_plugins = [
+    "plugins.static_asset_cache",
+    "plugins.har_replay",
+    "plugins.phase_profiler",
+    "plugins.sleep_accounting",
+    "plugins.structured_logging",
+    "plugins.results_store",
+    "plugins.error_buffer",
+    "plugins.failure_tracing",
+    "plugins.failure_artifacts",
+    "plugins.shared_browser",
+    "plugins.session_keepalive",
+    "plugins.device_health",
+    "plugins.adaptive_timeouts",
+]
 
 
 # Enhanced utility functions for dynamic waiting
@@ -206,6 +240,14 @@ def pytest_addoption(parser):
         default=True,
         help="Ignore SSL certificate errors (for self-signed certificates)",
     )
+    parser.addoption(
+        "--gnss-sample-seconds",
+        action="store",
+        type=float,
+        default=0,
+        help="Sample GNSS telemetry for this many seconds in signal loss tests "
+        "(default 0: skip them)",
+    )
 
 
 # Session-scoped fixtures
@@ -250,15 +292,7 @@ def browser_type_launch_args(browser_type_launch_args):
     """
 
     # Custom launch arguments for security and certificate handling
-    custom_args = [
-        "--ignore-ssl-errors",
-        "--ignore-certificate-errors",
-        "--ignore-certificate-errors-spki-list",
-        "--disable-web-security",
-        "--allow-running-insecure-content",
-        "--allow-insecure-localhost",
-        "--disable-dev-shm-usage",
-    ]
+    custom_args = DEVICE_BROWSER_ARGS
 
     # Merge custom args with the existing default launch args provided by the plugin
     # The 'headless' argument is automatically handled by the plugin based on --headed
@@ -269,10 +303,18 @@ def browser_type_launch_args(browser_type_launch_args):
     return browser_type_launch_args
 
 
+@pytest.fixture(scope="session")
+def browser(launch_browser, browser_type, pytestconfig) -> Generator[Browser, None, None]:
+    """Launch this worker's browser, or connect to the shared one (--shared-browser)."""
+    browser = connect_shared_browser(pytestconfig, browser_type) or launch_browser()
+    yield browser
+    browser.close()
+
+
 # Function-scoped fixtures
 @pytest.fixture(scope="function")
 def context(
-    browser: Browser, ignore_ssl: bool
+    browser: Browser, browser_type, ignore_ssl: bool, request
 ) -> Generator[BrowserContext, None, None]:
     """Create a new browser context for each test with enhanced SSL handling."""
     context_options = {
@@ -284,8 +326,24 @@ def context(
         "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     }
 
+    # Opt-in (--record-har): record this test's device traffic
+    context_options.update(har_context_options(request.config, request.node.nodeid))
+
+    # Opt-in (--shared-browser): reconnect if the shared browser was restarted
+    browser = ensure_connected(request.config, browser, browser_type)
     context = browser.new_context(**context_options)
+    # Console errors and failed requests are buffered in-page, read on failure
+    install_error_buffer(request.config, context)
+    # Opt-in (--static-cache): serve static assets from the shared disk cache
+    install_static_asset_cache(request.config, context)
+    # Opt-in (--replay-har): serve recorded traffic instead of the device.
+    # Installed last so replay routes take precedence over the asset cache.
+    install_har_replay(request.config, context, request.node.nodeid)
+    # Opt-in (--trace-on-failure): trace kept only if the test fails
+    tracer = install_failure_tracing(request.config, context, request.node.nodeid)
     yield context
+    release_session(request, context)
+    finish_failure_tracing(request.node, tracer)
     context.close()
 
 
@@ -302,17 +360,20 @@ def logged_in_page(page: Page, base_url: str, device_password: str, request) ->
     Handles the first authentication (status monitoring).
     """
     try:
-        page.goto(base_url, wait_until="domcontentloaded")
+        with phase("goto_login"):
+            page.goto(base_url, wait_until="domcontentloaded")
         login_page = LoginPage(page)
-        login_page.verify_page_loaded()
-        success = login_page.login(password=device_password)
-        if not success:
-            pytest.fail("Failed to login to device")
-        # Wait for page navigation away from authenticate page (indicates login success)
-        expect(page).not_to_have_url("**/authenticate", timeout=10000)
+        with phase("login"):
+            login_page.verify_page_loaded()
+            success = login_page.login(password=device_password)
+            if not success:
+                pytest.fail("Failed to login to device")
+            # Wait for page navigation away from authenticate page (indicates login success)
+            expect(page).not_to_have_url("**/authenticate", timeout=10000)
         # OPTIMIZATION: Wait 3 seconds for any satellite loading (based on device exploration timing)
         # This is much faster than the previous hardcoded 12-second sleep and dynamic waiting issues
-        login_page.wait_for_satellite_loading()  # Wait for satellite loading to complete
+        with phase("satellite_wait"):
+            login_page.wait_for_satellite_loading()  # Wait for satellite loading to complete
 
         # Extract and store device hardware model globally (only if not already set)
         if (
@@ -320,7 +381,8 @@ def logged_in_page(page: Page, base_url: str, device_password: str, request) ->
             or request.session.device_hardware_model is None
         ):
             dashboard_page = DashboardPage(page)
-            device_info = dashboard_page.get_device_info()
+            with phase("model_detect"):
+                device_info = dashboard_page.get_device_info()
             hardware_model = device_info.get("Model Number")
             if hardware_model:
                 request.session.device_hardware_model = hardware_model
@@ -328,6 +390,8 @@ def logged_in_page(page: Page, base_url: str, device_password: str, request) ->
             else:
                 print("Warning: Could not detect device hardware model from dashboard")
 
+        # Refresh the session in the background so long tests do not expire
+        keep_session_alive(request, page.context, base_url)
         return page
     except Exception as e:
         # Enhanced error reporting for certificate/connection issues
@@ -338,11 +402,41 @@ def logged_in_page(page: Page, base_url: str, device_password: str, request) ->
         )
 
 
+# One reachability watcher per device per process, shared by fixtures and helpers
+_reachability_watchers: Dict[str, ReachabilityWatcher] = {}
+
+
+def get_reachability_watcher(device_ip: str) -> ReachabilityWatcher:
+    """Get (or create) the reachability watcher for a device."""
+    device_ip = device_ip.replace("https://", "").replace("http://", "").strip("/")
+    if device_ip not in _reachability_watchers:
+        _reachability_watchers[device_ip] = ReachabilityWatcher(device_ip)
+    return _reachability_watchers[device_ip]
+
+
+@pytest.fixture(scope="session")
+def reachability_watcher(device_ip) -> Generator[ReachabilityWatcher, None, None]:
+    """
+    Reachability watcher for tests that restart the device.
+
+    Usage:
+        network_config_page.save_network_config("eth0")
+        if reachability_watcher.wait_for_restart()["restarted"]:
+            reachability_watcher.resume(page, base_url, device_password)
+    """
+    watcher = get_reachability_watcher(device_ip)
+    yield watcher
+    watcher.close()
+
+
 def navigate_with_retry(
     page: Page, url: str, device_ip: str, device_series: str, max_retries: int = 3
 ) -> bool:
     """
     Navigate to URL with retry logic and device-specific handling.
+    If the device is restarting, waits for the reachability watcher to see
+    the web UI come back and retries immediately instead of backing off.
+    Returns immediately if the device circuit breaker is open.
     Args:
         page: Playwright page object
         url: Target URL to navigate to
@@ -353,15 +447,29 @@ def navigate_with_retry(
         True if navigation successful, False otherwise
     """
     device_ip_clean = device_ip.replace("https://", "").replace("http://", "")
+    # Device known to be down (circuit breaker open): don't start retrying
+    if device_circuit_open(device_ip_clean):
+        print(f"Device {device_ip_clean} unreachable (circuit open) - not navigating to {url}")
+        return False
+    watcher = get_reachability_watcher(device_ip_clean)
     # Device-specific timeout adjustments
     base_timeout = 60000
+    # Safe point between page actions: rotate the failure trace (--trace-on-failure)
+    checkpoint()
     for attempt in range(max_retries):
         current_timeout = base_timeout * (2**attempt)  # Exponential backoff
         print(
             f"Navigation attempt {attempt + 1}/{max_retries} to {url} (timeout: {current_timeout}ms)"
         )
         try:
-            # Pre-navigation health check
+            # Pre-navigation health check: don't spend a full navigation
+            # timeout on a device that is down or restarting (no device to
+            # check when replaying HAR traffic)
+            if not replay_active() and not watcher.is_up():
+                print(f"Device {device_ip_clean} not answering - waiting for it to come back...")
+                if not watcher.wait_until_up(timeout=current_timeout / 1000):
+                    print(f"Device {device_ip_clean} still down after {current_timeout}ms")
+                    continue
             start_time = time.time()
             response = page.goto(
                 url, timeout=current_timeout, wait_until="domcontentloaded"
@@ -402,7 +510,7 @@ def navigate_with_retry(
 
 @pytest.fixture(scope="function")
 def unlocked_config_page(
-    logged_in_page: Page, base_url: str, device_password: str
+    logged_in_page: Page, base_url: str, device_password: str, request
 ) -> Page:
     """
     Provide a page with configuration access unlocked.
@@ -445,17 +553,20 @@ def unlocked_config_page(
         if not configure_link.is_visible(timeout=2000):
             configure_link = logged_in_page.get_by_text("Configure", exact=False).first
 
-        expect(configure_link).to_be_visible(timeout=5000)
-        configure_link.click()
-        time.sleep(2)  # Allow secondary auth page to load
+        with phase("configure_click"):
+            expect(configure_link).to_be_visible(timeout=5000)
+            configure_link.click()
+            time.sleep(2)  # Allow secondary auth page to load
 
         # Now unlock with password (device exploration shows this is required)
         print("Secondary authentication triggered - unlocking configuration...")
-        success = unlock_page.unlock_configuration(
-            password=device_password, timeout=unlock_timeout
-        )
+        with phase("unlock"):
+            success = unlock_page.unlock_configuration(
+                password=device_password, timeout=unlock_timeout
+            )
 
         if success:
+            keep_session_alive(request, logged_in_page.context, base_url, config_unlocked=True)
             return logged_in_page
         else:
             pytest.fail(f"Configuration unlock failed after clicking Configure.")
@@ -771,44 +882,6 @@ def test_metadata(request, results_dir, page: Page):
         "device_series": getattr(request.session, "device_series", "Unknown"),
     }
 
-    # Capture browser console logs during test execution
-    console_logs = []
-    js_errors = []
-
-    def handle_console(msg):
-        # Use current timestamp since msg.time is not available
-        current_ts = time.time()
-        if msg.type == "error":
-            js_errors.append(
-                {
-                    "text": msg.text,
-                    "timestamp": current_ts,
-                    "location": str(getattr(msg, "location", "unknown")),
-                }
-            )
-        else:
-            console_logs.append(
-                {"text": msg.text, "timestamp": current_ts, "type": msg.type}
-            )
-
-    page.on("console", handle_console)
-
-    # Capture failed network requests
-    failed_requests = []
-
-    def handle_response(response):
-        if not response.ok:
-            failed_requests.append(
-                {
-                    "url": response.url,
-                    "status": response.status,
-                    "status_text": response.status_text,
-                    "method": response.request.method,
-                }
-            )
-
-    page.on("response", handle_response)
-
     yield
 
     try:
@@ -917,31 +990,27 @@ def test_metadata(request, results_dir, page: Page):
             except:
                 pass
 
+            # Console errors and failed requests from the in-page buffer
+            error_buffer = fetch_error_buffer(page)
+
             # Add all debugging data to metadata
             metadata.update(
                 {
                     "error_details": error_details,
                     "device_info": device_info,
                     "browser_info": browser_info,
-                    "console_errors": js_errors,
-                    "console_logs": (
-                        console_logs[-10:] if console_logs else []
-                    ),  # Last 10 non-error logs
-                    "failed_requests": failed_requests,
+                    "console_errors": error_buffer["console_errors"],
+                    "console_logs": error_buffer["console_logs"],  # Last 10 non-error logs
+                    "failed_requests": error_buffer["failed_requests"],
                     "test_markers": list(request.node.keywords.keys()),
                 }
             )
 
-            # Take screenshot
-            screenshot_path = os.path.join(
-                results_dir, "screenshots", f"{request.node.name}_failure.png"
+            # Take screenshot (written in the background by the artifact store)
+            screenshot_path = get_artifact_store().save_screenshot(
+                page, f"{request.node.name}_failure"
             )
-            try:
-                page.screenshot(path=screenshot_path)
-                metadata["screenshot"] = os.path.relpath(screenshot_path, results_dir)
-            except Exception as e:
-                print(f"Failed to take screenshot: {e}")
-                metadata["screenshot"] = "Error"
+            metadata["screenshot"] = screenshot_path or "Error"
 
         # For expected failures, update metadata but skip debug files
         elif outcome == "failed" and call_report and is_expected_failure:
@@ -952,10 +1021,9 @@ def test_metadata(request, results_dir, page: Page):
                     "screenshot": "Suppressed (expected failure)",
                 }
             )
-        # Write metadata file
-        metadata_file = os.path.join(results_dir, f"{request.node.name}_metadata.json")
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        # Failure debugging data is stored with the test's results store row
+        if outcome in results_store.FAILED_OUTCOMES:
+            results_store.attach_details(request.node, metadata)
 
     except Exception as e:
         # Ensure metadata capture failures don't break tests
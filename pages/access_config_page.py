@@ -15,9 +15,9 @@ from playwright.sync_api import Page, expect
 from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, Any
-import logging
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class AccessConfigPage(BasePage):
@@ -41,7 +41,7 @@ class AccessConfigPage(BasePage):
             self.capabilities = {}
             self.available_sections = []
 
-        logger.info(f"AccessConfigPage initialized: {self.device_model}")
+        logger.info("AccessConfigPage initialized: %s", self.device_model)
 
     # ========================================================================
     #  ACCESS CONFIGURATION METHODS
@@ -108,7 +108,7 @@ class AccessConfigPage(BasePage):
             return access_config if access_config else None
 
         except Exception as e:
-            logger.warning(f"Error getting access configuration: {e}")
+            logger.warning("Error getting access configuration: %s", e)
             return None
 
     def configure_access_password(
@@ -136,7 +136,7 @@ class AccessConfigPage(BasePage):
                 )
 
             if password_field.count() == 0:
-                logger.error(f"Access password field {password_name} not found")
+                logger.error("Access password field %s not found", password_name)
                 return False
 
             # Set the password value
@@ -145,14 +145,14 @@ class AccessConfigPage(BasePage):
                 password_value,
                 context=f"access_password_{password_name}",
             ):
-                logger.info(f"Access password {password_name} configured successfully")
+                logger.info("Access password %s configured successfully", password_name)
                 return True
             else:
-                logger.warning(f"Failed to configure access password {password_name}")
+                logger.warning("Failed to configure access password %s", password_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error configuring access password {password_name}: {e}")
+            logger.error("Error configuring access password %s: %s", password_name, e)
             return False
 
     def configure_authentication_level(self, auth_name: str, auth_value: str) -> bool:
@@ -173,21 +173,21 @@ class AccessConfigPage(BasePage):
                 auth_field = self.page.locator(f"input[name='{auth_name}']")
 
             if auth_field.count() == 0:
-                logger.error(f"Authentication field {auth_name} not found")
+                logger.error("Authentication field %s not found", auth_name)
                 return False
 
             # Set the authentication value
             if self.safe_select_option(
                 auth_field.first, auth_value, context=f"auth_level_{auth_name}"
             ):
-                logger.info(f"Authentication level {auth_name} set to: {auth_value}")
+                logger.info("Authentication level %s set to: %s", auth_name, auth_value)
                 return True
             else:
-                logger.warning(f"Failed to set authentication level {auth_name}")
+                logger.warning("Failed to set authentication level %s", auth_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error configuring authentication level {auth_name}: {e}")
+            logger.error("Error configuring authentication level %s: %s", auth_name, e)
             return False
 
     def validate_access_accessibility(self) -> bool:
@@ -215,7 +215,7 @@ class AccessConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.warning(f"Error validating access accessibility: {e}")
+            logger.warning("Error validating access accessibility: %s", e)
             return False
 
     # ========================================================================
@@ -251,7 +251,7 @@ class AccessConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.error(f"Access config page verification failed: {e}")
+            logger.error("Access config page verification failed: %s", e)
             return False
 
     def navigate_to_page(self) -> bool:
@@ -280,5 +280,5 @@ class AccessConfigPage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Error navigating to access configuration page: {e}")
+            logger.error("Error navigating to access configuration page: %s", e)
             return False
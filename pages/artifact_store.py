@@ -0,0 +1,215 @@
+"""
+Background writer for failure evidence (screenshots, HTML, JSON).
+
+Page objects and fixtures hand artifacts to the store and continue; files
+are written by a small thread pool:
+
+    store = get_artifact_store()
+    path = store.save_screenshot(self.page, "debug_save_general")
+    store.save_html("debug_save_general", self.page.content())
+    store.save_json("debug_save_general", debug_data)
+    store.flush()  # Only needed before reading the files back
+
+- Screenshots are JPEG-encoded by the browser at CSS pixel scale, which is
+  several times smaller than the default PNG.
+- HTML is gzip-compressed (.html.gz).
+- Identical captures (same content hash) are written once; later saves
+  return the first file's path.
+- Everything a process writes counts against a size cap; when the cap is
+  exceeded the oldest artifacts are deleted first.
+
+The pytest plugin plugins.failure_artifacts configures the store per run
+(directory, cap, JPEG quality). Without it, a default store writes to
+test-results/artifacts.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DIR = "test-results/artifacts"
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+DEFAULT_JPEG_QUALITY = 70
+
+
+class ArtifactStore:
+    """Deduplicating, size-capped artifact writer with a background thread pool."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        workers: int = 2,
+    ):
+        """
+        Initialize artifact store.
+
+        Args:
+            directory: Directory artifacts are written to
+            max_bytes: Size cap for everything this store writes
+            jpeg_quality: JPEG quality for screenshots (1-100)
+            workers: Writer threads
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.jpeg_quality = jpeg_quality
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        # Written files, oldest first: path -> (size, digest)
+        self._written: "OrderedDict[Path, tuple]" = OrderedDict()
+        self._by_digest: Dict[str, Path] = {}
+        self.stats = {"written": 0, "deduplicated": 0, "evicted": 0, "bytes": 0}
+
+    def _path(self, name: str, suffix: str) -> Path:
+        safe = re.sub(r"[^\w.-]+", "_", name).strip("_") or "artifact"
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return self.directory / f"{safe}_{stamp}{suffix}"
+
+    def _submit(self, name: str, suffix: str, content: bytes, compress: bool = False) -> str:
+        """Queue content for writing; returns the path it will have."""
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            existing = self._by_digest.get(digest)
+            if existing is not None:
+                self.stats["deduplicated"] += 1
+                return str(existing)
+            path = self._path(name, suffix)
+            self._by_digest[digest] = path
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(
+                self._executor.submit(self._write, path, content, digest, compress)
+            )
+        return str(path)
+
+    def _write(self, path: Path, content: bytes, digest: str, compress: bool):
+        try:
+            if compress:
+                content = gzip.compress(content, compresslevel=6)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        except Exception as e:
+            logger.error("Error writing artifact %s: %s", path, e)
+            with self._lock:
+                self._by_digest.pop(digest, None)
+            return
+        with self._lock:
+            self._written[path] = (len(content), digest)
+            self.stats["written"] += 1
+            self.stats["bytes"] += len(content)
+            self._evict()
+
+    def _evict(self):
+        """Delete oldest artifacts until under the cap (lock held)."""
+        while self.stats["bytes"] > self.max_bytes and len(self._written) > 1:
+            path, (size, digest) = self._written.popitem(last=False)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            self._by_digest.pop(digest, None)
+            self.stats["bytes"] -= size
+            self.stats["evicted"] += 1
+            logger.warning("Artifact size cap reached, evicted %s", path)
+
+    def save_screenshot(self, page, name: str, full_page: bool = False) -> Optional[str]:
+        """
+        Capture a JPEG screenshot now and write it in the background.
+
+        Args:
+            page: Playwright Page
+            name: Artifact name (file name prefix)
+            full_page: Capture the full scrollable page
+
+        Returns:
+            Path of the screenshot, or None if capture failed
+        """
+        try:
+            content = page.screenshot(
+                type="jpeg", quality=self.jpeg_quality, scale="css", full_page=full_page
+            )
+        except Exception as e:
+            logger.error("Error capturing screenshot %s: %s", name, e)
+            return None
+        return self._submit(name, ".jpg", content)
+
+    def save_html(self, name: str, html: str) -> str:
+        """Write page HTML gzip-compressed in the background."""
+        return self._submit(name, ".html.gz", html.encode("utf-8"), compress=True)
+
+    def save_json(self, name: str, data: Any) -> str:
+        """Serialize now (so later changes to data are not seen) and write in the background."""
+        content = json.dumps(data, indent=2, default=str).encode("utf-8")
+        return self._submit(name, ".json", content)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Wait for queued writes to finish."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result(timeout=timeout)
+
+    def close(self):
+        """Finish queued writes and stop the writer threads."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+
+def configure_artifact_store(**options) -> ArtifactStore:
+    """
+    Replace the process-wide store (queued writes of the old one are finished).
+
+    Args:
+        **options: ArtifactStore arguments
+
+    Returns:
+        The new store
+    """
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = ArtifactStore(**options)
+        return _store
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the process-wide store, creating a default one if needed."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore()
+        return _store
+
+
+def close_artifact_store() -> Dict[str, int]:
+    """
+    Finish queued writes and drop the process-wide store.
+
+    Returns:
+        The store's counters (written, deduplicated, evicted, bytes)
+    """
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is None:
+        return {}
+    store.close()
+    return store.stats
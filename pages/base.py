@@ -11,15 +11,28 @@ Provides common functionality used across all page objects including:
 """
 
 from playwright.sync_api import Page, expect, TimeoutError
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union, Any
+from contextlib import contextmanager
 from datetime import datetime
+from urllib.parse import urlparse
 import time
 import re
-import json
 import os
 
 # Import centralized device capability system
 from pages.device_capabilities import DeviceCapabilities
+from pages.config_transaction import ConfigTransaction
+from pages.artifact_store import get_artifact_store
+from pages.timeout_policy import (
+    ELEMENT_WAIT,
+    PAGE_LOAD,
+    get_timeout_policy,
+    record_latency,
+    save_operation,
+)
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class BasePage:
@@ -34,6 +47,91 @@ class BasePage:
     - Dynamic interface adaptation
     """
 
+    # Form posts that belong to authentication/session handling, not saves
+    NON_SAVE_POST_PATHS = ("/Users/Delete", "/authenticate", "/login")
+
+    # Server-side result indicators rendered on the page after a save
+    SAVE_ERROR_SELECTORS = (
+        ".alert-danger, .has-error .help-block, "
+        "input[name='message'][value*='error' i], input[name='message'][value*='fail' i]"
+    )
+    SAVE_SUCCESS_SELECTORS = (
+        ".alert-success, "
+        "input[name='message'][value*='success' i], input[name='message'][value*='saved' i]"
+    )
+
+    # Save results of all page objects in this process, for per-section latency metrics
+    save_history: List[Dict[str, Any]] = []
+
+    # Called between page actions (before navigations and saves); plugins
+    # register here, e.g. failure_tracing rotates its trace chunks
+    action_checkpoints: List[Callable[[], None]] = []
+
+    # fill_many() keys matching this are field names, anything else is a CSS selector
+    FIELD_NAME_PATTERN = re.compile(r"^[\w-]+$")
+
+    # Validate, set and fire events for a batch of fields in one evaluate.
+    # Per field returns status, kind, value as set and whether it changed.
+    FILL_MANY_JS = """
+    ({scope, fields}) => {
+        const scopeElement = scope ? document.querySelector(scope) : null;
+        const root = (scopeElement && scopeElement.closest('form')) || document;
+        const results = {};
+
+        for (const {key, name, value} of fields) {
+            const elements = name
+                ? Array.from(root.querySelectorAll(`[name="${CSS.escape(key)}"]`))
+                : Array.from(root.querySelectorAll(key));
+            if (!elements.length) { results[key] = {status: 'not_found', kind: null}; continue; }
+
+            const first = elements[0];
+            const kind = first.tagName === 'SELECT' ? 'select'
+                : ['radio', 'checkbox'].includes(first.type) ? first.type : 'text';
+            let target = first;
+            let resolved = String(value);
+
+            if (kind === 'radio') {
+                target = elements.find((el) => el.value === resolved);
+                if (!target) { results[key] = {status: 'no_such_option', kind}; continue; }
+            } else if (kind === 'select') {
+                const option = Array.from(first.options).find(
+                    (opt) => opt.value === resolved || opt.text.trim() === resolved
+                );
+                if (!option) { results[key] = {status: 'no_such_option', kind}; continue; }
+                resolved = option.value;
+            }
+            if (target.type === 'hidden' || !target.getClientRects().length) {
+                results[key] = {status: 'hidden', kind}; continue;
+            }
+            if (target.disabled || target.readOnly) {
+                results[key] = {status: 'not_editable', kind}; continue;
+            }
+
+            let changed;
+            if (kind === 'radio') {
+                changed = !target.checked;
+                target.checked = true;
+            } else if (kind === 'checkbox') {
+                resolved = value === true || value === 'true' || value === 'on' || value === '1';
+                changed = target.checked !== resolved;
+                target.checked = resolved;
+            } else {
+                changed = target.value !== resolved;
+                // Native setter so framework-managed inputs see the new value
+                const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(target), 'value');
+                if (descriptor && descriptor.set) descriptor.set.call(target, resolved);
+                else target.value = resolved;
+            }
+
+            for (const type of ['input', 'change', 'blur']) {
+                target.dispatchEvent(new Event(type, {bubbles: type !== 'blur'}));
+            }
+            results[key] = {status: 'applied', kind, value: resolved, changed};
+        }
+        return results;
+    }
+    """
+
     def __init__(self, page: Page, device_model: Optional[str] = None):
         """
         Initialize base page object.
@@ -73,6 +171,9 @@ class BasePage:
         # Debug information
         self.debug_info = {}
 
+        # Result of the most recent click_save_and_wait() call
+        self.last_save_result = None
+
     def _detect_device_series_fallback(self) -> str:
         """
         Fallback method for device series detection when device_model not provided.
@@ -173,7 +274,6 @@ class BasePage:
                 "url": self.page.url,
                 "title": self.page.title(),
                 "viewport_size": self.page.viewport_size,
-                "page_content": self.page.content()[:2000],  # First 2KB
                 "performance_times": self.operation_times.copy(),
                 "device_model": self.device_model,
                 "device_series": self.device_series,
@@ -187,23 +287,43 @@ class BasePage:
                     "note": "No test context provided - enable test context passing for enhanced debugging"
                 }
 
-            # Add screenshot if possible
-            try:
-                screenshot_path = f"debug_{context}_{timestamp}.png"
-                self.page.screenshot(path=screenshot_path)
+            # Written in the background, compressed and size-capped
+            store = get_artifact_store()
+            name = f"debug_{context}"
+            debug_data["page_html"] = store.save_html(name, self.page.content())
+            screenshot_path = store.save_screenshot(self.page, name)
+            if screenshot_path:
                 debug_data["screenshot"] = screenshot_path
-            except Exception as e:
-                debug_data["screenshot_error"] = str(e)
-
-            # Save debug info
-            debug_filename = f"debug_{context}_{timestamp}.json"
-            with open(debug_filename, "w") as f:
-                json.dump(debug_data, f, indent=2, default=str)
+            else:
+                debug_data["screenshot_error"] = "capture failed"
 
-            print(f"Debug info captured: {debug_filename}")
+            debug_filename = store.save_json(name, debug_data)
+            logger.info("Debug info captured: %s", debug_filename)
 
         except Exception as e:
-            print(f"Error capturing debug info: {e}")
+            logger.error("Error capturing debug info: %s", e)
+
+    def _checkpoint(self):
+        """Run the registered action checkpoints."""
+        for checkpoint in BasePage.action_checkpoints:
+            checkpoint()
+
+    def timeout_for(self, operation: str, static_ms: int) -> int:
+        """
+        Timeout for an operation, learned from this device's previous runs
+        when --adaptive-timeouts is on.
+
+        Args:
+            operation: Operation name (see pages.timeout_policy)
+            static_ms: Timeout used otherwise; never exceeded
+
+        Returns:
+            Timeout in milliseconds
+        """
+        policy = get_timeout_policy()
+        if policy is None:
+            return static_ms
+        return policy.timeout_ms(operation, static_ms)
 
     def wait_for_page_load(self, timeout: Optional[int] = None) -> bool:
         """
@@ -216,12 +336,15 @@ class BasePage:
             True if page loaded, False if timeout
         """
         if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
+            timeout = self.timeout_for(PAGE_LOAD, self.DEFAULT_TIMEOUT)
+        self._checkpoint()
 
         try:
             # Wait for body to be visible and stable
             body = self.page.locator("body")
+            start_time = time.time()
             expect(body).to_be_visible(timeout=timeout)
+            record_latency(PAGE_LOAD, time.time() - start_time)
 
             # Wait for no loading indicators
             loading_indicators = [
@@ -243,7 +366,7 @@ class BasePage:
             return True
 
         except Exception as e:
-            print(f"Page load timeout or error: {e}")
+            logger.info("Page load timeout or error: %s", e)
             self._capture_debug_info(
                 "page_load_failure", failure_reason=f"Page load failed: {str(e)}"
             )
@@ -333,7 +456,7 @@ class BasePage:
                     pass
 
             except Exception as e:
-                print(f"Error during verification check: {e}")
+                logger.error("Error during verification check: %s", e)
 
             time.sleep(check_interval / 1000)  # Convert to seconds
         return False
@@ -353,16 +476,18 @@ class BasePage:
             True if click successful, False otherwise
         """
         if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
+            timeout = self.timeout_for(ELEMENT_WAIT, self.DEFAULT_TIMEOUT)
 
         try:
+            start_time = time.time()
             expect(locator).to_be_visible(timeout=timeout)
             expect(locator).to_be_enabled(timeout=timeout)
+            record_latency(ELEMENT_WAIT, time.time() - start_time)
             locator.click()
             return True
 
         except Exception as e:
-            print(f"Click failed ({context}): {e}")
+            logger.warning("Click failed (%s): %s", context, e)
             return False
 
     def safe_fill(
@@ -381,11 +506,13 @@ class BasePage:
             True if fill successful, False otherwise
         """
         if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
+            timeout = self.timeout_for(ELEMENT_WAIT, self.DEFAULT_TIMEOUT)
 
         try:
+            start_time = time.time()
             expect(locator).to_be_visible(timeout=timeout)
             expect(locator).to_be_editable(timeout=timeout)
+            record_latency(ELEMENT_WAIT, time.time() - start_time)
 
             # Fill the field and trigger change events for device firmware
             locator.fill(value)
@@ -398,9 +525,107 @@ class BasePage:
             return True
 
         except Exception as e:
-            print(f"Fill failed ({context}): {e}")
+            logger.warning("Fill failed (%s): %s", context, e)
             return False
 
+    def _fill_many_selector(self, key: str, scope: Optional[str] = None) -> str:
+        """Build the slow-path CSS selector for a fill_many() key."""
+        selector = f"[name='{key}']" if self.FIELD_NAME_PATTERN.match(key) else key
+        return f"form:has({scope}) {selector}" if scope else selector
+
+    def fill_many(
+        self,
+        mapping: Dict[str, Any],
+        scope: Optional[str] = None,
+        timeout: Optional[int] = None,
+        context: str = "fill_many",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate, set and fire change events for many fields in one round trip.
+
+        All fields are handled by a single page.evaluate: each is checked for
+        visibility and editability, set (text, select, radio or checkbox) and
+        sent the input/change/blur events the firmware listens for. Only
+        fields that exist but fail in the batch (hidden, not editable, or a
+        batch error) are retried one by one through safe_fill /
+        safe_select_option / check, which wait for them to become usable.
+
+        Args:
+            mapping: Field name or CSS selector -> value (option value or text
+                for selects, option value for radio groups, bool for checkboxes)
+            scope: Selector of an element (e.g. a save button) whose form
+                bounds the field lookup; the whole document when None
+            timeout: Timeout in milliseconds for slow-path retries
+            context: Context description for error handling
+
+        Returns:
+            Dictionary keyed like mapping with ok, status, value (as set),
+            changed and path ("batch" or "fallback") per field
+        """
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+        if not mapping:
+            return {}
+
+        try:
+            results = self.page.evaluate(
+                self.FILL_MANY_JS,
+                {
+                    "scope": scope,
+                    "fields": [
+                        {"key": key, "name": bool(self.FIELD_NAME_PATTERN.match(key)), "value": value}
+                        for key, value in mapping.items()
+                    ],
+                },
+            )
+        except Exception as e:
+            logger.info("Batch fill failed (%s), using per-field fill: %s", context, e)
+            results = {key: {"status": "error", "kind": None} for key in mapping}
+
+        for key, value in mapping.items():
+            result = results[key]
+            result["ok"] = result["status"] == "applied"
+            result["path"] = "batch"
+            # Missing fields and unknown options cannot be fixed by retrying
+            if result["ok"] or result["status"] in ("not_found", "no_such_option"):
+                continue
+
+            # Slow path for fields the batch could not handle
+            locator = self.page.locator(self._fill_many_selector(key, scope))
+            kind = result.get("kind")
+            try:
+                if kind == "select":
+                    ok = self.safe_select_option(locator, str(value), timeout, context=key)
+                elif kind == "checkbox":
+                    locator.first.set_checked(bool(value), timeout=timeout)
+                    ok = True
+                elif kind == "radio":
+                    self.page.locator(
+                        f"{self._fill_many_selector(key, scope)}[value='{value}']"
+                    ).check(timeout=timeout)
+                    ok = True
+                else:
+                    ok = self.safe_fill(locator, str(value), timeout, context=key)
+            except Exception as e:
+                logger.warning("Fill failed (%s: %s): %s", context, key, e)
+                ok = False
+            if ok:
+                value = bool(value) if kind == "checkbox" else str(value)
+            result.update(ok=ok, path="fallback", value=value if ok else None)
+
+        failed = [key for key, result in results.items() if not result["ok"]]
+        fallback = [key for key, result in results.items() if result["path"] == "fallback"]
+        logger.info(
+            "Filled %d/%d fields (%s), %d via per-field fallback",
+            len(mapping) - len(failed),
+            len(mapping),
+            context,
+            len(fallback),
+        )
+        if failed:
+            logger.warning("Fields not filled (%s): %s", context, failed)
+        return results
+
     def safe_select_option(
         self,
         locator,
@@ -421,16 +646,18 @@ class BasePage:
             True if selection successful, False otherwise
         """
         if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
+            timeout = self.timeout_for(ELEMENT_WAIT, self.DEFAULT_TIMEOUT)
 
         try:
+            start_time = time.time()
             expect(locator).to_be_visible(timeout=timeout)
             expect(locator).to_be_enabled(timeout=timeout)
+            record_latency(ELEMENT_WAIT, time.time() - start_time)
             locator.select_option(option)
             return True
 
         except Exception as e:
-            print(f"Select failed ({context}): {e}")
+            logger.warning("Select failed (%s): %s", context, e)
             return False
 
     def find_save_button(self, section_context: Optional[str] = None) -> Optional[Any]:
@@ -689,7 +916,7 @@ class BasePage:
                     for i in range(save_locator.count()):
                         element = save_locator.nth(i)
                         if element.is_visible() and element.is_enabled():
-                            print(f"Found save button using pattern: {pattern}")
+                            logger.info("Found save button using pattern: %s", pattern)
                             return element
 
             except Exception as e:
@@ -716,8 +943,9 @@ class BasePage:
                         keyword in text_content
                         for keyword in ["save", "apply", "submit", "confirm"]
                     ):
-                        print(
-                            f"Found save button via comprehensive search: {text_content}"
+                        logger.info(
+                            "Found save button via comprehensive search: %s",
+                            text_content,
                         )
                         return element
 
@@ -748,38 +976,37 @@ class BasePage:
         Returns:
             True if save successful, False otherwise
         """
-        if timeout is None:
-            timeout = self.DEFAULT_TIMEOUT
+        wait_timeout = timeout
+        if wait_timeout is None:
+            wait_timeout = self.timeout_for(ELEMENT_WAIT, self.DEFAULT_TIMEOUT)
 
         try:
             # Try to find save button with section-aware patterns
             save_button = self.find_save_button(section_context)
 
             if save_button:
-                print(
-                    f"Attempting to click save button for section: {section_context or 'unknown'}"
+                logger.info(
+                    "Attempting to click save button for section: %s",
+                    section_context or 'unknown',
                 )
 
                 # Ensure the button is visible and enabled before clicking
-                expect(save_button).to_be_visible(timeout=timeout)
-                expect(save_button).to_be_enabled(timeout=timeout)
-
-                # Click the save button
-                save_button.click()
-
-                # Wait a moment for the save operation to process
-                time.sleep(1)
-
-                print(
-                    f"Save button clicked successfully for section: {section_context or 'unknown'}"
+                start_time = time.time()
+                expect(save_button).to_be_visible(timeout=wait_timeout)
+                expect(save_button).to_be_enabled(timeout=wait_timeout)
+                record_latency(ELEMENT_WAIT, time.time() - start_time)
+
+                # Click and wait for the device to answer the form POST
+                result = self.click_save_and_wait(
+                    save_button, section_context=section_context, timeout=timeout
                 )
-                return True
+                return result["ok"]
             else:
                 # No save button found - capture debug info for analysis
                 failure_reason = (
                     f"Save button not found for section: {section_context or 'unknown'}"
                 )
-                print(f"Save operation failed: {failure_reason}")
+                logger.warning("Save operation failed: %s", failure_reason)
 
                 self._capture_debug_info(
                     context=f"{section_context or 'unknown'}_save_button_not_found",
@@ -790,7 +1017,7 @@ class BasePage:
         except Exception as e:
             # Save button click failed - capture debug info
             failure_reason = f"Save button click failed: {str(e)}"
-            print(f"Save operation failed ({context}): {e}")
+            logger.warning("Save operation failed (%s): %s", context, e)
 
             self._capture_debug_info(
                 context=f"{section_context or 'unknown'}_save_button_error",
@@ -798,9 +1025,176 @@ class BasePage:
             )
             return False
 
+    def _is_save_response(self, response) -> bool:
+        """Check whether a response answers a configuration form POST."""
+        if response.request.method != "POST":
+            return False
+        path = urlparse(response.url).path
+        return not any(path.endswith(p) for p in self.NON_SAVE_POST_PATHS)
+
+    def _read_save_message(self, response=None) -> Tuple[Optional[str], bool]:
+        """
+        Read the server's result message for a save.
+
+        Args:
+            response: Response of an XHR save; None to read the rendered page
+
+        Returns:
+            Tuple of (message, is_error)
+        """
+        if response is not None:
+            try:
+                data = response.json()
+            except Exception:
+                return None, False
+            if not isinstance(data, dict):
+                return None, False
+            message = data.get("message") or data.get("error")
+            is_error = bool(data.get("error")) or data.get("success") is False
+            return message, is_error
+
+        found = self.page.evaluate(
+            """([errorSelector, successSelector]) => {
+                const pick = (selector) => {
+                    for (const el of document.querySelectorAll(selector)) {
+                        const text = ((el.type === 'hidden' ? el.value : el.textContent) || '').trim();
+                        if (text && (el.type === 'hidden' || el.offsetParent !== null)) return text;
+                    }
+                    return null;
+                };
+                return {error: pick(errorSelector), success: pick(successSelector)};
+            }""",
+            [self.SAVE_ERROR_SELECTORS, self.SAVE_SUCCESS_SELECTORS],
+        )
+        if found["error"]:
+            return found["error"], True
+        return found["success"], False
+
+    def click_save_and_wait(
+        self,
+        save_button,
+        section_context: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Click a save button and wait for the device's response to the form POST.
+
+        Returns as soon as the device answers instead of sleeping or polling
+        loading indicators. Classic form posts navigate, so the result
+        message is read from the rendered page once its DOM is loaded; XHR
+        saves are read from the JSON response body.
+
+        Args:
+            save_button: Locator of the save button
+            section_context: Section name used for latency metrics
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Dictionary with section, ok, status, latency (seconds), url and
+            message (server-side validation or success message, if any)
+        """
+        section = section_context or "unknown"
+        if timeout is None:
+            timeout = self.timeout_for(save_operation(section), self.DEFAULT_TIMEOUT)
+        self._checkpoint()
+
+        result = {
+            "section": section,
+            "ok": False,
+            "status": None,
+            "latency": None,
+            "url": None,
+            "message": None,
+            "awaited": False,
+        }
+
+        dom_loaded = []
+
+        def on_dom_loaded(_page):
+            dom_loaded.append(time.time())
+
+        self.page.on("domcontentloaded", on_dom_loaded)
+        try:
+            expect(save_button).to_be_enabled(timeout=timeout)
+
+            start_time = time.time()
+            with self.page.expect_response(
+                self._is_save_response, timeout=timeout
+            ) as response_info:
+                save_button.click()
+            response = response_info.value
+            result["latency"] = time.time() - start_time
+            result["status"] = response.status
+            result["url"] = response.url
+
+            if response.request.is_navigation_request():
+                # Sync API events are only dispatched inside Playwright calls,
+                # so checking the flag before waiting cannot miss the event
+                if not dom_loaded:
+                    self.page.wait_for_event("domcontentloaded", timeout=timeout)
+                message, server_error = self._read_save_message()
+            else:
+                message, server_error = self._read_save_message(response)
+            # Everything the timeout covered, including the reload
+            record_latency(save_operation(section), time.time() - start_time)
+
+            result["message"] = message
+            result["ok"] = response.status < 400 and not server_error
+            logger.info(
+                "Save response for section %s: HTTP %s in %.2fs %s",
+                section,
+                response.status,
+                result["latency"],
+                message,
+            )
+
+        except TimeoutError:
+            result["message"] = f"No save response from device within {timeout}ms"
+            logger.warning("Save failed for section %s: %s", section, result['message'])
+        except Exception as e:
+            result["message"] = str(e)
+            logger.error(
+                "Error waiting for save response for section %s: %s", section, e
+            )
+        finally:
+            self.page.remove_listener("domcontentloaded", on_dom_loaded)
+
+        self.last_save_result = result
+        BasePage.save_history.append(result)
+        return result
+
+    @classmethod
+    def get_save_latency_summary(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize save latency per section for all saves in this process.
+
+        Returns:
+            Dictionary keyed by section with count, failures, mean, max and
+            p95 latency in seconds
+        """
+        summary = {}
+        by_section: Dict[str, List[Dict[str, Any]]] = {}
+        for result in cls.save_history:
+            by_section.setdefault(result["section"], []).append(result)
+
+        for section, results in by_section.items():
+            latencies = sorted(r["latency"] for r in results if r["latency"] is not None)
+            summary[section] = {
+                "count": len(results),
+                "failures": sum(1 for r in results if not r["ok"]),
+                "mean": sum(latencies) / len(latencies) if latencies else None,
+                "max": latencies[-1] if latencies else None,
+                "p95": latencies[int(0.95 * (len(latencies) - 1))] if latencies else None,
+            }
+        return summary
+
     def wait_for_save_completion(self, timeout: Optional[int] = None) -> bool:
         """
-        Wait for save operation completion with loading state detection.
+        Wait for save operation completion.
+
+        If the last save was made with click_save_and_wait(), the device has
+        already answered and its outcome is returned immediately. Otherwise
+        falls back to loading state detection.
 
         Args:
             timeout: Timeout in milliseconds
@@ -811,6 +1205,10 @@ class BasePage:
         if timeout is None:
             timeout = self.SHORT_TIMEOUT
 
+        if self.last_save_result is not None and not self.last_save_result["awaited"]:
+            self.last_save_result["awaited"] = True
+            return self.last_save_result["ok"]
+
         try:
             start_time = time.time()
 
@@ -844,7 +1242,7 @@ class BasePage:
             return False
 
         except Exception as e:
-            print(f"Error during save completion wait: {e}")
+            logger.error("Error during save completion wait: %s", e)
             return False
 
     def _get_device_behavior_data(self) -> Dict[str, Any]:
@@ -878,7 +1276,7 @@ class BasePage:
                 ),
             }
         except Exception as e:
-            print(f"Error getting device behavior data: {e}")
+            logger.error("Error getting device behavior data: %s", e)
             return {}
 
     def _get_form_change_patterns(self, section_context: str) -> Dict[str, Any]:
@@ -955,16 +1353,16 @@ class BasePage:
                 if save_button_locator.count() > 0:
                     element = save_button_locator.first
                     if element.is_visible() and element.is_enabled():
-                        print("Save button enabled after form change")
+                        logger.info("Save button enabled after form change")
                         return True
 
                 time.sleep(0.5)  # Check every 500ms
 
-            print("Timeout waiting for save button to become enabled")
+            logger.info("Timeout waiting for save button to become enabled")
             return False
 
         except Exception as e:
-            print(f"Error waiting for save button enablement: {e}")
+            logger.error("Error waiting for save button enablement: %s", e)
             return False
 
     def trigger_legitimate_form_change(
@@ -988,19 +1386,22 @@ class BasePage:
         try:
             # Get current value
             if field_locator.count() == 0:
-                print(f"Form field not found for {context}")
+                logger.info("Form field not found for %s", context)
                 return False
 
             current_value = field_locator.input_value()
 
             # Only proceed if we're making a real change
             if current_value == new_value:
-                print(f"No change needed for {context} - values are the same")
+                logger.info("No change needed for %s - values are the same", context)
                 return True
 
             # Make the legitimate change
-            print(
-                f"Making legitimate form change for {context}: '{current_value}' -> '{new_value}'"
+            logger.info(
+                "Making legitimate form change for %s: '%s' -> '%s'",
+                context,
+                current_value,
+                new_value,
             )
 
             # Clear field first to ensure clean change
@@ -1017,11 +1418,11 @@ class BasePage:
             # Wait for device to process the change
             time.sleep(1)
 
-            print(f"Legitimate form change completed for {context}")
+            logger.info("Legitimate form change completed for %s", context)
             return True
 
         except Exception as e:
-            print(f"Error triggering form change for {context}: {e}")
+            logger.error("Error triggering form change for %s: %s", context, e)
             return False
 
     def find_and_enable_save_button(
@@ -1044,28 +1445,33 @@ class BasePage:
             # Get device-specific patterns for this section
             patterns = self._get_form_change_patterns(section_context)
 
-            print(f"Looking for save button for section: {section_context}")
+            logger.info("Looking for save button for section: %s", section_context)
 
             # Try to find the save button
             save_button = self.find_save_button(section_context)
 
             if not save_button:
-                print(f"Save button not found for section: {section_context}")
+                logger.info("Save button not found for section: %s", section_context)
                 return False
 
             # Check if save button is already enabled
             if save_button.is_enabled():
-                print(f"Save button already enabled for section: {section_context}")
+                logger.info(
+                    "Save button already enabled for section: %s", section_context
+                )
                 return True
 
             # Wait for save button to become enabled with device-specific timing
-            print(
-                f"Waiting for save button to become enabled for section: {section_context}"
+            logger.info(
+                "Waiting for save button to become enabled for section: %s",
+                section_context,
             )
             return self._wait_for_save_button_enabled(save_button, timeout)
 
         except Exception as e:
-            print(f"Error finding and enabling save button for {section_context}: {e}")
+            logger.error(
+                "Error finding and enabling save button for %s: %s", section_context, e
+            )
             return False
 
     def configure_and_save(
@@ -1089,7 +1495,7 @@ class BasePage:
             True if configuration and save successful, False otherwise
         """
         try:
-            print(f"Configuring and saving section: {section_context}")
+            logger.info("Configuring and saving section: %s", section_context)
 
             # Configure the field with legitimate change
             field_locator = field_config.get("field_locator")
@@ -1097,7 +1503,7 @@ class BasePage:
             field_type = field_config.get("field_type", "input")
 
             if not field_locator or new_value is None:
-                print(f"Missing field configuration for {section_context}")
+                logger.info("Missing field configuration for %s", section_context)
                 return False
 
             # Make legitimate form change
@@ -1116,7 +1522,7 @@ class BasePage:
             )
 
         except Exception as e:
-            print(f"Error in configure_and_save for {section_context}: {e}")
+            logger.error("Error in configure_and_save for %s: %s", section_context, e)
             return False
 
     def get_device_specific_timeouts(self) -> Dict[str, int]:
@@ -1181,14 +1587,15 @@ class BasePage:
         """
         if timeout is None:
             timeout = self.DEFAULT_TIMEOUT
+        self._checkpoint()
 
         try:
             current_url = self.page.url
-            print(f"Current URL: {current_url}")
+            logger.info("Current URL: %s", current_url)
 
             # Check if we're already on the dashboard
             if current_url.endswith("/") or "/index" in current_url:
-                print("Already on dashboard page")
+                logger.info("Already on dashboard page")
                 return True
 
             # Check if we're on a configuration page
@@ -1211,11 +1618,11 @@ class BasePage:
             )
 
             if is_on_config_page:
-                print(f"Currently on configuration page, navigating to dashboard")
+                logger.info("Currently on configuration page, navigating to dashboard")
 
                 # Navigate to dashboard
                 dashboard_url = f"{base_url}/"
-                print(f"Navigating to: {dashboard_url}")
+                logger.info("Navigating to: %s", dashboard_url)
 
                 self.page.goto(
                     dashboard_url, wait_until="domcontentloaded", timeout=timeout
@@ -1227,10 +1634,10 @@ class BasePage:
                 # Verify we're now on dashboard
                 final_url = self.page.url
                 if final_url.endswith("/") or "/index" in final_url:
-                    print(f"Successfully navigated to dashboard: {final_url}")
+                    logger.info("Successfully navigated to dashboard: %s", final_url)
                     return True
                 else:
-                    print(f"Navigation failed, still on: {final_url}")
+                    logger.warning("Navigation failed, still on: %s", final_url)
                     self._capture_debug_info(
                         "dashboard_navigation_failure",
                         failure_reason=f"Failed to navigate from {current_url} to dashboard",
@@ -1238,8 +1645,9 @@ class BasePage:
                     return False
             else:
                 # Unknown page state - try to navigate to dashboard anyway
-                print(
-                    f"Unknown page state ({current_url}), attempting to navigate to dashboard"
+                logger.info(
+                    "Unknown page state (%s), attempting to navigate to dashboard",
+                    current_url,
                 )
                 dashboard_url = f"{base_url}/"
                 self.page.goto(
@@ -1249,7 +1657,7 @@ class BasePage:
                 return True
 
         except Exception as e:
-            print(f"Error ensuring dashboard context: {e}")
+            logger.error("Error ensuring dashboard context: %s", e)
             self._capture_debug_info(
                 "dashboard_context_error",
                 failure_reason=f"Dashboard context error: {str(e)}",
@@ -1275,7 +1683,7 @@ class BasePage:
             return element.is_visible() and element.is_enabled()
 
         except Exception as e:
-            print(f"Error checking save button enabled state: {e}")
+            logger.error("Error checking save button enabled state: %s", e)
             return False
 
     # ================================================
@@ -1334,6 +1742,29 @@ class BasePage:
             "panel_expansion_required": False,
         }
 
+    @contextmanager
+    def changes(
+        self, section: str, interface: Optional[str] = None
+    ) -> Iterator[ConfigTransaction]:
+        """
+        Batch field edits for a section into one save per save-button scope.
+
+        Edits queued on the transaction are applied when the block exits
+        without an exception: one in-page operation per save-button scope,
+        one save per scope, and one read-back of all values. Check tx.ok,
+        tx.errors and tx.mismatches afterwards.
+
+        Args:
+            section: Configuration section (e.g., "general", "network", "ptp")
+            interface: Default interface for Series 3 multi-interface sections
+
+        Yields:
+            ConfigTransaction collecting the edits
+        """
+        transaction = ConfigTransaction(self, section, interface)
+        yield transaction
+        transaction.commit()
+
     def is_panel_expanded(self, panel_id: str) -> bool:
         """
         Check if a Bootstrap collapsible panel is currently expanded.
@@ -1355,7 +1786,7 @@ class BasePage:
                 return "in" in class_attr or "show" in class_attr
             return True  # Assume expanded if panel structure not found
         except Exception as e:
-            print(f"Error checking panel expansion state for {panel_id}: {e}")
+            logger.error("Error checking panel expansion state for %s: %s", panel_id, e)
             return True  # Assume expanded on error to avoid blocking
 
     def expand_panel(self, panel_id: str) -> bool:
@@ -1370,7 +1801,7 @@ class BasePage:
         """
         try:
             if self.is_panel_expanded(panel_id):
-                print(f"Panel {panel_id} already expanded")
+                logger.info("Panel %s already expanded", panel_id)
                 return True
 
             # Find and click the panel toggle
@@ -1381,17 +1812,17 @@ class BasePage:
 
                 # Verify expansion
                 if self.is_panel_expanded(panel_id):
-                    print(f"Panel {panel_id} expanded successfully")
+                    logger.info("Panel %s expanded successfully", panel_id)
                     return True
                 else:
-                    print(f"Panel {panel_id} expansion verification failed")
+                    logger.warning("Panel %s expansion verification failed", panel_id)
                     return False
             else:
-                print(f"Panel toggle not found for {panel_id}")
+                logger.info("Panel toggle not found for %s", panel_id)
                 return False
 
         except Exception as e:
-            print(f"Error expanding panel {panel_id}: {e}")
+            logger.error("Error expanding panel %s: %s", panel_id, e)
             return False
 
     def is_section_available(self, section_name: str) -> bool:
@@ -1434,8 +1865,8 @@ class BasePage:
             if interface:
                 return f"#{interface}_{field_name}"
             else:
-                print(
-                    f"Warning: Series 3 device but no interface specified for {field_name}"
+                logger.warning(
+                    "Series 3 device but no interface specified for %s", field_name
                 )
                 return f"#{field_name}"
         return f"#{field_name}"  # Series 2 uses generic selectors
@@ -0,0 +1,222 @@
+"""
+Transactional configuration changes for Kronos device page objects.
+
+Page objects expose one-field-at-a-time setters, and each change is usually
+followed by its own save. ConfigTransaction collects edits for a section,
+applies all edits for a save-button scope with one BasePage.fill_many() call
+(firing the input/change/blur events the firmware's ``onchange="changed(...)"``
+handlers listen for), saves once per scope and verifies every value with one
+read-back.
+
+Usage:
+    with general_config_page.changes("general") as tx:
+        tx.set("identifier", "Lab unit 3")
+        tx.set("location", "Rack 4")
+        tx.set("contact", "Lab team")
+    assert tx.ok, tx.errors
+
+    # Series 3: edits for different ports are saved with their own button
+    with network_config_page.changes("network") as tx:
+        tx.set("mtu_eth1", "1500", interface="eth1")
+        tx.set("mtu_eth2", "1500", interface="eth2")
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Locate a scope's save button and the collapsed Bootstrap panel hiding it, if any.
+SCOPE_INFO_JS = """
+(saveSelector) => {
+    const button = document.querySelector(saveSelector);
+    let collapsedPanel = null;
+    const panel = button && button.closest('.collapse');
+    if (panel && panel.id.endsWith('_collapse')
+            && !panel.classList.contains('in') && !panel.classList.contains('show')) {
+        collapsedPanel = panel.id.slice(0, -'_collapse'.length);
+    }
+    return {buttonFound: !!button, collapsedPanel: collapsedPanel};
+}
+"""
+
+# Read current values for every scope in one call.
+READ_FIELDS_JS = """
+(scopes) => {
+    const values = {};
+    for (const [saveSelector, names] of Object.entries(scopes)) {
+        const button = saveSelector ? document.querySelector(saveSelector) : null;
+        const root = (button && button.closest('form')) || document;
+        values[saveSelector] = {};
+        for (const name of names) {
+            const elements = Array.from(root.querySelectorAll(`[name="${CSS.escape(name)}"]`));
+            if (!elements.length) { values[saveSelector][name] = null; continue; }
+            const first = elements[0];
+            if (first.type === 'radio') {
+                const checked = elements.find((el) => el.checked);
+                values[saveSelector][name] = checked ? checked.value : null;
+            } else if (first.type === 'checkbox') {
+                values[saveSelector][name] = first.checked;
+            } else {
+                values[saveSelector][name] = first.value;
+            }
+        }
+    }
+    return values;
+}
+"""
+
+
+class ConfigTransaction:
+    """
+    Collects field edits for one configuration section and commits them
+    with one save per save-button scope.
+    """
+
+    def __init__(self, page_object, section: str, interface: Optional[str] = None):
+        """
+        Initialize transaction.
+
+        Args:
+            page_object: BasePage (or subclass) instance owning the page
+            section: Configuration section (e.g., "general", "network", "ptp")
+            interface: Default interface for edits on multi-interface sections
+        """
+        self.page_object = page_object
+        self.section = section
+        self.interface = interface
+        # save selector -> (interface, {field name: value}), in insertion order
+        self._scopes: Dict[str, Tuple[Optional[str], Dict[str, Any]]] = {}
+
+        self.ok = False
+        self.committed = False
+        self.errors: List[str] = []
+        self.mismatches: Dict[str, Dict[str, Any]] = {}
+        self.save_results: List[Dict[str, Any]] = []
+
+    def set(self, field: str, value: Any, interface: Optional[str] = None) -> "ConfigTransaction":
+        """
+        Queue a field edit.
+
+        Args:
+            field: Form field name attribute
+            value: New value; option value or text for selects, option value
+                for radio groups, bool for checkboxes
+            interface: Interface whose save button scope owns the field
+
+        Returns:
+            The transaction, for chaining
+        """
+        interface = interface or self.interface
+        save_config = self.page_object.get_save_button_config(self.section, interface)
+        selector = save_config["selector"]
+        self._scopes.setdefault(selector, (interface, {}))[1][field] = value
+        return self
+
+    @property
+    def edit_count(self) -> int:
+        """Number of queued edits."""
+        return sum(len(edits) for _, edits in self._scopes.values())
+
+    def _apply_scope(self, selector: str, edits: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply one scope's edits with a single batched fill.
+
+        Returns:
+            fill_many() results, or None if the scope's save button is missing
+        """
+        page_object = self.page_object
+        info = page_object.page.evaluate(SCOPE_INFO_JS, selector)
+        if not info["buttonFound"]:
+            self.errors.append(f"{self.section}: save button {selector} not found")
+            return None
+        # Fields inside a collapsed panel are not visible until it is expanded
+        if info["collapsedPanel"]:
+            page_object.expand_panel(info["collapsedPanel"])
+
+        results = page_object.fill_many(
+            edits, scope=selector, context=f"{self.section} transaction"
+        )
+        for name, result in results.items():
+            if not result["ok"]:
+                self.errors.append(f"{self.section}.{name}: {result['status']}")
+        return results
+
+    def commit(self) -> bool:
+        """
+        Apply, save and verify all queued edits.
+
+        Returns:
+            True if every edit was applied, saved and read back unchanged
+        """
+        page_object = self.page_object
+        self.committed = True
+        if not self._scopes:
+            self.ok = True
+            return True
+
+        logger.info(
+            "Committing %s %s edits in %s save scope(s)",
+            self.edit_count,
+            self.section,
+            len(self._scopes),
+        )
+        expected: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            for selector, (interface, edits) in self._scopes.items():
+                applied = self._apply_scope(selector, edits)
+                if applied is None:
+                    continue
+
+                ok_fields = {name: r for name, r in applied.items() if r["ok"]}
+                expected[selector] = {name: r["value"] for name, r in ok_fields.items()}
+                # Fallback fills do not report changes; assume they changed something
+                if not any(r.get("changed", True) for r in ok_fields.values()):
+                    logger.info("No value changes for %s, skipping save", selector)
+                    continue
+
+                result = page_object.click_save_and_wait(
+                    page_object.page.locator(selector),
+                    section_context=self.section,
+                )
+                self.save_results.append(result)
+                if not result["ok"]:
+                    self.errors.append(
+                        f"{self.section}{f' ({interface})' if interface else ''}: "
+                        f"save failed: {result['message']}"
+                    )
+
+            self._verify(expected)
+
+        except Exception as e:
+            self.errors.append(f"{self.section}: {e}")
+            logger.error("Error committing %s changes: %s", self.section, e)
+
+        self.ok = not self.errors and not self.mismatches
+        logger.info(
+            "%s transaction %s: %s save(s), %s mismatch(es)",
+            self.section,
+            'committed' if self.ok else 'failed',
+            len(self.save_results),
+            len(self.mismatches),
+        )
+        return self.ok
+
+    def _verify(self, expected: Dict[str, Dict[str, Any]]):
+        """Read back every applied field in one call and record mismatches."""
+        scopes = {selector: list(values) for selector, values in expected.items() if values}
+        if not scopes:
+            return
+        actual = self.page_object.page.evaluate(READ_FIELDS_JS, scopes)
+        for selector, values in expected.items():
+            for name, value in values.items():
+                read_back = actual.get(selector, {}).get(name)
+                if read_back != value:
+                    interface = self._scopes[selector][0]
+                    key = f"{interface}.{name}" if interface else name
+                    self.mismatches[key] = {
+                        "expected": value,
+                        "actual": read_back,
+                        "scope": selector,
+                    }
@@ -0,0 +1,404 @@
+"""
+Configuration export/import for Kronos devices.
+
+The device has no configuration file export, but every setting lives in a
+config page form that posts back to its own section. ConfigTransfer reads
+every section over plain HTTP (DeviceHttpSession), parses the forms into a
+normalized snapshot, and imports a snapshot by posting only the forms whose
+values differ (or all of them, when forced), the same way the browser's save
+buttons do. After an import it reads every section again and diffs the live
+state against the snapshot. Each phase is timed so the device's bulk config
+path can be benchmarked.
+
+Snapshot format:
+    {
+        "device": "172.16.66.3",
+        "exported_at": "...",
+        "sections": {
+            "network": {
+                "port_eth1": {"action": "network", "values": {"mtu_eth1": "1494", ...}},
+                ...
+            },
+            ...
+        },
+    }
+
+Forms are keyed by their submit button name (the device tells per-port forms
+apart by it), then by form id, then by position.
+
+Usage:
+    session = DeviceHttpSession("172.16.66.3")
+    session.login(password) and session.unlock(password)
+    transfer = ConfigTransfer(session)
+    golden = transfer.export()
+    report = ConfigTransfer(other_session).clone(golden)
+"""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pages.device_http import (
+    DeviceHttpSession,
+    form_submission,
+    form_values,
+    page_alerts,
+    parse_forms,
+)
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Every configuration section that may exist; sections a model lacks are skipped
+CONFIG_SECTIONS = [
+    "general",
+    "network",
+    "time",
+    "gnss",
+    "outputs",
+    "display",
+    "access",
+    "snmp",
+    "syslog",
+    "contact",
+    "ptp",
+]
+
+# Sections that are safe to re-post on a live unit (no restart, no lockout)
+ROUNDTRIP_SECTIONS = ["general", "display", "snmp", "syslog"]
+
+# Sections imported and cloned by default; network is only touched when named
+IMPORT_SECTIONS = [section for section in CONFIG_SECTIONS if section != "network"]
+
+# Per-unit address fields of Series 2 network forms (port A and port B)
+SERIES2_ADDRESS_FIELDS = ("ipaddr", "ipmask", "ipaddrB", "ipmaskB")
+
+# Per-unit identity; kept from the target unit when cloning. Series 3 names
+# its fields per port (ip_eth0, mask_eth0, ...), Series 2 uses fixed names.
+IDENTITY_FIELD_PATTERN = re.compile(
+    r"^(ip|mask|changeip)_\w+$|^(gateway|identifier)$|^(%s)$" % "|".join(SERIES2_ADDRESS_FIELDS)
+)
+
+
+def form_key(form: Dict[str, Any], position: int) -> str:
+    """Stable key for a section form."""
+    if form["submitters"]:
+        return form["submitters"][0]
+    if form["id"]:
+        return form["id"]
+    return f"form{position}"
+
+
+def diff_snapshots(
+    expected: Dict[str, Any], actual: Dict[str, Any], ignore_identity: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Field-level differences between two snapshots.
+
+    Args:
+        expected: Snapshot (or its "sections") holding the wanted values
+        actual: Snapshot (or its "sections") holding the live values
+        ignore_identity: Skip per-unit identity fields
+
+    Returns:
+        List of {section, form, field, expected, actual}; sections missing
+        from either side are only compared where both have them
+    """
+    expected_sections = expected.get("sections", expected)
+    actual_sections = actual.get("sections", actual)
+    differences = []
+    for section, forms in expected_sections.items():
+        if section not in actual_sections:
+            continue
+        for key, form in forms.items():
+            live_values = actual_sections[section].get(key, {}).get("values")
+            for field, value in form["values"].items():
+                if ignore_identity and IDENTITY_FIELD_PATTERN.match(field):
+                    continue
+                live = live_values.get(field) if live_values is not None else None
+                if live != value:
+                    differences.append(
+                        {
+                            "section": section,
+                            "form": key,
+                            "field": field,
+                            "expected": value,
+                            "actual": live,
+                        }
+                    )
+    return differences
+
+
+class ConfigTransfer:
+    """Exports, imports and verifies device configuration over HTTP."""
+
+    def __init__(
+        self,
+        session: DeviceHttpSession,
+        sections: Optional[List[str]] = None,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize transfer engine.
+
+        Args:
+            session: Logged-in and unlocked DeviceHttpSession
+            sections: Sections to handle (default: CONFIG_SECTIONS)
+            max_workers: Concurrent page reads during export/verify
+        """
+        self.session = session
+        self.sections = sections or list(CONFIG_SECTIONS)
+        self.max_workers = max_workers
+        # section -> form key -> parsed form, from the latest read
+        self._forms: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    # Reading
+
+    def _read_section(self, section: str) -> Tuple[str, Optional[Dict[str, Any]], int]:
+        """Fetch and parse one section; None if the model lacks it."""
+        status, body, final_url = self.session.request("GET", f"/{section}")
+        if status != 200 or not final_url.rstrip("/").endswith(f"/{section}"):
+            return section, None, len(body)
+
+        forms: Dict[str, Dict[str, Any]] = {}
+        position = 0
+        for form in parse_forms(body):
+            if form["action"].strip("/") != section:
+                continue
+            forms[form_key(form, position)] = form
+            position += 1
+        return section, forms or None, len(body)
+
+    def read(self, sections: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Read and normalize the live configuration.
+
+        Args:
+            sections: Sections to read (default: all configured sections)
+
+        Returns:
+            Snapshot with sections, plus stats (pages, forms, fields, bytes, seconds)
+        """
+        sections = sections or self.sections
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._read_section, sections))
+
+        snapshot: Dict[str, Any] = {
+            "device": self.session.device_ip,
+            "exported_at": datetime.now().isoformat(),
+            "sections": {},
+        }
+        stats = {"pages": 0, "forms": 0, "fields": 0, "bytes": 0}
+        for section, forms, size in results:
+            stats["bytes"] += size
+            if forms is None:
+                continue
+            self._forms[section] = forms
+            stats["pages"] += 1
+            snapshot["sections"][section] = {}
+            for key, form in forms.items():
+                values = form_values(form)
+                snapshot["sections"][section][key] = {
+                    "action": form["action"],
+                    "values": values,
+                }
+                stats["forms"] += 1
+                stats["fields"] += len(values)
+        stats["seconds"] = round(time.time() - start_time, 3)
+        snapshot["stats"] = stats
+        return snapshot
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Export the full device configuration.
+
+        Returns:
+            Snapshot of every section the device has
+        """
+        snapshot = self.read()
+        stats = snapshot["stats"]
+        logger.info(
+            "Exported %s fields in %s forms from %s sections of %s in %ss",
+            stats['fields'],
+            stats['forms'],
+            stats['pages'],
+            self.session.device_ip,
+            stats['seconds'],
+        )
+        return snapshot
+
+    # Writing
+
+    def import_config(
+        self,
+        snapshot: Dict[str, Any],
+        sections: Optional[List[str]] = None,
+        include_identity: bool = False,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Apply a snapshot by posting section forms.
+
+        Each target form is taken from the live page and overlaid with the
+        snapshot values, so fields the snapshot does not know keep their
+        live values.
+
+        Args:
+            snapshot: Snapshot from export() (possibly from another unit)
+            sections: Restrict to these sections (default: IMPORT_SECTIONS,
+                i.e. everything but network)
+            include_identity: Also apply IP, mask, gateway and identifier
+            force: Post forms even when no value would change
+
+        Returns:
+            Dictionary with posted, skipped, errors and seconds
+        """
+        sections = sections or IMPORT_SECTIONS
+        wanted = {
+            section: forms
+            for section, forms in snapshot.get("sections", snapshot).items()
+            if section in sections
+        }
+        result: Dict[str, Any] = {"posted": [], "skipped": [], "errors": [], "seconds": None}
+        start_time = time.time()
+
+        live = self.read(list(wanted))["sections"]
+        for section, forms in wanted.items():
+            if section not in live:
+                result["errors"].append(f"{section}: not available on this device")
+                continue
+            for key, form in forms.items():
+                parsed = self._forms[section].get(key)
+                if parsed is None:
+                    result["errors"].append(f"{section}.{key}: form not found on this device")
+                    continue
+
+                overrides = {
+                    field: value
+                    for field, value in form["values"].items()
+                    if include_identity or not IDENTITY_FIELD_PATTERN.match(field)
+                }
+                current = live[section][key]["values"]
+                changes = {f: v for f, v in overrides.items() if current.get(f) != v}
+                if not changes and not force:
+                    result["skipped"].append(f"{section}.{key}")
+                    continue
+
+                post_start = time.time()
+                status, body = self.session.post_form(
+                    f"/{section}", form_submission(parsed, overrides)
+                )
+                alerts = page_alerts(body)
+                entry = {
+                    "section": section,
+                    "form": key,
+                    "changed": sorted(changes),
+                    "status": status,
+                    "seconds": round(time.time() - post_start, 3),
+                    "message": " ".join(alerts["danger"] + alerts["success"]),
+                }
+                result["posted"].append(entry)
+                if status != 200 or alerts["danger"]:
+                    result["errors"].append(
+                        f"{section}.{key}: HTTP {status} {' '.join(alerts['danger'])}".strip()
+                    )
+
+        result["seconds"] = round(time.time() - start_time, 3)
+        logger.info(
+            "Imported %s forms (%s unchanged) to %s in %ss, %s error(s)",
+            len(result['posted']),
+            len(result['skipped']),
+            self.session.device_ip,
+            result['seconds'],
+            len(result['errors']),
+        )
+        return result
+
+    # Verification
+
+    def verify(
+        self, snapshot: Dict[str, Any], include_identity: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Read every section and diff the live state against a snapshot.
+
+        Returns:
+            Dictionary with differences, live snapshot and seconds
+        """
+        live = self.read()
+        differences = diff_snapshots(snapshot, live, ignore_identity=not include_identity)
+        logger.info(
+            "Verified %s live fields in %ss: %s difference(s)",
+            live['stats']['fields'],
+            live['stats']['seconds'],
+            len(differences),
+        )
+        return {"differences": differences, "live": live, "seconds": live["stats"]["seconds"]}
+
+    def clone(
+        self,
+        snapshot: Dict[str, Any],
+        sections: Optional[List[str]] = None,
+        include_identity: bool = False,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Import a snapshot and verify it, timing both phases.
+
+        The network section is only cloned when ``sections`` names it.
+
+        Returns:
+            Report with import, verify, differences, phases and ok
+        """
+        sections = sections or IMPORT_SECTIONS
+        imported = self.import_config(snapshot, sections, include_identity, force)
+        wanted = {
+            section: forms
+            for section, forms in snapshot.get("sections", snapshot).items()
+            if section in sections
+        }
+        verified = self.verify({"sections": wanted}, include_identity)
+        return {
+            "device": self.session.device_ip,
+            "import": imported,
+            "differences": verified["differences"],
+            "phases": {"import": imported["seconds"], "verify": verified["seconds"]},
+            "ok": not imported["errors"] and not verified["differences"],
+        }
+
+    def round_trip(self, sections: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Export, re-import the same values (forced) and verify.
+
+        Benchmarks the bulk config path without changing the configuration.
+
+        Args:
+            sections: Sections to re-post (default: ROUNDTRIP_SECTIONS)
+
+        Returns:
+            Report with per-phase seconds and field throughput
+        """
+        sections = sections or ROUNDTRIP_SECTIONS
+        exported = self.export()
+        report = self.clone(exported, sections=sections, force=True)
+        report["phases"] = {"export": exported["stats"]["seconds"], **report["phases"]}
+
+        posted_fields = sum(
+            len(exported["sections"][entry["section"]][entry["form"]]["values"])
+            for entry in report["import"]["posted"]
+        )
+        import_seconds = report["phases"]["import"]
+        report["throughput"] = {
+            "export_fields_per_s": round(
+                exported["stats"]["fields"] / max(exported["stats"]["seconds"], 1e-6), 1
+            ),
+            "import_fields_per_s": round(posted_fields / max(import_seconds, 1e-6), 1),
+            "import_seconds_per_form": round(
+                import_seconds / max(len(report["import"]["posted"]), 1), 3
+            ),
+        }
+        report["export_stats"] = exported["stats"]
+        return report
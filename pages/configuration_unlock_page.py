@@ -16,6 +16,9 @@ from typing import Dict, Optional
 import time
 import sys
 import os
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -73,15 +76,15 @@ class ConfigurationUnlockPage(BasePage):
 
             # If none found, check if we're already on an unlocked page
             if self._has_configuration_sections():
-                print("Configuration already unlocked - no password field needed")
+                logger.info("Configuration already unlocked - no password field needed")
                 return
 
-            print(
-                "Warning: Config unlock page verification failed - password field not found"
+            logger.warning(
+                "Config unlock page verification failed - password field not found"
             )
 
         except Exception as e:
-            print(f"Warning: Config unlock page verification failed: {e}")
+            logger.warning("Config unlock page verification failed: %s", e)
 
     def _wait_for_page_content(self, timeout: Optional[int] = None) -> bool:
         """
@@ -139,18 +142,18 @@ class ConfigurationUnlockPage(BasePage):
                 # Check 4: Alternative - look for any input elements
                 inputs = self.page.locator("input")
                 if inputs.count() > 0:
-                    print("Page content loaded - found input elements")
+                    logger.info("Page content loaded - found input elements")
                     return True
 
                 time.sleep(0.5)
 
             except Exception as e:
-                print(f"Error checking page content: {e}")
+                logger.error("Error checking page content: %s", e)
                 time.sleep(0.5)
                 continue
 
-        print(
-            f"Page content failed to load within {timeout}ms - only HTML head present"
+        logger.info(
+            "Page content failed to load within %sms - only HTML head present", timeout
         )
         return False
 
@@ -180,7 +183,7 @@ class ConfigurationUnlockPage(BasePage):
             page_data["visible_sections"] = ", ".join(visible_sections)
 
         except Exception as e:
-            print(f"Error getting configuration unlock page data: {e}")
+            logger.error("Error getting configuration unlock page data: %s", e)
 
         return page_data
 
@@ -211,48 +214,52 @@ class ConfigurationUnlockPage(BasePage):
 
             # STEP 1: Check if already unlocked by looking for configuration sections
             if self._has_configuration_sections():
-                print("Configuration already unlocked - found configuration sections")
+                logger.info(
+                    "Configuration already unlocked - found configuration sections"
+                )
                 self.end_performance_tracking("unlock_configuration")
                 return True
 
             # STEP 2: Verify we're on a configuration unlock form
             # (We assume the Configure link has already been clicked by conftest.py fixture)
             current_url = self.page.url
-            print(f"Current URL: {current_url}")
+            logger.info("Current URL: %s", current_url)
 
             if not self._is_on_config_login_page():
-                print(
-                    "WARNING: Not detected as configuration login page - checking alternatives"
+                logger.warning(
+                    "Not detected as configuration login page - checking alternatives"
                 )
 
                 # Try to determine if we're in a configuration unlock scenario
                 if self._has_password_field():
-                    print("Found password field - assuming we're on unlock form")
+                    logger.info("Found password field - assuming we're on unlock form")
                 elif self._has_dashboard_access():
-                    print(
+                    logger.info(
                         "We're still on dashboard - attempting to access configure link"
                     )
                     if not self._access_configuration_mode(timeout=timeout):
-                        print("Failed to access configuration unlock mode")
+                        logger.error("Failed to access configuration unlock mode")
 
                         self.end_performance_tracking("unlock_configuration")
                         return False
                 else:
-                    print("Not on dashboard and no password field - unclear state")
+                    logger.info(
+                        "Not on dashboard and no password field - unclear state"
+                    )
                     self.end_performance_tracking("unlock_configuration")
                     return False
 
             # STEP 3: Perform configuration authentication
-            print("Performing configuration authentication...")
+            logger.info("Performing configuration authentication...")
             if not self._perform_configuration_authentication(
                 password, timeout=timeout
             ):
-                print("Configuration authentication failed")
+                logger.warning("Configuration authentication failed")
                 self.end_performance_tracking("unlock_configuration")
                 return False
 
             # STEP 4: Wait for second satellite loading cycle (configuration sections loading)
-            print(
+            logger.info(
                 "Waiting for configuration sections to load (second satellite cycle)..."
             )
             self.wait_for_satellite_loading(
@@ -264,14 +271,14 @@ class ConfigurationUnlockPage(BasePage):
                 self.end_performance_tracking("unlock_configuration")
                 return True
             else:
-                print(
+                logger.info(
                     "Final verification: Configuration unlock failed - no sections visible"
                 )
                 self.end_performance_tracking("unlock_configuration")
                 return False
 
         except Exception as e:
-            print(f"Error during configuration unlock: {e}")
+            logger.error("Error during configuration unlock: %s", e)
             self.end_performance_tracking("unlock_configuration")
             return False
 
@@ -300,7 +307,7 @@ class ConfigurationUnlockPage(BasePage):
                         current_url = self.page.url
                         if "/login" in current_url or self._has_password_field():
                             if self._wait_for_page_content(timeout=10000):
-                                print(
+                                logger.info(
                                     "Configure button successfully led to unlock page"
                                 )
                                 return True
@@ -310,7 +317,7 @@ class ConfigurationUnlockPage(BasePage):
             return False
 
         except Exception as e:
-            print(f"Error trying configure from current page: {e}")
+            logger.error("Error trying configure from current page: %s", e)
             return False
 
     def _has_password_field(self) -> bool:
@@ -378,7 +385,7 @@ class ConfigurationUnlockPage(BasePage):
             general_link.wait_for()
             return True
         except Exception as e:
-            print(f"Error waiting for general link: {e}")
+            logger.error("Error waiting for general link: %s", e)
             return False
 
     def _is_configuration_locked(self) -> bool:
@@ -406,16 +413,16 @@ class ConfigurationUnlockPage(BasePage):
                 try:
                     link = self.page.get_by_role("link", name=section)
                     if link.is_visible():
-                        print(f"Configuration section available: {section}")
+                        logger.info("Configuration section available: %s", section)
                         return True
                 except:
                     continue
 
-            print("No configuration sections found after unlock attempt")
+            logger.info("No configuration sections found after unlock attempt")
             return False
 
         except Exception as e:
-            print(f"Error verifying configuration unlock: {e}")
+            logger.error("Error verifying configuration unlock: %s", e)
             return False
 
     def navigate_to_page(self):
@@ -439,7 +446,7 @@ class ConfigurationUnlockPage(BasePage):
                 self.safe_click(configure_link, context="navigate_to_unlock_alt")
 
         except Exception as e:
-            print(f"Error navigating to configuration unlock page: {e}")
+            logger.error("Error navigating to configuration unlock page: %s", e)
 
     def get_configuration_access_level(self) -> Dict[str, str]:
         """
@@ -487,7 +494,7 @@ class ConfigurationUnlockPage(BasePage):
                 access_info["locked"] = True
 
         except Exception as e:
-            print(f"Error getting configuration access level: {e}")
+            logger.error("Error getting configuration access level: %s", e)
 
         return access_info
 
@@ -514,7 +521,7 @@ class ConfigurationUnlockPage(BasePage):
             for selector in dashboard_indicators:
                 element = self.page.locator(selector)
                 if element.is_visible(timeout=2000):  # Quick check
-                    print(f"Dashboard access verified: found {selector}")
+                    logger.info("Dashboard access verified: found %s", selector)
                     return True
 
             # Check for Configure button (indicates status monitoring access)
@@ -527,8 +534,9 @@ class ConfigurationUnlockPage(BasePage):
             for selector_str in configure_selectors:
                 element = self.page.locator(selector_str)
                 if element.is_visible(timeout=2000):
-                    print(
-                        f"Dashboard access verified: found configure link {selector_str}"
+                    logger.info(
+                        "Dashboard access verified: found configure link %s",
+                        selector_str,
                     )
                     return True
 
@@ -547,18 +555,19 @@ class ConfigurationUnlockPage(BasePage):
                         )
 
                         if len(content) > 200 and keyword_count >= 2:
-                            print(
-                                f"Dashboard access verified: {keyword_count} device keywords in content"
+                            logger.info(
+                                "Dashboard access verified: %s device keywords in content",
+                                keyword_count,
                             )
                             return True
             except Exception as e:
-                print(f"Error checking body content: {e}")
+                logger.error("Error checking body content: %s", e)
 
-            print("No dashboard access indicators found")
+            logger.info("No dashboard access indicators found")
             return False
 
         except Exception as e:
-            print(f"Error checking dashboard access: {e}")
+            logger.error("Error checking dashboard access: %s", e)
             return False
 
     def _access_configuration_mode(self, timeout: Optional[int] = None) -> bool:
@@ -588,7 +597,7 @@ class ConfigurationUnlockPage(BasePage):
             for selector in configure_selectors:
                 try:
                     if selector.is_visible(timeout=min(5000, timeout)):
-                        print(f"Found configure selector, attempting to click...")
+                        logger.info("Found configure selector, attempting to click...")
 
                         # Use safe_click with context for debugging
                         if self.safe_click(
@@ -601,22 +610,24 @@ class ConfigurationUnlockPage(BasePage):
 
                             # Verify we're now on the configuration login page
                             if self._is_on_config_login_page():
-                                print("Successfully accessed configuration unlock mode")
+                                logger.info(
+                                    "Successfully accessed configuration unlock mode"
+                                )
                                 return True
                             else:
-                                print(
+                                logger.info(
                                     "Configure click didn't lead to unlock page, trying next selector"
                                 )
                                 continue
                 except Exception as e:
-                    print(f"Error with selector: {e}")
+                    logger.error("Error with selector: %s", e)
                     continue
 
-            print("None of the configure selectors worked")
+            logger.info("None of the configure selectors worked")
             return False
 
         except Exception as e:
-            print(f"Error accessing configuration mode: {e}")
+            logger.error("Error accessing configuration mode: %s", e)
             return False
 
     def _is_on_config_login_page(self) -> bool:
@@ -638,13 +649,13 @@ class ConfigurationUnlockPage(BasePage):
 
             # Check if still on dashboard (configure didn't work)
             if self._has_dashboard_access():
-                print("Still on dashboard - configure link didn't navigate")
+                logger.info("Still on dashboard - configure link didn't navigate")
                 return False
 
             return False
 
         except Exception as e:
-            print(f"Error checking if on config login page: {e}")
+            logger.error("Error checking if on config login page: %s", e)
             return False
 
     def _perform_configuration_authentication(
@@ -666,7 +677,7 @@ class ConfigurationUnlockPage(BasePage):
         try:
             # Wait for page content to load fully
             if not self._wait_for_page_content(timeout=min(15000, timeout)):
-                print("Configuration login page content failed to load")
+                logger.warning("Configuration login page content failed to load")
                 return False
 
             # Find password field with multiple selector strategies
@@ -701,7 +712,7 @@ class ConfigurationUnlockPage(BasePage):
                     password_field = None
 
             if password_field is None:
-                print("No password field found on configuration login page")
+                logger.info("No password field found on configuration login page")
                 return False
 
             # Fill password field
@@ -723,13 +734,13 @@ class ConfigurationUnlockPage(BasePage):
 
             # Check for immediate authentication errors
             if self._has_authentication_errors():
-                print("Configuration authentication failed - errors detected")
+                logger.warning("Configuration authentication failed - errors detected")
                 return False
 
             return True
 
         except Exception as e:
-            print(f"Error during configuration authentication: {e}")
+            logger.error("Error during configuration authentication: %s", e)
             return False
 
     def _has_authentication_errors(self) -> bool:
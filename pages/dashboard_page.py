@@ -20,6 +20,10 @@ from pages.device_capabilities import DeviceCapabilities
 from typing import Dict, List, Optional
 import time
 import re
+import logging
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class DashboardPage(BasePage):
@@ -28,6 +32,23 @@ class DashboardPage(BasePage):
 
     """
 
+    TABLES_JS = """
+    () => Array.from(document.querySelectorAll('table'))
+        .filter((table) => !table.parentElement.closest('table'))
+        .map((table) => Array.from(table.rows)
+            .map((row) => Array.from(row.cells)
+                .map((cell) => (cell.textContent || '').replace(/\\s+/g, ' ').trim()))
+            .filter((row) => row.length))
+    """
+
+    # Rows of one table, cell text as text_content().strip() would return it
+    TABLE_ROWS_JS = """
+    (table) => Array.from(table.querySelectorAll('tr'))
+        .map((row) => Array.from(row.querySelectorAll('td, th'))
+            .map((cell) => (cell.textContent || '').trim()))
+        .filter((row) => row.length)
+    """
+
     def __init__(self, page: Page, device_model: Optional[str] = None):
         super().__init__(page, device_model)
         # Store device model for consistent detection throughout the page
@@ -73,20 +94,24 @@ class DashboardPage(BasePage):
                 table_count = tables.count()
                 if table_count == 4:
                     break
-                print(
-                    f"Table count attempt {attempt + 1}: found {table_count}, waiting..."
+                logger.info(
+                    "Table count attempt %s: found %s, waiting...",
+                    attempt + 1,
+                    table_count,
                 )
                 self.page.wait_for_timeout(3000)  # Extended: Wait 3s between checks
 
             if table_count != 4:
-                print(
-                    f"Warning: Expected 4 tables, found {table_count} after {max_retries} attempts - continuing with progressive enhancement"
+                logger.warning(
+                    "Expected 4 tables, found %s after %s attempts - continuing with progressive enhancement",
+                    table_count,
+                    max_retries,
                 )
             else:
-                print(f"Dashboard page verification: found {table_count} tables")
+                logger.info("Dashboard page verification: found %s tables", table_count)
 
         except Exception as e:
-            print(f"Warning: Dashboard page verification failed: {e}")
+            logger.warning("Dashboard page verification failed: %s", e)
 
     def get_page_data(self) -> Dict[str, str]:
         """Extract dashboard data from the page."""
@@ -110,7 +135,7 @@ class DashboardPage(BasePage):
                 page_data["satellite_table"] = self._extract_table_data(tables.nth(3))
 
         except Exception as e:
-            print(f"Error getting dashboard page data: {e}")
+            logger.error("Error getting dashboard page data: %s", e)
 
         return page_data
 
@@ -122,34 +147,34 @@ class DashboardPage(BasePage):
             # Wait for table to be visible
             expect(table_locator).to_be_visible(timeout=5000)
 
-            rows = table_locator.locator("tr")
-            row_count = rows.count()
-            print(f"Extracting data from table with {row_count} rows")
-
-            for i in range(row_count):
-                row = rows.nth(i)
-                cells = row.locator("td, th")
-                cell_count = cells.count()
-
-                row_data = []
-                for j in range(cell_count):
-                    cell = cells.nth(j)
-                    # Use text_content() instead of inner_text() for more reliable extraction
-                    cell_text = cell.text_content()
-                    text = cell_text.strip() if cell_text else ""
-                    row_data.append(text)
-                    print(f"  Cell {j}: '{text}'")
-
-                if row_data:
-                    table_data.append(row_data)
-                    print(f"  Row {i}: {row_data}")
+            # One round trip for the whole table instead of one per cell
+            table_data = table_locator.evaluate(self.TABLE_ROWS_JS)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, row_data in enumerate(table_data):
+                    logger.debug("Table row %d: %s", i, row_data)
 
         except Exception as e:
-            print(f"Error extracting table data: {e}")
+            logger.error("Error extracting table data: %s", e)
             # Don't re-raise exception to allow graceful degradation
 
         return table_data
 
+    def get_all_tables(self) -> List[List[List[str]]]:
+        """
+        Read every dashboard table in one evaluate call.
+
+        Cheap enough to poll repeatedly (see TelemetrySampler); unlike
+        _extract_table_data it reads all tables at once and does not log.
+
+        Returns:
+            List of tables, each a list of rows of cell text (header rows included)
+        """
+        try:
+            return self.page.evaluate(self.TABLES_JS)
+        except Exception as e:
+            logger.error("Error reading dashboard tables: %s", e)
+            return []
+
     def get_time_sync_data(self) -> Dict[str, str]:
         """Extract time status from table 0 with  Series 3 support."""
         time_status = {}
@@ -174,16 +199,18 @@ class DashboardPage(BasePage):
 
                 # If no data extracted, try direct element extraction
                 if not time_status:
-                    print(
+                    logger.info(
                         "Table extraction failed, trying direct element extraction for time data"
                     )
                     time_status = self._extract_time_data_direct()
 
         except Exception as e:
-            print(f"Error getting time status: {e}")
+            logger.error("Error getting time status: %s", e)
 
-        print(
-            f"Time sync data extraction result: {len(time_status)} items - {time_status}"
+        logger.info(
+            "Time sync data extraction result: %s items - %s",
+            len(time_status),
+            time_status,
         )
         return time_status
 
@@ -220,7 +247,7 @@ class DashboardPage(BasePage):
                 time_data["Local Time"] = local_text.strip() if local_text else ""
 
         except Exception as e:
-            print(f"Error in direct time data extraction: {e}")
+            logger.error("Error in direct time data extraction: %s", e)
 
         return time_data
 
@@ -240,17 +267,40 @@ class DashboardPage(BasePage):
 
                 # If table extraction failed, try direct extraction
                 if not gnss_status:
-                    print(
+                    logger.info(
                         "Table-based GNSS extraction failed, trying direct extraction"
                     )
                     gnss_status = self._extract_gnss_data_direct()
 
         except Exception as e:
-            print(f"Error getting GNSS status: {e}")
+            logger.error("Error getting GNSS status: %s", e)
 
-        print(f"GNSS data extraction result: {len(gnss_status)} items")
+        logger.info("GNSS data extraction result: %s items", len(gnss_status))
         return gnss_status
 
+    @staticmethod
+    def device_info_from_rows(rows: List[List[str]]) -> Dict[str, str]:
+        """
+        Map device information table rows (table 2) to title-cased keys.
+
+        Shared with tools that read the status page without a browser.
+        """
+        return {
+            row[0].strip().lower().title(): row[1].strip() for row in rows if len(row) >= 2
+        }
+
+    @staticmethod
+    def alarms_from_rows(rows: List[List[str]]) -> Dict[str, str]:
+        """Pick alarm/error/warning/status rows out of table rows."""
+        return {
+            row[0]: row[1]
+            for row in rows
+            if len(row) >= 2
+            and any(
+                keyword in row[0].lower() for keyword in ["alarm", "error", "warning", "status"]
+            )
+        }
+
     def get_device_info(self) -> Dict[str, str]:
         """
         Extract device information with  device model detection.
@@ -265,60 +315,59 @@ class DashboardPage(BasePage):
             # First: Extract additional info from table 2 if available
             tables = self.page.locator("table")
             table_count = tables.count()
-            print(f"DEBUG: Found {table_count} tables total")
+            logger.debug("Found %s tables total", table_count)
 
             if table_count >= 3:
                 try:
                     device_table = tables.nth(2)
                     table_data = self._extract_table_data(device_table)
-                    print(
-                        f"Device info table (nth(2)) extracted {len(table_data)} rows"
+                    logger.info(
+                        "Device info table (nth(2)) extracted %s rows", len(table_data)
                     )
 
                     # Process table data - look for expected device fields
                     # Don't hard-fail if rows are found but model isn't
-                    for row_idx, row in enumerate(table_data):
-                        if len(row) >= 2:
-                            key = row[0].strip().lower()
-                            value = row[1].strip()
-
-                            # Skip 'model' field if we already found it via detection
-                            if key in [
-                                "model",
-                                "hardware",
-                                "device model",
-                            ] and device_info.get("Model"):
-                                continue
+                    for key, value in self.device_info_from_rows(table_data).items():
+                        # Skip 'model' field if we already found it via detection
+                        if key in ["Model", "Hardware", "Device Model"] and device_info.get(
+                            "Model"
+                        ):
+                            continue
 
-                            # Store other device info fields
-                            device_info[key.title()] = value
-                            print(f"  Device info extracted: {key} = {value}")
+                        # Store other device info fields
+                        device_info[key] = value
+                        logger.info(
+                            "  Device info extracted: %s = %s", key.lower(), value
+                        )
 
                     # If we got some data from table, great! If not, that's OK (device models may not show on dashboard)
 
                 except Exception as table_e:
-                    print(
-                        f"Table extraction failed, but continuing with detection results: {table_e}"
+                    logger.info(
+                        "Table extraction failed, but continuing with detection results: %s",
+                        table_e,
                     )
                     # Don't fail completely - we may have already gotten the model via detection
 
             # THIRD: If still no luck, try direct extraction from DOM elements
             if not device_info.get("Model"):
-                print("detection failed, trying direct DOM extraction")
+                logger.info("detection failed, trying direct DOM extraction")
                 direct_info = self._extract_device_info_direct()
                 device_info.update(direct_info)
 
         except Exception as e:
-            print(f"Error in  device info extraction: {e}")
+            logger.error("Error in  device info extraction: %s", e)
 
         # SUCCESS CHECK: Did we get the critical device model?
         if device_info.get("Model"):
-            print(f" Device model detection SUCCESSFUL: {device_info['Model']}")
+            logger.info(" Device model detection SUCCESSFUL: %s", device_info['Model'])
         else:
-            print(" Device model detection FAILED - no model found")
+            logger.info(" Device model detection FAILED - no model found")
 
-        print(
-            f"Device info extraction result: {len(device_info)} items - {device_info}"
+        logger.info(
+            "Device info extraction result: %s items - %s",
+            len(device_info),
+            device_info,
         )
         return device_info
 
@@ -372,8 +421,10 @@ class DashboardPage(BasePage):
                                             )
                                             if value_text and value_text != keyword:
                                                 device_info[field_name] = value_text
-                                                print(
-                                                    f"Found device info {field_name}: {value_text}"
+                                                logger.info(
+                                                    "Found device info %s: %s",
+                                                    field_name,
+                                                    value_text,
                                                 )
                                                 break
                                     else:
@@ -388,8 +439,10 @@ class DashboardPage(BasePage):
                                                 value_part = parts[1].strip()
                                                 if value_part:
                                                     device_info[field_name] = value_part
-                                                    print(
-                                                        f"Found device info {field_name}: {value_part}"
+                                                    logger.info(
+                                                        "Found device info %s: %s",
+                                                        field_name,
+                                                        value_part,
                                                     )
                                                     break
                         except Exception:
@@ -398,7 +451,7 @@ class DashboardPage(BasePage):
                         break  # Move to next field once found
 
         except Exception as e:
-            print(f"Error in direct device info extraction: {e}")
+            logger.error("Error in direct device info extraction: %s", e)
 
         return device_info
 
@@ -423,7 +476,7 @@ class DashboardPage(BasePage):
                             satellites.append(satellite)
 
         except Exception as e:
-            print(f"Error getting satellite list: {e}")
+            logger.error("Error getting satellite list: %s", e)
 
         return satellites
 
@@ -446,13 +499,13 @@ class DashboardPage(BasePage):
                 section_link, context=f"navigate_to_{section_name.lower()}"
             ):
                 time.sleep(1)
-                print(f"Navigated to {section_name} configuration")
+                logger.info("Navigated to %s configuration", section_name)
                 return True
 
             return False
 
         except Exception as e:
-            print(f"Error navigating to {section_name} configuration: {e}")
+            logger.error("Error navigating to %s configuration: %s", section_name, e)
             return False
 
     def click_configure_button(self) -> bool:
@@ -472,13 +525,13 @@ class DashboardPage(BasePage):
 
             if self.safe_click(configure_button, context="configure_button"):
                 time.sleep(1)
-                print("Configure button clicked")
+                logger.info("Configure button clicked")
                 return True
 
             return False
 
         except Exception as e:
-            print(f"Error clicking configure button: {e}")
+            logger.error("Error clicking configure button: %s", e)
             return False
 
     def navigate_to_page(self):
@@ -490,7 +543,7 @@ class DashboardPage(BasePage):
             self.verify_page_loaded()
 
         except Exception as e:
-            print(f"Error navigating to dashboard page: {e}")
+            logger.error("Error navigating to dashboard page: %s", e)
 
     def get_status_data(self) -> Dict[str, str]:
         """
@@ -507,41 +560,42 @@ class DashboardPage(BasePage):
 
             # CRITICAL FIX: Fallback retry logic if initial table count is 0
             table_count = self.page.locator("table").count()
-            print(f"DEBUG: Found {table_count} tables on dashboard")
+            logger.debug("Found %s tables on dashboard", table_count)
 
             # If no tables found initially, wait and retry (Series 3 devices may load tables slowly)
             if table_count == 0:
-                print(
-                    "DEBUG: No tables found initially, retrying with progressive enhancement..."
+                logger.debug(
+                    "No tables found initially, retrying with progressive enhancement..."
                 )
                 max_retry_attempts = 3
 
                 for retry_attempt in range(max_retry_attempts):
-                    print(
-                        f"DEBUG: Retry attempt {retry_attempt + 1}/{max_retry_attempts}"
+                    logger.debug(
+                        "Retry attempt %s/%s", retry_attempt + 1, max_retry_attempts
                     )
                     self.page.wait_for_timeout(5000)  # Wait 5s between retries
 
                     table_count = self.page.locator("table").count()
-                    print(
-                        f"DEBUG: Retry {retry_attempt + 1}: Found {table_count} tables"
+                    logger.debug(
+                        "Retry %s: Found %s tables", retry_attempt + 1, table_count
                     )
 
                     if table_count > 0:
-                        print(f"DEBUG: Tables found after retry {retry_attempt + 1}")
+                        logger.debug("Tables found after retry %s", retry_attempt + 1)
                         break
 
                 # Continue with progressive enhancement even if table count is not 4
                 if table_count == 0:
-                    print(
-                        "WARNING: No tables found after retries - continuing with empty data (progressive enhancement)"
+                    logger.warning(
+                        "No tables found after retries - continuing with empty data (progressive enhancement)"
                     )
                 elif table_count < 4:
-                    print(
-                        f"WARNING: Only {table_count} tables found (expected 4) - continuing with available data"
+                    logger.warning(
+                        "Only %s tables found (expected 4) - continuing with available data",
+                        table_count,
                     )
                 else:
-                    print(f"SUCCESS: All {table_count} tables loaded")
+                    logger.info("All %s tables loaded", table_count)
 
             # Get device information with progressive enhancement
             device_info = self.get_device_info()
@@ -551,11 +605,11 @@ class DashboardPage(BasePage):
             time_status = self.get_time_sync_data()
             status_data.update(time_status)
 
-            print(f"Retrieved {len(status_data)} status data items")
+            logger.info("Retrieved %s status data items", len(status_data))
             return status_data
 
         except Exception as e:
-            print(f"Error getting status data: {e}")
+            logger.error("Error getting status data: %s", e)
             return {}
 
     def _extract_gnss_data_direct(self) -> Dict[str, str]:
@@ -594,13 +648,15 @@ class DashboardPage(BasePage):
 
             # If we found data with primary method, return it
             if gnss_data:
-                print(
-                    f"Direct GNSS extraction retrieved {len(gnss_data)} items via element IDs: {gnss_data}"
+                logger.info(
+                    "Direct GNSS extraction retrieved %s items via element IDs: %s",
+                    len(gnss_data),
+                    gnss_data,
                 )
                 return gnss_data
 
             # TIER 2:  table extraction with better cell parsing
-            print("Element ID extraction failed, trying  table extraction")
+            logger.info("Element ID extraction failed, trying  table extraction")
             try:
                 tables = self.page.locator("table")
                 if tables.count() >= 2:
@@ -620,15 +676,15 @@ class DashboardPage(BasePage):
                                 for term in ["gnss", "gps", "state", "status"]
                             ):
                                 gnss_data["GNSS state"] = value
-                                print(f"Found GNSS state via table: {value}")
+                                logger.info("Found GNSS state via table: %s", value)
                             elif any(term in label for term in ["antenna", "ant"]):
                                 gnss_data["Antenna state"] = value
-                                print(f"Found antenna state via table: {value}")
+                                logger.info("Found antenna state via table: %s", value)
                             elif any(
                                 term in label for term in ["accuracy", "time acc"]
                             ):
                                 gnss_data["Time accuracy"] = value
-                                print(f"Found time accuracy via table: {value}")
+                                logger.info("Found time accuracy via table: %s", value)
                             elif any(
                                 term in label
                                 for term in [
@@ -641,18 +697,22 @@ class DashboardPage(BasePage):
                             ):
                                 if value.isdigit() or "/" in value:
                                     gnss_data["Used / tracked SVs"] = value
-                                    print(f"Found satellite count via table: {value}")
+                                    logger.info(
+                                        "Found satellite count via table: %s", value
+                                    )
 
                     if gnss_data:
-                        print(
-                            f"Table-based GNSS extraction retrieved {len(gnss_data)} items: {gnss_data}"
+                        logger.info(
+                            "Table-based GNSS extraction retrieved %s items: %s",
+                            len(gnss_data),
+                            gnss_data,
                         )
                         return gnss_data
             except Exception as e:
-                print(f"Error in  table extraction: {e}")
+                logger.error("Error in  table extraction: %s", e)
 
             # TIER 3: Pattern-based search for GNSS keywords
-            print("Table extraction failed, trying pattern search")
+            logger.info("Table extraction failed, trying pattern search")
             gnss_keywords = {
                 "GNSS state": ["locked", "acquiring", "searching", "notime"],
                 "Antenna state": ["antenna", "ant", "connection"],
@@ -678,8 +738,10 @@ class DashboardPage(BasePage):
                                             field_name, value_part
                                         ):
                                             gnss_data[field_name] = value_part
-                                            print(
-                                                f"Found GNSS data {field_name}: {value_part}"
+                                            logger.info(
+                                                "Found GNSS data %s: %s",
+                                                field_name,
+                                                value_part,
                                             )
                                             break
                             if field_name in gnss_data:
@@ -689,11 +751,11 @@ class DashboardPage(BasePage):
                     if field_name in gnss_data:
                         break
 
-            print(f"GNSS extraction completed: {len(gnss_data)} items found")
+            logger.info("GNSS extraction completed: %s items found", len(gnss_data))
             return gnss_data
 
         except Exception as e:
-            print(f"Error in direct GNSS extraction: {e}")
+            logger.error("Error in direct GNSS extraction: %s", e)
             return {}
 
     def _is_valid_gnss_value(self, field_name: str, value: str) -> bool:
@@ -737,19 +799,14 @@ class DashboardPage(BasePage):
             if tables.count() >= 4:
                 try:
                     satellite_table = self._extract_table_data(tables.nth(3))
-                    for row in satellite_table:
-                        if len(row) >= 2 and any(
-                            keyword in row[0].lower()
-                            for keyword in ["alarm", "error", "warning", "status"]
-                        ):
-                            alarms[row[0]] = row[1]
+                    alarms.update(self.alarms_from_rows(satellite_table))
                 except Exception:
                     pass
 
             return alarms
 
         except Exception as e:
-            print(f"Error getting alarms data: {e}")
+            logger.error("Error getting alarms data: %s", e)
             return {}
 
     def is_configuration_locked(self) -> bool:
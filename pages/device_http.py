@@ -0,0 +1,508 @@
+"""
+Plain HTTP session for Kronos devices.
+
+Authenticates the same way the web UI does (status login form POST to
+``authenticate``, configuration unlock form POST to ``login``) and then
+performs GETs and form POSTs directly, without a browser. Used by tools and
+helpers that move data to or from the device where a browser adds nothing
+but overhead (uploads, config export/import, telemetry polling).
+
+Usage:
+    session = DeviceHttpSession("172.16.190.46")
+    if session.login("novatech") and session.unlock("novatech"):
+        status, html = session.get("/general")
+"""
+
+import html
+import http.cookiejar
+import re
+import ssl
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple, Union
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Fields present only on the login forms; their presence after a POST means
+# authentication was rejected
+STATUS_PASSWORD_FIELD = "sts_password"
+CONFIG_PASSWORD_FIELD = "cfg_password"
+
+# Server-side validation and save messages rendered into the returned page
+ALERT_PATTERN = re.compile(
+    r'<div[^>]*class="[^"]*alert-(danger|success)[^"]*"[^>]*>(.*?)</div>', re.S | re.I
+)
+
+
+class DeviceHttpSession:
+    """Cookie-based HTTP(S) session against a device web UI."""
+
+    def __init__(self, device_ip: str, scheme: str = "https", timeout: float = 30.0):
+        """
+        Initialize session.
+
+        Args:
+            device_ip: Device IP address (with or without scheme)
+            scheme: "https" (default) or "http"
+            timeout: Request timeout in seconds
+        """
+        self.device_ip = device_ip.replace("https://", "").replace("http://", "").strip("/")
+        self.scheme = scheme
+        self.base_url = f"{scheme}://{self.device_ip}"
+        self.timeout = timeout
+        self.cookie_jar = http.cookiejar.CookieJar()
+        self.ssl_context = ssl._create_unverified_context()
+        self._opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookie_jar),
+            urllib.request.HTTPSHandler(context=self.ssl_context),
+        )
+        self.authenticated = False
+        self.unlocked = False
+
+    def url(self, path: str) -> str:
+        """Build an absolute device URL from a path."""
+        return urllib.parse.urljoin(self.base_url + "/", path.lstrip("/"))
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[bytes, Dict[str, str], List[Tuple[str, str]]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, str, str]:
+        """
+        Perform a request, following redirects.
+
+        Args:
+            method: HTTP method
+            path: Path or absolute URL
+            data: Raw body, or form fields to URL-encode
+            headers: Extra request headers
+
+        Returns:
+            Tuple of (status, body text, final URL); status 0 on connection errors
+        """
+        if data is not None and not isinstance(data, bytes):
+            data = urllib.parse.urlencode(data).encode("utf-8")
+        url = path if path.startswith(("http://", "https://")) else self.url(path)
+        request = urllib.request.Request(url, data=data, method=method, headers=headers or {})
+        try:
+            with self._opener.open(request, timeout=self.timeout) as response:
+                body = response.read().decode("utf-8", errors="replace")
+                return response.status, body, response.geturl()
+        except urllib.error.HTTPError as e:
+            body = e.read().decode("utf-8", errors="replace") if e.fp else ""
+            return e.code, body, url
+        except (urllib.error.URLError, OSError) as e:
+            logger.warning("HTTP %s %s failed: %s", method, url, e)
+            return 0, "", url
+
+    def get(self, path: str) -> Tuple[int, str]:
+        """
+        GET a page.
+
+        Args:
+            path: Path relative to the device root
+
+        Returns:
+            Tuple of (status, body text)
+        """
+        status, body, _ = self.request("GET", path)
+        return status, body
+
+    def post_form(
+        self, path: str, fields: Union[Dict[str, str], List[Tuple[str, str]]]
+    ) -> Tuple[int, str]:
+        """
+        POST URL-encoded form fields, as the browser does for config forms.
+
+        Args:
+            path: Form action path
+            fields: Form fields (a list of pairs preserves repeated names)
+
+        Returns:
+            Tuple of (status, body text of the final page)
+        """
+        status, body, _ = self.request(
+            "POST",
+            path,
+            data=fields,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        return status, body
+
+    def login(self, password: str = "novatech") -> bool:
+        """
+        Status login via the ``authenticate`` form.
+
+        Args:
+            password: Device password
+
+        Returns:
+            True if authenticated
+        """
+        start_time = time.time()
+        status, body, final_url = self.request(
+            "POST",
+            "/authenticate",
+            data={STATUS_PASSWORD_FIELD: password, "redirect_url": "/"},
+        )
+        self.authenticated = (
+            status == 200
+            and "authenticate" not in urllib.parse.urlparse(final_url).path
+            and f'name="{STATUS_PASSWORD_FIELD}"' not in body
+        )
+        logger.info(
+            "HTTP status login to %s: %s (%.2fs)",
+            self.device_ip,
+            'ok' if self.authenticated else 'failed',
+            time.time() - start_time,
+        )
+        return self.authenticated
+
+    def unlock(self, password: str = "novatech") -> bool:
+        """
+        Configuration unlock via the ``login`` form.
+
+        Args:
+            password: Device password
+
+        Returns:
+            True if configuration is unlocked
+        """
+        start_time = time.time()
+        status, body, _ = self.request(
+            "POST",
+            "/login",
+            data={CONFIG_PASSWORD_FIELD: password, "redirect_url": "/general"},
+        )
+        self.unlocked = status == 200 and f'name="{CONFIG_PASSWORD_FIELD}"' not in body
+        logger.info(
+            "HTTP configuration unlock on %s: %s (%.2fs)",
+            self.device_ip,
+            'ok' if self.unlocked else 'failed',
+            time.time() - start_time,
+        )
+        return self.unlocked
+
+    def cookie_header(self) -> str:
+        """Return the session cookies formatted as a Cookie header value."""
+        return "; ".join(f"{cookie.name}={cookie.value}" for cookie in self.cookie_jar)
+
+    def set_cookies(self, cookies: List[Dict[str, str]]):
+        """
+        Adopt cookies from a browser context (context.cookies()).
+
+        Args:
+            cookies: Playwright cookie dictionaries
+        """
+        for cookie in cookies:
+            self.cookie_jar.set_cookie(
+                http.cookiejar.Cookie(
+                    version=0,
+                    name=cookie["name"],
+                    value=cookie["value"],
+                    port=None,
+                    port_specified=False,
+                    domain=cookie.get("domain", self.device_ip),
+                    domain_specified=True,
+                    domain_initial_dot=False,
+                    path=cookie.get("path", "/"),
+                    path_specified=True,
+                    secure=cookie.get("secure", False),
+                    expires=None,
+                    discard=True,
+                    comment=None,
+                    comment_url=None,
+                    rest={},
+                )
+            )
+        self.authenticated = bool(cookies)
+
+
+class _FormParser(HTMLParser):
+    """Collects forms and their successful-control candidates from a page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.forms: List[Dict[str, Any]] = []
+        self._form: Optional[Dict[str, Any]] = None
+        self._select: Optional[Dict[str, Any]] = None
+        self._option: Optional[Dict[str, Any]] = None
+        self._textarea: Optional[Dict[str, Any]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        attributes = {name: (value if value is not None else "") for name, value in attrs}
+        if tag == "form":
+            self._form = {
+                "index": len(self.forms),
+                "id": attributes.get("id", ""),
+                "action": attributes.get("action", ""),
+                "method": attributes.get("method", "GET").upper(),
+                "fields": [],
+                "submitters": [],
+            }
+            self.forms.append(self._form)
+            return
+        if self._form is None:
+            return
+
+        name = attributes.get("name")
+        disabled = "disabled" in attributes
+        if tag == "input" and name:
+            input_type = attributes.get("type", "text").lower()
+            if input_type in ("submit", "image"):
+                self._form["submitters"].append(name)
+            elif input_type not in ("button", "reset", "file"):
+                self._form["fields"].append(
+                    {
+                        "name": name,
+                        "tag": "input",
+                        "type": input_type,
+                        "value": attributes.get(
+                            "value", "on" if input_type in ("checkbox", "radio") else ""
+                        ),
+                        "checked": "checked" in attributes,
+                        "disabled": disabled,
+                    }
+                )
+        elif tag == "button" and name:
+            if attributes.get("type", "submit").lower() == "submit":
+                self._form["submitters"].append(name)
+        elif tag == "select" and name:
+            self._select = {
+                "name": name,
+                "tag": "select",
+                "type": "select-multiple" if "multiple" in attributes else "select-one",
+                "options": [],
+                "disabled": disabled,
+            }
+            self._form["fields"].append(self._select)
+        elif tag == "option" and self._select is not None:
+            self._option = {
+                "value": attributes.get("value"),
+                "text": "",
+                "selected": "selected" in attributes,
+            }
+            self._select["options"].append(self._option)
+        elif tag == "textarea" and name:
+            self._textarea = {
+                "name": name,
+                "tag": "textarea",
+                "type": "textarea",
+                "value": "",
+                "disabled": disabled,
+            }
+            self._form["fields"].append(self._textarea)
+
+    def handle_endtag(self, tag: str):
+        if tag == "form":
+            self._form = None
+        elif tag == "select":
+            self._select = None
+            self._option = None
+        elif tag == "option":
+            self._option = None
+        elif tag == "textarea":
+            self._textarea = None
+
+    def handle_data(self, data: str):
+        if self._option is not None:
+            self._option["text"] += data
+        elif self._textarea is not None:
+            self._textarea["value"] += data
+
+
+def parse_forms(page_html: str) -> List[Dict[str, Any]]:
+    """
+    Parse the forms of a device page.
+
+    Args:
+        page_html: Page HTML as served by the device
+
+    Returns:
+        List of forms with index, id, action, method, fields and the names of
+        their submit buttons. Select fields carry their options; the value of
+        an option without a value attribute is its text, as in a browser.
+    """
+    parser = _FormParser()
+    parser.feed(page_html)
+    parser.close()
+    for form in parser.forms:
+        for field in form["fields"]:
+            if field["tag"] == "select":
+                for option in field["options"]:
+                    option["text"] = option["text"].strip()
+                    if option["value"] is None:
+                        option["value"] = option["text"]
+    return parser.forms
+
+
+def form_values(form: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Current values of a parsed form, one entry per field name.
+
+    Checkboxes are True/False (lists for repeated names), radio groups and
+    single selects give the selected value, multi-selects a list of values.
+    Disabled fields are included; they are still part of the configuration.
+
+    Args:
+        form: Form from parse_forms()
+
+    Returns:
+        Dictionary of field name -> value
+    """
+    values: Dict[str, Any] = {}
+    for field in form["fields"]:
+        name = field["name"]
+        field_type = field["type"]
+        if field_type == "checkbox":
+            if name in values:
+                existing = values[name] if isinstance(values[name], list) else [values[name]]
+                values[name] = existing + [field["checked"]]
+            else:
+                values[name] = field["checked"]
+        elif field_type == "radio":
+            if field["checked"] or name not in values:
+                values[name] = field["value"] if field["checked"] else None
+        elif field_type == "select-one":
+            options = field["options"]
+            selected = [o for o in options if o["selected"]]
+            chosen = selected[-1] if selected else (options[0] if options else None)
+            values[name] = chosen["value"] if chosen else None
+        elif field_type == "select-multiple":
+            values[name] = [o["value"] for o in field["options"] if o["selected"]]
+        else:
+            values[name] = field["value"]
+    return values
+
+
+def form_submission(
+    form: Dict[str, Any],
+    overrides: Optional[Dict[str, Any]] = None,
+    submitter: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Build the name/value pairs a browser would submit for a form.
+
+    Args:
+        form: Form from parse_forms()
+        overrides: Values to apply first, in form_values() format
+        submitter: Name of the submit button to include (the device tells
+            per-port forms apart by it); defaults to the form's first one
+
+    Returns:
+        List of (name, value) pairs in document order
+    """
+    overrides = overrides or {}
+    pairs: List[Tuple[str, str]] = []
+    checkbox_seen: Dict[str, int] = {}
+    for field in form["fields"]:
+        if field["disabled"]:
+            continue
+        name = field["name"]
+        field_type = field["type"]
+        override = overrides.get(name)
+
+        if field_type == "checkbox":
+            position = checkbox_seen.get(name, 0)
+            checkbox_seen[name] = position + 1
+            checked = field["checked"]
+            if name in overrides:
+                checked = override[position] if isinstance(override, list) else override
+            if checked:
+                pairs.append((name, field["value"]))
+        elif field_type == "radio":
+            selected = override if name in overrides else (
+                field["value"] if field["checked"] else None
+            )
+            if selected is not None and field["value"] == str(selected):
+                pairs.append((name, field["value"]))
+        elif field_type.startswith("select"):
+            if name in overrides:
+                wanted = override if isinstance(override, list) else [override]
+                chosen = [o["value"] for o in field["options"] if o["value"] in map(str, wanted)]
+            else:
+                chosen = [o["value"] for o in field["options"] if o["selected"]]
+                if not chosen and field_type == "select-one" and field["options"]:
+                    chosen = [field["options"][0]["value"]]
+            pairs.extend((name, value) for value in chosen)
+        else:
+            pairs.append((name, str(override) if name in overrides else field["value"]))
+
+    submitter = submitter or (form["submitters"][0] if form["submitters"] else None)
+    if submitter:
+        pairs.append((submitter, ""))
+    return pairs
+
+
+class _TableParser(HTMLParser):
+    """Collects table cell text, row by row."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tables: List[List[List[str]]] = []
+        self._depth = 0
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if tag == "table":
+            self._depth += 1
+            if self._depth == 1:
+                self.tables.append([])
+        elif self._depth == 1 and tag == "tr":
+            self._row = []
+        elif self._depth == 1 and tag in ("td", "th") and self._row is not None:
+            self._cell = []
+
+    def handle_endtag(self, tag: str):
+        if tag == "table":
+            self._depth = max(0, self._depth - 1)
+        elif self._depth == 1 and tag in ("td", "th") and self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif self._depth == 1 and tag == "tr" and self._row is not None:
+            if self._row:
+                self.tables[-1].append(self._row)
+            self._row = None
+
+    def handle_data(self, data: str):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def parse_tables(page_html: str) -> List[List[List[str]]]:
+    """
+    Parse the top-level tables of a device page.
+
+    Args:
+        page_html: Page HTML as served by the device
+
+    Returns:
+        List of tables, each a list of rows of cell text (header rows included),
+        in the same shape as DashboardPage.get_all_tables()
+    """
+    parser = _TableParser()
+    parser.feed(page_html)
+    parser.close()
+    return parser.tables
+
+
+def page_alerts(page_html: str) -> Dict[str, List[str]]:
+    """
+    Extract alert messages rendered into a page after a form POST.
+
+    Returns:
+        Dictionary with "danger" and "success" message lists
+    """
+    alerts: Dict[str, List[str]] = {"danger": [], "success": []}
+    for kind, content in ALERT_PATTERN.findall(page_html):
+        text = " ".join(html.unescape(re.sub(r"<[^>]+>", " ", content)).split())
+        if text:
+            alerts[kind.lower()].append(text)
+    return alerts
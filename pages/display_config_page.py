@@ -26,9 +26,9 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any
 import time
-import logging
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DisplayConfigPage(BasePage):
@@ -42,7 +42,7 @@ class DisplayConfigPage(BasePage):
     def __init__(self, page: Page, device_model: Optional[str] = None):
         super().__init__(page, device_model)
 
-        logger.info(f"DisplayConfigPage initialized: {self.device_model}")
+        logger.info("DisplayConfigPage initialized: %s", self.device_model)
 
     # ========================================================================
     # DEVICE CAPABILITY DETECTION - AVAILABLE SECTIONS
@@ -81,7 +81,7 @@ class DisplayConfigPage(BasePage):
                 return base_sections
 
         except Exception as e:
-            logger.warning(f"Error getting available sections: {e}")
+            logger.warning("Error getting available sections: %s", e)
             return [
                 "general",
                 "network",
@@ -135,7 +135,7 @@ class DisplayConfigPage(BasePage):
                     else:
                         mode_states[mode_name] = False
                 except Exception as e:
-                    logger.warning(f"Error getting state for {mode_name}: {e}")
+                    logger.warning("Error getting state for %s: %s", mode_name, e)
                     mode_states[mode_name] = False
 
             display_config["mode_states"] = mode_states
@@ -143,7 +143,7 @@ class DisplayConfigPage(BasePage):
             return display_config if display_config else None
 
         except Exception as e:
-            logger.warning(f"Error getting display mode configuration: {e}")
+            logger.warning("Error getting display mode configuration: %s", e)
             return None
 
     def configure_display_modes(self, modes: Dict[str, bool]) -> bool:
@@ -163,7 +163,7 @@ class DisplayConfigPage(BasePage):
             for mode_name, enabled in modes.items():
                 if mode_name not in available_modes:
                     logger.warning(
-                        f"Mode {mode_name} not available on this device, skipping"
+                        "Mode %s not available on this device, skipping", mode_name
                     )
                     continue
 
@@ -176,11 +176,13 @@ class DisplayConfigPage(BasePage):
                             checkbox.first.click()
                             changes_made = True
                             logger.info(
-                                f"Changed {mode_name} to {'enabled' if enabled else 'disabled'}"
+                                "Changed %s to %s",
+                                mode_name,
+                                'enabled' if enabled else 'disabled',
                             )
 
                 except Exception as e:
-                    logger.warning(f"Error configuring mode {mode_name}: {e}")
+                    logger.warning("Error configuring mode %s: %s", mode_name, e)
                     continue
 
             if changes_made:
@@ -194,7 +196,7 @@ class DisplayConfigPage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Error configuring display modes: {e}")
+            logger.error("Error configuring display modes: %s", e)
             return False
 
     def validate_display_modes(self) -> bool:
@@ -218,7 +220,7 @@ class DisplayConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.warning(f"Error validating display modes: {e}")
+            logger.warning("Error validating display modes: %s", e)
             return False
 
     def get_page_data(self) -> Dict[str, Any]:
@@ -252,7 +254,7 @@ class DisplayConfigPage(BasePage):
                 try:
                     mode_states[mode_name] = self.is_display_mode_enabled(mode_name)
                 except Exception as e:
-                    logger.warning(f"Error getting state for mode {mode_name}: {e}")
+                    logger.warning("Error getting state for mode %s: %s", mode_name, e)
                     mode_states[mode_name] = False
 
             page_data["mode_states"] = mode_states
@@ -267,12 +269,12 @@ class DisplayConfigPage(BasePage):
             page_data["configuration_options_count"] = configuration_options
 
             logger.info(
-                f"Display page data extracted: {len(available_modes)} modes available"
+                "Display page data extracted: %s modes available", len(available_modes)
             )
             return page_data
 
         except Exception as e:
-            logger.error(f"Error extracting display page data: {e}")
+            logger.error("Error extracting display page data: %s", e)
             page_data["error"] = str(e)
             page_data["configuration_options_count"] = 0
             return page_data
@@ -377,11 +379,11 @@ class DisplayConfigPage(BasePage):
                     ]
                 )
 
-            logger.info(f"Found {len(options)} display configuration options")
+            logger.info("Found %s display configuration options", len(options))
             return options
 
         except Exception as e:
-            logger.warning(f"Error getting display configuration options: {e}")
+            logger.warning("Error getting display configuration options: %s", e)
             return ["Display Configuration"]
 
     def get_save_cancel_buttons(self) -> List[str]:
@@ -424,11 +426,11 @@ class DisplayConfigPage(BasePage):
                 except:
                     continue
 
-            logger.info(f"Found {len(buttons)} save/cancel buttons")
+            logger.info("Found %s save/cancel buttons", len(buttons))
             return buttons
 
         except Exception as e:
-            logger.warning(f"Error getting save/cancel buttons: {e}")
+            logger.warning("Error getting save/cancel buttons: %s", e)
             return []
 
     def get_save_button_locator(self) -> Optional[Locator]:
@@ -467,7 +469,7 @@ class DisplayConfigPage(BasePage):
             return None
 
         except Exception as e:
-            logger.warning(f"Error getting save button locator: {e}")
+            logger.warning("Error getting save button locator: %s", e)
             return None
 
     def is_section_available(self, section_name: str = "display") -> bool:
@@ -494,7 +496,7 @@ class DisplayConfigPage(BasePage):
             return "display" in available_sections
 
         except Exception as e:
-            logger.warning(f"Error checking section availability: {e}")
+            logger.warning("Error checking section availability: %s", e)
             return True  # Default to available for backward compatibility
 
     # ========================================================================
@@ -521,7 +523,7 @@ class DisplayConfigPage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Display config page verification failed: {e}")
+            logger.error("Display config page verification failed: %s", e)
             return False
 
     def get_timeout(self) -> int:
@@ -555,7 +557,7 @@ class DisplayConfigPage(BasePage):
             # Check if mode is available for this device
             available_modes = self.get_available_display_modes()
             if mode not in available_modes:
-                logger.warning(f"Display mode {mode} not available for this device")
+                logger.warning("Display mode %s not available for this device", mode)
                 return False
 
             # Find the checkbox for this mode
@@ -563,11 +565,11 @@ class DisplayConfigPage(BasePage):
             if checkbox.count() > 0:
                 return checkbox.first.is_checked()
             else:
-                logger.warning(f"Display mode checkbox for {mode} not found")
+                logger.warning("Display mode checkbox for %s not found", mode)
                 return False
 
         except Exception as e:
-            logger.error(f"Error checking display mode {mode} status: {e}")
+            logger.error("Error checking display mode %s status: %s", mode, e)
             return False
 
     def navigate_to_page(self) -> bool:
@@ -621,5 +623,5 @@ class DisplayConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.error(f"Display navigation failed: {e}")
+            logger.error("Display navigation failed: %s", e)
             return False
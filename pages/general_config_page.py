@@ -20,6 +20,9 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any
 import time
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class GeneralConfigPage(BasePage):
@@ -44,8 +47,10 @@ class GeneralConfigPage(BasePage):
             self.capabilities = {}
             self.available_sections = []
 
-        print(
-            f"GeneralConfigPage initialized for {self.device_model or 'Unknown'} (Series: {self.device_series})"
+        logger.info(
+            "GeneralConfigPage initialized for %s (Series: %s)",
+            self.device_model or 'Unknown',
+            self.device_series,
         )
 
     def validate_capabilities(self) -> bool:
@@ -56,21 +61,23 @@ class GeneralConfigPage(BasePage):
             bool: True if capabilities match, False if there are discrepancies
         """
         if not self.device_model:
-            print("No device model available for validation")
+            logger.info("No device model available for validation")
             return True
 
         try:
             validation_passed = True
-            print(f"Validating GeneralConfigPage capabilities for {self.device_model}:")
+            logger.info(
+                "Validating GeneralConfigPage capabilities for %s:", self.device_model
+            )
 
             # Validate that general configuration is available for this device
             if "general" not in self.available_sections:
-                print(
-                    f"  WARNING: General configuration not available for {self.device_model}"
+                logger.warning(
+                    "  General configuration not available for %s", self.device_model
                 )
                 validation_passed = False
             else:
-                print(f"  RESULT: General configuration available")
+                logger.info("  RESULT: General configuration available")
 
             # Validate page elements
             try:
@@ -79,32 +86,34 @@ class GeneralConfigPage(BasePage):
                 location_field = self.page.locator("input[name='location']")
 
                 if identifier_field.count() > 0:
-                    print(f"  RESULT: Device identifier field found")
+                    logger.info("  RESULT: Device identifier field found")
                 else:
-                    print(f"  RESULT: Device identifier field not found")
+                    logger.info("  RESULT: Device identifier field not found")
 
                 if location_field.count() > 0:
-                    print(f"  RESULT: Device location field found")
+                    logger.info("  RESULT: Device location field found")
                 else:
-                    print(f"  RESULT: Device location field not found")
+                    logger.info("  RESULT: Device location field not found")
 
             except Exception as e:
-                print(f"  WARNING: Error validating page elements: {e}")
+                logger.warning("  Error validating page elements: %s", e)
                 validation_passed = False
 
             if validation_passed:
-                print(
-                    f"GeneralConfigPage capability validation PASSED for {self.device_model}"
+                logger.info(
+                    "GeneralConfigPage capability validation PASSED for %s",
+                    self.device_model,
                 )
             else:
-                print(
-                    f"GeneralConfigPage capability validation FAILED for {self.device_model}"
+                logger.info(
+                    "GeneralConfigPage capability validation FAILED for %s",
+                    self.device_model,
                 )
 
             return validation_passed
 
         except Exception as e:
-            print(f"Error during general config capability validation: {e}")
+            logger.error("Error during general config capability validation: %s", e)
             return False
 
     def verify_page_loaded(self):
@@ -114,11 +123,12 @@ class GeneralConfigPage(BasePage):
             general_section = self.page.locator("h3:has-text('General')")
             expect(general_section).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
 
-            print(
-                f"General configuration page verification completed for {self.device_model or 'Unknown'}"
+            logger.info(
+                "General configuration page verification completed for %s",
+                self.device_model or 'Unknown',
             )
         except Exception as e:
-            print(f"Warning: General config page verification failed: {e}")
+            logger.warning("General config page verification failed: %s", e)
 
     def get_page_data(self) -> Dict[str, str]:
         """Extract general configuration data from the page."""
@@ -134,7 +144,7 @@ class GeneralConfigPage(BasePage):
                     page_data[field_name] = field_locator.input_value()
 
         except Exception as e:
-            print(f"Error getting general configuration page data: {e}")
+            logger.error("Error getting general configuration page data: %s", e)
 
         return page_data
 
@@ -174,7 +184,7 @@ class GeneralConfigPage(BasePage):
                     "requires_panel_expansion": False,
                 }
         except Exception as e:
-            print(f"Error getting device-specific save button: {e}")
+            logger.error("Error getting device-specific save button: %s", e)
             return {
                 "selector": "button#button_save",
                 "description": "Fallback save button",
@@ -203,11 +213,11 @@ class GeneralConfigPage(BasePage):
                 return False
 
             self.end_performance_tracking("configure_device_identifier")
-            print(f"Device identifier configured: {identifier}")
+            logger.info("Device identifier configured: %s", identifier)
             return True
 
         except Exception as e:
-            print(f"Error configuring device identifier: {e}")
+            logger.error("Error configuring device identifier: %s", e)
             self.end_performance_tracking("configure_device_identifier")
             return False
 
@@ -231,11 +241,11 @@ class GeneralConfigPage(BasePage):
                 return False
 
             self.end_performance_tracking("configure_device_location")
-            print(f"Device location configured: {location}")
+            logger.info("Device location configured: %s", location)
             return True
 
         except Exception as e:
-            print(f"Error configuring device location: {e}")
+            logger.error("Error configuring device location: %s", e)
             self.end_performance_tracking("configure_device_location")
             return False
 
@@ -259,11 +269,11 @@ class GeneralConfigPage(BasePage):
                 return False
 
             self.end_performance_tracking("configure_device_contact")
-            print(f"Device contact configured: {contact}")
+            logger.info("Device contact configured: %s", contact)
             return True
 
         except Exception as e:
-            print(f"Error configuring device contact: {e}")
+            logger.error("Error configuring device contact: %s", e)
             self.end_performance_tracking("configure_device_contact")
             return False
 
@@ -289,14 +299,43 @@ class GeneralConfigPage(BasePage):
                 return False
 
             self.end_performance_tracking("configure_device_description")
-            print(f"Device description configured: {description}")
+            logger.info("Device description configured: %s", description)
             return True
 
         except Exception as e:
-            print(f"Error configuring device description: {e}")
+            logger.error("Error configuring device description: %s", e)
             self.end_performance_tracking("configure_device_description")
             return False
 
+    def configure_general(
+        self,
+        identifier: Optional[str] = None,
+        location: Optional[str] = None,
+        contact: Optional[str] = None,
+    ) -> bool:
+        """
+        Configure several general fields and save them in one save cycle.
+
+        Args:
+            identifier: Device identifier string
+            location: Device location string
+            contact: Device contact string
+
+        Returns:
+            True if all given fields were applied, saved and read back, False otherwise
+        """
+        fields = {"identifier": identifier, "location": location, "contact": contact}
+        with self.changes("general") as tx:
+            for name, value in fields.items():
+                if value is not None:
+                    tx.set(name, value)
+
+        if not tx.ok:
+            logger.error(
+                "Error configuring general settings: %s", tx.errors or tx.mismatches
+            )
+        return tx.ok
+
     def save_configuration(self) -> bool:
         """
         Save general configuration using device-aware patterns.
@@ -310,24 +349,27 @@ class GeneralConfigPage(BasePage):
 
             # Check if panel expansion is required
             if save_config.get("requires_panel_expansion", False):
-                print("Panel expansion required for general configuration")
+                logger.info("Panel expansion required for general configuration")
                 # Add panel expansion logic if needed
 
             # Find and click save button
             save_button = self.page.locator(save_config["selector"])
 
-            if self.safe_click(save_button, context="save_general_config"):
-                time.sleep(1)
-                print(
-                    f"General configuration saved successfully (Device: {self.device_model})"
+            result = self.click_save_and_wait(save_button, section_context="general")
+            if result["ok"]:
+                logger.info(
+                    "General configuration saved successfully (Device: %s)",
+                    self.device_model,
                 )
                 return True
             else:
-                print("Error: Save button not found on general config page")
+                logger.error(
+                    "Error: General configuration save failed: %s", result['message']
+                )
                 return False
 
         except Exception as e:
-            print(f"Error saving general configuration: {e}")
+            logger.error("Error saving general configuration: %s", e)
             return False
 
     def navigate_to_page(self):
@@ -342,7 +384,7 @@ class GeneralConfigPage(BasePage):
                 self.verify_page_loaded()
 
         except Exception as e:
-            print(f"Error navigating to general configuration page: {e}")
+            logger.error("Error navigating to general configuration page: %s", e)
 
     def configure_all_general_settings(
         self,
@@ -390,7 +432,7 @@ class GeneralConfigPage(BasePage):
             return success_count == total_configs
 
         except Exception as e:
-            print(f"Error configuring general settings: {e}")
+            logger.error("Error configuring general settings: %s", e)
             return False
 
     def configure_device_info(self, **kwargs) -> bool:
@@ -433,7 +475,7 @@ class GeneralConfigPage(BasePage):
             return success_count == total_configs
 
         except Exception as e:
-            print(f"Error configuring device info: {e}")
+            logger.error("Error configuring device info: %s", e)
             return False
 
     def get_save_button_locator(self) -> str:
@@ -447,7 +489,7 @@ class GeneralConfigPage(BasePage):
             save_config = self.get_device_specific_save_button("general")
             return save_config["selector"]
         except Exception as e:
-            print(f"Error getting save button locator: {e}")
+            logger.error("Error getting save button locator: %s", e)
             return "button#button_save"
 
     def restore_page_data(self, page_data: Dict[str, str]) -> bool:
@@ -475,11 +517,11 @@ class GeneralConfigPage(BasePage):
                         time.sleep(0.5)  # Allow time for UI update
 
             self.end_performance_tracking("restore_general_page_data")
-            print("General configuration page data restored successfully")
+            logger.info("General configuration page data restored successfully")
             return True
 
         except Exception as e:
-            print(f"Error restoring general page data: {e}")
+            logger.error("Error restoring general page data: %s", e)
             self.end_performance_tracking("restore_general_page_data")
             return False
 
@@ -511,11 +553,11 @@ class GeneralConfigPage(BasePage):
             identifier_field = self.page.locator(identifier_locator)
             expect(identifier_field).to_be_visible(timeout=self.get_timeout())
 
-            print(f"Identifier field verified visible for {self.device_model}")
+            logger.info("Identifier field verified visible for %s", self.device_model)
             return True
 
         except Exception as e:
-            print(f"Error verifying identifier field visibility: {e}")
+            logger.error("Error verifying identifier field visibility: %s", e)
             return False
 
     def verify_location_field_visible(self) -> bool:
@@ -540,11 +582,11 @@ class GeneralConfigPage(BasePage):
             location_field = self.page.locator(location_locator)
             expect(location_field).to_be_visible(timeout=self.get_timeout())
 
-            print(f"Location field verified visible for {self.device_model}")
+            logger.info("Location field verified visible for %s", self.device_model)
             return True
 
         except Exception as e:
-            print(f"Error verifying location field visibility: {e}")
+            logger.error("Error verifying location field visibility: %s", e)
             return False
 
     def verify_contact_field_if_present(self) -> bool:
@@ -559,16 +601,17 @@ class GeneralConfigPage(BasePage):
 
             if contact_field.count() > 0:
                 expect(contact_field).to_be_visible(timeout=self.get_timeout())
-                print(f"Contact field verified visible for {self.device_model}")
+                logger.info("Contact field verified visible for %s", self.device_model)
             else:
-                print(
-                    f"Contact field not present for {self.device_model} (expected for some devices)"
+                logger.info(
+                    "Contact field not present for %s (expected for some devices)",
+                    self.device_model,
                 )
 
             return True
 
         except Exception as e:
-            print(f"Error verifying contact field visibility: {e}")
+            logger.error("Error verifying contact field visibility: %s", e)
             return False
 
     def has_basic_general_fields(self) -> bool:
@@ -586,16 +629,19 @@ class GeneralConfigPage(BasePage):
             location_present = location_field.count() > 0
 
             if identifier_present and location_present:
-                print(f"Basic general fields verified for {self.device_model}")
+                logger.info("Basic general fields verified for %s", self.device_model)
                 return True
             else:
-                print(
-                    f"Missing basic general fields for {self.device_model}: identifier={identifier_present}, location={location_present}"
+                logger.info(
+                    "Missing basic general fields for %s: identifier=%s, location=%s",
+                    self.device_model,
+                    identifier_present,
+                    location_present,
                 )
                 return False
 
         except Exception as e:
-            print(f"Error checking basic general fields: {e}")
+            logger.error("Error checking basic general fields: %s", e)
             return False
 
     def get_identifier_field(self):
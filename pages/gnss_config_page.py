@@ -10,9 +10,9 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Optional, Dict, Any, List
 import time
-import logging
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class GNSSConfigPage(BasePage):
@@ -60,9 +60,9 @@ class GNSSConfigPage(BasePage):
             self.available_constellations = ["GPS", "Galileo", "GLONASS", "BeiDou"]
             self.timeout_multiplier = 1.0
 
-        logger.info(f"GNSSConfigPage initialized: {device_model}")
-        logger.info(f"  Series: {self.device_series}")
-        logger.info(f"  Available constellations: {self.available_constellations}")
+        logger.info("GNSSConfigPage initialized: %s", device_model)
+        logger.info("  Series: %s", self.device_series)
+        logger.info("  Available constellations: %s", self.available_constellations)
 
     def validate_capabilities(self) -> bool:
         """
@@ -79,7 +79,7 @@ class GNSSConfigPage(BasePage):
 
         try:
             logger.info(
-                f"Validating GNSSConfigPage capabilities for {self.device_model}:"
+                "Validating GNSSConfigPage capabilities for %s:", self.device_model
             )
 
             # Validate available constellations match DeviceCapabilities
@@ -95,8 +95,8 @@ class GNSSConfigPage(BasePage):
                         actual_constellations.append(constellation)
 
             # Log validation results
-            logger.info(f"  Expected constellations: {expected_constellations}")
-            logger.info(f"  Actual constellations found: {actual_constellations}")
+            logger.info("  Expected constellations: %s", expected_constellations)
+            logger.info("  Actual constellations found: %s", actual_constellations)
 
             # Validate each expected constellation is present
             for expected in expected_constellations:
@@ -104,23 +104,25 @@ class GNSSConfigPage(BasePage):
                 found = any(c.upper() == expected_upper for c in actual_constellations)
                 if not found:
                     logger.warning(
-                        f"  WARNING: Expected constellation {expected} not found in UI"
+                        "  WARNING: Expected constellation %s not found in UI", expected
                     )
                     # Not a failure - UI may use different selectors
 
             if validation_passed:
                 logger.info(
-                    f"GNSSConfigPage capability validation PASSED for {self.device_model}"
+                    "GNSSConfigPage capability validation PASSED for %s",
+                    self.device_model,
                 )
             else:
                 logger.warning(
-                    f"GNSSConfigPage capability validation had warnings for {self.device_model}"
+                    "GNSSConfigPage capability validation had warnings for %s",
+                    self.device_model,
                 )
 
             return validation_passed
 
         except Exception as e:
-            logger.error(f"Error during GNSS capability validation: {e}")
+            logger.error("Error during GNSS capability validation: %s", e)
             return False
 
     def verify_page_loaded(self):
@@ -156,11 +158,11 @@ class GNSSConfigPage(BasePage):
 
             # Log successful page load
             logger.info(
-                f"GNSS config page verified successfully for {self.device_model}"
+                "GNSS config page verified successfully for %s", self.device_model
             )
 
         except Exception as e:
-            logger.error(f"GNSS config page verification failed: {e}")
+            logger.error("GNSS config page verification failed: %s", e)
 
     def get_available_constellations(self) -> List[str]:
         """
@@ -187,7 +189,9 @@ class GNSSConfigPage(BasePage):
 
         if constellation_upper not in available_upper:
             logger.warning(
-                f"Constellation {constellation} not available for {self.device_model}"
+                "Constellation %s not available for %s",
+                constellation,
+                self.device_model,
             )
             return None
 
@@ -199,14 +203,14 @@ class GNSSConfigPage(BasePage):
                 break
 
         if not checkbox_name:
-            logger.warning(f"No checkbox mapping for constellation {constellation}")
+            logger.warning("No checkbox mapping for constellation %s", constellation)
             return None
 
         checkbox = self.page.locator(f"input[name='{checkbox_name}']")
         if checkbox.count() > 0:
             return checkbox
         else:
-            logger.warning(f"Checkbox not found for {constellation}")
+            logger.warning("Checkbox not found for %s", constellation)
             return None
 
     def is_constellation_enabled(self, constellation: str) -> bool:
@@ -264,13 +268,13 @@ class GNSSConfigPage(BasePage):
                             break
 
             except Exception as e:
-                logger.warning(f"Error reading antenna config: {e}")
+                logger.warning("Error reading antenna config: %s", e)
 
-            logger.info(f"GNSS configuration data retrieved for {self.device_model}")
+            logger.info("GNSS configuration data retrieved for %s", self.device_model)
             return gnss_data
 
         except Exception as e:
-            logger.error(f"Error getting GNSS page data: {e}")
+            logger.error("Error getting GNSS page data: %s", e)
             return {
                 "device_model": self.device_model,
                 "device_series": self.device_series,
@@ -294,7 +298,9 @@ class GNSSConfigPage(BasePage):
                 available_upper = [c.upper() for c in self.available_constellations]
                 if constellation_upper not in available_upper:
                     logger.warning(
-                        f"Constellation {constellation} not available for {self.device_model}, skipping"
+                        "Constellation %s not available for %s, skipping",
+                        constellation,
+                        self.device_model,
                     )
 
             # Check if this is Series 2 (single constellation) or Series 3 (multiple)
@@ -323,13 +329,13 @@ class GNSSConfigPage(BasePage):
                             checkbox.click()
                             # Trigger change event for save button enablement
                             checkbox.dispatch_event("change")
-                        logger.info(f"Constellation {constellation} configured")
+                        logger.info("Constellation %s configured", constellation)
                         success_count += 1
 
                 return success_count > 0
 
         except Exception as e:
-            logger.error(f"Error configuring GNSS constellations: {e}")
+            logger.error("Error configuring GNSS constellations: %s", e)
             return False
 
     def configure_antenna(self, antenna_type: str = "Active") -> bool:
@@ -350,7 +356,7 @@ class GNSSConfigPage(BasePage):
                     antenna_select.select_option(label=antenna_type)
                     # Trigger change event
                     antenna_select.dispatch_event("change")
-                    logger.info(f"Series 2: Antenna type configured to {antenna_type}")
+                    logger.info("Series 2: Antenna type configured to %s", antenna_type)
                     return True
                 else:
                     logger.warning("Series 2: Antenna select dropdown not found")
@@ -365,16 +371,16 @@ class GNSSConfigPage(BasePage):
                     if not antenna_option.is_checked():
                         antenna_option.click()
                         antenna_option.dispatch_event("change")
-                    logger.info(f"Series 3: Antenna type configured to {antenna_type}")
+                    logger.info("Series 3: Antenna type configured to %s", antenna_type)
                     return True
                 else:
                     logger.warning(
-                        f"Series 3: Antenna option '{antenna_type}' not found"
+                        "Series 3: Antenna option '%s' not found", antenna_type
                     )
                     return False
 
         except Exception as e:
-            logger.error(f"Error configuring GNSS antenna: {e}")
+            logger.error("Error configuring GNSS antenna: %s", e)
             return False
 
     def save_configuration(self) -> bool:
@@ -385,7 +391,7 @@ class GNSSConfigPage(BasePage):
             True if save was successful
         """
         try:
-            logger.info(f"Saving GNSS configuration for {self.device_model}")
+            logger.info("Saving GNSS configuration for %s", self.device_model)
 
             # Use BasePage method for save button handling
             success = self.safe_save_click(section_context="gnss")
@@ -398,7 +404,7 @@ class GNSSConfigPage(BasePage):
             return success
 
         except Exception as e:
-            logger.error(f"Error saving GNSS configuration: {e}")
+            logger.error("Error saving GNSS configuration: %s", e)
             return False
 
     def configure_gnss_complete(
@@ -415,10 +421,12 @@ class GNSSConfigPage(BasePage):
             True if complete configuration was successful
         """
         try:
-            logger.info(f"Starting complete GNSS configuration for {self.device_model}")
-            logger.info(f"  Available constellations: {self.available_constellations}")
-            logger.info(f"  Requested constellations: {enabled_constellations}")
-            logger.info(f"  Antenna type: {antenna_type}")
+            logger.info(
+                "Starting complete GNSS configuration for %s", self.device_model
+            )
+            logger.info("  Available constellations: %s", self.available_constellations)
+            logger.info("  Requested constellations: %s", enabled_constellations)
+            logger.info("  Antenna type: %s", antenna_type)
 
             # Step 1: Configure constellations
             if not self.configure_constellations(enabled_constellations):
@@ -439,16 +447,16 @@ class GNSSConfigPage(BasePage):
             return True
 
         except Exception as e:
-            logger.error(f"Error during complete GNSS configuration: {e}")
+            logger.error("Error during complete GNSS configuration: %s", e)
             return False
 
     def close(self):
         """Clean up resources."""
         try:
-            logger.info(f"GNSSConfigPage closing for {self.device_model}")
+            logger.info("GNSSConfigPage closing for %s", self.device_model)
             super().close()
         except Exception as e:
-            logger.error(f"Error during GNSSConfigPage cleanup: {e}")
+            logger.error("Error during GNSSConfigPage cleanup: %s", e)
 
     def navigate_to_page(self):
         """
@@ -458,7 +466,7 @@ class GNSSConfigPage(BasePage):
         """
         try:
             logger.info(
-                f"Navigating to GNSS configuration page for {self.device_model}"
+                "Navigating to GNSS configuration page for %s", self.device_model
             )
 
             # Look for GNSS link using user-facing locator pattern
@@ -477,13 +485,14 @@ class GNSSConfigPage(BasePage):
                 self.verify_page_loaded()
 
                 logger.info(
-                    f"Successfully navigated to GNSS config page for {self.device_model}"
+                    "Successfully navigated to GNSS config page for %s",
+                    self.device_model,
                 )
             else:
                 logger.error("Failed to click GNSS navigation link")
 
         except Exception as e:
-            logger.error(f"Error navigating to GNSS configuration page: {e}")
+            logger.error("Error navigating to GNSS configuration page: %s", e)
 
     def detect_gnss_capabilities(self) -> Dict[str, Any]:
         """
@@ -535,7 +544,8 @@ class GNSSConfigPage(BasePage):
                                 "method": "select",
                             }
                     logger.info(
-                        f"Series 2: Found constellation select with {len(capabilities['available_constellations'])} options"
+                        "Series 2: Found constellation select with %s options",
+                        len(capabilities['available_constellations']),
                     )
 
             else:
@@ -562,7 +572,8 @@ class GNSSConfigPage(BasePage):
                         }
 
                 logger.info(
-                    f"Series 3: Found {len(capabilities['available_constellations'])} constellation checkboxes"
+                    "Series 3: Found %s constellation checkboxes",
+                    len(capabilities['available_constellations']),
                 )
 
             # Detect antenna configuration method
@@ -577,7 +588,8 @@ class GNSSConfigPage(BasePage):
                             capabilities["antenna_types"].append(option_text)
                     capabilities["has_antenna_select"] = True
                     logger.info(
-                        f"Series 2: Found antenna select with {len(capabilities['antenna_types'])} options"
+                        "Series 2: Found antenna select with %s options",
+                        len(capabilities['antenna_types']),
                     )
             else:
                 # Series 3: Radio buttons
@@ -592,7 +604,8 @@ class GNSSConfigPage(BasePage):
                     len(capabilities["antenna_types"]) > 0
                 )
                 logger.info(
-                    f"Series 3: Found antenna radio buttons: {capabilities['antenna_types']}"
+                    "Series 3: Found antenna radio buttons: %s",
+                    capabilities['antenna_types'],
                 )
 
             # PROTECT AGAINST FALSE NEGATIVES: If finding minimal capabilities,
@@ -623,18 +636,23 @@ class GNSSConfigPage(BasePage):
                 ),
             }
 
-            logger.info(f"GNSS capability detection completed for {self.device_model}:")
-            logger.info(f"  Series: {self.device_series}")
-            logger.info(f"  Constellations: {capabilities['available_constellations']}")
-            logger.info(f"  Antenna types: {capabilities['antenna_types']}")
             logger.info(
-                f"  Method: {capabilities['detection_summary']['configuration_method']}"
+                "GNSS capability detection completed for %s:", self.device_model
+            )
+            logger.info("  Series: %s", self.device_series)
+            logger.info(
+                "  Constellations: %s", capabilities['available_constellations']
+            )
+            logger.info("  Antenna types: %s", capabilities['antenna_types'])
+            logger.info(
+                "  Method: %s",
+                capabilities['detection_summary']['configuration_method'],
             )
 
             return capabilities
 
         except Exception as e:
-            logger.error(f"Error detecting GNSS capabilities: {e}")
+            logger.error("Error detecting GNSS capabilities: %s", e)
             return {
                 "device_series": self.device_series,
                 "device_model": self.device_model,
@@ -722,7 +740,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in GPS validation test: {e}")
+            logger.error("Error in GPS validation test: %s", e)
             return {"error": str(e)}
 
     def test_gnss_satellite_field_discovery(self) -> Dict[str, Any]:
@@ -770,7 +788,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in satellite field discovery: {e}")
+            logger.error("Error in satellite field discovery: %s", e)
             return {"error": str(e)}
 
     def test_gnss_series_specific_patterns(self) -> Dict[str, Any]:
@@ -876,7 +894,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in GNSS series-specific patterns test: {e}")
+            logger.error("Error in GNSS series-specific patterns test: %s", e)
             return {"error": str(e)}
 
     def test_satellite_status_display(self) -> Dict[str, Any]:
@@ -927,7 +945,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in satellite status display test: {e}")
+            logger.error("Error in satellite status display test: %s", e)
             return {"error": str(e)}
 
     def cross_validate_satellite_patterns(self) -> Dict[str, Any]:
@@ -983,7 +1001,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in satellite pattern validation: {e}")
+            logger.error("Error in satellite pattern validation: %s", e)
             return {"error": str(e)}
 
     def test_gnss_save_button_behavior(self) -> Dict[str, Any]:
@@ -1056,7 +1074,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in GNSS save button test: {e}")
+            logger.error("Error in GNSS save button test: %s", e)
             return {"error": str(e)}
 
     def test_gnss_performance_validation(self) -> Dict[str, Any]:
@@ -1125,7 +1143,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in GNSS performance validation: {e}")
+            logger.error("Error in GNSS performance validation: %s", e)
             return {"error": str(e)}
 
     def navigate_to_gnss_config(self):
@@ -1193,7 +1211,7 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in GLONASS checkbox toggle test: {e}")
+            logger.error("Error in GLONASS checkbox toggle test: %s", e)
             return {"error": str(e)}
 
     def _get_constellation_checkbox(self, constellation: str):
@@ -1237,7 +1255,7 @@ class GNSSConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.error(f"Error cancelling GNSS changes: {e}")
+            logger.error("Error cancelling GNSS changes: %s", e)
             return False
 
     def test_galileo_checkbox_toggle(self) -> Dict[str, Any]:
@@ -1303,5 +1321,5 @@ class GNSSConfigPage(BasePage):
             return results
 
         except Exception as e:
-            logger.error(f"Error in Galileo checkbox toggle test: {e}")
+            logger.error("Error in Galileo checkbox toggle test: %s", e)
             return {"error": str(e)}
@@ -0,0 +1,209 @@
+"""
+Structured, leveled logging for Kronos page objects.
+
+Page objects log through ``get_logger(__name__)`` instead of printing:
+
+    logger = get_logger(__name__)
+    logger.debug("Cell %d: %r", index, text)   # formatted only if DEBUG is enabled
+
+Loggers are structlog bound loggers on top of stdlib logging (plain stdlib
+loggers when structlog is not installed). Messages use %-style arguments so
+that disabled levels cost a level check and nothing else; enabled records are
+handed to a queue and formatted as JSON lines by a background listener, one
+file per pytest-xdist worker. The default level for ``pages`` is WARNING, so
+a normal run does almost no logging I/O; pass ``--page-log-level DEBUG`` (or
+per-module ``--page-log-module pages.dashboard_page=DEBUG``) for full detail.
+
+Context bound with ``bind_log_context(test=...)`` is added to every line.
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+try:
+    import structlog
+except ImportError:  # Fall back to plain stdlib loggers
+    structlog = None
+
+DEFAULT_LEVEL = "WARNING"
+LOG_DIR = "test-results/logs"
+ROOT_LOGGER = "pages"
+
+# LogRecord attributes that are not user context
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+_console_handler: Optional[logging.Handler] = None
+
+
+def _defer_to_logging(logger: Any, method_name: str, event_dict: Dict[str, Any]):
+    """
+    Final structlog processor: hand the event to stdlib logging unformatted.
+
+    Positional arguments stay arguments, so %-formatting happens in the
+    listener thread (and only for records that pass the level check).
+    """
+    args = tuple(event_dict.pop("positional_args", ()))
+    kwargs = {
+        key: event_dict.pop(key)
+        for key in ("exc_info", "stack_info", "stacklevel")
+        if key in event_dict
+    }
+    message = event_dict.pop("event")
+    kwargs["extra"] = event_dict
+    return (message,) + args, kwargs
+
+
+if structlog is not None:
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.contextvars.merge_contextvars,
+            _defer_to_logging,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+
+def get_logger(name: str):
+    """
+    Get a module logger.
+
+    Args:
+        name: Logger name, normally ``__name__``
+
+    Returns:
+        structlog BoundLogger (stdlib Logger without structlog); both accept
+        ``logger.info("message %s", value)``
+    """
+    if structlog is not None:
+        return structlog.stdlib.get_logger(name)
+    return logging.getLogger(name)
+
+
+def bind_log_context(**context: Any):
+    """Add key/value context (e.g. test=nodeid) to subsequent log lines."""
+    if structlog is not None:
+        structlog.contextvars.bind_contextvars(**context)
+
+
+def clear_log_context():
+    """Remove all bound log context."""
+    if structlog is not None:
+        structlog.contextvars.clear_contextvars()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line."""
+
+    def __init__(self, worker: str):
+        super().__init__()
+        self.worker = worker
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "worker": self.worker,
+            "message": record.getMessage(),
+            "where": f"{record.module}.{record.funcName}:{record.lineno}",
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key not in entry:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+def _parse_level(level: Any) -> int:
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
+
+
+def configure_logging(
+    level: Any = DEFAULT_LEVEL,
+    module_levels: Optional[Dict[str, Any]] = None,
+    log_dir: Optional[str] = LOG_DIR,
+    worker: Optional[str] = None,
+    console: bool = False,
+) -> Optional[str]:
+    """
+    Configure page object logging.
+
+    Args:
+        level: Level for the ``pages`` logger tree
+        module_levels: Per-logger overrides, e.g. {"pages.dashboard_page": "DEBUG"}
+        log_dir: Directory for JSON lines files (None disables the file)
+        worker: Worker name for the file name (default: xdist worker or "main")
+        console: Also echo records to stderr (for CLI tools)
+
+    Returns:
+        Path of the JSON lines file, or None
+    """
+    global _listener, _queue_handler, _console_handler
+    shutdown_logging()
+
+    logging.getLogger(ROOT_LOGGER).setLevel(_parse_level(level))
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(_parse_level(module_level))
+
+    root = logging.getLogger()
+    if console:
+        _console_handler = logging.StreamHandler(sys.stderr)
+        _console_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        root.addHandler(_console_handler)
+
+    if not log_dir:
+        return None
+    worker = worker or os.environ.get("PYTEST_XDIST_WORKER", "main")
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, f"{worker}.jsonl")
+
+    # delay=True: no file is created unless something is actually logged
+    file_handler = logging.FileHandler(path, mode="w", encoding="utf-8", delay=True)
+    file_handler.setFormatter(JsonLinesFormatter(worker))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = _DeferredQueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _listener.start()
+    logging.getLogger(ROOT_LOGGER).addHandler(_queue_handler)
+    return path
+
+
+def shutdown_logging():
+    """Flush queued records and detach handlers added by configure_logging()."""
+    global _listener, _queue_handler, _console_handler
+    if _queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _console_handler is not None:
+        logging.getLogger().removeHandler(_console_handler)
+        _console_handler = None
@@ -17,6 +17,9 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional
 import time
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class LoginPage(BasePage):
@@ -37,7 +40,7 @@ class LoginPage(BasePage):
             password_field = self.page.get_by_placeholder("Password")
             expect(password_field).to_be_visible()
         except Exception as e:
-            print(f"Warning: Login page verification failed: {e}")
+            logger.warning("Login page verification failed: %s", e)
 
     def get_page_data(self) -> Dict[str, str]:
         """
@@ -67,7 +70,7 @@ class LoginPage(BasePage):
                     continue
 
         except Exception as e:
-            print(f"Error getting login page data: {e}")
+            logger.error("Error getting login page data: %s", e)
 
         return page_data
 
@@ -115,7 +118,7 @@ class LoginPage(BasePage):
             # This is the key fix - check for error messages immediately after submit
             auth_errors = self.check_for_authentication_errors()
             if auth_errors:
-                print(f"Authentication failed: {auth_errors}")
+                logger.warning("Authentication failed: %s", auth_errors)
                 self.end_performance_tracking("login")
                 return False
 
@@ -132,10 +135,10 @@ class LoginPage(BasePage):
             if login_successful:
                 return True
             else:
-                print("Login verification failed")
+                logger.warning("Login verification failed")
                 return False
         except Exception as e:
-            print(f"Login error: {e}")
+            logger.info("Login error: %s", e)
             self.end_performance_tracking("login")
             return False
 
@@ -155,7 +158,7 @@ class LoginPage(BasePage):
             if "authenticate" in current_url.lower():
                 return False
         except Exception as e:
-            print(f"Error verifying login page: {e}")
+            logger.error("Error verifying login page: %s", e)
             return False
 
         # ENHANCED: Longer timeout for all devices to handle slower initialization
@@ -203,7 +206,7 @@ class LoginPage(BasePage):
                 for selector in universal_indicators:
                     element = self.page.locator(selector)
                     if element.is_visible():
-                        print(f"Found universal dashboard indicator: {selector}")
+                        logger.info("Found universal dashboard indicator: %s", selector)
                         return True
 
                 # THIRD: Configure button detection (generic patterns for both series)
@@ -216,7 +219,7 @@ class LoginPage(BasePage):
                 for selector in configure_selectors:
                     element = self.page.locator(selector)
                     if element.is_visible():
-                        print(f"Found configure link: {selector}")
+                        logger.info("Found configure link: %s", selector)
                         return True
 
                 # FOURTH: Body content check with device-neutral keywords
@@ -237,28 +240,30 @@ class LoginPage(BasePage):
                             if (
                                 len(content) > 200 and keyword_count >= 2
                             ):  # Substantial content with 2+ keywords
-                                print(
-                                    f"Found substantial dashboard content ({len(content)} chars, {keyword_count} keywords)"
+                                logger.info(
+                                    "Found substantial dashboard content (%s chars, %s keywords)",
+                                    len(content),
+                                    keyword_count,
                                 )
                                 return True
                 except Exception as e:
-                    print(f"Error checking body content: {e}")
+                    logger.error("Error checking body content: %s", e)
 
                 # FIFTH: Table count verification (both series should have 4 tables minimum)
                 try:
                     table_count = self.page.locator("table").count()
                     if table_count >= 4:  # Both series have 4 tables minimum
-                        print(f"Found {table_count} tables (dashboard loaded)")
+                        logger.info("Found %s tables (dashboard loaded)", table_count)
                         return True
                 except Exception as e:
-                    print(f"Error checking table count: {e}")
+                    logger.error("Error checking table count: %s", e)
 
             except Exception as e:
-                print(f"Error during verification check: {e}")
+                logger.error("Error during verification check: %s", e)
 
             time.sleep(check_interval / 1000)  # Convert to seconds
 
-        print("No success indicators found after checking all device selectors")
+        logger.info("No success indicators found after checking all device selectors")
         return False
 
     def navigate_to_page(self):
@@ -273,7 +278,7 @@ class LoginPage(BasePage):
             self.wait_for_page_load()
 
         except Exception as e:
-            print(f"Error navigating to login page: {e}")
+            logger.error("Error navigating to login page: %s", e)
 
     def check_for_authentication_errors(self) -> Dict[str, str]:
         """
@@ -318,12 +323,12 @@ class LoginPage(BasePage):
                             errors["error_text"] = error_element.inner_text()
                             errors["detection_method"] = "exact_device_message"
                             # Log exact match for debugging
-                            print(
-                                f"FOUND AUTHENTICATION ERROR: '{errors['error_text']}'"
+                            logger.info(
+                                "FOUND AUTHENTICATION ERROR: '%s'", errors['error_text']
                             )
                             return errors
                     except Exception as e:
-                        print(f"Error checking pattern '{pattern}': {e}")
+                        logger.error("Error checking pattern '%s': %s", pattern, e)
                         continue
 
                 # Method 3: Check for error CSS classes (fallback)
@@ -342,10 +347,10 @@ class LoginPage(BasePage):
                                     errors["auth_error"] = "Error element visible"
                                     errors["error_text"] = elem_text
                                     errors["detection_method"] = "css_class_fallback"
-                                    print(f"FOUND CSS ERROR: '{elem_text}'")
+                                    logger.info("FOUND CSS ERROR: '%s'", elem_text)
                                     return errors
                 except Exception as e:
-                    print(f"Error checking CSS classes: {e}")
+                    logger.error("Error checking CSS classes: %s", e)
 
                 # Method 4: Check if password field is still visible (suggests failed login)
                 try:
@@ -359,10 +364,10 @@ class LoginPage(BasePage):
                                 "Password field cleared (indicates failed login)"
                             )
                             errors["detection_method"] = "field_state"
-                            print("Password field cleared - likely failed login")
+                            logger.warning("Password field cleared - likely failed login")
                             return errors
                 except Exception as e:
-                    print(f"Error checking password field state: {e}")
+                    logger.error("Error checking password field state: %s", e)
 
                 # Method 5: Check for any error-related elements by content
                 try:
@@ -380,20 +385,22 @@ class LoginPage(BasePage):
                             errors["auth_error"] = f"Error keyword detected: {keyword}"
                             errors["detection_method"] = "content_scan"
                             errors["keyword"] = keyword
-                            print(f"Found error keyword in page content: {keyword}")
+                            logger.info(
+                                "Found error keyword in page content: %s", keyword
+                            )
                             return errors
                 except Exception as e:
-                    print(f"Error scanning page content: {e}")
+                    logger.error("Error scanning page content: %s", e)
 
             else:
                 # Not on auth page - likely successful login
                 return errors  # Return empty dict = no errors
 
         except Exception as e:
-            print(f"Error checking for authentication errors: {e}")
+            logger.error("Error checking for authentication errors: %s", e)
             errors["debug_error"] = str(e)
 
-        print("No authentication errors detected")
+        logger.info("No authentication errors detected")
         return errors
 
     # Wrapper methods for test compatibility - Fix missing get_password_field and get_login_button
@@ -414,7 +421,7 @@ class LoginPage(BasePage):
             return self.page.locator("input[name='sts_password']").first
 
         except Exception as e:
-            print(f"Error getting password field: {e}")
+            logger.error("Error getting password field: %s", e)
             # Return empty locator as fallback
             return self.page.locator("input[type='password']").first
 
@@ -435,6 +442,6 @@ class LoginPage(BasePage):
             return self.page.locator("input[type='submit']").first
 
         except Exception as e:
-            print(f"Error getting login button: {e}")
+            logger.error("Error getting login button: %s", e)
             # Return empty locator as fallback
             return self.page.locator("button").first
@@ -20,9 +20,10 @@ from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any
 import re
 import time
-import logging
+from pages.timeout_policy import save_operation
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class NetworkConfigPage(BasePage):
@@ -57,12 +58,14 @@ class NetworkConfigPage(BasePage):
             "elements_visible": False,
         }
 
-        logger.info(f"NetworkConfigPageDevice initialized: {device_model}")
+        logger.info("NetworkConfigPageDevice initialized: %s", device_model)
         logger.info(
-            f"  Series: {self.device_series}, Timeout multiplier: {self.timeout_multiplier}x"
+            "  Series: %s, Timeout multiplier: %sx",
+            self.device_series,
+            self.timeout_multiplier,
         )
-        logger.info(f"  Network interfaces: {self.network_interfaces}")
-        logger.info(f"  PTP interfaces: {self.ptp_interfaces}")
+        logger.info("  Network interfaces: %s", self.network_interfaces)
+        logger.info("  PTP interfaces: %s", self.ptp_interfaces)
 
     def validate_capabilities(self) -> bool:
         """
@@ -82,13 +85,15 @@ class NetworkConfigPage(BasePage):
             validation_passed = True
             actual_capabilities = self.detect_device_capabilities()
 
-            logger.info(f"Validating {self.device_model} network capabilities:")
+            logger.info("Validating %s network capabilities:", self.device_model)
 
             # Validate Series 2 vs Series 3 network capabilities
             expected_series = 2 if self.device_model.startswith("KRONOS-2") else 3
             if expected_series != self.device_series:
                 logger.warning(
-                    f"  Series mismatch - expected {expected_series}, detected {self.device_series}"
+                    "  Series mismatch - expected %s, detected %s",
+                    expected_series,
+                    self.device_series,
                 )
 
             # Validate network interface count
@@ -101,12 +106,16 @@ class NetworkConfigPage(BasePage):
                 actual_count = len(actual_interfaces)
 
                 logger.info(
-                    f"  Expected {expected_count} interfaces, detected {actual_count}"
+                    "  Expected %s interfaces, detected %s",
+                    expected_count,
+                    actual_count,
                 )
 
                 if expected_count != actual_count:
                     logger.warning(
-                        f"   Network interface count mismatch: expected {expected_count}, got {actual_count}"
+                        "   Network interface count mismatch: expected %s, got %s",
+                        expected_count,
+                        actual_count,
                     )
                     validation_passed = False
                 else:
@@ -123,20 +132,20 @@ class NetworkConfigPage(BasePage):
 
                 if not expected_ptp_interfaces.issubset(actual_ptp_interfaces):
                     missing_ptp = expected_ptp_interfaces - actual_ptp_interfaces
-                    logger.warning(f"   Missing PTP interfaces: {missing_ptp}")
+                    logger.warning("   Missing PTP interfaces: %s", missing_ptp)
                     validation_passed = False
 
             if validation_passed:
-                logger.info(f"   Network capability validation PASSED")
+                logger.info("   Network capability validation PASSED")
             else:
                 logger.warning(
-                    f"   Network capability validation FAILED - some mismatches detected"
+                    "   Network capability validation FAILED - some mismatches detected"
                 )
 
             return validation_passed
 
         except Exception as e:
-            logger.error(f"Error during network capability validation: {e}")
+            logger.error("Error during network capability validation: %s", e)
             return False
 
     def detect_device_capabilities(self) -> Dict[str, Any]:
@@ -204,13 +213,15 @@ class NetworkConfigPage(BasePage):
                 capabilities["ptp_capable_interfaces"] = ptp_capable
 
                 logger.info(
-                    f"Series 3: Detected {len(available_interfaces)} interfaces, {len(ptp_capable)} PTP-capable"
+                    "Series 3: Detected %s interfaces, %s PTP-capable",
+                    len(available_interfaces),
+                    len(ptp_capable),
                 )
 
             return capabilities
 
         except Exception as e:
-            logger.error(f"Error detecting network capabilities: {e}")
+            logger.error("Error detecting network capabilities: %s", e)
             return {
                 "device_series": self.device_series,
                 "available_interfaces": [],
@@ -251,7 +262,7 @@ class NetworkConfigPage(BasePage):
                     if match:
                         interface = match.group(1)
                         available_interfaces.append(interface)
-                        logger.info(f"Found interface: {interface}")
+                        logger.info("Found interface: %s", interface)
 
             # PROTECT AGAINST FALSE NEGATIVES: Device-aware loading protection
             if len(available_interfaces) <= 1:
@@ -274,19 +285,21 @@ class NetworkConfigPage(BasePage):
                             available_interfaces.append(interface)
 
                 logger.info(
-                    f"After device-aware loading: {len(available_interfaces)} interfaces - {available_interfaces}"
+                    "After device-aware loading: %s interfaces - %s",
+                    len(available_interfaces),
+                    available_interfaces,
                 )
 
             # Sort interfaces for consistency
             available_interfaces.sort()
 
             logger.info(
-                f"Final device-aware interface detection: {available_interfaces}"
+                "Final device-aware interface detection: %s", available_interfaces
             )
             return available_interfaces
 
         except Exception as e:
-            logger.error(f"Error in device-aware interface detection: {e}")
+            logger.error("Error in device-aware interface detection: %s", e)
             return []
 
     def verify_page_loaded(self):
@@ -314,11 +327,11 @@ class NetworkConfigPage(BasePage):
                     )
 
             logger.info(
-                f"Network config page verification completed for {self.device_model}"
+                "Network config page verification completed for %s", self.device_model
             )
 
         except Exception as e:
-            logger.error(f"Network config page verification failed: {e}")
+            logger.error("Network config page verification failed: %s", e)
 
     def get_save_button_locator(self):
         """
@@ -340,7 +353,8 @@ class NetworkConfigPage(BasePage):
                 save_button = self.page.locator(save_button_info["selector"])
                 if save_button.count() > 0:
                     logger.info(
-                        f"Using device-specific save button: {save_button_info['selector']}"
+                        "Using device-specific save button: %s",
+                        save_button_info['selector'],
                     )
                     return save_button
 
@@ -363,7 +377,7 @@ class NetworkConfigPage(BasePage):
             return self.page.get_by_role("button", name="Save")
 
         except Exception as e:
-            logger.error(f"Error getting save button locator: {e}")
+            logger.error("Error getting save button locator: %s", e)
             return self.page.get_by_role("button", name="Save")
 
     def expand_network_interface_panel(self, interface: str) -> bool:
@@ -377,12 +391,14 @@ class NetworkConfigPage(BasePage):
             True if panel was expanded successfully
         """
         if self.device_series != 3:
-            logger.info(f"Panel expansion not needed for Series {self.device_series}")
+            logger.info("Panel expansion not needed for Series %s", self.device_series)
             return True
 
         if interface not in self.network_interfaces:
             logger.warning(
-                f"Interface {interface} not in network interfaces list: {self.network_interfaces}"
+                "Interface %s not in network interfaces list: %s",
+                interface,
+                self.network_interfaces,
             )
             return False
 
@@ -399,7 +415,7 @@ class NetworkConfigPage(BasePage):
                 )
 
             if panel_link.count() == 0:
-                logger.error(f"Network interface panel link not found for {interface}")
+                logger.error("Network interface panel link not found for %s", interface)
                 return False
 
             # Check if panel is already expanded
@@ -409,7 +425,7 @@ class NetworkConfigPage(BasePage):
                 is_expanded = "in" in class_attr or "show" in class_attr
 
                 if not is_expanded:
-                    logger.info(f"Expanding network interface panel for {interface}")
+                    logger.info("Expanding network interface panel for %s", interface)
                     panel_link.click()
 
                     # Device-aware wait for expansion
@@ -422,25 +438,31 @@ class NetworkConfigPage(BasePage):
                     try:
                         expect(collapse_element).to_have_class("in", timeout=5000)
                         logger.info(
-                            f"Network interface panel {interface} expanded successfully"
+                            "Network interface panel %s expanded successfully",
+                            interface,
                         )
                         return True
                     except Exception as e:
                         logger.warning(
-                            f"Network interface panel {interface} may not have expanded: {e}"
+                            "Network interface panel %s may not have expanded: %s",
+                            interface,
+                            e,
                         )
                         return False
                 else:
-                    logger.info(f"Network interface panel {interface} already expanded")
+                    logger.info(
+                        "Network interface panel %s already expanded", interface
+                    )
                     return True
             else:
                 logger.error(
-                    f"Network interface collapse element not found: {interface}_collapse"
+                    "Network interface collapse element not found: %s_collapse",
+                    interface,
                 )
                 return False
 
         except Exception as e:
-            logger.error(f"Error expanding network interface panel {interface}: {e}")
+            logger.error("Error expanding network interface panel %s: %s", interface, e)
             return False
 
     def configure_network_interface(
@@ -462,7 +484,7 @@ class NetworkConfigPage(BasePage):
 
         if interface not in self.network_interfaces:
             logger.error(
-                f"Interface {interface} not available: {self.network_interfaces}"
+                "Interface %s not available: %s", interface, self.network_interfaces
             )
             return False
 
@@ -470,61 +492,42 @@ class NetworkConfigPage(BasePage):
             # Ensure panel is expanded first
             if not self.expand_network_interface_panel(interface):
                 logger.error(
-                    f"Cannot configure interface - failed to expand panel for {interface}"
+                    "Cannot configure interface - failed to expand panel for %s",
+                    interface,
                 )
                 return False
 
             # Device-aware timeout
             config_timeout = int(self.DEFAULT_TIMEOUT * self.timeout_multiplier)
 
-            success_count = 0
-
-            # Configure IP address if specified
+            # Map requested settings to interface fields and fill them in one batch
+            fields = {}
             if "ip_address" in config_data:
-                ip_field = self.page.locator(f"input[name='ip_{interface}']")
-                if ip_field.count() > 0:
-                    if self.safe_fill(
-                        ip_field, config_data["ip_address"], context=f"ip_{interface}"
-                    ):
-                        success_count += 1
-                    else:
-                        logger.warning(f"Failed to set IP address for {interface}")
-                else:
-                    logger.warning(f"IP address field not found for {interface}")
-
-            # Configure netmask if specified
+                fields[f"ip_{interface}"] = config_data["ip_address"]
             if "netmask" in config_data:
-                mask_field = self.page.locator(f"input[name='mask_{interface}']")
-                if mask_field.count() > 0:
-                    if self.safe_fill(
-                        mask_field, config_data["netmask"], context=f"mask_{interface}"
-                    ):
-                        success_count += 1
-                    else:
-                        logger.warning(f"Failed to set netmask for {interface}")
-                else:
-                    logger.warning(f"Netmask field not found for {interface}")
-
-            # Configure gateway if specified (eth0 only)
+                fields[f"mask_{interface}"] = config_data["netmask"]
             if "gateway" in config_data and interface == "eth0":
-                gateway_field = self.page.locator("input[name='gateway']")
-                if gateway_field.count() > 0:
-                    if self.safe_fill(
-                        gateway_field, config_data["gateway"], context="gateway"
-                    ):
-                        success_count += 1
-                    else:
-                        logger.warning(f"Failed to set gateway for {interface}")
-                else:
-                    logger.warning(f"Gateway field not found")
+                fields["gateway"] = config_data["gateway"]
+
+            results = self.fill_many(
+                fields, timeout=config_timeout, context=f"network_{interface}"
+            )
+            for name, result in results.items():
+                if not result["ok"]:
+                    logger.warning(
+                        "Failed to set %s for %s: %s", name, interface, result['status']
+                    )
+            success_count = sum(1 for result in results.values() if result["ok"])
 
             logger.info(
-                f"Network interface {interface} configuration: {success_count} fields set"
+                "Network interface %s configuration: %s fields set",
+                interface,
+                success_count,
             )
             return success_count > 0
 
         except Exception as e:
-            logger.error(f"Error configuring network interface {interface}: {e}")
+            logger.error("Error configuring network interface %s: %s", interface, e)
             return False
 
     def get_page_data(self) -> Dict[str, Any]:
@@ -571,12 +574,12 @@ class NetworkConfigPage(BasePage):
                 page_data["dhcp_enabled"] = dhcp_checkbox.is_checked()
 
             logger.info(
-                f"Extracted network configuration data: {len(page_data)} fields"
+                "Extracted network configuration data: %s fields", len(page_data)
             )
             return page_data
 
         except Exception as e:
-            logger.error(f"Error extracting network configuration data: {e}")
+            logger.error("Error extracting network configuration data: %s", e)
             return page_data
 
     def set_network_mode(self, mode: str) -> bool:
@@ -591,7 +594,7 @@ class NetworkConfigPage(BasePage):
         """
         if self.device_series != 2:
             logger.warning(
-                f"Network mode setting not applicable for Series {self.device_series}"
+                "Network mode setting not applicable for Series %s", self.device_series
             )
             return False
 
@@ -599,14 +602,14 @@ class NetworkConfigPage(BasePage):
             mode_select = self.page.locator("select[name='mode']")
             if mode_select.count() > 0:
                 mode_select.select_option(mode)
-                logger.info(f"Network mode set to: {mode}")
+                logger.info("Network mode set to: %s", mode)
                 return True
             else:
                 logger.error("Mode select element not found")
                 return False
 
         except Exception as e:
-            logger.error(f"Error setting network mode: {e}")
+            logger.error("Error setting network mode: %s", e)
             return False
 
     def configure_dhcp_mode(self, interface: str = "eth0") -> bool:
@@ -629,14 +632,14 @@ class NetworkConfigPage(BasePage):
                 if dhcp_checkbox.count() > 0:
                     if not dhcp_checkbox.is_checked():
                         dhcp_checkbox.click()
-                    logger.info(f"DHCP mode enabled for {interface}")
+                    logger.info("DHCP mode enabled for %s", interface)
                     return True
                 else:
-                    logger.warning(f"DHCP checkbox not found for {interface}")
+                    logger.warning("DHCP checkbox not found for %s", interface)
                     return False
 
         except Exception as e:
-            logger.error(f"Error configuring DHCP mode for {interface}: {e}")
+            logger.error("Error configuring DHCP mode for %s: %s", interface, e)
             return False
 
     def configure_static_ip(
@@ -660,30 +663,21 @@ class NetworkConfigPage(BasePage):
                 if not self.set_network_mode("static"):
                     return False
 
-                # Configure IP address
-                ip_field = self.page.locator("input[name='ipaddr']")
-                if ip_field.count() > 0 and not self.safe_fill(
-                    ip_field, ip_address, context="ipaddr"
-                ):
-                    logger.warning("Failed to set static IP address")
-                    return False
-
-                # Configure netmask
-                mask_field = self.page.locator("input[name='ipmask']")
-                if mask_field.count() > 0 and not self.safe_fill(
-                    mask_field, netmask, context="ipmask"
-                ):
-                    logger.warning("Failed to set static netmask")
-                    return False
-
-                # Configure gateway if provided
+                # Configure IP address, netmask and gateway (if provided) in one batch
+                fields = {"ipaddr": ip_address, "ipmask": netmask}
                 if gateway:
-                    gateway_field = self.page.locator("input[name='gateway']")
-                    if gateway_field.count() > 0 and not self.safe_fill(
-                        gateway_field, gateway, context="gateway"
-                    ):
-                        logger.warning("Failed to set gateway")
-                        return False
+                    fields["gateway"] = gateway
+                results = self.fill_many(fields, context="static_ip")
+
+                # Fields absent from this firmware's form are skipped, as before
+                failed = [
+                    name
+                    for name, result in results.items()
+                    if not result["ok"] and result["status"] != "not_found"
+                ]
+                if failed:
+                    logger.warning("Failed to set static IP fields: %s", failed)
+                    return False
 
                 logger.info("Series 2 static IP configuration completed")
                 return True
@@ -696,7 +690,7 @@ class NetworkConfigPage(BasePage):
                 )
 
         except Exception as e:
-            logger.error(f"Error configuring static IP for {interface}: {e}")
+            logger.error("Error configuring static IP for %s: %s", interface, e)
             return False
 
     def save_network_config(self, interface: str) -> bool:
@@ -715,55 +709,32 @@ class NetworkConfigPage(BasePage):
                 logger.error("Save button not found")
                 return False
 
-            # Device-aware timeout
-            save_timeout = int(self.DEFAULT_TIMEOUT * self.timeout_multiplier)
+            # Device-aware timeout, tightened from this device's save history
+            save_timeout = self.timeout_for(
+                save_operation("network"), int(self.DEFAULT_TIMEOUT * self.timeout_multiplier)
+            )
 
             logger.info(
-                f"Saving network configuration"
-                + (f" for {interface}" if interface else "")
+                "Saving network configuration%s", f" for {interface}" if interface else ""
             )
 
-            # Click save button
-            save_button.click()
-
-            # Wait for save operation with device-aware timeout
-            self.page.wait_for_load_state("networkidle", timeout=save_timeout)
-
-            # Additional wait for embedded device save processing
-            time.sleep(2 * self.timeout_multiplier)
-
-            # Verify save was successful (check for success message or absence of errors)
-            success_indicators = [
-                "input[name='message'][value*='success']",
-                ".alert-success",
-                "input[name='message'][value*='saved']",
-            ]
-
-            for indicator in success_indicators:
-                if self.page.locator(indicator).count() > 0:
-                    logger.info("Network configuration saved successfully")
-                    return True
-
-            # If no explicit success indicator, assume success if no error
-            error_indicators = [
-                "input[name='message'][value*='error']",
-                ".alert-danger",
-                "input[name='message'][value*='failed']",
-            ]
-
-            has_errors = any(
-                self.page.locator(error).count() > 0 for error in error_indicators
+            # Click save and wait for the device's response; the result
+            # carries any success or validation message the device rendered
+            result = self.click_save_and_wait(
+                save_button, section_context="network", timeout=save_timeout
             )
 
-            if not has_errors:
-                logger.info("Network configuration save completed (no errors detected)")
+            if result["ok"]:
+                logger.info("Network configuration saved in %.2fs", result["latency"])
+                if result["message"]:
+                    logger.info("Device message: %s", result["message"])
                 return True
             else:
-                logger.error("Network configuration save failed (errors detected)")
+                logger.error("Network configuration save failed: %s", result['message'])
                 return False
 
         except Exception as e:
-            logger.error(f"Error saving network configuration: {e}")
+            logger.error("Error saving network configuration: %s", e)
             return False
 
     def validate_network_config(self, expected_config: Dict[str, Any]) -> bool:
@@ -789,7 +760,9 @@ class NetworkConfigPage(BasePage):
                     != expected_config["device_series"]
                 ):
                     logger.error(
-                        f"Device series mismatch: expected {expected_config['device_series']}, got {current_config.get('device_series')}"
+                        "Device series mismatch: expected %s, got %s",
+                        expected_config['device_series'],
+                        current_config.get('device_series'),
                     )
                     validation_passed = False
 
@@ -797,7 +770,9 @@ class NetworkConfigPage(BasePage):
             if self.device_series == 2 and "mode" in expected_config:
                 if current_config.get("mode") != expected_config["mode"]:
                     logger.error(
-                        f"Network mode mismatch: expected {expected_config['mode']}, got {current_config.get('mode')}"
+                        "Network mode mismatch: expected %s, got %s",
+                        expected_config['mode'],
+                        current_config.get('mode'),
                     )
                     validation_passed = False
 
@@ -806,7 +781,10 @@ class NetworkConfigPage(BasePage):
                 if field.startswith("ip_") or field in ["gateway", "netmask"]:
                     if current_config.get(field) != expected_value:
                         logger.error(
-                            f"{field} mismatch: expected '{expected_value}', got '{current_config.get(field)}'"
+                            "%s mismatch: expected '%s', got '%s'",
+                            field,
+                            expected_value,
+                            current_config.get(field),
                         )
                         validation_passed = False
 
@@ -818,7 +796,7 @@ class NetworkConfigPage(BasePage):
             return validation_passed
 
         except Exception as e:
-            logger.error(f"Error validating network configuration: {e}")
+            logger.error("Error validating network configuration: %s", e)
             return False
 
     def reset_to_defaults(self, interface: str) -> bool:
@@ -833,8 +811,8 @@ class NetworkConfigPage(BasePage):
         """
         try:
             logger.info(
-                "Resetting network configuration to defaults"
-                + (f" for {interface}" if interface else "")
+                "Resetting network configuration to defaults%s",
+                f" for {interface}" if interface else "",
             )
 
             # This would typically involve clicking a reset/defaults button
@@ -846,7 +824,7 @@ class NetworkConfigPage(BasePage):
                 return self.configure_dhcp_mode("eth0")
 
         except Exception as e:
-            logger.error(f"Error resetting network configuration: {e}")
+            logger.error("Error resetting network configuration: %s", e)
             return False
 
     def get_network_status(self) -> Dict[str, Any]:
@@ -887,12 +865,12 @@ class NetworkConfigPage(BasePage):
 
             status["overall_status"] = "active"
             logger.info(
-                f"Network status retrieved for {len(status['interfaces'])} interfaces"
+                "Network status retrieved for %s interfaces", len(status['interfaces'])
             )
             return status
 
         except Exception as e:
-            logger.error(f"Error getting network status: {e}")
+            logger.error("Error getting network status: %s", e)
             status["overall_status"] = "error"
             return status
 
@@ -939,11 +917,11 @@ class NetworkConfigPage(BasePage):
                     if field.is_visible()
                 ]
 
-            logger.info(f"Firewall configuration: {firewall_config}")
+            logger.info("Firewall configuration: %s", firewall_config)
             return firewall_config
 
         except Exception as e:
-            logger.error(f"Error getting firewall configuration: {e}")
+            logger.error("Error getting firewall configuration: %s", e)
             return firewall_config
 
     def get_acl_configuration(self) -> Dict[str, Any]:
@@ -994,11 +972,11 @@ class NetworkConfigPage(BasePage):
                 if len(editable_rules) > 0:
                     acl_config["fields_editable"] = True
 
-            logger.info(f"ACL configuration: {acl_config}")
+            logger.info("ACL configuration: %s", acl_config)
             return acl_config
 
         except Exception as e:
-            logger.error(f"Error getting ACL configuration: {e}")
+            logger.error("Error getting ACL configuration: %s", e)
             return acl_config
 
     def get_port_security_configuration(self) -> Dict[str, Any]:
@@ -1049,11 +1027,11 @@ class NetworkConfigPage(BasePage):
                 if len(enabled_mac_filters) > 0:
                     port_security_config["fields_enabled"] = True
 
-            logger.info(f"Port security configuration: {port_security_config}")
+            logger.info("Port security configuration: %s", port_security_config)
             return port_security_config
 
         except Exception as e:
-            logger.error(f"Error getting port security configuration: {e}")
+            logger.error("Error getting port security configuration: %s", e)
             return port_security_config
 
     def get_interface_statistics_configuration(self) -> Dict[str, Any]:
@@ -1104,11 +1082,13 @@ class NetworkConfigPage(BasePage):
                 if len(enabled_links) > 0:
                     interface_stats_config["fields_enabled"] = True
 
-            logger.info(f"Interface statistics configuration: {interface_stats_config}")
+            logger.info(
+                "Interface statistics configuration: %s", interface_stats_config
+            )
             return interface_stats_config
 
         except Exception as e:
-            logger.error(f"Error getting interface statistics configuration: {e}")
+            logger.error("Error getting interface statistics configuration: %s", e)
             return interface_stats_config
 
     def get_link_status_monitoring_configuration(self) -> Dict[str, Any]:
@@ -1159,11 +1139,11 @@ class NetworkConfigPage(BasePage):
                 if len(visible_divs) > 0:
                     link_status_config["fields_visible"] = True
 
-            logger.info(f"Link status monitoring configuration: {link_status_config}")
+            logger.info("Link status monitoring configuration: %s", link_status_config)
             return link_status_config
 
         except Exception as e:
-            logger.error(f"Error getting link status monitoring configuration: {e}")
+            logger.error("Error getting link status monitoring configuration: %s", e)
             return link_status_config
 
     def get_network_diagnostics_configuration(self) -> Dict[str, Any]:
@@ -1233,12 +1213,12 @@ class NetworkConfigPage(BasePage):
                     network_diagnostics_config["fields_enabled"] = True
 
             logger.info(
-                f"Network diagnostics configuration: {network_diagnostics_config}"
+                "Network diagnostics configuration: %s", network_diagnostics_config
             )
             return network_diagnostics_config
 
         except Exception as e:
-            logger.error(f"Error getting network diagnostics configuration: {e}")
+            logger.error("Error getting network diagnostics configuration: %s", e)
             return network_diagnostics_config
 
     def get_vlan_creation_configuration(self) -> Dict[str, Any]:
@@ -1311,11 +1291,11 @@ class NetworkConfigPage(BasePage):
                     vlan_config["vlan_fields_found"] = True
                     vlan_config["global_vlan_fields"].append("vlan")
 
-            logger.info(f"VLAN creation configuration: {vlan_config}")
+            logger.info("VLAN creation configuration: %s", vlan_config)
             return vlan_config
 
         except Exception as e:
-            logger.error(f"Error getting VLAN creation configuration: {e}")
+            logger.error("Error getting VLAN creation configuration: %s", e)
             return vlan_config
 
     def test_vlan_id_range(self, port: str = None, vlan_ids: List[str] = None) -> bool:
@@ -1341,13 +1321,15 @@ class NetworkConfigPage(BasePage):
                         vlan_id_input.fill(vid)
                         actual_value = vlan_id_input.input_value()
                         if actual_value != vid:
-                            logger.warning(f"VLAN ID {vid} not set correctly on {port}")
+                            logger.warning(
+                                "VLAN ID %s not set correctly on %s", vid, port
+                            )
                             return False
-                    logger.info(f"VLAN ID range test passed on port {port}")
+                    logger.info("VLAN ID range test passed on port %s", port)
                     return True
                 else:
                     logger.warning(
-                        f"VLAN ID input not found or not visible on port {port}"
+                        "VLAN ID input not found or not visible on port %s", port
                     )
                     return False
             else:
@@ -1365,10 +1347,10 @@ class NetworkConfigPage(BasePage):
                             actual_value = vlan_id_input.input_value()
                             if actual_value != vid:
                                 logger.warning(
-                                    f"VLAN ID {vid} not set correctly on {port_name}"
+                                    "VLAN ID %s not set correctly on %s", vid, port_name
                                 )
                                 return False
-                        logger.info(f"VLAN ID range test passed on port {port_name}")
+                        logger.info("VLAN ID range test passed on port %s", port_name)
                         return True
 
                 # Try global VLAN fields
@@ -1378,7 +1360,7 @@ class NetworkConfigPage(BasePage):
                         global_vlan.first.fill(vid)
                         actual_value = global_vlan.first.input_value()
                         if actual_value != vid:
-                            logger.warning(f"Global VLAN ID {vid} not set correctly")
+                            logger.warning("Global VLAN ID %s not set correctly", vid)
                             return False
                     logger.info("Global VLAN ID range test passed")
                     return True
@@ -1387,7 +1369,7 @@ class NetworkConfigPage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Error testing VLAN ID range: {e}")
+            logger.error("Error testing VLAN ID range: %s", e)
             return False
 
     def get_vlan_port_assignment_configuration(self) -> Dict[str, Any]:
@@ -1439,12 +1421,12 @@ class NetworkConfigPage(BasePage):
                     vlan_port_assignment_config["fields_enabled"] = True
 
             logger.info(
-                f"VLAN port assignment configuration: {vlan_port_assignment_config}"
+                "VLAN port assignment configuration: %s", vlan_port_assignment_config
             )
             return vlan_port_assignment_config
 
         except Exception as e:
-            logger.error(f"Error getting VLAN port assignment configuration: {e}")
+            logger.error("Error getting VLAN port assignment configuration: %s", e)
             return vlan_port_assignment_config
 
     def get_vlan_trunking_configuration(self) -> Dict[str, Any]:
@@ -1495,17 +1477,17 @@ class NetworkConfigPage(BasePage):
                 if len(enabled_modes) > 0:
                     vlan_trunking_config["fields_enabled"] = True
 
-            logger.info(f"VLAN trunking configuration: {vlan_trunking_config}")
+            logger.info("VLAN trunking configuration: %s", vlan_trunking_config)
             return vlan_trunking_config
 
         except Exception as e:
-            logger.error(f"Error getting VLAN trunking configuration: {e}")
+            logger.error("Error getting VLAN trunking configuration: %s", e)
             return vlan_trunking_config
 
     def close(self):
         """Clean up resources."""
         try:
-            logger.info(f"NetworkConfigPageDevice closing for {self.device_model}")
+            logger.info("NetworkConfigPageDevice closing for %s", self.device_model)
             super().close()
         except Exception as e:
-            logger.error(f"Error closing NetworkConfigPageDevice: {e}")
+            logger.error("Error closing NetworkConfigPageDevice: %s", e)
@@ -20,6 +20,10 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any, Union
 import time
+from pages.timeout_policy import save_operation
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class OutputsConfigPage(BasePage):
@@ -47,9 +51,9 @@ class OutputsConfigPage(BasePage):
         # Set up device-aware expectations from capabilities database
         self._setup_expectations()
 
-        print(f"OutputsConfigPage initialized for {device_model}")
-        print(f"  Series: {self.get_device_series()}")
-        print(f"  Timeout multiplier: {self.timeout_multiplier}")
+        logger.info("OutputsConfigPage initialized for %s", device_model)
+        logger.info("  Series: %s", self.get_device_series())
+        logger.info("  Timeout multiplier: %s", self.timeout_multiplier)
 
     def _setup_expectations(self):
         """Set up device-aware expectations based on capabilities database."""
@@ -73,7 +77,7 @@ class OutputsConfigPage(BasePage):
                 self.has_extended_signal_types = False
                 self.supports_utc_local_selection = True
         except Exception as e:
-            print(f"Warning: Could not setup device-aware expectations: {e}")
+            logger.warning("Could not setup device-aware expectations: %s", e)
             self.expected_output_count = 2
             self.has_extended_signal_types = False
             self.supports_utc_local_selection = True
@@ -86,7 +90,7 @@ class OutputsConfigPage(BasePage):
             )
             return str(series) if series else "Unknown"
         except Exception as e:
-            print(f"Warning: Could not get device series: {e}")
+            logger.warning("Could not get device series: %s", e)
             return "Unknown"
 
     def validate_capabilities(self) -> bool:
@@ -100,7 +104,7 @@ class OutputsConfigPage(BasePage):
             bool: True if capabilities match, False if there are discrepancies
         """
         if not self.device_model:
-            print("No device model available for validation")
+            logger.info("No device model available for validation")
             return True
 
         try:
@@ -109,7 +113,9 @@ class OutputsConfigPage(BasePage):
             device_capabilities = DeviceCapabilities.get_capabilities(self.device_model)
 
             if not device_capabilities:
-                print(f"No capabilities found for device model: {self.device_model}")
+                logger.info(
+                    "No capabilities found for device model: %s", self.device_model
+                )
                 return False
 
             # Convert expected output_signal_types dict to expected count
@@ -117,19 +123,23 @@ class OutputsConfigPage(BasePage):
             expected_output_count = len(expected_signal_types)
             actual_output_count = actual_capabilities.get("output_channels", 0)
 
-            print(f"Validating {self.device_model} capabilities:")
-            print(
-                f"  Expected {expected_output_count} outputs, detected {actual_output_count}"
+            logger.info("Validating %s capabilities:", self.device_model)
+            logger.info(
+                "  Expected %s outputs, detected %s",
+                expected_output_count,
+                actual_output_count,
             )
 
             # Validate output count
             if expected_output_count != actual_output_count:
-                print(
-                    f"   Output count mismatch: expected {expected_output_count}, got {actual_output_count}"
+                logger.info(
+                    "   Output count mismatch: expected %s, got %s",
+                    expected_output_count,
+                    actual_output_count,
                 )
                 validation_passed = False
             else:
-                print("   Output count matches expected capabilities")
+                logger.info("   Output count matches expected capabilities")
 
             # Validate signal types for each expected channel
             for channel_num in range(1, expected_output_count + 1):
@@ -151,30 +161,36 @@ class OutputsConfigPage(BasePage):
                     actual_set = set(actual_signals)
 
                     if expected_set == actual_set:
-                        print(
-                            f"   Channel {channel_num}: signal types match ({len(expected_signals)} options)"
+                        logger.info(
+                            "   Channel %s: signal types match (%s options)",
+                            channel_num,
+                            len(expected_signals),
                         )
                     else:
-                        print(f"   Channel {channel_num}: signal types don't match")
-                        print(f"    Expected: {sorted(expected_set)}")
-                        print(f"    Actual: {sorted(actual_set)}")
+                        logger.info(
+                            "   Channel %s: signal types don't match", channel_num
+                        )
+                        logger.info("    Expected: %s", sorted(expected_set))
+                        logger.info("    Actual: %s", sorted(actual_set))
                         validation_passed = False
                 else:
-                    print(
-                        f"   Channel {channel_num}: not found on page (page has only {actual_output_count} channels)"
+                    logger.info(
+                        "   Channel %s: not found on page (page has only %s channels)",
+                        channel_num,
+                        actual_output_count,
                     )
                     validation_passed = False
 
             if validation_passed:
-                print("   Capability validation PASSED")
+                logger.info("   Capability validation PASSED")
             else:
-                print(
+                logger.info(
                     "   Capability validation FAILED - device layout doesn't match database"
                 )
             return validation_passed
 
         except Exception as e:
-            print(f"Error during capability validation: {e}")
+            logger.error("Error during capability validation: %s", e)
             return False
 
     def detect_output_capabilities(self) -> Dict[str, Any]:
@@ -200,12 +216,16 @@ class OutputsConfigPage(BasePage):
                 else:
                     break  # Stop when we hit first missing channel
 
-            print(f"Dynamic output detection: Found {output_count} output channels")
+            logger.info(
+                "Dynamic output detection: Found %s output channels", output_count
+            )
 
             # PROTECT AGAINST FALSE NEGATIVES: If finding 1 or fewer outputs,
             # wait for full page load before concluding (embedded device timing issues)
             if output_count <= 1:
-                print("Only found 1 or fewer outputs - waiting for full page load...")
+                logger.info(
+                    "Only found 1 or fewer outputs - waiting for full page load..."
+                )
 
                 # Wait for page loading to complete fully
                 self.wait_for_page_load(timeout=timeout)
@@ -220,8 +240,9 @@ class OutputsConfigPage(BasePage):
                     else:
                         break
 
-                print(
-                    f"After full load verification: Confirmed {output_count} output channels"
+                logger.info(
+                    "After full load verification: Confirmed %s output channels",
+                    output_count,
                 )
 
             # Detect signal capabilities for each available channel
@@ -252,13 +273,13 @@ class OutputsConfigPage(BasePage):
                 if channel_capabilities.get("extended_irig_available", False):
                     capabilities["extended_irig_available"] = True
 
-            print(
-                f" output capabilities: {output_count} channels with detected features"
+            logger.info(
+                " output capabilities: %s channels with detected features", output_count
             )
             return capabilities
 
         except Exception as e:
-            print(f"Error detecting output capabilities: {e}")
+            logger.error("Error detecting output capabilities: %s", e)
             return {"output_channels": 0, "error": str(e)}
 
     def _detect_channel_capabilities(self, channel: int) -> Dict[str, Any]:
@@ -316,7 +337,7 @@ class OutputsConfigPage(BasePage):
                         capabilities["supports_ppm"] = True
 
         except Exception as e:
-            print(f"Error detecting capabilities for channel {channel}: {e}")
+            logger.error("Error detecting capabilities for channel %s: %s", channel, e)
 
         return capabilities
 
@@ -336,13 +357,13 @@ class OutputsConfigPage(BasePage):
         if "Series 3" in device_series:
             save_button = self.page.locator("button#button_save")
             if save_button.count() > 0:
-                print("Using Series 3 button#button_save")
+                logger.info("Using Series 3 button#button_save")
                 return save_button
 
         # Fallback to Series 2 input element
         save_button = self.page.locator("input#button_save")
         if save_button.count() > 0:
-            print("Using Series 2 input#button_save")
+            logger.info("Using Series 2 input#button_save")
             return save_button
 
         # Final fallback - try by role and text
@@ -358,8 +379,9 @@ class OutputsConfigPage(BasePage):
             timeout = int(self.DEFAULT_TIMEOUT * self.timeout_multiplier)
             expect(signal1_select).to_be_visible(timeout=timeout)
 
-            print(
-                f"Outputs configuration page verification completed for {self.get_device_series()}"
+            logger.info(
+                "Outputs configuration page verification completed for %s",
+                self.get_device_series(),
             )
 
             # Additional verification: check output count matches expectations
@@ -370,12 +392,14 @@ class OutputsConfigPage(BasePage):
                 hasattr(self, "expected_output_count")
                 and actual_count != self.expected_output_count
             ):
-                print(
-                    f"Warning: Expected {self.expected_output_count} outputs, found {actual_count}"
+                logger.warning(
+                    "Expected %s outputs, found %s",
+                    self.expected_output_count,
+                    actual_count,
                 )
 
         except Exception as e:
-            print(f"Warning: Outputs config page verification failed: {e}")
+            logger.warning("Outputs config page verification failed: %s", e)
 
     def get_page_data(self) -> Dict[str, str]:
         """Extract outputs configuration data from the page."""
@@ -407,7 +431,7 @@ class OutputsConfigPage(BasePage):
                         break
 
         except Exception as e:
-            print(f"Error getting outputs configuration page data: {e}")
+            logger.error("Error getting outputs configuration page data: %s", e)
 
         return page_data
 
@@ -431,8 +455,11 @@ class OutputsConfigPage(BasePage):
             # Verify channel is valid for this device
             capabilities = self.detect_output_capabilities()
             if channel > capabilities["output_channels"]:
-                print(
-                    f"Error: Channel {channel} not available on {self.get_device_series()} (max: {capabilities['output_channels']})"
+                logger.error(
+                    "Error: Channel %s not available on %s (max: %s)",
+                    channel,
+                    self.get_device_series(),
+                    capabilities['output_channels'],
                 )
                 return False
 
@@ -460,14 +487,51 @@ class OutputsConfigPage(BasePage):
                 return False
 
             self.end_performance_tracking(f"configure_output_{channel}")
-            print(f"Output {channel} configured: {signal_type}, {time_reference}")
+            logger.info(
+                "Output %s configured: %s, %s", channel, signal_type, time_reference
+            )
             return True
 
         except Exception as e:
-            print(f"Error configuring output {channel}: {e}")
+            logger.error("Error configuring output %s: %s", channel, e)
             self.end_performance_tracking(f"configure_output_{channel}")
             return False
 
+    def configure_outputs(self, outputs: Dict[int, Dict[str, str]]) -> bool:
+        """
+        Configure several output channels and save them in one save cycle.
+
+        Args:
+            outputs: Mapping of channel number to {"signal_type": ..., "time_reference": ...};
+                time_reference defaults to UTC
+
+        Returns:
+            True if all channels were applied, saved and read back, False otherwise
+        """
+        capabilities = self.detect_output_capabilities()
+        invalid = [ch for ch in outputs if ch > capabilities["output_channels"]]
+        if invalid:
+            logger.error(
+                "Error: Channels %s not available on %s (max: %s)",
+                invalid,
+                self.get_device_series(),
+                capabilities['output_channels'],
+            )
+            return False
+
+        with self.changes("outputs") as tx:
+            for channel, settings in outputs.items():
+                tx.set(f"signal{channel}", settings["signal_type"])
+                tx.set(f"time{channel}", settings.get("time_reference", "UTC"))
+
+        if not tx.ok:
+            logger.error(
+                "Error configuring outputs %s: %s",
+                list(outputs),
+                tx.errors or tx.mismatches,
+            )
+        return tx.ok
+
     def save_configuration_with_modification(
         self,
         channel: int = 1,
@@ -506,25 +570,26 @@ class OutputsConfigPage(BasePage):
                                 break
 
                         if signal_type_modified:
-                            print(
-                                f"CRITICAL FIX: Modifying signal{channel} from {signal_type_original} to {signal_type_modified} to enable save button"
+                            logger.info(
+                                "CRITICAL FIX: Modifying signal%s from %s to %s to enable save button",
+                                channel,
+                                signal_type_original,
+                                signal_type_modified,
                             )
 
-                            # Make the configuration change
+                            # Make the configuration change; save_configuration()
+                            # waits for the save button to become enabled
                             if not self.configure_output(channel, signal_type_modified):
-                                print(
+                                logger.error(
                                     "Failed to modify configuration - cannot enable save button"
                                 )
                                 return False
 
-                            # Allow JavaScript to process the change and enable save button
-                            time.sleep(2)
-
             # Now attempt to save with the enabled button
             return self.save_configuration()
 
         except Exception as e:
-            print(f"Error saving outputs configuration with modification: {e}")
+            logger.error("Error saving outputs configuration with modification: %s", e)
             return False
 
     def save_configuration(self) -> bool:
@@ -532,24 +597,29 @@ class OutputsConfigPage(BasePage):
         try:
             # Use  save button detection with device-aware patterns
             save_button = self.get_save_button_locator()
-            timeout = int(self.DEFAULT_TIMEOUT * self.timeout_multiplier * 2)
+            timeout = self.timeout_for(
+                save_operation("outputs"), int(self.DEFAULT_TIMEOUT * self.timeout_multiplier * 2)
+            )
 
             if save_button.count() > 0:
-                if self.safe_click(
-                    save_button, context="save_outputs_config", timeout=timeout
-                ):
-                    time.sleep(1)
-                    print("Outputs configuration saved successfully")
+                result = self.click_save_and_wait(
+                    save_button, section_context="outputs", timeout=timeout
+                )
+                if result["ok"]:
+                    logger.info("Outputs configuration saved successfully")
                     return True
                 else:
-                    print("Error: Could not click save button on outputs config page")
+                    logger.error(
+                        "Error: Outputs configuration save failed: %s",
+                        result['message'],
+                    )
                     return False
             else:
-                print("Error: Save button not found on outputs config page")
+                logger.error("Error: Save button not found on outputs config page")
                 return False
 
         except Exception as e:
-            print(f"Error saving outputs configuration: {e}")
+            logger.error("Error saving outputs configuration: %s", e)
             return False
 
     def get_available_signal_types(self, channel: int = 1) -> list:
@@ -567,7 +637,7 @@ class OutputsConfigPage(BasePage):
                     signal_types.append({"value": value, "text": text})
 
         except Exception as e:
-            print(f"Error getting available signal types: {e}")
+            logger.error("Error getting available signal types: %s", e)
 
         return signal_types
 
@@ -584,7 +654,7 @@ class OutputsConfigPage(BasePage):
                 self.verify_page_loaded()
 
         except Exception as e:
-            print(f"Error navigating to outputs configuration page: {e}")
+            logger.error("Error navigating to outputs configuration page: %s", e)
 
     def configure_all_outputs(
         self, signal_types: List[str], time_references: Optional[List[str]] = None
@@ -607,12 +677,17 @@ class OutputsConfigPage(BasePage):
             max_channels = capabilities["output_channels"]
 
             if len(signal_types) != len(time_references):
-                print("Error: signal_types and time_references must have same length")
+                logger.error(
+                    "Error: signal_types and time_references must have same length"
+                )
                 return False
 
             if len(signal_types) > max_channels:
-                print(
-                    f"Error: Cannot configure {len(signal_types)} channels on {self.get_device_series()} (max: {max_channels})"
+                logger.error(
+                    "Error: Cannot configure %s channels on %s (max: %s)",
+                    len(signal_types),
+                    self.get_device_series(),
+                    max_channels,
                 )
                 return False
 
@@ -623,12 +698,12 @@ class OutputsConfigPage(BasePage):
                 if self.configure_output(i, signal_type, time_ref):
                     success_count += 1
                 else:
-                    print(f"Failed to configure output {i}")
+                    logger.error("Failed to configure output %s", i)
 
             return success_count == len(signal_types)
 
         except Exception as e:
-            print(f"Error configuring all outputs: {e}")
+            logger.error("Error configuring all outputs: %s", e)
             return False
 
     def get_all_signal_types_by_channel(self) -> Dict[str, list]:
@@ -643,6 +718,6 @@ class OutputsConfigPage(BasePage):
                 )
 
         except Exception as e:
-            print(f"Error getting signal types for all channels: {e}")
+            logger.error("Error getting signal types for all channels: %s", e)
 
         return all_types
@@ -35,6 +35,9 @@ from typing import Dict, Optional, List, Any
 import time
 
 from .ptp_profile_manager import PTPProfileManager
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class PTPConfigPage(BasePage):
@@ -63,8 +66,12 @@ class PTPConfigPage(BasePage):
         )
         self._available_ports = None  # Cache for available ports
 
-        print(
-            f"PTPConfigPage initialized for {device_series} (IP: {device_ip}, model: {device_model}, PTP supported: {self.ptp_supported})"
+        logger.info(
+            "PTPConfigPage initialized for %s (IP: %s, model: %s, PTP supported: %s)",
+            device_series,
+            device_ip,
+            device_model,
+            self.ptp_supported,
         )
 
     def validate_capabilities(self) -> bool:
@@ -78,7 +85,7 @@ class PTPConfigPage(BasePage):
             bool: True if capabilities match, False if there are discrepancies
         """
         if not self.device_model:
-            print("No device model available for validation")
+            logger.info("No device model available for validation")
             return True
 
         try:
@@ -91,8 +98,10 @@ class PTPConfigPage(BasePage):
             actual_ptp_support = self.ptp_supported
 
             if expected_ptp_support != actual_ptp_support:
-                print(
-                    f"  WARNING: PTP support mismatch - expected {expected_ptp_support}, got {actual_ptp_support}"
+                logger.warning(
+                    "  PTP support mismatch - expected %s, got %s",
+                    expected_ptp_support,
+                    actual_ptp_support,
                 )
                 validation_passed = False
 
@@ -104,33 +113,41 @@ class PTPConfigPage(BasePage):
             actual_ports_sorted = sorted(actual_ports)
 
             if expected_ports_sorted != actual_ports_sorted:
-                print(
-                    f"  WARNING: PTP ports mismatch - expected {expected_ports_sorted}, got {actual_ports_sorted}"
+                logger.warning(
+                    "  PTP ports mismatch - expected %s, got %s",
+                    expected_ports_sorted,
+                    actual_ports_sorted,
                 )
                 validation_passed = False
             else:
-                print(
-                    f"  RESULT: PTP ports match ({len(actual_ports)} ports available) - {actual_ports_sorted}"
+                logger.info(
+                    "  RESULT: PTP ports match (%s ports available) - %s",
+                    len(actual_ports),
+                    actual_ports_sorted,
                 )
 
             # Validate PTP profile capabilities if device supports PTP
             if self.ptp_supported and expected_ptp_support:
                 # This would be a more detailed validation - simplified for now
-                print(
-                    f"  RESULT: PTP profiles validation completed for {self.device_model}"
+                logger.info(
+                    "  RESULT: PTP profiles validation completed for %s",
+                    self.device_model,
                 )
 
             if validation_passed:
-                print(f"PTP capability validation PASSED for {self.device_model}")
+                logger.info(
+                    "PTP capability validation PASSED for %s", self.device_model
+                )
             else:
-                print(
-                    f"PTP capability validation FAILED for {self.device_model} - some mismatches detected"
+                logger.info(
+                    "PTP capability validation FAILED for %s - some mismatches detected",
+                    self.device_model,
                 )
 
             return validation_passed
 
         except Exception as e:
-            print(f"Error during PTP capability validation: {e}")
+            logger.error("Error during PTP capability validation: %s", e)
             return False
 
     def is_series3_device(self) -> bool:
@@ -161,8 +178,9 @@ class PTPConfigPage(BasePage):
             # Check if PTP is supported on this device
             if not self.ptp_supported:
                 self._available_ports = []
-                print(
-                    f"PTP not supported on {self.device_model} - no PTP ports available"
+                logger.info(
+                    "PTP not supported on %s - no PTP ports available",
+                    self.device_model,
                 )
                 return self._available_ports
 
@@ -171,23 +189,27 @@ class PTPConfigPage(BasePage):
                 available_ports = DeviceCapabilities.get_ptp_interfaces(
                     self.device_model
                 )
-                print(
-                    f"Using DeviceCapabilities data for {self.device_model}: {available_ports}"
+                logger.info(
+                    "Using DeviceCapabilities data for %s: %s",
+                    self.device_model,
+                    available_ports,
                 )
             else:
                 # Fallback for unknown device model
                 available_ports = []
-                print(f"Unknown device model - no PTP ports available")
+                logger.info("Unknown device model - no PTP ports available")
 
             self._available_ports = available_ports
-            print(
-                f"PTP port detection result: {len(available_ports)} ports - {available_ports}"
+            logger.info(
+                "PTP port detection result: %s ports - %s",
+                len(available_ports),
+                available_ports,
             )
 
             return self._available_ports
 
         except Exception as e:
-            print(f"Error getting PTP ports from DeviceCapabilities: {e}")
+            logger.error("Error getting PTP ports from DeviceCapabilities: %s", e)
             # Safe fallback - return empty list
             return []
 
@@ -203,7 +225,7 @@ class PTPConfigPage(BasePage):
                 "ptp_supported": self.ptp_supported,
             }
         except Exception as e:
-            print(f"Error getting device capabilities: {e}")
+            logger.error("Error getting device capabilities: %s", e)
             return {
                 "ethernet_ports": [],
                 "supports_all_ports": False,
@@ -216,8 +238,10 @@ class PTPConfigPage(BasePage):
         try:
             # FIXED: Check if PTP is supported on this device
             if not self.ptp_supported:
-                print(
-                    f"PTP not supported on {self.device_series}/{self.device_model} - skipping verification"
+                logger.info(
+                    "PTP not supported on %s/%s - skipping verification",
+                    self.device_series,
+                    self.device_model,
                 )
                 return
 
@@ -240,12 +264,14 @@ class PTPConfigPage(BasePage):
                     "No PTP profile selectors found - page may not be fully loaded or PTP not enabled"
                 )
 
-            print(
-                f"PTP configuration page verification completed for {self.device_series}/{self.device_model}"
+            logger.info(
+                "PTP configuration page verification completed for %s/%s",
+                self.device_series,
+                self.device_model,
             )
 
         except Exception as e:
-            print(f"Warning: PTP config page verification failed: {e}")
+            logger.warning("PTP config page verification failed: %s", e)
 
     def _expand_single_panel(self, port: str) -> bool:
         """Expand a single PTP panel for the specified port."""
@@ -268,16 +294,16 @@ class PTPConfigPage(BasePage):
                     # Verify expansion worked
                     profile_select = self.page.locator(f"select#{port}_profile")
                     if profile_select.is_visible():
-                        print(f"PTP panel {port} expanded successfully")
+                        logger.info("PTP panel %s expanded successfully", port)
                         return True
 
                 except Exception as e:
-                    print(f"Warning: Bootstrap expansion failed for {port}: {e}")
+                    logger.warning("Bootstrap expansion failed for %s: %s", port, e)
 
             return False
 
         except Exception as e:
-            print(f"Error expanding panel for {port}: {e}")
+            logger.error("Error expanding panel for %s: %s", port, e)
             return False
 
     def configure_ptp_profile(self, port: str, profile: str) -> bool:
@@ -293,13 +319,15 @@ class PTPConfigPage(BasePage):
         """
         try:
             if not self.ptp_supported:
-                print(f"PTP not supported on {self.device_series} devices")
+                logger.info("PTP not supported on %s devices", self.device_series)
                 return False
 
             available_ports = self.get_available_ports()
             if port not in available_ports:
-                print(
-                    f"Port {port} not available on this device. Available ports: {available_ports}"
+                logger.info(
+                    "Port %s not available on this device. Available ports: %s",
+                    port,
+                    available_ports,
                 )
                 return False
 
@@ -307,9 +335,11 @@ class PTPConfigPage(BasePage):
             profile_select = self.page.locator(f"select#{port}_profile")
 
             if not profile_select.is_visible():
-                print(f"PTP panel for {port} is not visible - expanding panel first...")
+                logger.info(
+                    "PTP panel for %s is not visible - expanding panel first...", port
+                )
                 if not self._expand_single_panel(port):
-                    print(f"Failed to expand PTP panel for {port}")
+                    logger.error("Failed to expand PTP panel for %s", port)
                     return False
 
                 time.sleep(1)
@@ -324,11 +354,11 @@ class PTPConfigPage(BasePage):
             # Wait for field state changes to complete
             time.sleep(2)
 
-            print(f"PTP profile configured for {port}: {profile}")
+            logger.info("PTP profile configured for %s: %s", port, profile)
             return True
 
         except Exception as e:
-            print(f"Error configuring PTP profile for {port}: {e}")
+            logger.error("Error configuring PTP profile for %s: %s", port, e)
             return False
 
     def save_port_configuration(self, port: str) -> bool:
@@ -343,13 +373,15 @@ class PTPConfigPage(BasePage):
         """
         try:
             if not self.ptp_supported:
-                print(f"PTP not supported on {self.device_series} devices")
+                logger.info("PTP not supported on %s devices", self.device_series)
                 return False
 
             available_ports = self.get_available_ports()
             if port not in available_ports:
-                print(
-                    f"Port {port} not available on this device. Available ports: {available_ports}"
+                logger.info(
+                    "Port %s not available on this device. Available ports: %s",
+                    port,
+                    available_ports,
                 )
                 return False
 
@@ -359,23 +391,26 @@ class PTPConfigPage(BasePage):
             )
 
             if save_button.is_visible():
-                print(f"Clicking save button for {port}...")
-
-                if not self.safe_click(save_button, context=f"save_{port}"):
+                logger.info("Clicking save button for %s...", port)
+
+                result = self.click_save_and_wait(save_button, section_context="ptp")
+                if not result["ok"]:
+                    logger.info(
+                        "PTP configuration save failed for %s: %s",
+                        port,
+                        result['message'],
+                    )
                     return False
 
-                # Wait for save operation to complete
-                time.sleep(2)
-
-                print(f"PTP configuration saved for {port}")
+                logger.info("PTP configuration saved for %s", port)
                 return True
 
             else:
-                print(f"Save button not found for port {port}")
+                logger.info("Save button not found for port %s", port)
                 return False
 
         except Exception as e:
-            print(f"Error saving PTP configuration for {port}: {e}")
+            logger.error("Error saving PTP configuration for %s: %s", port, e)
             return False
 
     def expand_all_ptp_panels(self) -> int:
@@ -390,35 +425,39 @@ class PTPConfigPage(BasePage):
         """
         try:
             if not self.ptp_supported:
-                print(f"PTP not supported - cannot expand panels")
+                logger.info("PTP not supported - cannot expand panels")
                 return 0
 
             available_ports = self.get_available_ports()
             if not available_ports:
-                print(f"No PTP ports available for panel expansion")
+                logger.info("No PTP ports available for panel expansion")
                 return 0
 
             expanded_count = 0
-            print(f"Expanding PTP panels for ports: {available_ports}")
+            logger.info("Expanding PTP panels for ports: %s", available_ports)
 
             for port in available_ports:
                 try:
                     if self._expand_single_panel(port):
                         expanded_count += 1
-                        print(f" PTP panel {port} expanded successfully")
+                        logger.info(" PTP panel %s expanded successfully", port)
                     else:
-                        print(f" PTP panel {port} expansion failed or already expanded")
+                        logger.info(
+                            " PTP panel %s expansion failed or already expanded", port
+                        )
                 except Exception as e:
-                    print(f" Error expanding panel for {port}: {e}")
+                    logger.error(" Error expanding panel for %s: %s", port, e)
                     continue
 
-            print(
-                f"PTP panel expansion complete: {expanded_count}/{len(available_ports)} panels expanded"
+            logger.info(
+                "PTP panel expansion complete: %s/%s panels expanded",
+                expanded_count,
+                len(available_ports),
             )
             return expanded_count
 
         except Exception as e:
-            print(f"Error during PTP panel expansion: {e}")
+            logger.error("Error during PTP panel expansion: %s", e)
             return 0
 
     def expand_ptp_interface_panel(self, interface: str) -> bool:
@@ -433,51 +472,61 @@ class PTPConfigPage(BasePage):
         """
         try:
             if not self.ptp_supported:
-                print(
-                    f"PTP not supported - cannot expand panel for interface {interface}"
+                logger.info(
+                    "PTP not supported - cannot expand panel for interface %s",
+                    interface,
                 )
                 return False
 
             available_ports = self.get_available_ports()
             if interface not in available_ports:
-                print(
-                    f"Interface {interface} not available for PTP. Available: {available_ports}"
+                logger.info(
+                    "Interface %s not available for PTP. Available: %s",
+                    interface,
+                    available_ports,
                 )
                 return False
 
-            print(f"Expanding PTP panel for interface {interface}...")
+            logger.info("Expanding PTP panel for interface %s...", interface)
 
             # Try to expand the panel
             expansion_success = self._expand_single_panel(interface)
 
             if expansion_success:
-                print(f" PTP panel for interface {interface} expanded successfully")
+                logger.info(
+                    " PTP panel for interface %s expanded successfully", interface
+                )
                 return True
             else:
                 # Panel might already be expanded or expansion failed
                 # Check if the profile selector is already visible
                 profile_select = self.page.locator(f"select#{interface}_profile")
                 if profile_select.is_visible():
-                    print(f" PTP panel for interface {interface} was already expanded")
+                    logger.info(
+                        " PTP panel for interface %s was already expanded", interface
+                    )
                     return True
                 else:
-                    print(f" PTP panel for interface {interface} expansion failed")
+                    logger.info(
+                        " PTP panel for interface %s expansion failed", interface
+                    )
                     return False
 
         except Exception as e:
-            print(f"Error expanding PTP panel for interface {interface}: {e}")
+            logger.error("Error expanding PTP panel for interface %s: %s", interface, e)
             return False
 
     def navigate_to_page(self):
         """Navigate to PTP configuration page."""
         try:
             if not self.ptp_supported:
-                print(
-                    f"PTP not supported on {self.device_series} devices - navigation skipped"
+                logger.info(
+                    "PTP not supported on %s devices - navigation skipped",
+                    self.device_series,
                 )
                 return
 
-            print(f"Navigating to PTP configuration page...")
+            logger.info("Navigating to PTP configuration page...")
 
             # Note: Device has link with text "PTP"
             ptp_link = self.page.get_by_role("link", name="PTP")
@@ -489,7 +538,7 @@ class PTPConfigPage(BasePage):
                 time.sleep(2)
 
                 self.verify_page_loaded()
-                print("Successfully navigated to PTP configuration page")
+                logger.info("Successfully navigated to PTP configuration page")
 
         except Exception as e:
-            print(f"Error navigating to PTP configuration page: {e}")
+            logger.error("Error navigating to PTP configuration page: %s", e)
@@ -11,6 +11,9 @@ Provides:
 """
 
 from typing import Dict, Any, Optional
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class PTPProfileManager:
@@ -159,21 +162,25 @@ class PTPProfileManager:
             profiles = self.profile_data.get("profiles", {})
 
             if profile_name not in profiles:
-                print(f"Profile '{profile_name}' not found, defaulting to editable")
+                logger.info(
+                    "Profile '%s' not found, defaulting to editable", profile_name
+                )
                 return False
 
             profile_config = profiles[profile_name]
 
             if field_name not in profile_config:
-                print(
-                    f"Field '{field_name}' not found in profile '{profile_name}', defaulting to editable"
+                logger.info(
+                    "Field '%s' not found in profile '%s', defaulting to editable",
+                    field_name,
+                    profile_name,
                 )
                 return False
 
             return profile_config[field_name].get("grayedout", False)
 
         except Exception as e:
-            print(f"Error checking field readonly status: {e}")
+            logger.error("Error checking field readonly status: %s", e)
             return False
 
     def get_profile_constraints(self, profile_name: str) -> Dict[str, Any]:
@@ -190,13 +197,15 @@ class PTPProfileManager:
             profiles = self.profile_data.get("profiles", {})
 
             if profile_name not in profiles:
-                print(f"Profile '{profile_name}' not found")
+                logger.info("Profile '%s' not found", profile_name)
                 return {}
 
             return profiles[profile_name]
 
         except Exception as e:
-            print(f"Error getting profile constraints for '{profile_name}': {e}")
+            logger.error(
+                "Error getting profile constraints for '%s': %s", profile_name, e
+            )
             return {}
 
     def get_available_profiles(self) -> list[str]:
@@ -210,7 +219,7 @@ class PTPProfileManager:
             profiles = self.profile_data.get("profiles", {})
             return list(profiles.keys())
         except Exception as e:
-            print(f"Error getting available profiles: {e}")
+            logger.error("Error getting available profiles: %s", e)
             return []
 
     def validate_profile_exists(self, profile_name: str) -> bool:
@@ -227,7 +236,7 @@ class PTPProfileManager:
             profiles = self.profile_data.get("profiles", {})
             return profile_name in profiles
         except Exception as e:
-            print(f"Error validating profile existence: {e}")
+            logger.error("Error validating profile existence: %s", e)
             return False
 
     def get_field_default_value(
@@ -249,7 +258,10 @@ class PTPProfileManager:
                 return field_config.get("defaultValue")
             return None
         except Exception as e:
-            print(
-                f"Error getting default value for field '{field_name}' in profile '{profile_name}': {e}"
+            logger.error(
+                "Error getting default value for field '%s' in profile '%s': %s",
+                field_name,
+                profile_name,
+                e,
             )
             return None
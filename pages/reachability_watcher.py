@@ -0,0 +1,351 @@
+"""
+Reachability watcher for Kronos devices.
+
+Network, HTTPS enforcement and firmware changes can restart the unit. Rather
+than waiting out long navigation timeouts, the watcher polls cheap signals
+concurrently (TCP connect on 443 and 80, an HTTP HEAD on the web UI over
+HTTPS or plain HTTP, an NTP query) several times a second, detects down/up transitions within about a
+second, and re-establishes the status login and configuration unlock so a
+test can resume.
+
+Usage:
+    watcher = ReachabilityWatcher("172.16.190.46")
+    network_config_page.save_network_config("eth0")
+    if watcher.wait_for_restart(down_timeout=15)["restarted"]:
+        watcher.resume(page, base_url, device_password, return_url=f"{base_url}/network")
+"""
+
+import http.client
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.sync_api import Page
+
+from pages.configuration_unlock_page import ConfigurationUnlockPage
+from pages.login_page import LoginPage
+
+try:
+    import ntplib
+except ImportError:  # NTP probe is optional
+    ntplib = None
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReachabilityWatcher:
+    """
+    Watches device reachability with concurrent lightweight probes.
+
+    "Up" means the web UI answers over HTTPS or HTTP; "down" means no probe answers at all.
+    Anything in between (e.g. NTP answering while the web server starts) is
+    reported as "starting".
+    """
+
+    def __init__(
+        self,
+        device_ip: str,
+        interval: float = 0.25,
+        probe_timeout: float = 1.0,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            device_ip: Device IP address (with or without scheme)
+            interval: Seconds between probe rounds
+            probe_timeout: Timeout in seconds for each individual probe
+        """
+        self.device_ip = device_ip.replace("https://", "").replace("http://", "").strip("/")
+        self.interval = interval
+        self.probe_timeout = probe_timeout
+        self.probes: Dict[str, Callable[[], bool]] = {
+            "tcp_443": lambda: self._tcp_probe(443),
+            "tcp_80": lambda: self._tcp_probe(80),
+            "http_head": self._http_head_probe,
+        }
+        if ntplib is not None:
+            self.probes["ntp"] = self._ntp_probe
+
+        self.state: Optional[str] = None
+        self.last_results: Dict[str, bool] = {}
+        self.transitions: List[Dict[str, Any]] = []
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.probes), thread_name_prefix="reachability"
+        )
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # Probes
+
+    def _tcp_probe(self, port: int) -> bool:
+        try:
+            with socket.create_connection((self.device_ip, port), timeout=self.probe_timeout):
+                return True
+        except OSError:
+            return False
+
+    def _http_head_probe(self) -> bool:
+        # Units with HTTPS disabled or broken still serve the UI over HTTP
+        return self._head_probe(https=True) or self._head_probe(https=False)
+
+    def _head_probe(self, https: bool) -> bool:
+        if https:
+            connection = http.client.HTTPSConnection(
+                self.device_ip,
+                443,
+                timeout=self.probe_timeout,
+                context=ssl._create_unverified_context(),
+            )
+        else:
+            connection = http.client.HTTPConnection(
+                self.device_ip, 80, timeout=self.probe_timeout
+            )
+        try:
+            connection.request("HEAD", "/")
+            connection.getresponse()
+            return True
+        except (OSError, http.client.HTTPException):
+            return False
+        finally:
+            connection.close()
+
+    def _ntp_probe(self) -> bool:
+        try:
+            ntplib.NTPClient().request(self.device_ip, version=3, timeout=self.probe_timeout)
+            return True
+        except (ntplib.NTPException, OSError):
+            return False
+
+    def probe_once(self) -> Dict[str, bool]:
+        """
+        Run all probes concurrently.
+
+        Returns:
+            Dictionary of probe name -> answered
+        """
+        futures = {name: self._executor.submit(probe) for name, probe in self.probes.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    @staticmethod
+    def classify(results: Dict[str, bool]) -> str:
+        """Classify probe results as "up", "starting" or "down"."""
+        if results.get("http_head"):
+            return "up"
+        if any(results.values()):
+            return "starting"
+        return "down"
+
+    # Background monitoring
+
+    def _record(self, results: Dict[str, bool]):
+        state = self.classify(results)
+        with self._changed:
+            self.last_results = results
+            if state != self.state:
+                self.transitions.append(
+                    {"time": time.time(), "from": self.state, "to": state, "probes": results}
+                )
+                if self.state is not None:
+                    logger.info(
+                        "Device %s reachability: %s -> %s",
+                        self.device_ip,
+                        self.state,
+                        state,
+                    )
+                self.state = state
+            self._changed.notify_all()
+
+    def _run(self):
+        while not self._stop.is_set():
+            round_start = time.time()
+            self._record(self.probe_once())
+            self._stop.wait(max(0.0, self.interval - (time.time() - round_start)))
+
+    def start(self) -> "ReachabilityWatcher":
+        """Start background monitoring (idempotent)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"reachability-{self.device_ip}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop background monitoring."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.probe_timeout * 2)
+            self._thread = None
+
+    def close(self):
+        """Stop monitoring and release probe threads."""
+        self.stop()
+        self._executor.shutdown(wait=False)
+
+    # Waiting
+
+    def wait_for_state(
+        self, states: List[str], timeout: float, since: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Wait until the device enters one of the given states.
+
+        Args:
+            states: Acceptable states ("up", "starting", "down")
+            timeout: Maximum seconds to wait
+            since: Also accept a transition into the state recorded after
+                this time, even if the state has changed again since
+
+        Returns:
+            Time the state was observed, or None on timeout
+        """
+        self.start()
+        deadline = time.time() + timeout
+        with self._changed:
+            while True:
+                if since is not None:
+                    for transition in self.transitions:
+                        if transition["time"] >= since and transition["to"] in states:
+                            return transition["time"]
+                if self.state in states:
+                    return time.time()
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def is_up(self) -> bool:
+        """
+        Check right now whether the web UI answers, on either scheme.
+
+        Only the HTTP probe decides "up", so the other probes are not run
+        (a filtered port would otherwise add a full probe timeout).
+        """
+        return self._http_head_probe()
+
+    def wait_until_up(self, timeout: float = 300.0) -> bool:
+        """
+        Wait until the web UI answers again.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Background monitoring started for the wait is stopped again when it
+        returns; monitoring that was already running keeps running.
+
+        Returns:
+            True if the device is up
+        """
+        monitoring = self._thread is not None and self._thread.is_alive()
+        try:
+            return self.wait_for_state(["up"], timeout) is not None
+        finally:
+            if not monitoring:
+                self.stop()
+
+    def wait_for_restart(
+        self,
+        down_timeout: float = 30.0,
+        up_timeout: float = 300.0,
+        since: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for a restart: the device going down and coming back up.
+
+        Args:
+            down_timeout: Seconds to wait for the device to go down
+            up_timeout: Seconds to wait for it to come back after going down
+            since: Count a down transition observed after this time (use the
+                time the restart was triggered if monitoring already ran)
+
+        Returns:
+            Dictionary with restarted, came_back, downtime and total seconds
+        """
+        start = since or time.time()
+        result = {"restarted": False, "came_back": True, "downtime": None, "total": None}
+
+        down_at = self.wait_for_state(["down"], down_timeout, since=start)
+        if down_at is None:
+            logger.info(
+                "Device %s did not go down within %ss", self.device_ip, down_timeout
+            )
+            return result
+
+        result["restarted"] = True
+        up_at = self.wait_for_state(["up"], up_timeout, since=down_at)
+        result["came_back"] = up_at is not None
+        if up_at is not None:
+            result["downtime"] = up_at - down_at
+            result["total"] = up_at - start
+            logger.info(
+                "Device %s restarted: down %.1fs, back %.1fs after trigger",
+                self.device_ip,
+                result['downtime'],
+                result['total'],
+            )
+        else:
+            logger.info(
+                "Device %s did not come back within %ss", self.device_ip, up_timeout
+            )
+        return result
+
+    # Resuming
+
+    def resume(
+        self,
+        page: Page,
+        base_url: str,
+        password: str,
+        unlock: bool = True,
+        return_url: Optional[str] = None,
+        device_model: Optional[str] = None,
+    ) -> bool:
+        """
+        Re-establish authentication after a restart and return to the test page.
+
+        Args:
+            page: Playwright page of the running test
+            base_url: Device base URL
+            password: Device password
+            unlock: Also unlock configuration
+            return_url: URL to navigate back to once authenticated
+            device_model: Hardware model for device-aware page objects
+
+        Returns:
+            True if the session was re-established
+        """
+        try:
+            if not self.wait_until_up(timeout=300):
+                return False
+
+            page.goto(base_url, wait_until="domcontentloaded")
+            login_page = LoginPage(page)
+            if not login_page.login(password=password):
+                logger.warning("Re-authentication after restart failed")
+                return False
+            login_page.wait_for_satellite_loading()
+
+            if unlock:
+                unlock_page = ConfigurationUnlockPage(page, device_model=device_model)
+                if not unlock_page.unlock_configuration(password=password):
+                    logger.warning("Configuration unlock after restart failed")
+                    return False
+
+            if return_url:
+                page.goto(return_url, wait_until="domcontentloaded")
+
+            logger.info("Session re-established after device restart")
+            return True
+
+        except Exception as e:
+            logger.error("Error resuming after device restart: %s", e)
+            return False
@@ -0,0 +1,224 @@
+"""
+Background keepalive for device web sessions.
+
+Device sessions expire after DeviceCapabilities.get_session_timeout()
+minutes (30 on current firmware). Long-lived contexts then hit the
+``#modal-user-session-expire`` modal and must redo the status login and
+configuration unlock. The keepalive copies a context's session cookies
+into a DeviceHttpSession and, from a background thread, sends one cheap
+authenticated GET per session every ``fraction`` x timeout, so the device
+never sees the session idle for long.
+
+The sync Playwright API cannot be used from other threads, so refreshes go
+over plain HTTP with the browser's cookies; call register() again after
+anything that changes them (configuration unlock, re-login).
+
+Usage:
+    keepalive = get_session_keepalive()
+    keepalive.register(page.context, "172.16.66.6", timeout_minutes=30)
+    ...
+    keepalive.session_age(page.context)   # seconds since login
+    keepalive.unregister(page.context)
+"""
+
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Optional
+
+from pages.device_http import CONFIG_PASSWORD_FIELD, STATUS_PASSWORD_FIELD, DeviceHttpSession
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIMEOUT_MINUTES = 30
+DEFAULT_FRACTION = 0.5
+
+# Smallest authenticated pages: a config page while unlocked, else the
+# status page. Both refresh the session they belong to.
+CONFIG_KEEPALIVE_PATH = "/contact"
+STATUS_KEEPALIVE_PATH = "/"
+
+
+def _login_form(status: int, body: str, final_url: str, field: str) -> bool:
+    """True if the response is (or redirected to) a login form."""
+    path = urllib.parse.urlparse(final_url).path
+    return status == 200 and (path in ("/authenticate", "/login") or f'name="{field}"' in body)
+
+
+class _KeptSession:
+    """Keepalive state of one browser context."""
+
+    def __init__(self, name: str, http: DeviceHttpSession, interval: float, path: str):
+        self.name = name
+        self.http = http
+        self.interval = interval
+        self.path = path
+        self.started = time.time()
+        self.last_refresh = self.started
+        self.refreshes = 0
+        self.expired = False
+
+
+class SessionKeepalive:
+    """Refreshes registered device sessions from one background thread."""
+
+    def __init__(self, fraction: float = DEFAULT_FRACTION, poll_interval: float = 5.0):
+        """
+        Initialize keepalive.
+
+        Args:
+            fraction: Refresh after this fraction of the session timeout
+            poll_interval: How often the thread checks for due sessions (seconds)
+        """
+        if not 0 < fraction < 1:
+            raise ValueError(f"Keepalive fraction must be between 0 and 1, got {fraction}")
+        self.fraction = fraction
+        self.poll_interval = poll_interval
+        self.stats = {"registered": 0, "refreshes": 0, "expired": 0}
+        self._sessions: Dict[Any, _KeptSession] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        context,
+        device_ip: str,
+        timeout_minutes: Optional[float] = None,
+        config_unlocked: bool = False,
+        name: Optional[str] = None,
+    ):
+        """
+        Start (or update) keeping a context's session alive.
+
+        Must be called on the thread that owns the context. Session age is
+        kept when an already registered context is registered again.
+
+        Args:
+            context: Playwright BrowserContext, logged in
+            device_ip: Device IP address
+            timeout_minutes: Device session timeout (default 30)
+            config_unlocked: Configuration is unlocked; refresh via a config page
+            name: Label for logs (default: device IP)
+        """
+        http = DeviceHttpSession(device_ip, timeout=10.0)
+        http.set_cookies(context.cookies())
+        interval = (timeout_minutes or DEFAULT_TIMEOUT_MINUTES) * 60 * self.fraction
+        path = CONFIG_KEEPALIVE_PATH if config_unlocked else STATUS_KEEPALIVE_PATH
+        with self._lock:
+            previous = self._sessions.get(context)
+            kept = _KeptSession(name or device_ip, http, interval, path)
+            if previous is not None:
+                kept.started = previous.started
+                kept.refreshes = previous.refreshes
+            else:
+                self.stats["registered"] += 1
+            self._sessions[context] = kept
+        self._ensure_thread()
+
+    def unregister(self, context):
+        """Stop keeping a context's session alive (call before closing the context)."""
+        with self._lock:
+            self._sessions.pop(context, None)
+
+    def session_age(self, context) -> Optional[float]:
+        """Seconds since the context's session was registered, or None."""
+        with self._lock:
+            kept = self._sessions.get(context)
+        return time.time() - kept.started if kept else None
+
+    def sessions(self) -> Dict[str, Dict[str, Any]]:
+        """Age, seconds since last refresh and refresh count per live session."""
+        now = time.time()
+        with self._lock:
+            kept_sessions = list(self._sessions.values())
+        return {
+            kept.name: {
+                "age": now - kept.started,
+                "since_refresh": now - kept.last_refresh,
+                "refreshes": kept.refreshes,
+                "expired": kept.expired,
+            }
+            for kept in kept_sessions
+        }
+
+    def _refresh(self, kept: _KeptSession):
+        status, body, final_url = kept.http.request("GET", kept.path)
+        if kept.path != STATUS_KEEPALIVE_PATH and _login_form(
+            status, body, final_url, CONFIG_PASSWORD_FIELD
+        ):
+            # Configuration lock timed out; keep the status session alive
+            kept.path = STATUS_KEEPALIVE_PATH
+            status, body, final_url = kept.http.request("GET", kept.path)
+        kept.last_refresh = time.time()
+        if status == 0:
+            logger.warning("Session keepalive could not reach %s", kept.name)
+        elif status != 200 or _login_form(status, body, final_url, STATUS_PASSWORD_FIELD):
+            kept.expired = True
+            self.stats["expired"] += 1
+            logger.warning("Session on %s expired before keepalive (HTTP %s)", kept.name, status)
+        else:
+            kept.refreshes += 1
+            self.stats["refreshes"] += 1
+            logger.debug("Session kept alive: %s (%s)", kept.name, kept.path)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            now = time.time()
+            with self._lock:
+                due = [
+                    kept
+                    for kept in self._sessions.values()
+                    if not kept.expired and now - kept.last_refresh >= kept.interval
+                ]
+            for kept in due:
+                try:
+                    self._refresh(kept)
+                except Exception as e:
+                    logger.error("Error refreshing session on %s: %s", kept.name, e)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="session-keepalive", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop the background thread and forget all sessions."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+        with self._lock:
+            self._sessions.clear()
+
+
+_keepalive: Optional[SessionKeepalive] = None
+
+
+def configure_session_keepalive(fraction: float = DEFAULT_FRACTION) -> SessionKeepalive:
+    """Replace the process-wide keepalive."""
+    global _keepalive
+    if _keepalive is not None:
+        _keepalive.close()
+    _keepalive = SessionKeepalive(fraction=fraction)
+    return _keepalive
+
+
+def get_session_keepalive() -> SessionKeepalive:
+    """Return the process-wide keepalive, creating a default one if needed."""
+    global _keepalive
+    if _keepalive is None:
+        _keepalive = SessionKeepalive()
+    return _keepalive
+
+
+def close_session_keepalive() -> Dict[str, int]:
+    """Stop the process-wide keepalive and return its counters."""
+    global _keepalive
+    keepalive, _keepalive = _keepalive, None
+    if keepalive is None:
+        return {}
+    keepalive.close()
+    return keepalive.stats
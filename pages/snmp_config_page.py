@@ -16,6 +16,9 @@ import pytest
 from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class SNMPConfigPage(BasePage):
@@ -52,7 +55,7 @@ class SNMPConfigPage(BasePage):
             self.available_sections = []
         if self.device_model == 2:
             pytest.skip("SNMP not supported on Series 2 devices")
-        print(f"SNMPConfigPage initialized for {self.device_model or 'Unknown'}")
+        logger.info("SNMPConfigPage initialized for %s", self.device_model or 'Unknown')
 
     def validate_capabilities(self) -> bool:
         """
@@ -68,7 +71,7 @@ class SNMPConfigPage(BasePage):
             # Check if SNMP section is available
             return self.is_section_available("snmp")
         except Exception as e:
-            print(f"SNMPConfigPage: Error validating capabilities: {e}")
+            logger.error("SNMPConfigPage: Error validating capabilities: %s", e)
             return False
 
     def verify_page_loaded(self) -> bool:
@@ -97,7 +100,7 @@ class SNMPConfigPage(BasePage):
             return self.validate_page_loaded()
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error verifying page loaded: {e}")
+            logger.error("SNMPConfigPage: Error verifying page loaded: %s", e)
             return False
 
     def get_page_data(self) -> Dict[str, Any]:
@@ -123,7 +126,7 @@ class SNMPConfigPage(BasePage):
             return page_data
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting page data: {e}")
+            logger.error("SNMPConfigPage: Error getting page data: %s", e)
             return {"error": str(e)}
 
     def get_snmp_settings(self) -> Dict[str, Any]:
@@ -161,7 +164,7 @@ class SNMPConfigPage(BasePage):
             return settings
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting SNMP settings: {e}")
+            logger.error("SNMPConfigPage: Error getting SNMP settings: %s", e)
             return {"error": str(e)}
 
     def set_snmp_community(self, community: str, version: str = "v2c") -> bool:
@@ -191,16 +194,18 @@ class SNMPConfigPage(BasePage):
                         element = elements.nth(i)
                         if element.is_visible():
                             element.fill(community)
-                            print(f"SNMPConfigPage: Set community string: {community}")
+                            logger.info(
+                                "SNMPConfigPage: Set community string: %s", community
+                            )
                             return True
                 except:
                     continue
 
-            print("SNMPConfigPage: No community field found")
+            logger.info("SNMPConfigPage: No community field found")
             return False
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error setting SNMP community: {e}")
+            logger.error("SNMPConfigPage: Error setting SNMP community: %s", e)
             return False
 
     def get_snmp_traps(self) -> Dict[str, Any]:
@@ -237,7 +242,7 @@ class SNMPConfigPage(BasePage):
             return traps
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting SNMP traps: {e}")
+            logger.error("SNMPConfigPage: Error getting SNMP traps: %s", e)
             return {"error": str(e)}
 
     def configure_snmp_trap(self, trap_config: Dict[str, Any]) -> bool:
@@ -277,11 +282,11 @@ class SNMPConfigPage(BasePage):
                 if configured:
                     break
 
-            print(f"SNMPConfigPage: Trap configuration result: {configured}")
+            logger.info("SNMPConfigPage: Trap configuration result: %s", configured)
             return configured
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error configuring SNMP trap: {e}")
+            logger.error("SNMPConfigPage: Error configuring SNMP trap: %s", e)
             return False
 
     def navigate_to_page(self) -> bool:
@@ -292,7 +297,9 @@ class SNMPConfigPage(BasePage):
             bool: True if navigation successful, False otherwise
         """
         try:
-            print(f"SNMPConfigPage: Navigating to SNMP config for {self.device_model}")
+            logger.info(
+                "SNMPConfigPage: Navigating to SNMP config for %s", self.device_model
+            )
 
             # Try navigation patterns
             nav_selectors = [
@@ -313,11 +320,11 @@ class SNMPConfigPage(BasePage):
                     continue
 
             # If no navigation found, assume already on page
-            print("SNMPConfigPage: No navigation link found, assuming on page")
+            logger.info("SNMPConfigPage: No navigation link found, assuming on page")
             return True
 
         except Exception as e:
-            print(f"SNMPConfigPage: Navigation error: {e}")
+            logger.info("SNMPConfigPage: Navigation error: %s", e)
             return False
 
     def save_configuration(self) -> bool:
@@ -331,15 +338,18 @@ class SNMPConfigPage(BasePage):
             # Use base class save button detection
             save_button = self.find_save_button()
             if save_button:
-                save_button.click()
-                print("SNMPConfigPage: Configuration saved")
-                return True
-
-            print("SNMPConfigPage: No save button found")
+                result = self.click_save_and_wait(save_button, section_context="snmp")
+                if result["ok"]:
+                    logger.info("SNMPConfigPage: Configuration saved")
+                else:
+                    logger.warning("SNMPConfigPage: Save failed: %s", result['message'])
+                return result["ok"]
+
+            logger.info("SNMPConfigPage: No save button found")
             return False
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error saving configuration: {e}")
+            logger.error("SNMPConfigPage: Error saving configuration: %s", e)
             return False
 
     def get_community_strings(self) -> List[str]:
@@ -376,7 +386,7 @@ class SNMPConfigPage(BasePage):
             return communities
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting community strings: {e}")
+            logger.error("SNMPConfigPage: Error getting community strings: %s", e)
             return []
 
     def get_trap_configuration(self) -> Dict[str, Any]:
@@ -413,7 +423,7 @@ class SNMPConfigPage(BasePage):
             return config_data
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting trap configuration: {e}")
+            logger.error("SNMPConfigPage: Error getting trap configuration: %s", e)
             return {"error": str(e)}
 
     def get_configuration_options(self) -> List[str]:
@@ -469,7 +479,7 @@ class SNMPConfigPage(BasePage):
             return options
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting configuration options: {e}")
+            logger.error("SNMPConfigPage: Error getting configuration options: %s", e)
             return []
 
     def get_save_button_locator(self) -> Optional[Locator]:
@@ -506,7 +516,7 @@ class SNMPConfigPage(BasePage):
             return None
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting save button: {e}")
+            logger.error("SNMPConfigPage: Error getting save button: %s", e)
             return None
 
     def is_section_available(self, section_name: str = "snmp") -> bool:
@@ -521,7 +531,7 @@ class SNMPConfigPage(BasePage):
         """
         try:
             if not self.device_model:
-                print(
+                logger.info(
                     "SNMPConfigPage: No device model available, assuming section available"
                 )
                 return True
@@ -533,7 +543,7 @@ class SNMPConfigPage(BasePage):
             return "snmp" in available_sections
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error checking section availability: {e}")
+            logger.error("SNMPConfigPage: Error checking section availability: %s", e)
             return True  # Default to available for backward compatibility
 
     def test_section_access_pure(self) -> Dict[str, Any]:
@@ -568,11 +578,11 @@ class SNMPConfigPage(BasePage):
                 except Exception as e:
                     result["error"] = str(e)
 
-            print(f"SNMPConfigPage: Section access test result: {result}")
+            logger.info("SNMPConfigPage: Section access test result: %s", result)
             return result
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error in section access test: {e}")
+            logger.error("SNMPConfigPage: Error in section access test: %s", e)
             return {"section_name": "SNMP", "accessible": False, "error": str(e)}
 
     def get_snmp_version_options(self) -> List[str]:
@@ -591,7 +601,7 @@ class SNMPConfigPage(BasePage):
                 return [opt.strip() for opt in options if opt.strip()]
             return []
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting SNMP version options: {e}")
+            logger.error("SNMPConfigPage: Error getting SNMP version options: %s", e)
             return []
 
     # DeviceCapabilities encapsulation methods
@@ -616,7 +626,7 @@ class SNMPConfigPage(BasePage):
                 return DeviceCapabilities.get_timeout_multiplier(self.device_model)
             return 1.0
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting timeout multiplier: {e}")
+            logger.error("SNMPConfigPage: Error getting timeout multiplier: %s", e)
             return 1.0
 
     def get_interface_specific_save_button(
@@ -639,7 +649,7 @@ class SNMPConfigPage(BasePage):
                 )
             return {"selector": "button#button_save"}  # Default fallback
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting save button config: {e}")
+            logger.error("SNMPConfigPage: Error getting save button config: %s", e)
             return {"selector": "button#button_save"}
 
     def get_capabilities(self):
@@ -663,7 +673,7 @@ class SNMPConfigPage(BasePage):
                 return DeviceCapabilities.get_device_info(self.device_model)
             return {}
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting device info: {e}")
+            logger.error("SNMPConfigPage: Error getting device info: %s", e)
             return {}
 
     def get_performance_expectations(self):
@@ -680,7 +690,9 @@ class SNMPConfigPage(BasePage):
                 )
             return {}
         except Exception as e:
-            print(f"SNMPConfigPage: Error getting performance expectations: {e}")
+            logger.error(
+                "SNMPConfigPage: Error getting performance expectations: %s", e
+            )
             return {}
 
     def has_capability(self, capability: str) -> bool:
@@ -698,7 +710,9 @@ class SNMPConfigPage(BasePage):
                 return DeviceCapabilities.has_capability(self.device_model, capability)
             return False
         except Exception as e:
-            print(f"SNMPConfigPage: Error checking capability {capability}: {e}")
+            logger.error(
+                "SNMPConfigPage: Error checking capability %s: %s", capability, e
+            )
             return False
 
     def is_ptp_supported(self) -> bool:
@@ -713,7 +727,7 @@ class SNMPConfigPage(BasePage):
                 return DeviceCapabilities.is_ptp_supported(self.device_model)
             return False
         except Exception as e:
-            print(f"SNMPConfigPage: Error checking PTP support: {e}")
+            logger.error("SNMPConfigPage: Error checking PTP support: %s", e)
             return False
 
     def test_snmp_configuration_validation(self) -> Dict[str, Any]:
@@ -787,11 +801,15 @@ class SNMPConfigPage(BasePage):
             except Exception as e:
                 results["cross_validation"] = {"error": str(e)}
 
-            print(f"SNMP configuration validation completed for {self.device_model}")
+            logger.info(
+                "SNMP configuration validation completed for %s", self.device_model
+            )
             return results
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error in SNMP configuration validation: {e}")
+            logger.error(
+                "SNMPConfigPage: Error in SNMP configuration validation: %s", e
+            )
             return {"error": str(e)}
 
     def get_device_capabilities_summary(self) -> Dict[str, Any]:
@@ -814,11 +832,15 @@ class SNMPConfigPage(BasePage):
                 "ptp_supported": self.is_ptp_supported(),
             }
 
-            print(f"Device capabilities summary generated for {self.device_model}")
+            logger.info(
+                "Device capabilities summary generated for %s", self.device_model
+            )
             return summary
 
         except Exception as e:
-            print(f"SNMPConfigPage: Error generating device capabilities summary: {e}")
+            logger.error(
+                "SNMPConfigPage: Error generating device capabilities summary: %s", e
+            )
             return {"error": str(e)}
 
     def validate_snmp_against_device_capabilities(self) -> Dict[str, Any]:
@@ -890,13 +912,16 @@ class SNMPConfigPage(BasePage):
                     "No performance data available"
                 )
 
-            print(
-                f"SNMP validation completed for {self.device_model}: {validation_results['overall_status']}"
+            logger.info(
+                "SNMP validation completed for %s: %s",
+                self.device_model,
+                validation_results['overall_status'],
             )
             return validation_results
 
         except Exception as e:
-            print(
-                f"SNMPConfigPage: Error validating SNMP against device capabilities: {e}"
+            logger.error(
+                "SNMPConfigPage: Error validating SNMP against device capabilities: %s",
+                e,
             )
             return {"error": str(e), "overall_status": "ERROR"}
@@ -15,9 +15,9 @@ from playwright.sync_api import Page, expect
 from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, List, Any
-import logging
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class SyslogConfigPage(BasePage):
@@ -31,7 +31,7 @@ class SyslogConfigPage(BasePage):
     def __init__(self, page: Page, device_model: Optional[str] = None):
         super().__init__(page, device_model)
 
-        logger.info(f"SyslogConfigPage initialized: {self.device_model}")
+        logger.info("SyslogConfigPage initialized: %s", self.device_model)
 
     # ========================================================================
     #  SYSLOG CONFIGURATION METHODS
@@ -102,7 +102,7 @@ class SyslogConfigPage(BasePage):
             return syslog_config if syslog_config else None
 
         except Exception as e:
-            logger.warning(f"Error getting syslog configuration: {e}")
+            logger.warning("Error getting syslog configuration: %s", e)
             return None
 
     def configure_syslog_server(self, server_name: str, server_value: str) -> bool:
@@ -124,21 +124,21 @@ class SyslogConfigPage(BasePage):
                 server_field = self.page.locator(f"input[name*='{server_name}']")
 
             if server_field.count() == 0:
-                logger.error(f"Syslog server field {server_name} not found")
+                logger.error("Syslog server field %s not found", server_name)
                 return False
 
             # Set the server value
             if self.safe_fill(
                 server_field.first, server_value, context=f"syslog_server_{server_name}"
             ):
-                logger.info(f"Syslog server {server_name} set to: {server_value}")
+                logger.info("Syslog server %s set to: %s", server_name, server_value)
                 return True
             else:
-                logger.warning(f"Failed to set syslog server {server_name}")
+                logger.warning("Failed to set syslog server %s", server_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error configuring syslog server {server_name}: {e}")
+            logger.error("Error configuring syslog server %s: %s", server_name, e)
             return False
 
     def configure_syslog_facility(
@@ -161,7 +161,7 @@ class SyslogConfigPage(BasePage):
                 facility_field = self.page.locator(f"input[name='{facility_name}']")
 
             if facility_field.count() == 0:
-                logger.error(f"Syslog facility field {facility_name} not found")
+                logger.error("Syslog facility field %s not found", facility_name)
                 return False
 
             # Set the facility value
@@ -170,14 +170,16 @@ class SyslogConfigPage(BasePage):
                 facility_value,
                 context=f"syslog_facility_{facility_name}",
             ):
-                logger.info(f"Syslog facility {facility_name} set to: {facility_value}")
+                logger.info(
+                    "Syslog facility %s set to: %s", facility_name, facility_value
+                )
                 return True
             else:
-                logger.warning(f"Failed to set syslog facility {facility_name}")
+                logger.warning("Failed to set syslog facility %s", facility_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error configuring syslog facility {facility_name}: {e}")
+            logger.error("Error configuring syslog facility %s: %s", facility_name, e)
             return False
 
     def validate_syslog_accessibility(self) -> bool:
@@ -205,7 +207,7 @@ class SyslogConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.warning(f"Error validating syslog accessibility: {e}")
+            logger.warning("Error validating syslog accessibility: %s", e)
             return False
 
     # ========================================================================
@@ -241,7 +243,7 @@ class SyslogConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.error(f"Syslog config page verification failed: {e}")
+            logger.error("Syslog config page verification failed: %s", e)
             return False
 
     def navigate_to_page(self) -> bool:
@@ -270,5 +272,5 @@ class SyslogConfigPage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Error navigating to syslog configuration page: {e}")
+            logger.error("Error navigating to syslog configuration page: %s", e)
             return False
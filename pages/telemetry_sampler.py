@@ -0,0 +1,493 @@
+"""
+Dashboard telemetry sampler for Kronos devices.
+
+DashboardPage's getters are one-shot scrapes. TelemetrySampler polls the
+dashboard tables at a fixed rate over a long window through the lightest
+available path - one bulk evaluate on an open dashboard page
+(DashboardPage.get_all_tables), or a direct HTTP GET of the status page
+parsed without a browser - and keeps the samples in fixed-size NumPy ring
+buffers, so hours of telemetry fit in bounded memory.
+
+Analytics over the buffered window:
+- C/N0 statistics per satellite (mean, std, min, max, percentiles, visibility)
+- GNSS lock/loss and satellite acquired/lost events (recorded as samples
+  arrive, so they survive ring buffer wrap-around)
+- Used/tracked satellite count and mean C/N0 trends (least-squares slope)
+
+Usage:
+    sampler = TelemetrySampler.from_page(logged_in_page, interval=1.0, capacity=3600)
+    sampler.run(duration=600)
+    summary = sampler.summary()
+
+    # Without a browser, in a background thread
+    sampler = TelemetrySampler.from_session(session, interval=5.0, capacity=17280).start()
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+from playwright.sync_api import Page
+
+from pages.dashboard_page import DashboardPage
+from pages.device_http import DeviceHttpSession, parse_tables
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+TablesSource = Callable[[], List[List[List[str]]]]
+
+# Dashboard table positions (see DashboardPage)
+GNSS_TABLE = 1
+SATELLITE_TABLE = 3
+
+LOCKED_STATE = "LOCKED"
+
+# PRN / slot numbers per constellation a receiver can report
+CONSTELLATION_PRNS = {
+    "GPS": 32,
+    "GLONASS": 24,
+    "Galileo": 36,
+    "BeiDou": 63,
+    "QZSS": 10,
+    "SBAS": 39,
+    "NavIC": 14,
+}
+# Every satellite of every constellation fits at once
+MAX_SATELLITES = sum(CONSTELLATION_PRNS.values())
+MAX_EVENTS = 10000
+
+NUMBER_PATTERN = re.compile(r"[-+]?\d+(?:\.\d+)?")
+ACCURACY_UNITS = {"ps": 1e-3, "ns": 1.0, "us": 1e3, "µs": 1e3, "ms": 1e6}
+
+
+def parse_accuracy_ns(text: str) -> float:
+    """Parse a time accuracy like "4 ns" or "1.2 us" into nanoseconds (NaN if unknown)."""
+    match = NUMBER_PATTERN.search(text or "")
+    if not match:
+        return float("nan")
+    unit = (text[match.end():].strip().split() or ["ns"])[0].lower()
+    return float(match.group()) * ACCURACY_UNITS.get(unit, 1.0)
+
+
+def parse_sv_counts(text: str) -> List[int]:
+    """Parse "Used / tracked SVs" like "25 / 28" into [used, tracked] (-1 if unknown)."""
+    numbers = [int(float(n)) for n in NUMBER_PATTERN.findall(text or "")]
+    return (numbers + [-1, -1])[:2]
+
+
+class TelemetryRing:
+    """
+    Fixed-capacity ring buffers of dashboard samples.
+
+    Scalars are stored in 1-D arrays; per-satellite C/N0 in a capacity x
+    MAX_SATELLITES matrix (NaN when a satellite is not tracked). Satellites
+    are assigned columns on first sight. When all columns are taken, the
+    column of a satellite not seen within the buffered window is recycled;
+    only when none is idle is the new satellite counted in
+    dropped_satellites.
+    """
+
+    def __init__(self, capacity: int, max_satellites: int = MAX_SATELLITES):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.locked = np.zeros(capacity, dtype=bool)
+        self.accuracy_ns = np.full(capacity, np.nan, dtype=np.float32)
+        self.used = np.full(capacity, -1, dtype=np.int16)
+        self.tracked = np.full(capacity, -1, dtype=np.int16)
+        self.cn0 = np.full((capacity, max_satellites), np.nan, dtype=np.float32)
+        self.in_use = np.zeros((capacity, max_satellites), dtype=bool)
+        self.satellite_columns: Dict[str, int] = {}
+        self.column_satellites: Dict[int, str] = {}
+        # Sample index each column last had data at
+        self.last_seen = np.full(max_satellites, -1, dtype=np.int64)
+        self.dropped_satellites = 0
+        self.count = 0  # Total samples ever appended
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def column(self, satellite: str) -> Optional[int]:
+        """Column for a satellite key, assigning (or recycling) one on first sight."""
+        column = self.satellite_columns.get(satellite)
+        if column is not None:
+            return column
+        if len(self.satellite_columns) < self.cn0.shape[1]:
+            column = len(self.satellite_columns)
+        else:
+            # Idle: last data in a row that has been overwritten (or is
+            # being overwritten by the current sample)
+            column = int(np.argmin(self.last_seen))
+            if self.last_seen[column] > self.count - self.capacity:
+                self.dropped_satellites += 1
+                return None
+            del self.satellite_columns[self.column_satellites[column]]
+        self.satellite_columns[satellite] = column
+        self.column_satellites[column] = satellite
+        return column
+
+    def append(self, sample: Dict[str, Any]):
+        """Append a parsed sample, overwriting the oldest when full."""
+        slot = self.count % self.capacity
+        self.timestamps[slot] = sample["time"]
+        self.locked[slot] = sample["locked"]
+        self.accuracy_ns[slot] = sample["accuracy_ns"]
+        self.used[slot], self.tracked[slot] = sample["used"], sample["tracked"]
+        self.cn0[slot] = np.nan
+        self.in_use[slot] = False
+        for satellite, (cn0, in_use) in sample["satellites"].items():
+            column = self.column(satellite)
+            if column is not None:
+                self.cn0[slot, column] = cn0
+                self.in_use[slot, column] = in_use
+                self.last_seen[column] = self.count
+        self.count += 1
+
+    def ordered(self, array: np.ndarray) -> np.ndarray:
+        """Return the buffered rows of an array in chronological order."""
+        if self.count <= self.capacity:
+            return array[: self.count]
+        start = self.count % self.capacity
+        return np.concatenate((array[start:], array[:start]))
+
+
+class TelemetrySampler:
+    """Polls dashboard telemetry into a TelemetryRing and analyzes it."""
+
+    def __init__(
+        self,
+        source: TablesSource,
+        interval: float = 1.0,
+        capacity: int = 3600,
+        wait: Optional[Callable[[float], None]] = None,
+        label: str = "dashboard",
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            source: Callable returning the dashboard tables (lists of rows)
+            interval: Seconds between samples
+            capacity: Samples kept in the ring buffer (window = capacity x interval)
+            wait: Sleep function between samples (default time.sleep)
+            label: Source description for logs
+        """
+        self.source = source
+        self.interval = interval
+        self.ring = TelemetryRing(capacity)
+        self.wait = wait or time.sleep
+        self.label = label
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=MAX_EVENTS)
+        self.errors = 0
+        self.sample_seconds: Deque[float] = deque(maxlen=1000)
+
+        self._previous: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_page(
+        cls, page: Page, device_model: Optional[str] = None, **kwargs
+    ) -> "TelemetrySampler":
+        """
+        Sample an open dashboard page with one evaluate per sample.
+
+        The page must stay on the dashboard; run() must be called from the
+        test thread (the Playwright sync API is not thread-safe).
+        """
+        dashboard = DashboardPage(page, device_model)
+        return cls(
+            dashboard.get_all_tables,
+            wait=lambda seconds: page.wait_for_timeout(seconds * 1000),
+            label="dashboard evaluate",
+            **kwargs,
+        )
+
+    @classmethod
+    def from_session(cls, session: DeviceHttpSession, **kwargs) -> "TelemetrySampler":
+        """Sample the status page over HTTP; safe to run in a background thread."""
+
+        def fetch() -> List[List[List[str]]]:
+            status, body = session.get("/")
+            return parse_tables(body) if status == 200 else []
+
+        return cls(fetch, label=f"HTTP {session.device_ip}", **kwargs)
+
+    # Sampling
+
+    @staticmethod
+    def parse(tables: List[List[List[str]]], timestamp: float) -> Optional[Dict[str, Any]]:
+        """
+        Parse dashboard tables into a sample.
+
+        Returns:
+            Sample dictionary, or None if the GNSS table is missing
+        """
+        if len(tables) <= GNSS_TABLE:
+            return None
+        gnss = {row[0]: row[1] for row in tables[GNSS_TABLE] if len(row) >= 2}
+        used, tracked = parse_sv_counts(gnss.get("Used / tracked SVs", ""))
+        state = gnss.get("GNSS state", "")
+
+        satellites = {}
+        if len(tables) > SATELLITE_TABLE and tables[SATELLITE_TABLE]:
+            headers = tables[SATELLITE_TABLE][0]
+            for row in tables[SATELLITE_TABLE][1:]:
+                if len(row) != len(headers):
+                    continue
+                satellite = dict(zip(headers, row))
+                key = f"{satellite.get('Constellation', '?')}:{satellite.get('Id', '?')}"
+                match = NUMBER_PATTERN.search(satellite.get("C/No", ""))
+                cn0 = float(match.group()) if match else float("nan")
+                satellites[key] = (cn0, satellite.get("State", "").lower() == "in use")
+
+        return {
+            "time": timestamp,
+            "state": state,
+            "locked": state.upper() == LOCKED_STATE,
+            "antenna": gnss.get("Antenna state", ""),
+            "accuracy_ns": parse_accuracy_ns(gnss.get("Time accuracy", "")),
+            "used": used,
+            "tracked": tracked,
+            "satellites": satellites,
+        }
+
+    def _record_events(self, sample: Dict[str, Any]):
+        previous = self._previous
+        self._previous = sample
+        if previous is None:
+            return
+        timestamp = sample["time"]
+        if sample["state"] != previous["state"]:
+            kind = "lock" if sample["locked"] else ("loss" if previous["locked"] else "state")
+            self.events.append(
+                {
+                    "time": timestamp,
+                    "type": kind,
+                    "from": previous["state"],
+                    "to": sample["state"],
+                }
+            )
+            logger.info("GNSS state %s -> %s", previous['state'], sample['state'])
+        if sample["antenna"] != previous["antenna"]:
+            self.events.append(
+                {
+                    "time": timestamp,
+                    "type": "antenna",
+                    "from": previous["antenna"],
+                    "to": sample["antenna"],
+                }
+            )
+        for satellite in sample["satellites"].keys() - previous["satellites"].keys():
+            self.events.append({"time": timestamp, "type": "acquired", "satellite": satellite})
+        for satellite in previous["satellites"].keys() - sample["satellites"].keys():
+            self.events.append({"time": timestamp, "type": "lost", "satellite": satellite})
+
+    def sample_once(self) -> Optional[Dict[str, Any]]:
+        """
+        Take one sample.
+
+        Returns:
+            The parsed sample, or None if the dashboard could not be read
+        """
+        start_time = time.time()
+        try:
+            sample = self.parse(self.source(), start_time)
+        except Exception as e:
+            logger.error("Error sampling %s: %s", self.label, e)
+            sample = None
+        self.sample_seconds.append(time.time() - start_time)
+        if sample is None:
+            self.errors += 1
+            return None
+        with self._lock:
+            self.ring.append(sample)
+            self._record_events(sample)
+        return sample
+
+    def run(self, duration: float, stop: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Sample at the configured rate for a duration, on the calling thread.
+
+        Args:
+            duration: Seconds to sample
+            stop: Optional predicate checked after each sample to end early
+
+        Returns:
+            Number of samples taken
+        """
+        logger.info(
+            "Sampling %s every %ss for %ss (buffer %s samples)",
+            self.label,
+            self.interval,
+            duration,
+            self.ring.capacity,
+        )
+        deadline = time.time() + duration
+        taken = 0
+        while time.time() < deadline and not self._stop.is_set():
+            round_start = time.time()
+            if self.sample_once() is not None:
+                taken += 1
+            if stop and stop():
+                break
+            remaining = min(self.interval - (time.time() - round_start), deadline - time.time())
+            if remaining > 0:
+                self.wait(remaining)
+        return taken
+
+    def start(self) -> "TelemetrySampler":
+        """Sample in a background thread until stop() (HTTP sources only)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.run, args=(float("inf"),), name="telemetry-sampler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop background sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 30)
+            self._thread = None
+
+    # Analytics
+
+    def cn0_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        C/N0 statistics per satellite over the buffered window.
+
+        Returns:
+            Satellite key -> mean, std, min, max, p10, p90 (dB-Hz), visible
+            (fraction of samples tracked) and in_use (fraction used in solution)
+        """
+        with self._lock:
+            cn0 = self.ring.ordered(self.ring.cn0)
+            in_use = self.ring.ordered(self.ring.in_use)
+            columns = dict(self.ring.satellite_columns)
+        if not len(cn0):
+            return {}
+
+        tracked = ~np.isnan(cn0)
+        visible = tracked.mean(axis=0)
+        stats = {}
+        for satellite, column in sorted(columns.items()):
+            if not tracked[:, column].any():
+                continue
+            values = cn0[tracked[:, column], column]
+            p10, p90 = np.percentile(values, [10, 90])
+            stats[satellite] = {
+                "mean": round(float(values.mean()), 2),
+                "std": round(float(values.std()), 2),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "p10": round(float(p10), 2),
+                "p90": round(float(p90), 2),
+                "visible": round(float(visible[column]), 3),
+                "in_use": round(float(in_use[:, column].mean()), 3),
+            }
+        return stats
+
+    def trends(self) -> Dict[str, Any]:
+        """
+        Least-squares trends over the buffered window.
+
+        Returns:
+            Slopes per hour for used/tracked satellite counts and mean C/N0,
+            plus current means and the locked fraction
+        """
+        with self._lock:
+            timestamps = self.ring.ordered(self.ring.timestamps)
+            used = self.ring.ordered(self.ring.used).astype(np.float64)
+            tracked = self.ring.ordered(self.ring.tracked).astype(np.float64)
+            cn0 = self.ring.ordered(self.ring.cn0)
+            locked = self.ring.ordered(self.ring.locked)
+            accuracy = self.ring.ordered(self.ring.accuracy_ns)
+        result: Dict[str, Any] = {"samples": len(timestamps)}
+        if not len(timestamps):
+            return result
+
+        hours = (timestamps - timestamps[0]) / 3600.0
+        counts = (~np.isnan(cn0)).sum(axis=1)
+        mean_cn0 = np.where(counts > 0, np.nansum(cn0, axis=1) / np.maximum(counts, 1), np.nan)
+
+        def slope(values: np.ndarray) -> Optional[float]:
+            valid = ~np.isnan(values) & (values >= 0)
+            if valid.sum() < 2 or np.ptp(hours[valid]) == 0:
+                return None
+            return round(float(np.polyfit(hours[valid], values[valid], 1)[0]), 3)
+
+        result.update(
+            {
+                "window_seconds": round(float(timestamps[-1] - timestamps[0]), 1),
+                "locked_fraction": round(float(locked.mean()), 3),
+                "used_mean": (
+                    round(float(used[used >= 0].mean()), 2) if (used >= 0).any() else None
+                ),
+                "tracked_mean": (
+                    round(float(tracked[tracked >= 0].mean()), 2) if (tracked >= 0).any() else None
+                ),
+                "mean_cn0": (
+                    round(float(np.nanmean(mean_cn0)), 2) if (~np.isnan(mean_cn0)).any() else None
+                ),
+                "accuracy_ns_p95": (
+                    round(float(np.nanpercentile(accuracy, 95)), 2)
+                    if (~np.isnan(accuracy)).any()
+                    else None
+                ),
+                "used_per_hour": slope(used),
+                "tracked_per_hour": slope(tracked),
+                "mean_cn0_per_hour": slope(mean_cn0),
+            }
+        )
+        return result
+
+    def lock_events(self) -> List[Dict[str, Any]]:
+        """GNSS lock/loss/state events recorded so far."""
+        with self._lock:
+            return [e for e in self.events if e["type"] in ("lock", "loss", "state")]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the sampling run.
+
+        Returns:
+            Dictionary with trends, per-satellite C/N0 statistics, lock events,
+            satellite acquired/lost counts and sampling cost
+        """
+        with self._lock:
+            events = list(self.events)
+            total = self.ring.count
+            dropped = self.ring.dropped_satellites
+        sample_seconds = np.array(self.sample_seconds) if self.sample_seconds else np.zeros(1)
+        return {
+            "source": self.label,
+            "samples_total": total,
+            "errors": self.errors,
+            "trends": self.trends(),
+            "cn0": self.cn0_statistics(),
+            "lock_events": [e for e in events if e["type"] in ("lock", "loss", "state")],
+            "acquired": sum(1 for e in events if e["type"] == "acquired"),
+            "lost": sum(1 for e in events if e["type"] == "lost"),
+            "dropped_satellites": dropped,
+            "sample_ms_p50": round(float(np.percentile(sample_seconds, 50)) * 1000, 1),
+            "sample_ms_max": round(float(sample_seconds.max()) * 1000, 1),
+            "buffer_bytes": sum(
+                array.nbytes
+                for array in (
+                    self.ring.timestamps,
+                    self.ring.locked,
+                    self.ring.accuracy_ns,
+                    self.ring.used,
+                    self.ring.tracked,
+                    self.ring.cn0,
+                    self.ring.in_use,
+                )
+            ),
+        }
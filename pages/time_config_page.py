@@ -23,9 +23,9 @@ from .base import BasePage
 from .device_capabilities import DeviceCapabilities
 from typing import Dict, Optional, Any
 import time
-import logging
+from pages.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class TimeConfigPage(BasePage):
@@ -50,7 +50,9 @@ class TimeConfigPage(BasePage):
         )
 
         logger.info(
-            f"TimeConfigPage initialized: {device_model} (Series {self.device_series})"
+            "TimeConfigPage initialized: %s (Series %s)",
+            device_model,
+            self.device_series,
         )
 
     def navigate_to_page(self):
@@ -83,7 +85,7 @@ class TimeConfigPage(BasePage):
             logger.info("Navigated to time configuration page")
 
         except Exception as e:
-            logger.error(f"Error navigating to time config page: {e}")
+            logger.error("Error navigating to time config page: %s", e)
             raise
 
     def verify_page_loaded(self):
@@ -107,7 +109,7 @@ class TimeConfigPage(BasePage):
                     logger.warning("Series 3: Timezone collapse element not found")
 
         except Exception as e:
-            logger.error(f"Time config page verification failed: {e}")
+            logger.error("Time config page verification failed: %s", e)
             raise
 
     def select_timezone(self, timezone_value: str) -> bool:
@@ -137,14 +139,14 @@ class TimeConfigPage(BasePage):
             )
 
             if success:
-                logger.info(f"Timezone selected: {timezone_value}")
+                logger.info("Timezone selected: %s", timezone_value)
             else:
-                logger.warning(f"Failed to select timezone: {timezone_value}")
+                logger.warning("Failed to select timezone: %s", timezone_value)
 
             return success
 
         except Exception as e:
-            logger.error(f"Error selecting timezone: {e}")
+            logger.error("Error selecting timezone: %s", e)
             return False
 
     def get_available_timezones(self) -> list:
@@ -166,7 +168,7 @@ class TimeConfigPage(BasePage):
             return timezones
 
         except Exception as e:
-            logger.error(f"Error getting available timezones: {e}")
+            logger.error("Error getting available timezones: %s", e)
             return []
 
     def configure_dst(self, dst_enabled: bool, dst_name: str = "") -> bool:
@@ -206,11 +208,11 @@ class TimeConfigPage(BasePage):
                     ):
                         success_count += 1
 
-            logger.info(f"DST configuration: {success_count} fields set")
+            logger.info("DST configuration: %s fields set", success_count)
             return success_count > 0
 
         except Exception as e:
-            logger.error(f"Error configuring DST: {e}")
+            logger.error("Error configuring DST: %s", e)
             return False
 
     def get_dst_rules(self) -> list:
@@ -232,7 +234,7 @@ class TimeConfigPage(BasePage):
             return rules
 
         except Exception as e:
-            logger.error(f"Error getting DST rules: {e}")
+            logger.error("Error getting DST rules: %s", e)
             return []
 
     def select_dst_rule(self, rule_name: str) -> bool:
@@ -248,12 +250,12 @@ class TimeConfigPage(BasePage):
             )
 
             if success:
-                logger.info(f"DST rule selected: {rule_name}")
+                logger.info("DST rule selected: %s", rule_name)
 
             return success
 
         except Exception as e:
-            logger.error(f"Error selecting DST rule: {e}")
+            logger.error("Error selecting DST rule: %s", e)
             return False
 
     def save_configuration(self) -> bool:
@@ -264,18 +266,20 @@ class TimeConfigPage(BasePage):
                 logger.error("Save button not found")
                 return False
 
-            save_button.first.click()
-
-            # Device-aware wait for save operation
-            self.page.wait_for_load_state(
-                "networkidle", timeout=int(10000 * self.timeout_multiplier)
+            result = self.click_save_and_wait(
+                save_button.first,
+                section_context="time",
+                timeout=int(10000 * self.timeout_multiplier),
             )
+            if not result["ok"]:
+                logger.error("Time configuration save failed: %s", result['message'])
+                return False
 
             logger.info("Time configuration saved")
             return True
 
         except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
             return False
 
     def get_current_timezone(self) -> str:
@@ -289,7 +293,7 @@ class TimeConfigPage(BasePage):
             return ""
 
         except Exception as e:
-            logger.error(f"Error getting current timezone: {e}")
+            logger.error("Error getting current timezone: %s", e)
             return ""
 
     def is_dst_enabled(self) -> bool:
@@ -301,7 +305,7 @@ class TimeConfigPage(BasePage):
             return False
 
         except Exception as e:
-            logger.error(f"Error checking DST status: {e}")
+            logger.error("Error checking DST status: %s", e)
             return False
 
     def get_save_button(self):
@@ -344,7 +348,7 @@ class TimeConfigPage(BasePage):
             return True
 
         except Exception as e:
-            logger.error(f"Error expanding timezone panel: {e}")
+            logger.error("Error expanding timezone panel: %s", e)
             return False
 
     def _ensure_dst_panel_expanded(self) -> bool:
@@ -381,7 +385,7 @@ class TimeConfigPage(BasePage):
             return True
 
         except Exception as e:
-            logger.error(f"Error expanding DST panel: {e}")
+            logger.error("Error expanding DST panel: %s", e)
             return False
 
     def _get_save_button(self):
@@ -410,5 +414,5 @@ class TimeConfigPage(BasePage):
             return self.page.get_by_role("button", name="Save").first
 
         except Exception as e:
-            logger.error(f"Error getting save button: {e}")
+            logger.error("Error getting save button: %s", e)
             return self.page.get_by_role("button", name="Save").first
@@ -0,0 +1,205 @@
+"""
+Timeouts learned from observed device latencies.
+
+BasePage picks fixed timeouts by series (DEFAULT/SHORT/LONG, e.g. 90/10/120 s
+for Series 3). Those are sized for the worst device on its worst day, so a
+hung page takes minutes to fail. Page objects record the latency of each
+operation that waits on a timeout when it completes (record_latency): saves
+per section ("save:network", "save:outputs", ...), page loads ("page_load")
+and element waits ("element_wait"). The results store keeps them per test.
+The policy reads the latencies recorded on the same device and sets the
+timeout of each operation to
+
+    percentile(latencies) x safety factor
+
+clamped between MIN_TIMEOUT_MS and the static value the caller would have
+used. The static value stays the ceiling, so learned timeouts are never more
+generous than today's; with too few samples for an operation the static
+value is used unchanged. Only operations with their own history are
+tightened; nothing else shares their timeout.
+
+Usage:
+    history = load_latency_history("test-results/results.sqlite", "172.16.66.6")
+    configure_timeout_policy(history, percentile=0.99, safety_factor=3.0)
+    ...
+    policy = get_timeout_policy()
+    policy.timeout_ms("save:network", static_ms=90000)
+"""
+
+import json
+import math
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PERCENTILE = 0.99
+DEFAULT_SAFETY_FACTOR = 3.0
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_HISTORY_RUNS = 20
+
+# Learned timeouts never go below this, whatever the history says
+MIN_TIMEOUT_MS = 2000
+
+# Operations recorded by page objects
+PAGE_LOAD = "page_load"
+ELEMENT_WAIT = "element_wait"
+SAVE_PREFIX = "save:"
+
+# Only completed operations are recorded, so latencies of failed tests count too
+HISTORY_QUERY = """
+SELECT results.latencies FROM results
+JOIN runs ON runs.run_id = results.run_id
+WHERE results.device_ip = ? AND results.latencies IS NOT NULL
+  AND runs.run_id IN (
+      SELECT run_id FROM runs WHERE device_ip = ? ORDER BY started DESC LIMIT ?
+  )
+"""
+
+# Latencies recorded in this process since the last take_latencies()
+_latencies: Dict[str, List[float]] = {}
+
+
+def save_operation(section: str) -> str:
+    """Operation name of a save in a configuration section."""
+    return f"{SAVE_PREFIX}{section}"
+
+
+def record_latency(operation: str, seconds: float):
+    """
+    Record the latency of a completed operation.
+
+    Args:
+        operation: Operation name (PAGE_LOAD, ELEMENT_WAIT, save_operation(...))
+        seconds: Time the operation took
+    """
+    _latencies.setdefault(operation, []).append(round(seconds, 3))
+
+
+def take_latencies() -> Dict[str, List[float]]:
+    """Return the latencies recorded since the last call and start over."""
+    global _latencies
+    latencies, _latencies = _latencies, {}
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of values (fraction between 0 and 1)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_latency_history(
+    db_path: str, device_ip: str, runs: int = DEFAULT_HISTORY_RUNS
+) -> Dict[str, List[float]]:
+    """
+    Operation latencies recorded on the device in its most recent runs.
+
+    Args:
+        db_path: Results store database
+        device_ip: Device IP address
+        runs: Number of most recent runs to learn from
+
+    Returns:
+        Dictionary of operation -> latencies in seconds (empty without history)
+    """
+    if not Path(db_path).exists():
+        return {}
+    history: Dict[str, List[float]] = {}
+    try:
+        connection = sqlite3.connect(db_path)
+        try:
+            for (latencies,) in connection.execute(HISTORY_QUERY, (device_ip, device_ip, runs)):
+                for operation, seconds in json.loads(latencies).items():
+                    history.setdefault(operation, []).extend(seconds)
+        finally:
+            connection.close()
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning("Could not read latency history from %s: %s", db_path, e)
+        return {}
+    return history
+
+
+class TimeoutPolicy:
+    """Per-operation timeouts from a latency history."""
+
+    def __init__(
+        self,
+        history: Dict[str, List[float]],
+        percentile: float = DEFAULT_PERCENTILE,
+        safety_factor: float = DEFAULT_SAFETY_FACTOR,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            history: Operation -> observed latencies in seconds
+            percentile: Latency percentile to cover (0-1)
+            safety_factor: Multiplier applied to the percentile
+            min_samples: Samples an operation needs before its timeout is learned
+        """
+        self.history = history
+        self.percentile = percentile
+        self.safety_factor = safety_factor
+        self.min_samples = min_samples
+
+    def learned_ms(self, operation: str) -> Optional[int]:
+        """Learned timeout of an operation before clamping, or None without enough samples."""
+        samples = self.history.get(operation, [])
+        if len(samples) < self.min_samples:
+            return None
+        return math.ceil(percentile(samples, self.percentile) * self.safety_factor * 1000)
+
+    def timeout_ms(self, operation: str, static_ms: int) -> int:
+        """
+        Timeout for an operation.
+
+        Args:
+            operation: Operation name, e.g. "save:network"
+            static_ms: Timeout the caller would use otherwise; the ceiling and the fallback
+
+        Returns:
+            Timeout in milliseconds
+        """
+        learned = self.learned_ms(operation)
+        if learned is None:
+            return static_ms
+        return min(static_ms, max(MIN_TIMEOUT_MS, learned))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Sample count, percentile and learned timeout (s) per operation."""
+        return {
+            operation: {
+                "samples": len(samples),
+                "percentile_s": percentile(samples, self.percentile),
+                "learned_s": (self.learned_ms(operation) or 0) / 1000,
+            }
+            for operation, samples in sorted(self.history.items())
+            if samples
+        }
+
+
+_policy: Optional[TimeoutPolicy] = None
+
+
+def configure_timeout_policy(history: Dict[str, List[float]], **options) -> TimeoutPolicy:
+    """Install the process-wide policy used by page objects."""
+    global _policy
+    _policy = TimeoutPolicy(history, **options)
+    return _policy
+
+
+def get_timeout_policy() -> Optional[TimeoutPolicy]:
+    """Return the process-wide policy, or None when timeouts are static."""
+    return _policy
+
+
+def clear_timeout_policy():
+    """Go back to static timeouts."""
+    global _policy
+    _policy = None
@@ -14,8 +14,132 @@ Based on DeviceCapabilities integration for device-aware behavior:
 from playwright.sync_api import Page, expect, Locator
 from .base import BasePage
 from .device_capabilities import DeviceCapabilities
-from typing import Dict, Optional, List, Any
+from typing import Any, Callable, Dict, List, Optional
 import os
+import time
+import weakref
+from pages.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upload outcome signals. Text signals are matched case-insensitively against
+# rendered page text, like Playwright's text= selectors.
+UPLOAD_COMPLETION_TEXTS = ["Upload completed", "Success"]
+UPLOAD_COMPLETION_SELECTORS = [".success-message", ".upload-success"]
+UPLOAD_ERROR_TEXTS = ["Error", "Failed"]
+UPLOAD_ERROR_SELECTORS = [".error-message", ".upload-error"]
+UPLOAD_PROGRESS_SELECTORS = ["progress", ".progress-bar", ".upload-progress"]
+
+PROGRESS_BINDING = "__kronosUploadProgress"
+
+# Single in-page watcher: races completion, error and progress signals and
+# resolves on the first terminal state. Signals already on the page when the
+# watch starts (static labels, earlier messages) are ignored; only new
+# occurrences count. Progress changes are streamed through the exposed binding.
+UPLOAD_WATCH_JS = """
+(opts) => new Promise((resolve) => {
+    const start = performance.now();
+    const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const bodyText = () => (document.body ? document.body.innerText : '').toLowerCase();
+    const countText = (text) => bodyText().split(text.toLowerCase()).length - 1;
+    const selectorState = (selector) => {
+        const texts = [];
+        document.querySelectorAll(selector).forEach((el) => {
+            if (visible(el)) texts.push(el.textContent.trim());
+        });
+        return texts;
+    };
+    const occurrences = (texts, text) => texts.filter((t) => t === text).length;
+
+    // Signals already on the page before the upload started don't count.
+    // The caller passes the baseline taken before clicking Upload; without
+    // one (or with baseline_only) it is taken now.
+    let baseline = opts.baseline;
+    if (!baseline) {
+        baseline = {texts: {}, selectors: {}};
+        for (const text of [...opts.completion_texts, ...opts.error_texts]) {
+            baseline.texts[text] = countText(text);
+        }
+        for (const selector of [...opts.completion_selectors, ...opts.error_selectors]) {
+            baseline.selectors[selector] = selectorState(selector);
+        }
+    }
+    if (opts.baseline_only) return resolve(baseline);
+
+    const newText = (texts) => texts.find((text) => countText(text) > (baseline.texts[text] || 0));
+    const newSelector = (selectors) => {
+        for (const selector of selectors) {
+            const before = baseline.selectors[selector] || [];
+            const now = selectorState(selector);
+            for (const text of now) {
+                if (occurrences(now, text) > occurrences(before, text)) return [selector, text];
+            }
+        }
+        return null;
+    };
+
+    const readProgress = () => {
+        for (const selector of opts.progress_selectors) {
+            const el = document.querySelector(selector);
+            if (!el || !visible(el)) continue;
+            let value = null;
+            if (el.tagName === 'PROGRESS' && el.max) {
+                value = (el.value / el.max) * 100;
+            } else if (el.getAttribute('aria-valuenow') !== null) {
+                value = parseFloat(el.getAttribute('aria-valuenow'));
+            } else {
+                const match = (el.textContent || '').match(/(\\d+(?:\\.\\d+)?)\\s*%/)
+                    || (el.style.width || '').match(/(\\d+(?:\\.\\d+)?)%/);
+                if (match) value = parseFloat(match[1]);
+            }
+            return {progress: value === null || isNaN(value) ? null : Math.round(value),
+                    text: (el.textContent || '').trim()};
+        }
+        return null;
+    };
+
+    let lastProgress;
+    let done = false;
+    const observer = new MutationObserver(() => check());
+    const poll = setInterval(() => check(), 250);
+    const timer = setTimeout(() => finish('timeout', null, null), opts.timeout);
+
+    function finish(state, signal, text) {
+        if (done) return;
+        done = true;
+        observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(timer);
+        resolve({state, signal, text, elapsed_ms: Math.round(performance.now() - start)});
+    }
+
+    function check() {
+        if (done) return;
+        const progress = readProgress();
+        if (progress && progress.progress !== lastProgress) {
+            lastProgress = progress.progress;
+            const report = window[opts.binding];
+            if (report) {
+                report({...progress, elapsed_ms: Math.round(performance.now() - start),
+                        timestamp: Date.now() / 1000});
+            }
+        }
+
+        const error = newSelector(opts.error_selectors);
+        if (error) return finish('failed', error[0], error[1]);
+        const errorText = newText(opts.error_texts);
+        if (errorText) return finish('failed', `text=${errorText}`, errorText);
+        const completion = newSelector(opts.completion_selectors);
+        if (completion) return finish('completed', completion[0], completion[1]);
+        const completionText = newText(opts.completion_texts);
+        if (completionText) return finish('completed', `text=${completionText}`, completionText);
+    }
+
+    observer.observe(document.documentElement,
+                     {childList: true, subtree: true, characterData: true, attributes: true});
+    check();
+})
+"""
 
 
 class UploadConfigPage(BasePage):
@@ -29,6 +153,9 @@ class UploadConfigPage(BasePage):
     maintaining compatibility with the base functionality.
     """
 
+    # page -> active progress sink; the binding can only be exposed once per page
+    _progress_sinks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
     def __init__(self, page: Page, device_model: Optional[str] = None):
         """
         Initialize upload configuration page with device enhancement.
@@ -51,7 +178,14 @@ class UploadConfigPage(BasePage):
             self.capabilities = {}
             self.available_sections = []
 
-        print(f"UploadConfigPage initialized for {self.device_model or 'Unknown'}")
+        self._progress_events: List[Dict[str, Any]] = []
+        self._progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        # Result signals on the page before start_upload() clicked Upload
+        self._upload_baseline: Optional[Dict[str, Any]] = None
+
+        logger.info(
+            "UploadConfigPage initialized for %s", self.device_model or 'Unknown'
+        )
 
     def validate_capabilities(self) -> bool:
         """
@@ -67,7 +201,7 @@ class UploadConfigPage(BasePage):
             # Check if upload section is available
             return self.is_section_available("upload")
         except Exception as e:
-            print(f"UploadConfigPage: Error validating capabilities: {e}")
+            logger.error("UploadConfigPage: Error validating capabilities: %s", e)
             return False
 
     def verify_page_loaded(self) -> bool:
@@ -95,7 +229,7 @@ class UploadConfigPage(BasePage):
             return self.validate_page_loaded()
 
         except Exception as e:
-            print(f"UploadConfigPage: Error verifying page loaded: {e}")
+            logger.error("UploadConfigPage: Error verifying page loaded: %s", e)
             return False
 
     def get_page_data(self) -> Dict[str, Any]:
@@ -121,7 +255,7 @@ class UploadConfigPage(BasePage):
             return page_data
 
         except Exception as e:
-            print(f"UploadConfigPage: Error getting page data: {e}")
+            logger.error("UploadConfigPage: Error getting page data: %s", e)
             return {"error": str(e)}
 
     def select_firmware_file(self, file_path: str) -> bool:
@@ -137,22 +271,22 @@ class UploadConfigPage(BasePage):
         try:
             # Check if file exists
             if not os.path.exists(file_path):
-                print(f"UploadConfigPage: File does not exist: {file_path}")
+                logger.info("UploadConfigPage: File does not exist: %s", file_path)
                 return False
 
             # Find file input
             file_input = self.page.locator("input[type='file']")
             if file_input.count() == 0:
-                print("UploadConfigPage: No file input found")
+                logger.info("UploadConfigPage: No file input found")
                 return False
 
             # Set file path
             file_input.set_input_files(file_path)
-            print(f"UploadConfigPage: File selected: {file_path}")
+            logger.info("UploadConfigPage: File selected: %s", file_path)
             return True
 
         except Exception as e:
-            print(f"UploadConfigPage: Error selecting file: {e}")
+            logger.error("UploadConfigPage: Error selecting file: %s", e)
             return False
 
     def start_upload(self) -> bool:
@@ -173,84 +307,153 @@ class UploadConfigPage(BasePage):
             for selector in upload_buttons:
                 button = self.page.locator(selector)
                 if button.is_visible(timeout=5000):
+                    # Baseline before clicking: a fast result rendered before
+                    # monitoring starts still counts as new
+                    self._upload_baseline = self.page.evaluate(
+                        UPLOAD_WATCH_JS, {**self._upload_signals(), "baseline_only": True}
+                    )
                     button.click()
-                    print("UploadConfigPage: Upload started")
+                    logger.info("UploadConfigPage: Upload started")
                     return True
 
-            print("UploadConfigPage: No upload button found")
+            logger.info("UploadConfigPage: No upload button found")
             return False
 
         except Exception as e:
-            print(f"UploadConfigPage: Error starting upload: {e}")
+            logger.error("UploadConfigPage: Error starting upload: %s", e)
             return False
 
-    def monitor_upload_progress(self, timeout: int = 300000) -> Dict[str, str]:
+    @staticmethod
+    def _upload_signals() -> Dict[str, Any]:
+        """Signal definitions for UPLOAD_WATCH_JS."""
+        return {
+            "completion_texts": UPLOAD_COMPLETION_TEXTS,
+            "completion_selectors": UPLOAD_COMPLETION_SELECTORS,
+            "error_texts": UPLOAD_ERROR_TEXTS,
+            "error_selectors": UPLOAD_ERROR_SELECTORS,
+            "progress_selectors": UPLOAD_PROGRESS_SELECTORS,
+            "binding": PROGRESS_BINDING,
+        }
+
+    def _progress_sink(self, source, event: Dict[str, Any]):
+        """Receive progress events streamed from the in-page watcher."""
+        self._progress_events.append(event)
+        if event.get("progress") is not None:
+            logger.info(
+                "UploadConfigPage: Upload progress %s%% at %.1fs",
+                event['progress'],
+                event['elapsed_ms'] / 1000,
+            )
+        if self._progress_callback:
+            self._progress_callback(event)
+
+    def _ensure_progress_binding(self):
+        """Expose the progress binding once per page; later instances reuse it."""
+        sinks = UploadConfigPage._progress_sinks
+        page = self.page
+        if page not in sinks:
+
+            def dispatch(source, event):
+                sink = sinks.get(page)
+                if sink:
+                    sink(source, event)
+
+            sinks[page] = None
+            page.expose_binding(PROGRESS_BINDING, dispatch)
+        sinks[page] = self._progress_sink
+
+    def monitor_upload_progress(
+        self,
+        timeout: int = 300000,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Monitor firmware upload progress.
 
+        A single in-page watcher races the completion, error and progress
+        signals and resolves on the first terminal state, so both success
+        and failure are reported as soon as the device shows them. Any signal
+        that was not on the page when start_upload() clicked Upload counts,
+        including one rendered before monitoring started. Progress
+        percentages are streamed back while the upload runs.
+
         Args:
             timeout: Timeout in milliseconds to wait for upload completion
+            on_progress: Optional callback receiving each progress event
+                (progress, text, elapsed_ms, timestamp)
 
         Returns:
-            Dict[str, str]: Dictionary with upload progress information
-        """
-        try:
-            progress_info = {
-                "status": "monitoring",
-                "progress": "0%",
-                "message": "Upload in progress",
-            }
-
-            # Wait for upload to complete or timeout
-            import time
-
-            start_time = time.time()
-
-            # Look for completion indicators
-            completion_selectors = [
-                "text=Upload completed",
-                "text=Success",
-                ".success-message",
-                ".upload-success",
-            ]
+            Dict[str, Any]: Dictionary with upload progress information,
+            including progress_events and the signal that ended the watch
+        """
+        start_time = time.time()
+        self._progress_events = []
+        self._progress_callback = on_progress
+        progress_info: Dict[str, Any] = {
+            "status": "monitoring",
+            "progress": "0%",
+            "message": "Upload in progress",
+        }
 
-            for selector in completion_selectors:
-                try:
-                    element = self.page.locator(selector)
-                    if element.is_visible(timeout=timeout):
-                        progress_info["status"] = "completed"
-                        progress_info["progress"] = "100%"
-                        progress_info["message"] = "Upload completed successfully"
-                        break
-                except:
-                    continue
-
-            # Check for errors
-            error_selectors = [
-                "text=Error",
-                "text=Failed",
-                ".error-message",
-                ".upload-error",
-            ]
-
-            for selector in error_selectors:
+        try:
+            self._ensure_progress_binding()
+            signals = {**self._upload_signals(), "baseline": self._upload_baseline}
+
+            outcome = None
+            while outcome is None:
+                remaining_ms = timeout - (time.time() - start_time) * 1000
+                if remaining_ms <= 0:
+                    outcome = {"state": "timeout", "signal": None, "text": None}
+                    break
                 try:
-                    element = self.page.locator(selector)
-                    if element.is_visible(timeout=2000):
-                        progress_info["status"] = "failed"
-                        progress_info["message"] = "Upload failed"
-                        break
-                except:
-                    continue
-
-            elapsed_time = time.time() - start_time
-            progress_info["elapsed_seconds"] = round(elapsed_time, 2)
-
+                    outcome = self.page.evaluate(
+                        UPLOAD_WATCH_JS, {**signals, "timeout": remaining_ms}
+                    )
+                except Exception as e:
+                    # A form-posted upload navigates away; watch the result page
+                    if "context was destroyed" not in str(e) and "navigat" not in str(e):
+                        raise
+                    logger.info(
+                        "UploadConfigPage: Page navigated during upload, re-attaching"
+                    )
+                    self.page.wait_for_load_state("domcontentloaded")
+
+            state = outcome["state"]
+            if state == "completed":
+                progress_info["status"] = "completed"
+                progress_info["progress"] = "100%"
+                progress_info["message"] = "Upload completed successfully"
+            elif state == "failed":
+                progress_info["status"] = "failed"
+                progress_info["message"] = "Upload failed"
+            else:
+                progress_info["status"] = "timeout"
+                progress_info["message"] = f"No upload outcome within {timeout / 1000:.0f}s"
+                if self._progress_events:
+                    last = self._progress_events[-1].get("progress")
+                    if last is not None:
+                        progress_info["progress"] = f"{last}%"
+
+            progress_info["signal"] = outcome.get("signal")
+            progress_info["detail"] = outcome.get("text")
+            progress_info["progress_events"] = list(self._progress_events)
+            progress_info["elapsed_seconds"] = round(time.time() - start_time, 2)
+            logger.info(
+                "UploadConfigPage: Upload %s after %ss (%s)",
+                progress_info['status'],
+                progress_info['elapsed_seconds'],
+                outcome.get('signal') or 'no signal',
+            )
             return progress_info
 
         except Exception as e:
-            print(f"UploadConfigPage: Error monitoring upload: {e}")
+            logger.error("UploadConfigPage: Error monitoring upload: %s", e)
             return {"status": "error", "message": str(e)}
+        finally:
+            self._progress_callback = None
+            self._upload_baseline = None
+            if UploadConfigPage._progress_sinks.get(self.page) == self._progress_sink:
+                UploadConfigPage._progress_sinks[self.page] = None
 
     def get_upload_result(self) -> Dict[str, str]:
         """
@@ -304,7 +507,7 @@ class UploadConfigPage(BasePage):
             return result
 
         except Exception as e:
-            print(f"UploadConfigPage: Error getting upload result: {e}")
+            logger.error("UploadConfigPage: Error getting upload result: %s", e)
             return {"status": "error", "message": str(e)}
 
     def navigate_to_page(self) -> bool:
@@ -315,8 +518,9 @@ class UploadConfigPage(BasePage):
             bool: True if navigation successful, False otherwise
         """
         try:
-            print(
-                f"UploadConfigPage: Navigating to upload config for {self.device_model}"
+            logger.info(
+                "UploadConfigPage: Navigating to upload config for %s",
+                self.device_model,
             )
 
             # Try navigation patterns
@@ -338,11 +542,11 @@ class UploadConfigPage(BasePage):
                     continue
 
             # If no navigation found, assume already on page
-            print("UploadConfigPage: No navigation link found, assuming on page")
+            logger.info("UploadConfigPage: No navigation link found, assuming on page")
             return True
 
         except Exception as e:
-            print(f"UploadConfigPage: Navigation error: {e}")
+            logger.info("UploadConfigPage: Navigation error: %s", e)
             return False
 
     def save_configuration(self) -> bool:
@@ -356,15 +560,18 @@ class UploadConfigPage(BasePage):
             # Use base class save button detection
             save_button = self.find_save_button()
             if save_button:
-                save_button.click()
-                print("UploadConfigPage: Configuration saved")
-                return True
+                result = self.click_save_and_wait(save_button, section_context="upload")
+                if result["ok"]:
+                    logger.info("UploadConfigPage: Configuration saved")
+                else:
+                    logger.warning("UploadConfigPage: Save failed: %s", result['message'])
+                return result["ok"]
 
-            print("UploadConfigPage: No save button found")
+            logger.info("UploadConfigPage: No save button found")
             return False
 
         except Exception as e:
-            print(f"UploadConfigPage: Error saving configuration: {e}")
+            logger.error("UploadConfigPage: Error saving configuration: %s", e)
             return False
 
     def get_upload_status(self) -> Dict[str, str]:
@@ -411,7 +618,7 @@ class UploadConfigPage(BasePage):
             return status
 
         except Exception as e:
-            print(f"UploadConfigPage: Error getting upload status: {e}")
+            logger.error("UploadConfigPage: Error getting upload status: %s", e)
             return {"error": str(e)}
 
     def verify_file_selected(self, expected_filename: str) -> bool:
@@ -433,7 +640,7 @@ class UploadConfigPage(BasePage):
             return expected_filename in selected_file if selected_file else False
 
         except Exception as e:
-            print(f"UploadConfigPage: Error verifying file selected: {e}")
+            logger.error("UploadConfigPage: Error verifying file selected: %s", e)
             return False
 
     def cancel_upload(self) -> bool:
@@ -455,16 +662,16 @@ class UploadConfigPage(BasePage):
                     button = self.page.locator(selector)
                     if button.is_visible(timeout=2000):
                         button.click()
-                        print("UploadConfigPage: Upload cancelled")
+                        logger.info("UploadConfigPage: Upload cancelled")
                         return True
                 except:
                     continue
 
-            print("UploadConfigPage: No cancel button found")
+            logger.info("UploadConfigPage: No cancel button found")
             return False
 
         except Exception as e:
-            print(f"UploadConfigPage: Error cancelling upload: {e}")
+            logger.error("UploadConfigPage: Error cancelling upload: %s", e)
             return False
 
     def is_section_available(self, section_name: str = "upload") -> bool:
@@ -479,7 +686,7 @@ class UploadConfigPage(BasePage):
         """
         try:
             if not self.device_model:
-                print(
+                logger.info(
                     "UploadConfigPage: No device model available, assuming section available"
                 )
                 return True
@@ -491,7 +698,7 @@ class UploadConfigPage(BasePage):
             return "upload" in available_sections
 
         except Exception as e:
-            print(f"UploadConfigPage: Error checking section availability: {e}")
+            logger.error("UploadConfigPage: Error checking section availability: %s", e)
             return True  # Default to available for backward compatibility
 
     def get_save_cancel_buttons(self) -> List[Any]:
@@ -530,7 +737,7 @@ class UploadConfigPage(BasePage):
             return buttons
 
         except Exception as e:
-            print(f"UploadConfigPage: Error getting save/cancel buttons: {e}")
+            logger.error("UploadConfigPage: Error getting save/cancel buttons: %s", e)
             return []
 
     def get_upload_configuration(self) -> Dict[str, Any]:
@@ -556,14 +763,14 @@ class UploadConfigPage(BasePage):
                     config_data["file_selected"] = False
 
             except Exception as e:
-                print(f"UploadConfigPage: Error getting file input info: {e}")
+                logger.error("UploadConfigPage: Error getting file input info: %s", e)
                 config_data["file_input_available"] = False
                 config_data["file_selected"] = False
 
             return config_data
 
         except Exception as e:
-            print(f"UploadConfigPage: Error getting upload configuration: {e}")
+            logger.error("UploadConfigPage: Error getting upload configuration: %s", e)
             return {"error": str(e)}
 
     def test_section_access_pure(self) -> Dict[str, Any]:
@@ -598,11 +805,11 @@ class UploadConfigPage(BasePage):
                 except Exception as e:
                     result["error"] = str(e)
 
-            print(f"UploadConfigPage: Section access test result: {result}")
+            logger.info("UploadConfigPage: Section access test result: %s", result)
             return result
 
         except Exception as e:
-            print(f"UploadConfigPage: Error in section access test: {e}")
+            logger.error("UploadConfigPage: Error in section access test: %s", e)
             return {"section_name": "Upload", "accessible": False, "error": str(e)}
 
     def create_test_file(self, content: str, extension: str = "txt") -> str:
@@ -628,11 +835,11 @@ class UploadConfigPage(BasePage):
             with open(file_path, "w") as f:
                 f.write(content)
 
-            print(f"UploadConfigPage: Test file created: {file_path}")
+            logger.info("UploadConfigPage: Test file created: %s", file_path)
             return file_path
 
         except Exception as e:
-            print(f"UploadConfigPage: Error creating test file: {e}")
+            logger.error("UploadConfigPage: Error creating test file: %s", e)
             return ""
 
     def check_file_type_validation(
@@ -682,5 +889,5 @@ class UploadConfigPage(BasePage):
             return validation_result
 
         except Exception as e:
-            print(f"UploadConfigPage: Error in file type validation: {e}")
+            logger.error("UploadConfigPage: Error in file type validation: %s", e)
             return {"valid": False, "error": str(e), "file_path": file_path}
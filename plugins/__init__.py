@@ -0,0 +1,7 @@
+"""
+Pytest plugins for Kronos device test automation.
+
+This package contains opt-in pytest plugins registered from the root
+conftest.py via ``pytest_plugins``. Each plugin owns its command line
+options and is inactive unless enabled.
+"""
@@ -0,0 +1,121 @@
+"""
+Opt-in adaptive page object timeouts learned from the results store.
+
+With ``--adaptive-timeouts`` each process loads the operation latencies
+(saves per section, page loads, element waits) recorded on ``--device_ip`` in
+the last ``--timeout-history-runs`` runs of the results database and installs
+a pages.timeout_policy.TimeoutPolicy. Each of those operations then waits
+``--timeout-percentile`` of its own observed latency x
+``--timeout-safety-factor``, never longer than its static timeout.
+Operations with fewer than ``--timeout-min-samples`` samples keep the static
+timeouts, so a new device starts with today's behaviour and tightens as
+history accumulates.
+
+Usage:
+    pytest tests --device_ip 172.16.66.6 --adaptive-timeouts
+    pytest tests --adaptive-timeouts --timeout-percentile 0.995 --timeout-safety-factor 4
+"""
+
+import pytest
+
+from pages.timeout_policy import (
+    DEFAULT_HISTORY_RUNS,
+    DEFAULT_MIN_SAMPLES,
+    DEFAULT_PERCENTILE,
+    DEFAULT_SAFETY_FACTOR,
+    clear_timeout_policy,
+    configure_timeout_policy,
+    load_latency_history,
+)
+from plugins import xdist_support
+from plugins.results_store import DEFAULT_DB
+
+
+def pytest_addoption(parser):
+    """Add adaptive timeout options."""
+    group = parser.getgroup("adaptive-timeouts", "timeouts learned from previous runs")
+    group.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=False,
+        help="Size page object timeouts from observed latencies in the results database",
+    )
+    group.addoption(
+        "--timeout-percentile",
+        action="store",
+        type=float,
+        default=DEFAULT_PERCENTILE,
+        help=f"Latency percentile a timeout must cover (default: {DEFAULT_PERCENTILE})",
+    )
+    group.addoption(
+        "--timeout-safety-factor",
+        action="store",
+        type=float,
+        default=DEFAULT_SAFETY_FACTOR,
+        help=f"Multiplier applied to the percentile (default: {DEFAULT_SAFETY_FACTOR})",
+    )
+    group.addoption(
+        "--timeout-min-samples",
+        action="store",
+        type=int,
+        default=DEFAULT_MIN_SAMPLES,
+        help=f"Samples needed before an operation's timeout is learned (default: {DEFAULT_MIN_SAMPLES})",
+    )
+    group.addoption(
+        "--timeout-history-runs",
+        action="store",
+        type=int,
+        default=DEFAULT_HISTORY_RUNS,
+        help=f"Most recent runs of the device to learn from (default: {DEFAULT_HISTORY_RUNS})",
+    )
+
+
+def pytest_configure(config):
+    """Load the device's latency history and install the policy."""
+    config._timeout_policy = None
+    if not config.getoption("--adaptive-timeouts"):
+        return
+    percentile = config.getoption("--timeout-percentile")
+    if not 0 < percentile <= 1:
+        raise pytest.UsageError("--timeout-percentile must be between 0 and 1")
+    if config.getoption("--timeout-safety-factor") < 1:
+        raise pytest.UsageError("--timeout-safety-factor must be at least 1")
+    history = load_latency_history(
+        config.getoption("--results-db", default=DEFAULT_DB),
+        config.getoption("--device_ip"),
+        runs=config.getoption("--timeout-history-runs"),
+    )
+    config._timeout_policy = configure_timeout_policy(
+        history,
+        percentile=percentile,
+        safety_factor=config.getoption("--timeout-safety-factor"),
+        min_samples=config.getoption("--timeout-min-samples"),
+    )
+
+
+def pytest_unconfigure(config):
+    clear_timeout_policy()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report the learned timeouts (controller only)."""
+    policy = getattr(config, "_timeout_policy", None)
+    if policy is None or xdist_support.is_worker(config):
+        return
+    terminalreporter.section("adaptive timeouts")
+    summary = policy.summary()
+    if not summary:
+        terminalreporter.write_line("no latency history yet; static timeouts used")
+        return
+    terminalreporter.write_line(
+        f"{'operation':<22} {'samples':>8} {'p' + format(policy.percentile * 100, 'g'):>8} {'learned':>8}"
+    )
+    for operation, stats in summary.items():
+        learned = (
+            f"{stats['learned_s']:>7.1f}s"
+            if stats["samples"] >= policy.min_samples
+            else f"{'static':>8}"
+        )
+        terminalreporter.write_line(
+            f"{operation:<22} {stats['samples']:>8} {stats['percentile_s']:>7.2f}s {learned}"
+        )
@@ -0,0 +1,402 @@
+"""
+Device health gate and circuit breaker shared by all xdist workers.
+
+When a unit drops off the network every remaining test would otherwise
+spend minutes in navigation timeouts, retries and backoff sleeps. This
+plugin stops that early:
+
+- Health gate: before any test runs, the controller waits up to
+  ``--health-gate-timeout`` seconds for the device's web UI to answer over
+  HTTPS or plain HTTP (units with HTTPS disabled are up too). If it does
+  not, the breaker starts open.
+- Circuit breaker: when a test fails, a quick reachability probe tells a
+  device outage apart from an ordinary failure. After ``--circuit-threshold``
+  consecutive failures with the device down, the breaker opens and the
+  remaining tests for the device fail (or skip, ``--circuit-action skip``)
+  at setup without touching the browser.
+- Recovery: while the breaker is open the controller probes the device every
+  ``--circuit-probe-interval`` seconds and closes the breaker as soon as the
+  web UI answers again.
+
+Breaker state lives in one JSON file per device under ``--circuit-dir``;
+updates are serialized with a lock file, so every worker sees the same
+state. The breaker is inactive with ``--replay-har`` (no device is needed).
+
+Usage:
+    pytest tests -n 4 --device_ip 172.16.66.6
+    pytest tests --device_ip 172.16.66.6 --circuit-threshold 5 --circuit-action skip
+    pytest tests --device_ip 172.16.66.6 --no-health-gate --circuit-threshold 0
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from pages.reachability_watcher import ReachabilityWatcher
+from plugins import xdist_support
+
+STATS_KEY = "device_health_stats"
+DEFAULT_DIR = ".cache/device-health"
+DEFAULT_THRESHOLD = 3
+DEFAULT_GATE_TIMEOUT = 60.0
+DEFAULT_PROBE_INTERVAL = 10.0
+LOCK_STALE_SECONDS = 10.0
+
+CLOSED = "closed"
+OPEN = "open"
+
+# Breaker of this process, for helpers outside the pytest hooks
+_breaker = None
+
+
+class DeviceCircuitBreaker:
+    """Consecutive-failure circuit breaker persisted in a shared state file."""
+
+    def __init__(self, directory: str, device_ip: str, threshold: int = DEFAULT_THRESHOLD):
+        """
+        Initialize breaker.
+
+        Args:
+            directory: Directory holding the state and lock files
+            device_ip: Device the breaker guards
+            threshold: Consecutive device-down failures that open the breaker
+        """
+        self.device_ip = device_ip.replace("https://", "").replace("http://", "").strip("/")
+        self.threshold = threshold
+        self.directory = Path(directory)
+        name = self.device_ip.replace(":", "_")
+        self.path = self.directory / f"{name}.json"
+        self.lock_path = self.directory / f"{name}.lock"
+
+    @contextmanager
+    def _locked(self):
+        """Hold the cross-process lock file (breaks locks left by dead processes)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        self.lock_path.unlink()
+                except OSError:
+                    pass
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            try:
+                self.lock_path.unlink()
+            except OSError:
+                pass
+
+    def read(self) -> Dict[str, Any]:
+        """Current breaker state (closed with no failures if never written)."""
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {"state": CLOSED, "failures": 0, "opened": 0, "open_seconds": 0.0}
+
+    def _write(self, state: Dict[str, Any]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def reset(self):
+        """Start the run with a closed breaker."""
+        with self._locked():
+            self._write({"state": CLOSED, "failures": 0, "opened": 0, "open_seconds": 0.0})
+
+    def is_open(self) -> bool:
+        return self.read()["state"] == OPEN
+
+    def open(self, reason: str):
+        """Open the breaker now."""
+        with self._locked():
+            state = self.read()
+            if state["state"] != OPEN:
+                state.update(state=OPEN, since=time.time(), reason=reason)
+                state["opened"] += 1
+                self._write(state)
+                print(f"Circuit breaker for {self.device_ip} opened: {reason}")
+
+    def record_failure(self, reason: str) -> bool:
+        """
+        Count a failure seen while the device was down.
+
+        Returns:
+            True if the breaker is open afterwards
+        """
+        with self._locked():
+            state = self.read()
+            if state["state"] == OPEN:
+                return True
+            state["failures"] += 1
+            if self.threshold and state["failures"] >= self.threshold:
+                state.update(state=OPEN, since=time.time(), reason=reason)
+                state["opened"] += 1
+                print(
+                    f"Circuit breaker for {self.device_ip} opened after "
+                    f"{state['failures']} consecutive failures: {reason}"
+                )
+            self._write(state)
+            return state["state"] == OPEN
+
+    def record_success(self):
+        """Reset the consecutive failure count (no write if already zero)."""
+        if not self.read()["failures"]:
+            return
+        with self._locked():
+            state = self.read()
+            if state["state"] == CLOSED:
+                state["failures"] = 0
+                self._write(state)
+
+    def close(self):
+        """Close the breaker after the device answered again."""
+        with self._locked():
+            state = self.read()
+            if state["state"] == OPEN:
+                state["open_seconds"] += time.time() - state.get("since", time.time())
+                state.update(state=CLOSED, failures=0)
+                self._write(state)
+                print(f"Circuit breaker for {self.device_ip} closed: device answers again")
+
+
+class _RecoveryProber:
+    """Controller-side thread that closes an open breaker once the device is up."""
+
+    def __init__(self, breaker: DeviceCircuitBreaker, watcher: ReachabilityWatcher, interval: float):
+        self.breaker = breaker
+        self.watcher = watcher
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="circuit-probe", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if self.breaker.is_open() and self.watcher.is_up():
+                    self.breaker.close()
+            except Exception as e:
+                print(f"Error probing device {self.breaker.device_ip}: {e}")
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 5)
+
+
+def pytest_addoption(parser):
+    """Add health gate and circuit breaker options."""
+    group = parser.getgroup("device-health", "device health gate and circuit breaker")
+    group.addoption(
+        "--no-health-gate",
+        action="store_true",
+        default=False,
+        help="Do not check that the device answers before the run",
+    )
+    group.addoption(
+        "--health-gate-timeout",
+        action="store",
+        type=float,
+        default=DEFAULT_GATE_TIMEOUT,
+        help=f"Seconds to wait for the device at session start (default: {DEFAULT_GATE_TIMEOUT:.0f})",
+    )
+    group.addoption(
+        "--circuit-threshold",
+        action="store",
+        type=int,
+        default=DEFAULT_THRESHOLD,
+        help=f"Consecutive device-down failures that open the breaker; 0 disables it (default: {DEFAULT_THRESHOLD})",
+    )
+    group.addoption(
+        "--circuit-action",
+        action="store",
+        choices=["fail", "skip"],
+        default="fail",
+        help="What happens to tests while the breaker is open (default: fail)",
+    )
+    group.addoption(
+        "--circuit-probe-interval",
+        action="store",
+        type=float,
+        default=DEFAULT_PROBE_INTERVAL,
+        help=f"Seconds between recovery probes while open (default: {DEFAULT_PROBE_INTERVAL:.0f})",
+    )
+    group.addoption(
+        "--circuit-dir",
+        action="store",
+        default=DEFAULT_DIR,
+        help=f"Directory for the shared breaker state (default: {DEFAULT_DIR})",
+    )
+
+
+def pytest_configure(config):
+    """Set up the breaker; on the controller reset it, run the gate and start probing."""
+    global _breaker
+    config._device_health = None
+    config._device_health_totals = {}
+    config._device_health_gate = None
+    if config.getoption("--replay-har", default=None) or config.option.collectonly:
+        return
+    device_ip = config.getoption("--device_ip", default=None)
+    if not device_ip:
+        return
+
+    breaker = DeviceCircuitBreaker(
+        config.getoption("--circuit-dir"), device_ip, config.getoption("--circuit-threshold")
+    )
+    config._device_health = breaker
+    config._device_health_watcher = ReachabilityWatcher(device_ip)
+    config._device_health_stats = {"short_circuited": 0, "down_failures": 0}
+    config._device_health_prober = None
+    _breaker = breaker
+    if xdist_support.is_worker(config):
+        return
+
+    breaker.reset()
+    if not config.getoption("--no-health-gate"):
+        timeout = config.getoption("--health-gate-timeout")
+        start = time.time()
+        up = config._device_health_watcher.wait_until_up(timeout=timeout)
+        config._device_health_watcher.stop()
+        config._device_health_gate = {"up": up, "seconds": time.time() - start}
+        if not up:
+            breaker.open(f"health gate: no answer within {timeout:.0f}s")
+    prober = _RecoveryProber(
+        breaker, config._device_health_watcher, config.getoption("--circuit-probe-interval")
+    )
+    prober.start()
+    config._device_health_prober = prober
+
+
+def pytest_unconfigure(config):
+    global _breaker
+    _breaker = None
+    prober = getattr(config, "_device_health_prober", None)
+    if prober is not None:
+        prober.stop()
+    if getattr(config, "_device_health", None) is not None:
+        config._device_health_watcher.close()
+
+
+def device_circuit_open(device_ip: Optional[str] = None) -> bool:
+    """
+    True if this process's breaker (for device_ip, if given) is open.
+
+    For helpers such as navigate_with_retry that should not start a long
+    retry loop against a device known to be down.
+    """
+    if _breaker is None:
+        return False
+    if device_ip and device_ip.replace("https://", "").replace("http://", "").strip("/") != _breaker.device_ip:
+        return False
+    return _breaker.is_open()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Fail or skip immediately while the breaker is open."""
+    breaker = item.config._device_health
+    if breaker is None:
+        return
+    state = breaker.read()
+    if state["state"] != OPEN:
+        return
+    item.config._device_health_stats["short_circuited"] += 1
+    item._device_health_short_circuited = True
+    message = f"Device {breaker.device_ip} unreachable (circuit open: {state.get('reason')})"
+    if item.config.getoption("--circuit-action") == "skip":
+        pytest.skip(message)
+    pytest.fail(message, pytrace=False)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Count failures that happened while the device was down."""
+    outcome = yield
+    report = outcome.get_result()
+    breaker = item.config._device_health
+    if breaker is None or getattr(item, "_device_health_short_circuited", False):
+        return
+    if report.when == "call" and report.passed:
+        breaker.record_success()
+    elif report.failed and report.when in ("setup", "call"):
+        # A quick probe (HTTPS or HTTP) tells an outage from an ordinary
+        # test failure
+        if item.config._device_health_watcher.is_up():
+            breaker.record_success()
+            return
+        item.config._device_health_stats["down_failures"] += 1
+        breaker.record_failure(f"{item.nodeid} failed with the device down")
+
+
+def _merge_stats(config, stats: Dict[str, int]):
+    """Add one process's counters to the run totals."""
+    totals = config._device_health_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Publish worker counters or record them."""
+    config = session.config
+    if config._device_health is None:
+        return
+    if xdist_support.is_worker(config):
+        xdist_support.publish(config, STATS_KEY, config._device_health_stats)
+    else:
+        _merge_stats(config, config._device_health_stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker counters on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report the health gate and breaker activity."""
+    breaker = getattr(config, "_device_health", None)
+    if breaker is None:
+        return
+    gate = config._device_health_gate
+    state = breaker.read()
+    totals = config._device_health_totals
+    if not state["opened"] and not totals.get("down_failures") and (gate is None or gate["up"]):
+        return
+    terminalreporter.section("device health")
+    if gate is not None:
+        terminalreporter.write_line(
+            f"health gate: {'up' if gate['up'] else 'DOWN'} after {gate['seconds']:.1f}s"
+        )
+    open_seconds = state["open_seconds"]
+    if state["state"] == OPEN:
+        open_seconds += time.time() - state.get("since", time.time())
+    terminalreporter.write_line(
+        f"breaker: {state['state']}, opened {state['opened']} time(s), open {open_seconds:.0f}s"
+    )
+    terminalreporter.write_line(
+        f"failures with device down: {totals.get('down_failures', 0)}, "
+        f"tests short-circuited: {totals.get('short_circuited', 0)}"
+    )
@@ -0,0 +1,188 @@
+"""
+In-page ring buffer of console errors and failed requests.
+
+Listening with ``page.on("console")`` and ``page.on("response")`` sends
+every console message and every response from the browser to Python,
+although the data is only read when a test fails. Instead, an init script
+installed on each context records them inside the page:
+
+- ``console.error`` calls, uncaught errors and unhandled promise rejections
+- the last few other console messages (log, info, warning, debug)
+- failed requests (HTTP status >= 400, or no response at all): fetch and
+  XHR calls are wrapped, and documents, scripts, stylesheets and images are
+  reported by a PerformanceObserver from the resource timing
+  ``responseStatus``, so nothing crosses the process boundary
+
+Each list is a bounded ring (``--error-buffer-size`` entries). The buffer
+is saved to sessionStorage on ``pagehide`` and restored by the next
+document, so it survives the form-post navigations of config pages. Python
+reads it in one ``evaluate`` call with ``fetch_error_buffer(page)``.
+
+Usage:
+    pytest tests --device_ip 172.16.66.3 --error-buffer-size 200
+"""
+
+import json
+from typing import Any, Dict, List
+
+DEFAULT_CAPACITY = 50
+LOG_CAPACITY = 10
+STORAGE_KEY = "__kronosErrorBuffer"
+
+ERROR_BUFFER_JS = """
+(({ key, capacity, logCapacity }) => {
+    if (window[key]) return;
+    const now = () => Date.now() / 1000;
+    let state = null;
+    try { state = JSON.parse(sessionStorage.getItem(key)); } catch (e) {}
+    state = state || { console_errors: [], console_logs: [], failed_requests: [] };
+    window[key] = state;
+    const limits = { console_errors: capacity, console_logs: logCapacity, failed_requests: capacity };
+    const push = (kind, entry) => {
+        const ring = state[kind];
+        ring.push(entry);
+        if (ring.length > limits[kind]) ring.splice(0, ring.length - limits[kind]);
+    };
+    addEventListener('pagehide', () => {
+        try { sessionStorage.setItem(key, JSON.stringify(state)); } catch (e) {}
+    });
+
+    const text = (args) => args.map((arg) => {
+        if (typeof arg === 'string') return arg;
+        if (arg instanceof Error) return arg.stack || String(arg);
+        try { return JSON.stringify(arg); } catch (e) { return String(arg); }
+    }).join(' ');
+    for (const [method, type] of [['log', 'log'], ['info', 'info'], ['warn', 'warning'], ['debug', 'debug']]) {
+        const original = console[method];
+        console[method] = function (...args) {
+            push('console_logs', { text: text(args), timestamp: now(), type });
+            return original.apply(this, args);
+        };
+    }
+    const originalError = console.error;
+    console.error = function (...args) {
+        push('console_errors', { text: text(args), timestamp: now(), location: location.href });
+        return originalError.apply(this, args);
+    };
+    addEventListener('error', (event) => {
+        if (event.target !== window) {
+            // Script, stylesheet or image that got no usable response
+            failed(event.target.src || event.target.href, 0, 'load error', 'GET');
+            return;
+        }
+        push('console_errors', {
+            text: String(event.message),
+            timestamp: now(),
+            location: `${event.filename}:${event.lineno}:${event.colno}`,
+        });
+    }, true);
+    addEventListener('unhandledrejection', (event) => {
+        const reason = event.reason;
+        push('console_errors', {
+            text: 'Unhandled rejection: ' + String((reason && reason.stack) || reason),
+            timestamp: now(),
+            location: location.href,
+        });
+    });
+
+    const failed = (url, status, statusText, method) => {
+        if (status && status < 400) return;
+        push('failed_requests', {
+            url: String(url), status, status_text: statusText, method, timestamp: now(),
+        });
+    };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (input, init) {
+            const method = ((init && init.method) || (input && input.method) || 'GET').toUpperCase();
+            const url = (input && input.url) || String(input);
+            return originalFetch.apply(this, arguments).then(
+                (response) => { failed(response.url || url, response.status, response.statusText, method); return response; },
+                (error) => { failed(url, 0, String(error), method); throw error; },
+            );
+        };
+    }
+    const open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+        this.__kronosRequest = [String(method).toUpperCase(), String(url)];
+        return open.call(this, method, url, ...rest);
+    };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        this.addEventListener('loadend', () => {
+            const [method, url] = this.__kronosRequest || ['GET', ''];
+            failed(this.responseURL || url, this.status, this.statusText || (this.status ? '' : 'network error'), method);
+        });
+        return send.apply(this, args);
+    };
+    if (window.PerformanceObserver) {
+        const observe = (type) => {
+            try {
+                new PerformanceObserver((list) => {
+                    for (const entry of list.getEntries()) {
+                        if (entry.initiatorType === 'fetch' || entry.initiatorType === 'xmlhttprequest') continue;
+                        if (entry.responseStatus >= 400) {
+                            failed(entry.name, entry.responseStatus, '', type === 'navigation' ? 'NAVIGATE' : 'GET');
+                        }
+                    }
+                }).observe({ type, buffered: true });
+            } catch (e) {}
+        };
+        observe('navigation');
+        observe('resource');
+    }
+})
+"""
+
+EMPTY_BUFFER: Dict[str, List[Dict[str, Any]]] = {
+    "console_errors": [],
+    "console_logs": [],
+    "failed_requests": [],
+}
+
+
+def pytest_addoption(parser):
+    """Add error buffer options."""
+    group = parser.getgroup("error-buffer", "in-page console and network error buffer")
+    group.addoption(
+        "--error-buffer-size",
+        action="store",
+        type=int,
+        default=DEFAULT_CAPACITY,
+        help=f"Console errors and failed requests kept per page (default: {DEFAULT_CAPACITY})",
+    )
+
+
+def install_error_buffer(config, context) -> None:
+    """
+    Install the error buffer init script on a context.
+
+    Args:
+        config: pytest config
+        context: Playwright BrowserContext
+    """
+    arguments = {
+        "key": STORAGE_KEY,
+        "capacity": config.getoption("--error-buffer-size", default=DEFAULT_CAPACITY),
+        "logCapacity": LOG_CAPACITY,
+    }
+    context.add_init_script(f"{ERROR_BUFFER_JS.strip()}({json.dumps(arguments)});")
+
+
+def fetch_error_buffer(page) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read the page's error buffer in one call.
+
+    Args:
+        page: Playwright Page
+
+    Returns:
+        Dictionary with console_errors, console_logs and failed_requests
+        (empty lists when the page is closed or the script is not installed)
+    """
+    try:
+        buffer = page.evaluate(f"() => window.{STORAGE_KEY} || null")
+    except Exception as e:
+        print(f"Error reading in-page error buffer: {e}")
+        return {kind: [] for kind in EMPTY_BUFFER}
+    return {kind: list((buffer or {}).get(kind, [])) for kind in EMPTY_BUFFER}
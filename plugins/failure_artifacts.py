@@ -0,0 +1,109 @@
+"""
+Per-run configuration of the failure artifact store.
+
+Configures pages.artifact_store for the session: artifacts (debug captures
+from page objects, failure screenshots from test_metadata) go to
+``--artifact-dir`` (default ``<results_dir>/artifacts``), one subdirectory
+per xdist worker, and the run is capped at ``--artifact-max-mb`` in total,
+split evenly across workers, with oldest-first eviction. Queued writes are
+finished at session end and the run's counters are reported.
+
+Usage:
+    pytest tests --device_ip 172.16.66.1 --artifact-max-mb 200
+    pytest tests -n 3 --artifact-dir /var/tmp/kronos-artifacts --artifact-jpeg-quality 50
+"""
+
+import os
+from typing import Dict
+
+import pytest
+
+from pages.artifact_store import (
+    DEFAULT_JPEG_QUALITY,
+    close_artifact_store,
+    configure_artifact_store,
+)
+from plugins import xdist_support
+
+STATS_KEY = "failure_artifacts_stats"
+DEFAULT_MAX_MB = 500
+
+
+def pytest_addoption(parser):
+    """Add artifact store options."""
+    group = parser.getgroup("artifacts", "failure artifact store")
+    group.addoption(
+        "--artifact-dir",
+        action="store",
+        default=None,
+        help="Directory for screenshots, HTML and debug JSON (default: <results_dir>/artifacts)",
+    )
+    group.addoption(
+        "--artifact-max-mb",
+        action="store",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=f"Size cap for the run's artifacts; oldest are evicted first (default: {DEFAULT_MAX_MB})",
+    )
+    group.addoption(
+        "--artifact-jpeg-quality",
+        action="store",
+        type=int,
+        default=DEFAULT_JPEG_QUALITY,
+        help=f"JPEG quality for screenshots (default: {DEFAULT_JPEG_QUALITY})",
+    )
+
+
+def pytest_configure(config):
+    """Configure this process's artifact store."""
+    config._artifact_totals = {}
+    directory = config.getoption("--artifact-dir") or os.path.join(
+        config.getoption("--results_dir", default="test-results"), "artifacts"
+    )
+    workers = 1
+    if xdist_support.is_worker(config):
+        directory = os.path.join(directory, xdist_support.worker_id(config))
+        workers = int(config.workerinput.get("workercount", 1)) or 1
+    configure_artifact_store(
+        directory=directory,
+        max_bytes=int(config.getoption("--artifact-max-mb") * 1024 * 1024 / workers),
+        jpeg_quality=config.getoption("--artifact-jpeg-quality"),
+    )
+    config._artifact_dir = directory
+
+
+def _merge_stats(config, stats: Dict[str, int]):
+    """Add one process's counters to the run totals."""
+    totals = config._artifact_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Finish queued writes; publish worker counters or record them."""
+    stats = close_artifact_store()
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, stats)
+    else:
+        _merge_stats(session.config, stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker counters on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report artifacts written, deduplicated and evicted."""
+    totals = getattr(config, "_artifact_totals", {})
+    if not totals.get("written"):
+        return
+    terminalreporter.section("failure artifacts")
+    terminalreporter.write_line(
+        f"written: {totals['written']} ({totals['bytes'] / 1e6:.1f} MB), "
+        f"deduplicated: {totals['deduplicated']}, evicted: {totals['evicted']}"
+    )
+    terminalreporter.write_line(f"artifacts: {config._artifact_dir}")
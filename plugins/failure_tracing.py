@@ -0,0 +1,314 @@
+"""
+Opt-in Playwright tracing kept only for failing tests.
+
+With ``--trace-on-failure`` every test context records a Playwright trace
+(DOM snapshots and actions, optionally screenshots and sources). Tracing is
+started once per context and recorded in chunks: a passing test's chunk is
+discarded without being written, a failing test's chunk is saved as
+``<trace dir>/<test>.zip``; open it with ``playwright show-trace``.
+
+Snapshots are bounded by ``--trace-window``: when a chunk is older than
+the window at a checkpoint, it is closed to a temporary file and a new
+chunk started. Checkpoints are the end of setup, every BasePage navigation
+wait, dashboard navigation and save (BasePage.action_checkpoints),
+navigate_with_retry and explicit ``checkpoint()`` calls; a test body that
+never reaches one is recorded as one chunk. Only the newest closed chunk
+is kept, so a failure saves the last one to two windows as ``<test>.zip``
+plus ``<test>.previous.zip``.
+
+Time spent in tracing calls and the size of written traces are measured
+per process and reported at the end of the run, so the overhead can be
+checked before leaving tracing on for production runs. The trace path is
+added to the test's results store row.
+
+Usage:
+    pytest tests --device_ip 172.16.66.6 --trace-on-failure
+    pytest tests --trace-on-failure --trace-screenshots --trace-sources
+    pytest tests -n 3 --trace-on-failure --trace-window 60 --trace-dir test-results/traces
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from pages.base import BasePage
+from plugins import results_store, xdist_support
+
+STATS_KEY = "failure_tracing_stats"
+DEFAULT_WINDOW = 120.0
+
+
+def trace_name_for(nodeid: str) -> str:
+    """File-system safe trace base name for a test."""
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+
+
+class FailureTracer:
+    """Chunked tracing of one test context."""
+
+    def __init__(self, context, nodeid: str, options: Dict[str, Any], stats: Dict[str, float]):
+        self.context = context
+        self.nodeid = nodeid
+        self.options = options
+        self.stats = stats
+        self.previous: Optional[Path] = None
+        self.chunk_started = 0.0
+        self._spool = Path(options["directory"]) / ".spool"
+
+    def _timed(self, action, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return action(*args, **kwargs)
+        finally:
+            self.stats["overhead"] += time.perf_counter() - start
+
+    def start(self):
+        self._timed(
+            self.context.tracing.start,
+            screenshots=self.options["screenshots"],
+            snapshots=True,
+            sources=self.options["sources"],
+        )
+        self._start_chunk()
+
+    def _start_chunk(self):
+        self._timed(self.context.tracing.start_chunk, title=self.nodeid)
+        self.chunk_started = time.time()
+        self.stats["chunks"] += 1
+
+    def checkpoint(self):
+        """Rotate the chunk if it is older than the window."""
+        if time.time() - self.chunk_started < self.options["window"]:
+            return
+        self._spool.mkdir(parents=True, exist_ok=True)
+        closed = self._spool / f"{trace_name_for(self.nodeid)}.{os.getpid()}.{self.stats['chunks']}.zip"
+        self._timed(self.context.tracing.stop_chunk, path=str(closed))
+        if self.previous is not None:
+            self.previous.unlink(missing_ok=True)
+        self.previous = closed
+        self._start_chunk()
+
+    def finish(self, failed: bool) -> Optional[str]:
+        """
+        Stop tracing; save the trace only when the test failed.
+
+        Returns:
+            Path of the saved trace, or None
+        """
+        saved = None
+        try:
+            if failed:
+                directory = Path(self.options["directory"])
+                directory.mkdir(parents=True, exist_ok=True)
+                path = directory / f"{trace_name_for(self.nodeid)}.zip"
+                self._timed(self.context.tracing.stop_chunk, path=str(path))
+                self.stats["saved"] += 1
+                self.stats["bytes"] += path.stat().st_size
+                if self.previous is not None:
+                    self.previous.replace(path.with_suffix(".previous.zip"))
+                    self.previous = None
+                saved = str(path)
+            else:
+                self._timed(self.context.tracing.stop_chunk)
+                self.stats["discarded"] += 1
+            self._timed(self.context.tracing.stop)
+        except Exception as e:
+            print(f"Error finishing trace for {self.nodeid}: {e}")
+        finally:
+            if self.previous is not None:
+                self.previous.unlink(missing_ok=True)
+        return saved
+
+
+_active: Optional[FailureTracer] = None
+
+
+def pytest_addoption(parser):
+    """Add failure tracing options."""
+    group = parser.getgroup("trace-on-failure", "Playwright tracing kept for failing tests")
+    group.addoption(
+        "--trace-on-failure",
+        action="store_true",
+        default=False,
+        help="Record a Playwright trace per test and keep it only when the test fails",
+    )
+    group.addoption(
+        "--trace-dir",
+        action="store",
+        default=None,
+        help="Directory for saved traces (default: <results_dir>/traces)",
+    )
+    group.addoption(
+        "--trace-window",
+        action="store",
+        type=float,
+        default=DEFAULT_WINDOW,
+        help=f"Seconds of trace kept before older chunks are dropped (default: {DEFAULT_WINDOW:g})",
+    )
+    group.addoption(
+        "--trace-screenshots",
+        action="store_true",
+        default=False,
+        help="Include screenshots in traces (larger, slower)",
+    )
+    group.addoption(
+        "--trace-sources",
+        action="store_true",
+        default=False,
+        help="Include test source files in traces",
+    )
+
+
+def pytest_configure(config):
+    """Collect tracing options for this process."""
+    config._failure_tracing = None
+    config._failure_tracing_totals = {}
+    if config.getoption("--trace-on-failure"):
+        directory = config.getoption("--trace-dir") or os.path.join(
+            config.getoption("--results_dir", default="test-results"), "traces"
+        )
+        config._failure_tracing = {
+            "directory": directory,
+            "window": config.getoption("--trace-window"),
+            "screenshots": config.getoption("--trace-screenshots"),
+            "sources": config.getoption("--trace-sources"),
+            "stats": {
+                "tests": 0,
+                "chunks": 0,
+                "saved": 0,
+                "discarded": 0,
+                "bytes": 0,
+                "overhead": 0.0,
+                "test_time": 0.0,
+            },
+        }
+        # Rotate chunks during the test body too, before navigations and saves
+        BasePage.action_checkpoints.append(checkpoint)
+
+
+def pytest_unconfigure(config):
+    if checkpoint in BasePage.action_checkpoints:
+        BasePage.action_checkpoints.remove(checkpoint)
+
+
+def install_failure_tracing(config, context, nodeid: str) -> Optional[FailureTracer]:
+    """
+    Start chunked tracing on a test's context when --trace-on-failure is set.
+
+    Args:
+        config: pytest config
+        context: Playwright BrowserContext
+        nodeid: pytest node id of the test owning the context
+
+    Returns:
+        The tracer, or None when tracing is disabled or failed to start
+    """
+    global _active
+    options = getattr(config, "_failure_tracing", None)
+    if options is None:
+        return None
+    tracer = FailureTracer(context, nodeid, options, options["stats"])
+    try:
+        tracer.start()
+    except Exception as e:
+        print(f"Error starting trace for {nodeid}: {e}")
+        return None
+    options["stats"]["tests"] += 1
+    _active = tracer
+    return tracer
+
+
+def finish_failure_tracing(item, tracer: Optional[FailureTracer]) -> Optional[str]:
+    """
+    Save or discard a test's trace; call before closing the context.
+
+    Args:
+        item: The pytest item (request.node)
+        tracer: Value returned by install_failure_tracing
+
+    Returns:
+        Path of the saved trace, or None
+    """
+    global _active
+    if tracer is None:
+        return None
+    if _active is tracer:
+        _active = None
+    reports = getattr(item, "reports", {})
+    failed = any(report.failed for report in reports.values())
+    path = tracer.finish(failed)
+    if path:
+        results_store.attach_details(item, {"trace": path})
+    return path
+
+
+def checkpoint():
+    """Drop trace chunks older than --trace-window; safe between page actions."""
+    if _active is not None:
+        try:
+            _active.checkpoint()
+        except Exception as e:
+            print(f"Error rotating trace chunk: {e}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Checkpoint after setup (login, unlock) and time the test body."""
+    checkpoint()
+    start = time.time()
+    yield
+    options = getattr(item.config, "_failure_tracing", None)
+    if options is not None:
+        options["stats"]["test_time"] += time.time() - start
+
+
+def _merge_stats(config, stats: Dict[str, float]):
+    """Add one process's counters to the run totals."""
+    totals = config._failure_tracing_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Publish worker statistics, or record them when running without xdist."""
+    options = getattr(session.config, "_failure_tracing", None)
+    if options is None:
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, options["stats"])
+    else:
+        _merge_stats(session.config, options["stats"])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker tracing statistics on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report traces written and the time spent tracing."""
+    options = getattr(config, "_failure_tracing", None)
+    totals = getattr(config, "_failure_tracing_totals", {})
+    if options is None or not totals.get("tests"):
+        return
+    terminalreporter.section("trace on failure")
+    terminalreporter.write_line(
+        f"traced {totals['tests']} tests in {totals['chunks']} chunks: "
+        f"{totals['saved']} saved ({totals['bytes'] / 1e6:.1f} MB), "
+        f"{totals['discarded']} discarded"
+    )
+    overhead = totals["overhead"]
+    test_time = totals["test_time"] or 1.0
+    terminalreporter.write_line(
+        f"tracing calls: {overhead:.1f}s total, {overhead / totals['tests'] * 1000:.0f} ms/test, "
+        f"{overhead / test_time:.1%} of test body time"
+    )
+    if totals["saved"]:
+        terminalreporter.write_line(f"traces: {options['directory']}")
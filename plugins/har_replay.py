@@ -0,0 +1,352 @@
+"""
+HAR record and replay of device traffic for offline suite runs.
+
+``--record-har DIR`` records all traffic of each test's browser context into
+``DIR/<test id>.har`` using Playwright's built-in HAR recording.
+
+``--replay-har DIR`` serves recorded traffic back without any device on the
+network. Each test first replays its own HAR through ``route_from_har``; any
+request that does not match exactly falls back to a tolerant matcher built
+from every HAR in the directory. The tolerant matcher ignores volatile query
+string and form fields (session tokens, CSRF values, cache-busting
+timestamps) and serves repeated requests in recorded order, so polling pages
+such as the dashboard see the same sequence of responses as on the device.
+Requests with no recording at all are aborted and reported.
+
+Usage:
+    pytest tests --device_ip 172.16.190.46 --record-har har/190.46
+    pytest tests --device_ip 172.16.190.46 --replay-har har/190.46
+"""
+
+import base64
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import pytest
+
+from plugins import xdist_support
+
+STATS_KEY = "har_replay_stats"
+
+# Query/form fields whose values change between sessions or requests
+VOLATILE_PARAMS = {
+    "token",
+    "session",
+    "sessionid",
+    "session_id",
+    "sid",
+    "csrf",
+    "csrf_token",
+    "_csrf",
+    "nonce",
+    "_",
+    "t",
+    "ts",
+    "time",
+    "timestamp",
+    "rand",
+    "random",
+    "cachebust",
+}
+
+_SKIP_RESPONSE_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+# Whether this process replays HAR traffic, for helpers outside the hooks
+_replaying = False
+
+
+def har_name_for(nodeid: str) -> str:
+    """
+    Build a file-system safe HAR file name for a test.
+
+    Args:
+        nodeid: pytest node id
+
+    Returns:
+        File name ending in .har
+    """
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".har"
+
+
+def _strip_volatile(pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Drop volatile fields and sort the rest for order-independent matching."""
+    return sorted((k, v) for k, v in pairs if k.lower() not in VOLATILE_PARAMS)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for tolerant matching.
+
+    Volatile query parameters are removed and the remaining parameters
+    sorted. Scheme and host are dropped so a recording from one lab unit can
+    be replayed against another address.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Normalized path and query
+    """
+    parsed = urlparse(url)
+    query = urlencode(_strip_volatile(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse(("", "", parsed.path or "/", "", query, ""))
+
+
+def normalize_post_data(post_data: Optional[str]) -> str:
+    """
+    Normalize a request body for tolerant matching.
+
+    Form-encoded bodies have volatile fields removed; anything else is
+    compared as-is.
+
+    Args:
+        post_data: Raw request body text
+
+    Returns:
+        Normalized body
+    """
+    if not post_data:
+        return ""
+    if "=" in post_data and not post_data.lstrip().startswith(("{", "[", "<")):
+        pairs = parse_qsl(post_data, keep_blank_values=True)
+        if pairs:
+            return urlencode(_strip_volatile(pairs))
+    return post_data
+
+
+def match_key(method: str, url: str, post_data: Optional[str]) -> Tuple[str, str, str]:
+    """Build the tolerant matching key for a request."""
+    return (method.upper(), normalize_url(url), normalize_post_data(post_data))
+
+
+class HarIndex:
+    """Tolerant index over all HAR files in a directory."""
+
+    def __init__(self, har_dir: str):
+        """
+        Load and index every HAR file in a directory.
+
+        Args:
+            har_dir: Directory containing recorded .har files
+        """
+        self.har_dir = Path(har_dir)
+        self.entries: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self.files = 0
+        self._load()
+
+    def _load(self):
+        for har_path in sorted(self.har_dir.glob("*.har")):
+            try:
+                har = json.loads(har_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"Error loading HAR {har_path}: {e}")
+                continue
+            self.files += 1
+            for entry in har.get("log", {}).get("entries", []):
+                request = entry.get("request", {})
+                key = match_key(
+                    request.get("method", "GET"),
+                    request.get("url", ""),
+                    request.get("postData", {}).get("text"),
+                )
+                self.entries.setdefault(key, []).append(entry["response"])
+        print(
+            f"HAR replay: indexed {sum(len(v) for v in self.entries.values())} "
+            f"responses from {self.files} files in {self.har_dir}"
+        )
+
+    def lookup(self, key: Tuple[str, str, str], occurrence: int) -> Optional[Dict[str, Any]]:
+        """
+        Find the recorded response for the n-th occurrence of a request.
+
+        Args:
+            key: Tolerant matching key
+            occurrence: How many times this key was already served
+
+        Returns:
+            HAR response object, or None if the request was never recorded
+        """
+        responses = self.entries.get(key)
+        if not responses:
+            return None
+        # Past the end of the recorded sequence, keep serving the last response
+        return responses[min(occurrence, len(responses) - 1)]
+
+
+class HarReplayer:
+    """Per-context tolerant replay handler on top of a shared HarIndex."""
+
+    def __init__(self, index: HarIndex, stats: Dict[str, int]):
+        self.index = index
+        self.stats = stats
+        self._served: Dict[Tuple[str, str, str], int] = {}
+
+    def handle(self, route):
+        """
+        Route handler serving a request from the tolerant index.
+
+        Args:
+            route: Playwright route not matched exactly by route_from_har
+        """
+        request = route.request
+        key = match_key(request.method, request.url, request.post_data)
+        occurrence = self._served.get(key, 0)
+        response = self.index.lookup(key, occurrence)
+        if response is None:
+            self.stats["misses"] += 1
+            print(f"HAR replay miss: {request.method} {request.url}")
+            route.abort("internetdisconnected")
+            return
+
+        self._served[key] = occurrence + 1
+        self.stats["tolerant"] += 1
+        content = response.get("content", {})
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        headers = {
+            h["name"]: h["value"]
+            for h in response.get("headers", [])
+            if h["name"].lower() not in _SKIP_RESPONSE_HEADERS
+        }
+        route.fulfill(status=response.get("status", 200), headers=headers, body=body)
+
+
+def pytest_addoption(parser):
+    """Add HAR record/replay options."""
+    group = parser.getgroup("har", "HAR record and replay")
+    group.addoption(
+        "--record-har",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Record each test's device traffic to DIR/<test>.har",
+    )
+    group.addoption(
+        "--replay-har",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Replay device traffic from HAR files in DIR instead of a live device",
+    )
+
+
+def pytest_configure(config):
+    """Validate HAR options."""
+    global _replaying
+    config._har_index = None
+    config._har_stats = {"tolerant": 0, "misses": 0}
+    config._har_totals = {}
+    if config.getoption("--record-har") and config.getoption("--replay-har"):
+        raise pytest.UsageError("--record-har and --replay-har are mutually exclusive")
+    replay_dir = config.getoption("--replay-har")
+    if replay_dir and not Path(replay_dir).is_dir():
+        raise pytest.UsageError(f"--replay-har directory not found: {replay_dir}")
+    _replaying = bool(replay_dir)
+
+
+def pytest_unconfigure(config):
+    global _replaying
+    _replaying = False
+
+
+def replay_active() -> bool:
+    """True when this run replays HAR traffic (there is no live device)."""
+    return _replaying
+
+
+def har_context_options(config, nodeid: str) -> Dict[str, Any]:
+    """
+    Context options enabling HAR recording for a test.
+
+    Args:
+        config: pytest config
+        nodeid: pytest node id of the test owning the context
+
+    Returns:
+        Options to merge into browser.new_context(), empty when not recording
+    """
+    record_dir = config.getoption("--record-har")
+    if not record_dir:
+        return {}
+    Path(record_dir).mkdir(parents=True, exist_ok=True)
+    return {
+        "record_har_path": str(Path(record_dir) / har_name_for(nodeid)),
+        "record_har_content": "embed",
+        "record_har_mode": "full",
+    }
+
+
+def install_har_replay(config, context, nodeid: str) -> bool:
+    """
+    Install HAR replay routes on a context when --replay-har is set.
+
+    Must be called after any other context.route() registration so the
+    replay handlers take precedence.
+
+    Args:
+        config: pytest config
+        context: Playwright BrowserContext
+        nodeid: pytest node id of the test owning the context
+
+    Returns:
+        True if replay routes were installed
+    """
+    replay_dir = config.getoption("--replay-har")
+    if not replay_dir:
+        return False
+
+    if config._har_index is None:
+        config._har_index = HarIndex(replay_dir)
+
+    # Registered first so it runs last: only reached when the exact
+    # route_from_har lookup below falls back.
+    replayer = HarReplayer(config._har_index, config._har_stats)
+    context.route("**/*", replayer.handle)
+
+    own_har = Path(replay_dir) / har_name_for(nodeid)
+    if own_har.exists():
+        context.route_from_har(own_har, not_found="fallback")
+    return True
+
+
+def _merge_stats(config, stats: Dict[str, int]):
+    """Add one process's counters to the run totals."""
+    totals = config._har_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Publish worker statistics, or record them when running without xdist."""
+    if not session.config.getoption("--replay-har"):
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, session.config._har_stats)
+    else:
+        _merge_stats(session.config, session.config._har_stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker replay statistics on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report how requests were served during replay."""
+    if config.getoption("--record-har"):
+        terminalreporter.section("HAR record")
+        terminalreporter.write_line(f"HAR files written to {config.getoption('--record-har')}")
+    if not config.getoption("--replay-har"):
+        return
+    totals = getattr(config, "_har_totals", {})
+    terminalreporter.section("HAR replay")
+    terminalreporter.write_line(
+        f"tolerant matches: {totals.get('tolerant', 0)}, "
+        f"unrecorded requests aborted: {totals.get('misses', 0)}"
+    )
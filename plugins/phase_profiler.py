@@ -0,0 +1,332 @@
+"""
+Per-fixture phase profiler: where does each test's wall time go.
+
+With ``--profile-phases`` enabled, every fixture setup and teardown, every
+test body and every named phase inside a fixture (login, satellite wait,
+configuration unlock, ...) is timed. At the end of the run the plugin
+prints a breakdown by fixture and writes two files to
+``--profile-phases-dir``:
+
+- ``phase_profile_<device>.json``: totals, means and shares per fixture and
+  phase, grouped by device (IP and hardware model)
+- ``phase_trace_<device>.json``: Chrome trace timeline, open it in
+  chrome://tracing or https://ui.perfetto.dev; each xdist worker is a row
+
+Fixtures mark phases with the ``phase`` context manager, which is a no-op
+when profiling is disabled:
+
+    from plugins.phase_profiler import phase
+
+    with phase("login"):
+        login_page.login(password=device_password)
+
+Usage:
+    pytest tests --device_ip 172.16.190.46 --profile-phases
+    pytest tests --profile-phases --profile-phases-dir test-results/profile -n 3
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from plugins import xdist_support
+
+STATS_KEY = "phase_profiler_events"
+
+# Event categories
+SETUP = "fixture-setup"
+TEARDOWN = "fixture-teardown"
+CALL = "test-body"
+PHASE = "phase"
+RUNTEST = "runtest"
+
+_profiler: Optional["PhaseProfiler"] = None
+
+
+class PhaseProfiler:
+    """Collects timed events for one process."""
+
+    def __init__(self, worker: str):
+        self.worker = worker
+        self.events: List[Dict[str, Any]] = []
+        self.current_test = ""
+        self.device = ""
+        self._teardown_starts: Dict[int, float] = {}
+
+    def record(self, name: str, category: str, start: float, end: float, **args):
+        """
+        Record a completed event.
+
+        Args:
+            name: Fixture, phase or test name
+            category: One of the event categories
+            start: Start time (epoch seconds)
+            end: End time (epoch seconds)
+            **args: Extra attributes stored with the event
+        """
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "start": start,
+                "duration": end - start,
+                "test": self.current_test,
+                "device": self.device,
+                "worker": self.worker,
+                **args,
+            }
+        )
+
+
+def get_profiler() -> Optional[PhaseProfiler]:
+    """Return the active profiler, or None when profiling is disabled."""
+    return _profiler
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a named phase inside a fixture or test.
+
+    Args:
+        name: Phase name, e.g. "login" or "satellite_wait"
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        profiler.record(name, PHASE, start, time.time())
+
+
+def pytest_addoption(parser):
+    """Add phase profiler options."""
+    group = parser.getgroup("profile-phases", "per-fixture phase profiler")
+    group.addoption(
+        "--profile-phases",
+        action="store_true",
+        default=False,
+        help="Time fixture setup/teardown, test bodies and fixture phases",
+    )
+    group.addoption(
+        "--profile-phases-dir",
+        action="store",
+        default="test-results/profile",
+        help="Directory for phase profile JSON and Chrome trace output",
+    )
+
+
+def pytest_configure(config):
+    """Activate the profiler when enabled."""
+    global _profiler
+    config._phase_events = []
+    if config.getoption("--profile-phases"):
+        _profiler = PhaseProfiler(xdist_support.worker_id(config))
+        _profiler.device = config.getoption("--device_ip", default="")
+
+
+def pytest_unconfigure(config):
+    global _profiler
+    _profiler = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Track which test the following events belong to."""
+    if _profiler is not None:
+        _profiler.current_test = item.nodeid
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    start = time.time()
+    yield
+    if _profiler is not None:
+        _profiler.record("setup", RUNTEST, start, time.time())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    start = time.time()
+    yield
+    if _profiler is not None:
+        _profiler.record(item.name, CALL, start, time.time())
+        _profiler.record("call", RUNTEST, start, time.time())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    start = time.time()
+    yield
+    if _profiler is not None:
+        _profiler.record("teardown", RUNTEST, start, time.time())
+        model = getattr(item.session, "device_hardware_model", None)
+        if model:
+            _profiler.device = (
+                f"{item.config.getoption('--device_ip', default='')} ({model})"
+            )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Time fixture setup and arm teardown timing."""
+    if _profiler is None:
+        yield
+        return
+    profiler = _profiler
+    start = time.time()
+    yield
+    profiler.record(fixturedef.argname, SETUP, start, time.time(), scope=fixturedef.scope)
+
+    # Finalizers run last-in first-out, so this one runs before the
+    # fixture's own teardown; pytest_fixture_post_finalizer runs after it.
+    key = id(fixturedef)
+
+    def _mark_teardown_start():
+        profiler._teardown_starts[key] = time.time()
+
+    fixturedef.addfinalizer(_mark_teardown_start)
+
+
+def pytest_fixture_post_finalizer(fixturedef, request):
+    """Record fixture teardown duration."""
+    if _profiler is None:
+        return
+    start = _profiler._teardown_starts.pop(id(fixturedef), None)
+    if start is not None:
+        _profiler.record(
+            fixturedef.argname, TEARDOWN, start, time.time(), scope=fixturedef.scope
+        )
+
+
+def aggregate(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate events by device, then by category and name.
+
+    Args:
+        events: Recorded events from all workers
+
+    Returns:
+        Dict keyed by device with per-name totals and shares of test time
+    """
+    result: Dict[str, Any] = {}
+    for event in events:
+        device = result.setdefault(
+            event["device"] or "unknown", {"test_time": 0.0, "tests": set(), "phases": {}}
+        )
+        if event["cat"] == RUNTEST:
+            device["test_time"] += event["duration"]
+            device["tests"].add(event["test"])
+            continue
+        key = f"{event['cat']}:{event['name']}"
+        entry = device["phases"].setdefault(
+            key,
+            {"category": event["cat"], "name": event["name"], "count": 0, "total": 0.0, "max": 0.0},
+        )
+        entry["count"] += 1
+        entry["total"] += event["duration"]
+        entry["max"] = max(entry["max"], event["duration"])
+
+    for device in result.values():
+        test_time = device["test_time"] or 1.0
+        for entry in device["phases"].values():
+            entry["mean"] = entry["total"] / entry["count"]
+            entry["share"] = entry["total"] / test_time
+        device["tests"] = len(device["tests"])
+        device["phases"] = dict(
+            sorted(device["phases"].items(), key=lambda kv: kv[1]["total"], reverse=True)
+        )
+    return result
+
+
+def chrome_trace(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert events to Chrome trace format.
+
+    Args:
+        events: Recorded events from all workers
+
+    Returns:
+        Trace document with one process row per xdist worker
+    """
+    workers = sorted({e["worker"] for e in events})
+    pids = {worker: i + 1 for i, worker in enumerate(workers)}
+    trace = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": worker}}
+        for worker, pid in pids.items()
+    ]
+    for event in events:
+        trace.append(
+            {
+                "name": event["name"],
+                "cat": event["cat"],
+                "ph": "X",
+                "ts": int(event["start"] * 1e6),
+                "dur": int(event["duration"] * 1e6),
+                "pid": pids[event["worker"]],
+                "tid": 0,
+                "args": {"test": event["test"], "device": event["device"]},
+            }
+        )
+    return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+
+def pytest_sessionfinish(session):
+    """Publish worker events, or keep them when running without xdist."""
+    if _profiler is None:
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, _profiler.events)
+    else:
+        session.config._phase_events.extend(_profiler.events)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect worker events on the xdist controller."""
+    events = xdist_support.collect(node, STATS_KEY)
+    if events:
+        node.config._phase_events.extend(events)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the breakdown and write profile/trace files."""
+    if not config.getoption("--profile-phases"):
+        return
+    events = config._phase_events
+    if not events:
+        return
+
+    output_dir = Path(config.getoption("--profile-phases-dir"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    device_tag = config.getoption("--device_ip", default="device").replace(".", "_")
+    profile = aggregate(events)
+    profile_path = output_dir / f"phase_profile_{device_tag}.json"
+    trace_path = output_dir / f"phase_trace_{device_tag}.json"
+    profile_path.write_text(json.dumps(profile, indent=2))
+    trace_path.write_text(json.dumps(chrome_trace(events)))
+
+    terminalreporter.section("phase profile")
+    for device, data in profile.items():
+        terminalreporter.write_line(
+            f"{device}: {data['tests']} tests, {data['test_time']:.1f}s test time"
+        )
+        terminalreporter.write_line(
+            f"  {'phase':<45} {'count':>6} {'total s':>9} {'mean s':>8} {'max s':>8} {'share':>7}"
+        )
+        for entry in list(data["phases"].values())[:20]:
+            label = f"{entry['category']}:{entry['name']}"
+            terminalreporter.write_line(
+                f"  {label:<45} {entry['count']:>6} {entry['total']:>9.1f} "
+                f"{entry['mean']:>8.2f} {entry['max']:>8.2f} {entry['share']:>7.1%}"
+            )
+    terminalreporter.write_line(f"profile: {profile_path}")
+    terminalreporter.write_line(f"trace:   {trace_path}")
@@ -0,0 +1,398 @@
+"""
+Append-only SQLite store for per-test results across runs.
+
+Every test produces one row: outcome, duration, setup/call/teardown times,
+named fixture phases (when --profile-phases is on), latencies of page
+object operations (saves, page loads, element waits), rerun count, device
+identity (IP, hardware model, series), markers and, for failures, an error
+type and a normalized failure signature that groups the same failure
+across runs and devices. Failure debugging data from the test_metadata
+fixture (console errors, failed requests, browser state) is kept as JSON in
+the row's ``details`` column.
+
+Rows are buffered in memory; xdist workers hand their buffers to the
+controller, which writes the whole run in one transaction at session end.
+Query the store with tools/results_query.py.
+
+Usage:
+    pytest tests --device_ip 172.16.66.6
+    pytest tests -n 3 --results-db test-results/results.sqlite
+    pytest tests --no-results-store
+"""
+
+import hashlib
+import json
+import os
+import re
+import socket
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from pages.timeout_policy import take_latencies
+from plugins import xdist_support
+from plugins.phase_profiler import PHASE, get_profiler
+
+STATS_KEY = "results_store_rows"
+DEFAULT_DB = "test-results/results.sqlite"
+FAILED_OUTCOMES = ("failed", "setup_failed", "teardown_failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL,
+    finished REAL,
+    host TEXT,
+    device_ip TEXT,
+    device_model TEXT,
+    device_series TEXT,
+    workers INTEGER,
+    tests INTEGER,
+    failed INTEGER,
+    args TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    test_name TEXT,
+    test_file TEXT,
+    worker TEXT,
+    started REAL,
+    outcome TEXT,
+    duration REAL,
+    setup_s REAL,
+    call_s REAL,
+    teardown_s REAL,
+    reruns INTEGER,
+    phases TEXT,
+    latencies TEXT,
+    device_ip TEXT,
+    device_model TEXT,
+    device_series TEXT,
+    markers TEXT,
+    error_type TEXT,
+    failure_signature TEXT,
+    failure_message TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS results_device_test ON results (device_ip, nodeid, started);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_signature ON results (failure_signature);
+"""
+
+# Columns added after the first schema, created on older databases by connect()
+ADDED_COLUMNS = {"latencies": "TEXT"}
+
+RESULT_COLUMNS = [
+    "run_id",
+    "nodeid",
+    "test_name",
+    "test_file",
+    "worker",
+    "started",
+    "outcome",
+    "duration",
+    "setup_s",
+    "call_s",
+    "teardown_s",
+    "reruns",
+    "phases",
+    "latencies",
+    "device_ip",
+    "device_model",
+    "device_series",
+    "markers",
+    "error_type",
+    "failure_signature",
+    "failure_message",
+    "details",
+]
+
+# Volatile parts of failure messages, replaced before hashing
+_VOLATILE_PATTERNS = [
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b"), "<ip>"),
+    (re.compile(r"0x[0-9a-fA-F]+"), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+_store: Optional["ResultsStore"] = None
+
+
+def failure_signature(error_type: str, location: str, message: str) -> str:
+    """
+    Stable identifier for a failure, independent of timings and addresses.
+
+    Args:
+        error_type: Exception class name
+        location: file:line of the failing assertion
+        message: First line of the failure message
+
+    Returns:
+        12 character hex digest
+    """
+    normalized = message
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    key = f"{error_type}|{location}|{normalized.strip()}"
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def _failure_fields(report) -> Dict[str, Optional[str]]:
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        message = crash.message.splitlines()[0] if crash.message else ""
+        location = f"{os.path.basename(crash.path)}:{crash.lineno}"
+    else:
+        message = str(report.longrepr).strip().splitlines()[-1] if report.longrepr else ""
+        location = ""
+    match = re.match(r"([A-Za-z_][\w.]*(?:Error|Exception|Exit|Failed))\b", message)
+    error_type = match.group(1).rsplit(".", 1)[-1] if match else "AssertionError"
+    return {
+        "error_type": error_type,
+        "failure_signature": failure_signature(error_type, location, message),
+        "failure_message": message[:500],
+    }
+
+
+class ResultsStore:
+    """Buffers result rows for one process."""
+
+    def __init__(self, config):
+        self.config = config
+        self.worker = xdist_support.worker_id(config)
+        self.rows: List[Dict[str, Any]] = []
+        self._open: Dict[str, Dict[str, Any]] = {}
+        self._phase_index = 0
+
+    def _row(self, item) -> Dict[str, Any]:
+        row = self._open.get(item.nodeid)
+        if row is None:
+            row = {
+                "nodeid": item.nodeid,
+                "test_name": item.name,
+                "test_file": os.path.basename(str(item.fspath)),
+                "worker": self.worker,
+                "started": time.time(),
+                "outcome": None,
+                "duration": 0.0,
+                "setup_s": None,
+                "call_s": None,
+                "teardown_s": None,
+                "reruns": 0,
+                "markers": sorted({marker.name for marker in item.iter_markers()}),
+                "details": None,
+            }
+            self._open[item.nodeid] = row
+        return row
+
+    def start(self, item):
+        self._row(item)
+        take_latencies()
+        profiler = get_profiler()
+        if profiler is not None:
+            self._phase_index = len(profiler.events)
+
+    def attach_details(self, item, details: Dict[str, Any]):
+        row = self._row(item)
+        row["details"] = {**(row["details"] or {}), **details}
+
+    def add_report(self, item, report):
+        row = self._row(item)
+        if report.outcome == "rerun":
+            # pytest-rerunfailures: the next attempt reuses this row
+            row["reruns"] += 1
+            row["duration"] += report.duration
+            return
+        row[f"{report.when}_s"] = report.duration
+        row["duration"] += report.duration
+        if report.failed and row["outcome"] in (None, "passed"):
+            row["outcome"] = "failed" if report.when == "call" else f"{report.when}_failed"
+            row.update(_failure_fields(report))
+        elif report.skipped and row["outcome"] is None:
+            row["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+        elif report.when == "call" and row["outcome"] is None:
+            row["outcome"] = "xpassed" if hasattr(report, "wasxfail") else "passed"
+
+    def finish(self, item):
+        row = self._open.pop(item.nodeid, None)
+        if row is None:
+            return
+        session = item.session
+        row["device_ip"] = self.config.getoption("--device_ip", default=None)
+        row["device_model"] = getattr(session, "device_hardware_model", None)
+        row["device_series"] = getattr(session, "device_series", None)
+
+        phases: Dict[str, float] = {}
+        profiler = get_profiler()
+        if profiler is not None:
+            for event in profiler.events[self._phase_index :]:
+                if event["cat"] == PHASE and event["test"] == item.nodeid:
+                    phases[event["name"]] = phases.get(event["name"], 0.0) + event["duration"]
+        row["phases"] = phases or None
+        row["latencies"] = take_latencies() or None
+        row["outcome"] = row["outcome"] or "unknown"
+        self.rows.append(row)
+
+
+def get_store() -> Optional[ResultsStore]:
+    """Return the active store, or None when the store is disabled."""
+    return _store
+
+
+def attach_details(item, details: Dict[str, Any]) -> None:
+    """
+    Attach debugging data to a test's result row (merged with earlier data).
+
+    Args:
+        item: The pytest item (request.node)
+        details: JSON-serializable data, stored in the ``details`` column
+    """
+    if _store is not None:
+        _store.attach_details(item, details)
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (and create if needed) a results database."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.executescript(SCHEMA)
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(results)")}
+    for column, kind in ADDED_COLUMNS.items():
+        if column not in existing:
+            connection.execute(f"ALTER TABLE results ADD COLUMN {column} {kind}")
+    return connection
+
+
+def write_run(path: str, run: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+    """
+    Append one run and its result rows in a single transaction.
+
+    Args:
+        path: Database file
+        run: Values for the runs table
+        rows: Result rows from all workers
+    """
+    records = []
+    for row in rows:
+        values = {**row, "run_id": run["run_id"]}
+        for column in ("phases", "latencies", "markers", "details"):
+            if values.get(column) is not None:
+                values[column] = json.dumps(values[column], default=str)
+        records.append(tuple(values.get(column) for column in RESULT_COLUMNS))
+
+    connection = connect(path)
+    try:
+        with connection:
+            connection.execute(
+                "INSERT INTO runs VALUES (:run_id, :started, :finished, :host, :device_ip, "
+                ":device_model, :device_series, :workers, :tests, :failed, :args)",
+                run,
+            )
+            connection.executemany(
+                f"INSERT INTO results ({', '.join(RESULT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in RESULT_COLUMNS)})",
+                records,
+            )
+    finally:
+        connection.close()
+
+
+def pytest_addoption(parser):
+    """Add results store options."""
+    group = parser.getgroup("results-store", "per-test results database")
+    group.addoption(
+        "--results-db",
+        action="store",
+        default=DEFAULT_DB,
+        help=f"SQLite file the run's results are appended to (default: {DEFAULT_DB})",
+    )
+    group.addoption(
+        "--no-results-store",
+        action="store_true",
+        default=False,
+        help="Do not record this run in the results database",
+    )
+
+
+def pytest_configure(config):
+    """Start buffering results for this process."""
+    global _store
+    config._results_rows = []
+    config._results_started = time.time()
+    if not config.getoption("--no-results-store"):
+        _store = ResultsStore(config)
+
+
+def pytest_unconfigure(config):
+    global _store
+    _store = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Open a row before the test runs and close it after teardown."""
+    if _store is not None:
+        _store.start(item)
+    yield
+    if _store is not None:
+        _store.finish(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if _store is not None:
+        _store.add_report(item, outcome.get_result())
+
+
+def pytest_sessionfinish(session):
+    """Publish worker rows, or keep them when running without xdist."""
+    if _store is None:
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, _store.rows)
+    else:
+        session.config._results_rows.extend(_store.rows)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect worker rows on the xdist controller."""
+    rows = xdist_support.collect(node, STATS_KEY)
+    if rows:
+        node.config._results_rows.extend(rows)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Write the run to the database."""
+    if config.getoption("--no-results-store") or xdist_support.is_worker(config):
+        return
+    rows = config._results_rows
+    if not rows:
+        return
+
+    first = next((row for row in rows if row.get("device_model")), rows[0])
+    run = {
+        "run_id": uuid.uuid4().hex,
+        "started": config._results_started,
+        "finished": time.time(),
+        "host": socket.gethostname(),
+        "device_ip": config.getoption("--device_ip", default=None),
+        "device_model": first.get("device_model"),
+        "device_series": first.get("device_series"),
+        "workers": len({row["worker"] for row in rows}),
+        "tests": len(rows),
+        "failed": sum(1 for row in rows if row["outcome"] in FAILED_OUTCOMES),
+        "args": " ".join(config.invocation_params.args),
+    }
+    path = config.getoption("--results-db")
+    try:
+        write_run(path, run, rows)
+        terminalreporter.write_line(f"results: {len(rows)} tests recorded in {path}")
+    except sqlite3.Error as e:
+        terminalreporter.write_line(f"Error writing results database {path}: {e}")
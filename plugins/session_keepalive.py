@@ -0,0 +1,144 @@
+"""
+Background session keepalive for logged-in test contexts.
+
+Every context logged in by the ``logged_in_page`` fixture is registered with
+pages.session_keepalive, which refreshes its device session every
+``--session-keepalive-fraction`` x the model's session timeout
+(DeviceCapabilities.get_session_timeout), so long tests never hit the
+session expiry modal and never have to log in again mid-test. Session age
+per context is tracked; refreshes and sessions that expired anyway are
+reported at the end of the run.
+
+The keepalive is off for tests marked ``no_session_keepalive``; tests whose
+node id mentions session expiry or session timeout (all of category 32,
+test_13_1_1, test_20_3_1) get the marker automatically.
+
+Usage:
+    pytest tests --device_ip 172.16.66.6 --session-keepalive-fraction 0.3
+    pytest tests --no-session-keepalive
+"""
+
+import re
+from typing import Dict
+from urllib.parse import urlparse
+
+import pytest
+
+from pages.device_capabilities import DeviceCapabilities
+from pages.session_keepalive import (
+    DEFAULT_FRACTION,
+    close_session_keepalive,
+    configure_session_keepalive,
+    get_session_keepalive,
+)
+from plugins import xdist_support
+
+STATS_KEY = "session_keepalive_stats"
+MARKER = "no_session_keepalive"
+
+# Tests that need the session to expire
+SESSION_EXPIRY_TESTS = re.compile(r"session_expir|session_timeout|test_32_")
+
+
+def pytest_addoption(parser):
+    """Add session keepalive options."""
+    group = parser.getgroup("session-keepalive", "background device session keepalive")
+    group.addoption(
+        "--no-session-keepalive",
+        action="store_true",
+        default=False,
+        help="Do not refresh device sessions in the background",
+    )
+    group.addoption(
+        "--session-keepalive-fraction",
+        action="store",
+        type=float,
+        default=DEFAULT_FRACTION,
+        help=f"Refresh each session after this fraction of its timeout (default: {DEFAULT_FRACTION})",
+    )
+
+
+def pytest_configure(config):
+    """Configure this process's keepalive."""
+    config._session_keepalive_totals = {}
+    config._session_keepalive = not config.getoption("--no-session-keepalive")
+    if config._session_keepalive:
+        fraction = config.getoption("--session-keepalive-fraction")
+        if not 0 < fraction < 1:
+            raise pytest.UsageError("--session-keepalive-fraction must be between 0 and 1")
+        configure_session_keepalive(fraction=fraction)
+
+
+def pytest_collection_modifyitems(items):
+    """Mark session expiry tests so they keep the device's own timeout."""
+    for item in items:
+        if SESSION_EXPIRY_TESTS.search(item.nodeid) and not item.get_closest_marker(MARKER):
+            item.add_marker(MARKER)
+
+
+def keep_session_alive(request, context, base_url: str, config_unlocked: bool = False):
+    """
+    Register a logged-in context with the keepalive.
+
+    Does nothing with --no-session-keepalive or for tests marked
+    no_session_keepalive. Call again after the configuration unlock so the
+    refresh uses the unlocked session's cookies.
+
+    Args:
+        request: pytest request of the fixture
+        context: Logged-in BrowserContext
+        base_url: Device base URL
+        config_unlocked: Configuration is unlocked
+    """
+    if not request.config._session_keepalive or request.node.get_closest_marker(MARKER):
+        return
+    model = getattr(request.session, "device_hardware_model", None)
+    get_session_keepalive().register(
+        context,
+        urlparse(base_url).netloc or base_url,
+        timeout_minutes=DeviceCapabilities.get_session_timeout(model) if model else None,
+        config_unlocked=config_unlocked,
+        name=request.node.nodeid,
+    )
+
+
+def release_session(request, context):
+    """Stop refreshing a context's session (before the context is closed)."""
+    if request.config._session_keepalive:
+        get_session_keepalive().unregister(context)
+
+
+def _merge_stats(config, stats: Dict[str, int]):
+    """Add one process's counters to the run totals."""
+    totals = config._session_keepalive_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Stop the keepalive; publish worker counters or record them."""
+    stats = close_session_keepalive()
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, stats)
+    else:
+        _merge_stats(session.config, stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker counters on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report session refreshes and sessions that expired regardless."""
+    totals = getattr(config, "_session_keepalive_totals", {})
+    if not totals.get("refreshes") and not totals.get("expired"):
+        return
+    terminalreporter.section("session keepalive")
+    terminalreporter.write_line(
+        f"sessions: {totals.get('registered', 0)}, refreshes: {totals.get('refreshes', 0)}, "
+        f"expired anyway: {totals.get('expired', 0)}"
+    )
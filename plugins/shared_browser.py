@@ -0,0 +1,298 @@
+"""
+Opt-in shared Chromium for all xdist workers of a run.
+
+By default every xdist worker launches its own Chromium through
+pytest-playwright, so browser startup time and memory grow with the number
+of workers. With ``--shared-browser`` the controller process launches one
+Chromium with the suite's launch arguments (plus the switches a Playwright
+launch adds itself) and a local DevTools port; every
+worker connects to it with ``connect_over_cdp`` and opens its own isolated
+contexts in it (contexts do not share cookies, storage or cache).
+
+The controller health-checks the browser (process alive and the DevTools
+``/json/version`` endpoint answering) every few seconds and relaunches it on
+the same port if it crashed. Workers reconnect on their next context when
+their connection was lost.
+
+Usage:
+    pytest tests -n 4 --device_ip 172.16.66.6 --shared-browser
+    pytest tests -n 6 --shared-browser --shared-browser-port 9333
+"""
+
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from typing import List, Optional
+
+import pytest
+
+from plugins import xdist_support
+
+# Launch arguments needed for the embedded devices' web UI (self-signed
+# certificates, no CSP); used for both per-worker and shared browsers.
+DEVICE_BROWSER_ARGS = [
+    "--ignore-ssl-errors",
+    "--ignore-certificate-errors",
+    "--ignore-certificate-errors-spki-list",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--allow-insecure-localhost",
+    "--disable-dev-shm-usage",
+]
+
+# Switches a Playwright launch adds on its own (chromiumSwitches); without
+# them Chromium throttles timers and rendering of background and occluded
+# pages, and many workers' pages share this one browser
+PLAYWRIGHT_CHROMIUM_SWITCHES = [
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-back-forward-cache",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--allow-pre-commit-input",
+    "--force-color-profile=srgb",
+    "--metrics-recording-only",
+    "--enable-automation",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--no-service-autorun",
+]
+# Added by Playwright for headless launches
+PLAYWRIGHT_HEADLESS_SWITCHES = ["--hide-scrollbars", "--mute-audio"]
+
+ENDPOINT_KEY = "shared_browser_endpoint"
+HEALTH_INTERVAL = 3.0
+HEALTH_FAILURES = 3
+START_TIMEOUT = 30.0
+
+# Worker-side replacement connection after a shared browser restart
+_reconnected = None
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def endpoint_healthy(endpoint: str, timeout: float = 2.0) -> bool:
+    """True if the DevTools endpoint answers /json/version."""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return "webSocketDebuggerUrl" in json.loads(response.read())
+    except Exception:
+        return False
+
+
+class SharedBrowserServer:
+    """Chromium process with a DevTools port, restarted when it dies."""
+
+    def __init__(self, executable: str, args: List[str], headless: bool, port: int = 0):
+        self.executable = executable
+        self.args = args
+        self.headless = headless
+        self.port = port or _free_port()
+        self.endpoint = f"http://127.0.0.1:{self.port}"
+        self.restarts = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._profile_dir: Optional[str] = None
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def _launch(self):
+        self._profile_dir = tempfile.mkdtemp(prefix="kronos-shared-browser-")
+        command = [
+            self.executable,
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *PLAYWRIGHT_CHROMIUM_SWITCHES,
+            *self.args,
+        ]
+        if self.headless:
+            command.extend(["--headless=new", *PLAYWRIGHT_HEADLESS_SWITCHES])
+        command.append("about:blank")
+        self._process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.time() + START_TIMEOUT
+        while time.time() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Shared browser exited with code {self._process.returncode}")
+            if endpoint_healthy(self.endpoint):
+                return
+            time.sleep(0.2)
+        raise RuntimeError(f"Shared browser did not answer on {self.endpoint}")
+
+    def _terminate(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+    def _watch(self):
+        failures = 0
+        while not self._stop.wait(HEALTH_INTERVAL):
+            alive = self._process is not None and self._process.poll() is None
+            failures = 0 if alive and endpoint_healthy(self.endpoint) else failures + 1
+            if alive and failures < HEALTH_FAILURES:
+                continue
+            print(f"Shared browser unhealthy, restarting on {self.endpoint}")
+            self._terminate()
+            try:
+                self._launch()
+                self.restarts += 1
+                failures = 0
+            except Exception as e:
+                print(f"Error restarting shared browser: {e}")
+
+    def start(self):
+        """Launch the browser and start the health monitor."""
+        self._launch()
+        self._monitor = threading.Thread(target=self._watch, name="shared-browser", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """Stop the monitor and the browser."""
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=HEALTH_INTERVAL + 1)
+        self._terminate()
+
+
+def _chromium_executable() -> str:
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    try:
+        return playwright.chromium.executable_path
+    finally:
+        playwright.stop()
+
+
+def pytest_addoption(parser):
+    """Add shared browser options."""
+    group = parser.getgroup("shared-browser", "one browser shared by all xdist workers")
+    group.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=False,
+        help="Launch one Chromium for the run; workers connect to it over CDP",
+    )
+    group.addoption(
+        "--shared-browser-port",
+        action="store",
+        type=int,
+        default=0,
+        help="DevTools port for the shared browser (default: any free port)",
+    )
+
+
+def pytest_configure(config):
+    """Launch the shared browser in the controller process."""
+    config._shared_browser = None
+    if not config.getoption("--shared-browser") or xdist_support.is_worker(config):
+        return
+    if config.getoption("--browser", default=None) not in (None, [], ["chromium"]):
+        raise pytest.UsageError("--shared-browser supports chromium only")
+    server = SharedBrowserServer(
+        executable=_chromium_executable(),
+        args=DEVICE_BROWSER_ARGS,
+        headless=not config.getoption("--headed", default=False),
+        port=config.getoption("--shared-browser-port"),
+    )
+    server.start()
+    config._shared_browser = server
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_shared_browser", None)
+    if server is not None:
+        server.stop()
+        if server.restarts:
+            print(f"Shared browser was restarted {server.restarts} time(s)")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the shared browser endpoint to each xdist worker."""
+    server = getattr(node.config, "_shared_browser", None)
+    if server is not None:
+        node.workerinput[ENDPOINT_KEY] = server.endpoint
+
+
+def shared_browser_endpoint(config) -> Optional[str]:
+    """DevTools endpoint of the shared browser, or None when not enabled."""
+    if xdist_support.is_worker(config):
+        return config.workerinput.get(ENDPOINT_KEY)
+    server = getattr(config, "_shared_browser", None)
+    return server.endpoint if server is not None else None
+
+
+def connect_shared_browser(config, browser_type, timeout: float = START_TIMEOUT):
+    """
+    Connect to the shared browser, waiting for a restart in progress.
+
+    Args:
+        config: pytest config
+        browser_type: Playwright BrowserType (chromium)
+        timeout: Seconds to keep retrying
+
+    Returns:
+        Connected Browser, or None when --shared-browser is not enabled
+    """
+    endpoint = shared_browser_endpoint(config)
+    if endpoint is None:
+        return None
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return browser_type.connect_over_cdp(endpoint)
+        except Exception as e:
+            if time.time() > deadline:
+                raise RuntimeError(f"Could not connect to shared browser {endpoint}: {e}")
+            time.sleep(1.0)
+
+
+def ensure_connected(config, browser, browser_type):
+    """
+    Return a connected browser, reconnecting to a restarted shared browser.
+
+    Args:
+        config: pytest config
+        browser: The session's Browser
+        browser_type: Playwright BrowserType
+
+    Returns:
+        `browser` if still connected (or not shared), else a new connection
+    """
+    global _reconnected
+    if browser.is_connected() or shared_browser_endpoint(config) is None:
+        return browser
+    if _reconnected is not None and _reconnected.is_connected():
+        return _reconnected
+    print("Shared browser connection lost, reconnecting")
+    _reconnected = connect_shared_browser(config, browser_type)
+    return _reconnected
@@ -0,0 +1,392 @@
+"""
+Sleep and idle-wait accounting across the page-object layer.
+
+With ``--account-sleeps`` enabled, every fixed sleep (``time.sleep``,
+``page.wait_for_timeout``) and every polling wait (``wait_for_load_state``,
+``wait_for_url``, ``wait_for_selector``, ``wait_for_function``,
+``locator.wait_for``) made from repository code is recorded with its call
+site, requested duration and actual duration. The run reports idle time per
+test, per call site and in total, and writes the full breakdown to
+``--sleep-report``.
+
+``--sleep-cap SECONDS`` caps every fixed sleep at the given value. Polling
+waits are never capped. The report lists, per call site, how many tests
+passed and failed while its sleeps were capped, which shows which sleeps
+the tests actually need.
+
+Only sleeps on the main thread whose call site is inside the repository are
+recorded; Playwright, pytest and background helper threads are ignored.
+
+Usage:
+    pytest tests --device_ip 172.16.190.46 --account-sleeps
+    pytest tests --account-sleeps --sleep-cap 0.2 --sleep-report test-results/sleeps_capped.json
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from plugins import xdist_support
+
+STATS_KEY = "sleep_accounting"
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGINS_DIR = os.path.join(REPO_ROOT, "plugins")
+
+FIXED = "fixed"
+POLL = "poll"
+
+# (class name, method name, kind) patched on playwright.sync_api classes
+PLAYWRIGHT_WAITS = [
+    ("Page", "wait_for_timeout", FIXED),
+    ("Frame", "wait_for_timeout", FIXED),
+    ("Page", "wait_for_load_state", POLL),
+    ("Page", "wait_for_url", POLL),
+    ("Page", "wait_for_selector", POLL),
+    ("Page", "wait_for_function", POLL),
+    ("Locator", "wait_for", POLL),
+]
+
+_original_sleep = time.sleep
+
+
+class SleepAccountant:
+    """Records sleeps and waits for one process."""
+
+    def __init__(self, cap: Optional[float] = None):
+        """
+        Initialize accountant.
+
+        Args:
+            cap: Maximum seconds for any fixed sleep, or None for no cap
+        """
+        self.cap = cap
+        self.current_test = ""
+        self.sites: Dict[str, Dict[str, Any]] = {}
+        self.tests: Dict[str, Dict[str, Any]] = {}
+        self.outcomes: Dict[str, str] = {}
+        self._patches = []
+        self._local = threading.local()
+
+    def _call_site(self) -> Optional[str]:
+        """Return "path:line function" of the first repository frame, if any."""
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if filename.startswith(REPO_ROOT) and not filename.startswith(PLUGINS_DIR):
+                rel_path = os.path.relpath(filename, REPO_ROOT)
+                return f"{rel_path}:{frame.f_lineno} {frame.f_code.co_name}"
+            frame = frame.f_back
+        return None
+
+    def _record(self, site: str, kind: str, api: str, requested: Optional[float], actual: float):
+        entry = self.sites.setdefault(
+            site,
+            {
+                "kind": kind,
+                "api": api,
+                "count": 0,
+                "requested": 0.0,
+                "actual": 0.0,
+                "max": 0.0,
+                "tests": [],
+            },
+        )
+        entry["count"] += 1
+        entry["requested"] += requested or 0.0
+        entry["actual"] += actual
+        entry["max"] = max(entry["max"], actual)
+        if self.current_test and self.current_test not in entry["tests"]:
+            entry["tests"].append(self.current_test)
+
+        test = self.tests.setdefault(
+            self.current_test or "<session>", {"fixed": 0.0, "poll": 0.0, "count": 0}
+        )
+        test[kind] += actual
+        test["count"] += 1
+
+    def timed(self, kind: str, api: str, func: Callable, requested: Optional[float], *args, **kwargs):
+        """
+        Run a sleep or wait, recording it when called from repository code.
+
+        Args:
+            kind: FIXED or POLL
+            api: Name of the sleeping API
+            func: Original function
+            requested: Requested duration in seconds (None for polling waits)
+            *args: Arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        # Ignore background threads and nested waits (e.g. a wait implemented on top of another)
+        if threading.current_thread() is not threading.main_thread() or getattr(
+            self._local, "active", False
+        ):
+            return func(*args, **kwargs)
+        site = self._call_site()
+        if site is None:
+            return func(*args, **kwargs)
+
+        self._local.active = True
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.active = False
+            self._record(site, kind, api, requested, time.perf_counter() - start)
+
+    def _capped(self, seconds: float) -> float:
+        return min(seconds, self.cap) if self.cap is not None else seconds
+
+    def install(self):
+        """Patch time.sleep and Playwright wait methods."""
+
+        def sleep(seconds):
+            return self.timed(FIXED, "time.sleep", _original_sleep, seconds, self._capped(seconds))
+
+        time.sleep = sleep
+        self._patches.append((time, "sleep", _original_sleep))
+
+        try:
+            import playwright.sync_api as sync_api
+        except ImportError:
+            return
+
+        for class_name, method_name, kind in PLAYWRIGHT_WAITS:
+            owner = getattr(sync_api, class_name)
+            original = getattr(owner, method_name)
+            setattr(owner, method_name, self._wrap(original, f"{class_name}.{method_name}", kind))
+            self._patches.append((owner, method_name, original))
+
+    def _wrap(self, original: Callable, api: str, kind: str) -> Callable:
+        accountant = self
+
+        if kind == FIXED:
+
+            @functools.wraps(original)
+            def fixed_wrapper(target, timeout, *args, **kwargs):
+                requested = timeout / 1000
+                capped = accountant._capped(requested) * 1000
+                return accountant.timed(kind, api, original, requested, target, capped, *args, **kwargs)
+
+            return fixed_wrapper
+
+        @functools.wraps(original)
+        def poll_wrapper(*args, **kwargs):
+            return accountant.timed(kind, api, original, None, *args, **kwargs)
+
+        return poll_wrapper
+
+    def uninstall(self):
+        """Restore the original functions."""
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+
+_accountant: Optional[SleepAccountant] = None
+
+
+def pytest_addoption(parser):
+    """Add sleep accounting options."""
+    group = parser.getgroup("sleep-accounting", "sleep and idle-wait accounting")
+    group.addoption(
+        "--account-sleeps",
+        action="store_true",
+        default=False,
+        help="Record every fixed sleep and polling wait with its call site",
+    )
+    group.addoption(
+        "--sleep-cap",
+        action="store",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Cap fixed sleeps (time.sleep/wait_for_timeout) at SECONDS; implies --account-sleeps",
+    )
+    group.addoption(
+        "--sleep-report",
+        action="store",
+        default="test-results/sleep_accounting.json",
+        help="Output file for the sleep accounting report",
+    )
+
+
+def pytest_configure(config):
+    """Install instrumentation when enabled."""
+    global _accountant
+    config._sleep_results = {"sites": {}, "tests": {}, "outcomes": {}, "wall": 0.0}
+    if config.getoption("--account-sleeps") or config.getoption("--sleep-cap") is not None:
+        _accountant = SleepAccountant(cap=config.getoption("--sleep-cap"))
+        _accountant.install()
+        config._sleep_start = time.time()
+
+
+def pytest_unconfigure(config):
+    global _accountant
+    if _accountant is not None:
+        _accountant.uninstall()
+        _accountant = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute sleeps to the running test."""
+    if _accountant is not None:
+        _accountant.current_test = item.nodeid
+    yield
+    if _accountant is not None:
+        _accountant.current_test = ""
+
+
+def pytest_runtest_logreport(report):
+    """Remember each test's outcome for the capped-sleep correlation."""
+    if _accountant is None:
+        return
+    if report.failed:
+        _accountant.outcomes[report.nodeid] = "failed"
+    elif report.when == "call" or report.skipped:
+        _accountant.outcomes.setdefault(report.nodeid, report.outcome)
+
+
+def _merge(config, data: Dict[str, Any]):
+    """Merge one process's results into the run results."""
+    results = config._sleep_results
+    for site, entry in data["sites"].items():
+        merged = results["sites"].setdefault(
+            site,
+            {
+                "kind": entry["kind"],
+                "api": entry["api"],
+                "count": 0,
+                "requested": 0.0,
+                "actual": 0.0,
+                "max": 0.0,
+                "tests": [],
+            },
+        )
+        merged["count"] += entry["count"]
+        merged["requested"] += entry["requested"]
+        merged["actual"] += entry["actual"]
+        merged["max"] = max(merged["max"], entry["max"])
+        merged["tests"].extend(entry["tests"])
+    results["tests"].update(data["tests"])
+    results["outcomes"].update(data["outcomes"])
+    results["wall"] += data["wall"]
+
+
+def _snapshot(config) -> Dict[str, Any]:
+    return {
+        "sites": _accountant.sites,
+        "tests": _accountant.tests,
+        "outcomes": _accountant.outcomes,
+        "wall": time.time() - config._sleep_start,
+    }
+
+
+def pytest_sessionfinish(session):
+    """Publish worker results, or keep them when running without xdist."""
+    if _accountant is None:
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, _snapshot(session.config))
+    else:
+        _merge(session.config, _snapshot(session.config))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge worker results on the xdist controller."""
+    data = xdist_support.collect(node, STATS_KEY)
+    if data:
+        _merge(node.config, data)
+
+
+def build_report(results: Dict[str, Any], cap: Optional[float]) -> Dict[str, Any]:
+    """
+    Build the final report from merged results.
+
+    Args:
+        results: Merged sites, tests, outcomes and worker wall time
+        cap: Sleep cap in effect, if any
+
+    Returns:
+        Report with run totals, per-site and per-test breakdowns
+    """
+    outcomes = results["outcomes"]
+    sites = {}
+    for site, entry in sorted(results["sites"].items(), key=lambda kv: kv[1]["actual"], reverse=True):
+        tests = sorted(set(entry["tests"]))
+        sites[site] = {
+            "kind": entry["kind"],
+            "api": entry["api"],
+            "count": entry["count"],
+            "requested_s": round(entry["requested"], 3),
+            "actual_s": round(entry["actual"], 3),
+            "mean_s": round(entry["actual"] / entry["count"], 3),
+            "max_s": round(entry["max"], 3),
+            "tests": len(tests),
+            "tests_failed": sum(1 for t in tests if outcomes.get(t) == "failed"),
+        }
+    fixed = sum(t["fixed"] for t in results["tests"].values())
+    poll = sum(t["poll"] for t in results["tests"].values())
+    wall = results["wall"]
+    return {
+        "sleep_cap_s": cap,
+        "totals": {
+            "worker_wall_s": round(wall, 1),
+            "fixed_sleep_s": round(fixed, 1),
+            "polling_wait_s": round(poll, 1),
+            "idle_share": round((fixed + poll) / wall, 3) if wall else None,
+        },
+        "sites": sites,
+        "tests": {
+            test: {
+                "fixed_s": round(data["fixed"], 2),
+                "poll_s": round(data["poll"], 2),
+                "waits": data["count"],
+                "outcome": outcomes.get(test),
+            }
+            for test, data in sorted(
+                results["tests"].items(), key=lambda kv: kv[1]["fixed"] + kv[1]["poll"], reverse=True
+            )
+        },
+    }
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the idle-time summary and write the report."""
+    if not hasattr(config, "_sleep_start"):
+        return
+    cap = config.getoption("--sleep-cap")
+    report = build_report(config._sleep_results, cap)
+    report_path = Path(config.getoption("--sleep-report"))
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2))
+
+    totals = report["totals"]
+    terminalreporter.section("sleep accounting")
+    terminalreporter.write_line(
+        f"fixed sleeps: {totals['fixed_sleep_s']}s, polling waits: {totals['polling_wait_s']}s, "
+        f"worker wall time: {totals['worker_wall_s']}s"
+        + (f", idle share: {totals['idle_share']:.1%}" if totals["idle_share"] is not None else "")
+    )
+    if cap is not None:
+        terminalreporter.write_line(f"fixed sleeps capped at {cap}s")
+    terminalreporter.write_line("top call sites:")
+    for site, entry in list(report["sites"].items())[:15]:
+        failed = f", {entry['tests_failed']} failed" if cap is not None else ""
+        terminalreporter.write_line(
+            f"  {entry['actual_s']:>8.1f}s {entry['kind']:<5} x{entry['count']:<5} {site} "
+            f"({entry['api']}, {entry['tests']} tests{failed})"
+        )
+    terminalreporter.write_line(f"report: {report_path}")
@@ -0,0 +1,324 @@
+"""
+Opt-in on-disk cache for static web assets served by the device.
+
+The embedded web server re-sends the same JavaScript, CSS, fonts and images
+on every navigation of every test. With ``--static-cache`` enabled, requests
+for those assets are intercepted with ``context.route`` and served from a
+disk cache shared by all contexts and xdist workers. Dynamic pages and form
+posts never match the route and always reach the device.
+
+Cache entries are validated in one of two ways:
+
+- ``--static-cache-firmware VERSION``: entries are keyed by firmware version
+  and trusted without contacting the device. Use when the firmware under
+  test is known; a firmware change starts a fresh namespace.
+- Default (ETag): each asset is revalidated once per process with a
+  conditional GET (If-None-Match / If-Modified-Since). A 304 serves the
+  cached body and the asset is trusted for the rest of the process.
+
+Usage:
+    pytest tests --static-cache
+    pytest tests --static-cache --static-cache-firmware 2.4.1
+    pytest tests --static-cache --static-cache-dir /tmp/kronos-assets
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import pytest
+
+from plugins import xdist_support
+
+DEFAULT_CACHE_DIR = ".cache/static-assets"
+STATS_KEY = "static_asset_cache_stats"
+
+STATIC_EXTENSIONS = (
+    "js",
+    "css",
+    "map",
+    "woff",
+    "woff2",
+    "ttf",
+    "otf",
+    "eot",
+    "png",
+    "jpg",
+    "jpeg",
+    "gif",
+    "svg",
+    "ico",
+)
+
+# Only URLs matching this pattern are routed through Python at all, so
+# dynamic pages and form posts incur no interception overhead.
+STATIC_URL_PATTERN = re.compile(
+    r"^https?://[^?#]+\.(?:" + "|".join(STATIC_EXTENSIONS) + r")(?:[?#].*)?$",
+    re.IGNORECASE,
+)
+
+# Headers describing the transfer rather than the asset; Playwright hands us
+# the decoded body so these must not be replayed.
+_HOP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection"}
+
+
+class StaticAssetCache:
+    """Disk-backed cache for static assets, safe to share across processes."""
+
+    def __init__(self, cache_dir: str, firmware_version: Optional[str] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Root directory of the cache
+            firmware_version: Firmware namespace; when set, entries are
+                trusted without revalidation
+        """
+        self.cache_dir = Path(cache_dir)
+        self.firmware_version = firmware_version
+        self._validated = set()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "bypassed": 0}
+
+    def _entry_path(self, url: str) -> Path:
+        """Return the path prefix for a URL's cache entry."""
+        parsed = urlparse(url)
+        namespace = self.firmware_version or "etag"
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / parsed.netloc.replace(":", "_") / namespace / digest
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cache entry.
+
+        Args:
+            url: Asset URL
+
+        Returns:
+            Entry metadata with "body" bytes, or None if not cached
+        """
+        base = self._entry_path(url)
+        try:
+            meta = json.loads(base.with_suffix(".json").read_text())
+            meta["body"] = base.with_suffix(".body").read_bytes()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """
+        Write a cache entry atomically.
+
+        Body and metadata are written to temporary files and moved into place
+        with os.replace, so concurrent workers never observe partial entries.
+
+        Args:
+            url: Asset URL
+            status: HTTP status code
+            headers: Response headers
+            body: Decoded response body
+        """
+        base = self._entry_path(url)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        headers = {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS}
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "stored_at": time.time(),
+        }
+        # Body first: a metadata file always points at a complete body
+        self._atomic_write(base.with_suffix(".body"), body)
+        self._atomic_write(
+            base.with_suffix(".json"), json.dumps(meta, indent=2).encode("utf-8")
+        )
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write data to path via a temporary file in the same directory."""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _is_cacheable(self, status: int, headers: Dict[str, str]) -> bool:
+        """Check whether a fetched response may be stored."""
+        if status != 200:
+            return False
+        if "no-store" in headers.get("cache-control", "").lower():
+            return False
+        # Without a firmware namespace an entry can only be trusted again
+        # if the device gives us a validator to revalidate it with
+        if not self.firmware_version:
+            return bool(headers.get("etag") or headers.get("last-modified"))
+        return True
+
+    def _fulfill_from_entry(self, route, entry: Dict[str, Any]):
+        """Serve a cached entry without touching the device."""
+        route.fulfill(
+            status=entry["status"], headers=entry["headers"], body=entry["body"]
+        )
+
+    def handle(self, route):
+        """
+        Route handler serving static assets from the cache.
+
+        Args:
+            route: Playwright route for a static asset request
+        """
+        request = route.request
+        if request.method != "GET":
+            self.stats["bypassed"] += 1
+            route.fallback()
+            return
+
+        url = request.url
+        entry = self.load(url)
+
+        try:
+            if entry and (self.firmware_version or url in self._validated):
+                self.stats["hits"] += 1
+                self._fulfill_from_entry(route, entry)
+                return
+
+            headers = dict(request.headers)
+            if entry:
+                if entry.get("etag"):
+                    headers["if-none-match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["if-modified-since"] = entry["last_modified"]
+
+            response = route.fetch(headers=headers)
+
+            if entry and response.status == 304:
+                self.stats["revalidated"] += 1
+                self._validated.add(url)
+                self._fulfill_from_entry(route, entry)
+                return
+
+            self.stats["misses"] += 1
+            body = response.body()
+            if self._is_cacheable(response.status, response.headers):
+                self.store(url, response.status, response.headers, body)
+                self._validated.add(url)
+            route.fulfill(response=response, body=body)
+        except Exception as e:
+            print(f"Static asset cache error for {url}: {e}")
+            self.stats["bypassed"] += 1
+            route.fallback()
+
+    def install(self, context):
+        """
+        Install the cache on a browser context.
+
+        Args:
+            context: Playwright BrowserContext
+        """
+        context.route(STATIC_URL_PATTERN, self.handle)
+
+
+def pytest_addoption(parser):
+    """Add static asset cache options."""
+    group = parser.getgroup("static-cache", "static asset cache")
+    group.addoption(
+        "--static-cache",
+        action="store_true",
+        default=False,
+        help="Serve static device assets (js/css/fonts/images) from a disk cache",
+    )
+    group.addoption(
+        "--static-cache-dir",
+        action="store",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for the static asset cache",
+    )
+    group.addoption(
+        "--static-cache-firmware",
+        action="store",
+        default=None,
+        help="Firmware version namespace; trusts cached assets without ETag revalidation",
+    )
+
+
+def pytest_configure(config):
+    """Create the process-wide cache when enabled."""
+    config._static_asset_cache = None
+    config._static_asset_cache_totals = {}
+    if config.getoption("--static-cache"):
+        config._static_asset_cache = StaticAssetCache(
+            config.getoption("--static-cache-dir"),
+            config.getoption("--static-cache-firmware"),
+        )
+
+
+def install_static_asset_cache(config, context) -> Optional[StaticAssetCache]:
+    """
+    Install the static asset cache on a context if enabled.
+
+    Args:
+        config: pytest config
+        context: Playwright BrowserContext
+
+    Returns:
+        The installed cache, or None when the cache is disabled
+    """
+    cache = getattr(config, "_static_asset_cache", None)
+    if cache is not None:
+        cache.install(context)
+    return cache
+
+
+def _merge_stats(config, stats: Dict[str, int]):
+    """Add one process's counters to the run totals."""
+    totals = config._static_asset_cache_totals
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Publish worker statistics, or record them when running without xdist."""
+    cache = getattr(session.config, "_static_asset_cache", None)
+    if cache is None:
+        return
+    if xdist_support.is_worker(session.config):
+        xdist_support.publish(session.config, STATS_KEY, cache.stats)
+    else:
+        _merge_stats(session.config, cache.stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report cache effectiveness for the run."""
+    if getattr(config, "_static_asset_cache", None) is None:
+        return
+    totals = getattr(config, "_static_asset_cache_totals", {})
+    served = totals.get("hits", 0) + totals.get("revalidated", 0)
+    fetched = totals.get("misses", 0)
+    total = served + fetched
+    terminalreporter.section("static asset cache")
+    terminalreporter.write_line(
+        f"served from cache: {served} (hits {totals.get('hits', 0)}, "
+        f"revalidated {totals.get('revalidated', 0)}), fetched from device: {fetched}, "
+        f"bypassed: {totals.get('bypassed', 0)}"
+    )
+    if total:
+        terminalreporter.write_line(f"cache hit ratio: {served / total:.1%}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge per-worker cache statistics on the xdist controller."""
+    stats = xdist_support.collect(node, STATS_KEY)
+    if stats:
+        _merge_stats(node.config, stats)
@@ -0,0 +1,84 @@
+"""
+Page object logging configuration for test runs.
+
+Configures pages.logging_config for the session: the level of the ``pages``
+logger tree (WARNING by default, so a normal run writes almost nothing),
+per-module overrides, and the directory for the per-worker JSON lines files
+(``<dir>/<worker>.jsonl``). Every line is tagged with the running test's
+node id.
+
+Usage:
+    pytest tests --device_ip 172.16.190.46 --page-log-level DEBUG
+    pytest tests -n 3 --page-log-module pages.dashboard_page=DEBUG --page-log-module pages.base=INFO
+"""
+
+from typing import Dict
+
+import pytest
+
+from pages.logging_config import (
+    DEFAULT_LEVEL,
+    LOG_DIR,
+    bind_log_context,
+    clear_log_context,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+def pytest_addoption(parser):
+    """Add page logging options."""
+    group = parser.getgroup("page-logging", "page object structured logging")
+    group.addoption(
+        "--page-log-level",
+        action="store",
+        default=DEFAULT_LEVEL,
+        help=f"Level for page object loggers (default: {DEFAULT_LEVEL})",
+    )
+    group.addoption(
+        "--page-log-module",
+        action="append",
+        default=[],
+        metavar="LOGGER=LEVEL",
+        help="Per-module level override, e.g. pages.dashboard_page=DEBUG (repeatable)",
+    )
+    group.addoption(
+        "--page-log-dir",
+        action="store",
+        default=LOG_DIR,
+        help="Directory for per-worker JSON lines log files",
+    )
+
+
+def _module_levels(values) -> Dict[str, str]:
+    levels = {}
+    for value in values:
+        name, separator, level = value.partition("=")
+        if not separator or not name or not level:
+            raise pytest.UsageError(f"--page-log-module expects LOGGER=LEVEL, got {value!r}")
+        levels[name.strip()] = level.strip()
+    return levels
+
+
+def pytest_configure(config):
+    """Configure page object logging for this process."""
+    try:
+        configure_logging(
+            level=config.getoption("--page-log-level"),
+            module_levels=_module_levels(config.getoption("--page-log-module")),
+            log_dir=config.getoption("--page-log-dir"),
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+def pytest_unconfigure(config):
+    shutdown_logging()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Tag log lines with the running test."""
+    bind_log_context(test=item.nodeid)
+    yield
+    clear_log_context()
@@ -0,0 +1,32 @@
+"""
+Helpers for plugins that aggregate data across pytest-xdist workers.
+
+Workers publish their data through ``config.workeroutput`` at session end;
+the controller receives it in ``pytest_testnodedown``. Without xdist the
+single process is both worker and controller.
+"""
+
+from typing import Any, Optional
+
+
+def is_worker(config) -> bool:
+    """True when running inside an xdist worker process."""
+    return hasattr(config, "workerinput")
+
+
+def worker_id(config) -> str:
+    """Return the xdist worker id (gw0, gw1, ...) or "master"."""
+    if is_worker(config):
+        return config.workerinput.get("workerid", "gw?")
+    return "master"
+
+
+def publish(config, key: str, data: Any) -> None:
+    """Hand worker data to the controller (no-op outside xdist workers)."""
+    if is_worker(config):
+        config.workeroutput[key] = data
+
+
+def collect(node, key: str) -> Optional[Any]:
+    """Read data a worker published, from the controller side."""
+    return getattr(node, "workeroutput", {}).get(key)
@@ -13,6 +13,9 @@ import time
 from playwright.sync_api import Page, expect
 from pages.login_page import LoginPage
 
+# These tests wait for the device session to expire
+pytestmark = pytest.mark.no_session_keepalive
+
 
 class TestSessionExpiryModalAppearance:
     """Test 32.1: Session Expiry Modal Appearance"""
@@ -12,14 +12,40 @@ Source Class: TestTimeSyncEdgeCases
 
 import pytest
 from playwright.sync_api import Page
+from pages.telemetry_sampler import TelemetrySampler
 
+SAMPLE_INTERVAL = 1.0
 
-def test_25_1_5_gnss_signal_loss_handling(logged_in_page: Page, base_url: str):
+
+def test_25_1_5_gnss_signal_loss_handling(request, logged_in_page: Page, base_url: str):
     """Test 25.1.5: GNSS signal loss handling"""
+    # Observation window; block the antenna during it to exercise signal loss
+    sample_seconds = request.config.getoption("--gnss-sample-seconds")
+    if sample_seconds <= 0:
+        pytest.skip("GNSS signal loss sampling is opt-in: --gnss-sample-seconds N")
     logged_in_page.goto(f"{base_url}/", wait_until="domcontentloaded")
     # Check dashboard for GNSS status
     tables = logged_in_page.locator("table")
-    if tables.count() >= 2:
-        # GNSS status table exists
+    if tables.count() < 2:
+        pytest.skip("GNSS status table not available on dashboard")
+
+    # Observe GNSS status over time instead of a single scrape
+    sampler = TelemetrySampler.from_page(
+        logged_in_page, interval=SAMPLE_INTERVAL, capacity=int(sample_seconds / SAMPLE_INTERVAL) + 1
+    )
+    sampler.run(sample_seconds)
+    summary = sampler.summary()
+    print(f"GNSS trends: {summary['trends']}")
+    print(f"GNSS lock events: {summary['lock_events']}")
+    print(f"Satellites acquired/lost: {summary['acquired']}/{summary['lost']}")
+
+    assert summary["samples_total"] > 0, "No GNSS telemetry could be sampled"
+
+    losses = [e for e in summary["lock_events"] if e["type"] == "loss"]
+    if not losses:
         # Device should gracefully handle signal loss (holdover mode)
-        pytest.skip("Manual test - requires blocking GNSS signals")
+        pytest.skip("No GNSS signal loss observed - requires blocking GNSS signals")
+
+    # After a loss the device must report a defined state, not go blank
+    for event in losses:
+        assert event["to"], f"GNSS state blank after signal loss: {event}"
@@ -1,7 +1,7 @@
 """
 Category 26: API & Alternative Interface Testing - Individual Test
 Test 26.1.12: Bulk Configuration Import Export - FIXED
-Test Count: 1 test
+Test Count: 2 tests
 Hardware: Conditional ([WARNING])
 Priority: LOW
 Series: Both Series 2 and 3
@@ -12,6 +12,8 @@ FIXED: Increased timeouts, proper authentication, device-aware handling
 import pytest
 import time
 from playwright.sync_api import Page
+from pages.config_transfer import ConfigTransfer
+from pages.device_http import DeviceHttpSession
 
 
 def test_26_1_12_bulk_configuration_import_export(
@@ -41,3 +43,21 @@ def test_26_1_12_bulk_configuration_import_export(
             assert True, "File upload functionality available"
     else:
         pytest.skip("Configuration import not available via web interface")
+
+
+def test_26_1_12_bulk_configuration_round_trip(
+    unlocked_config_page: Page, base_url: str
+):
+    """Test 26.1.12: Export full configuration, re-import it and verify no drift"""
+    # Reuse the browser's authenticated session for direct form posts
+    session = DeviceHttpSession(base_url)
+    session.set_cookies(unlocked_config_page.context.cookies())
+    transfer = ConfigTransfer(session)
+
+    report = transfer.round_trip()
+    print(f"Round-trip phases: {report['phases']}")
+    print(f"Round-trip throughput: {report['throughput']}")
+
+    assert report["export_stats"]["pages"] > 0, "No configuration sections exported"
+    assert not report["import"]["errors"], f"Import errors: {report['import']['errors']}"
+    assert not report["differences"], f"Configuration drift after re-import: {report['differences']}"
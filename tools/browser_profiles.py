@@ -0,0 +1,220 @@
+"""
+Persistent Browser Profiles for Kronos Exploration Tools
+
+Exploration sessions normally start from a fresh browser context, so every
+run downloads and parses all device assets again. A persistent profile (one
+per device, under .cache/browser-profiles/<ip>) keeps the HTTP disk cache and
+cookies between runs.
+
+This tool:
+1. measure - Load the login page and, with a password, the dashboard, in a
+             cold (empty, throw-away) profile and in the device's warm
+             profile, each in a newly launched browser, and compare load
+             time, TLS handshake time, bytes transferred and requests served
+             from cache
+2. clear   - Delete device profiles (cache busting)
+3. list    - Show existing profiles and their size
+
+Other tools open a device's profile with launch_device_profile(); see
+device_explorer --persistent-profile.
+
+Note: TLS session tickets are kept in memory by Chromium and only reused
+within one browser process, so across runs only the HTTP cache and
+cookies carry over. Chromium also does not cache responses whose
+certificate was rejected (self-signed device certificates accepted through
+ignore_https_errors), so measure may show little warm gain on such units;
+that is what the cold/warm comparison is for.
+
+Usage:
+    python -m tools.browser_profiles measure --device 172.16.66.3 --runs 3
+    python -m tools.browser_profiles measure --device 172.16.66.3 --password novatech
+    python -m tools.browser_profiles clear --device 172.16.66.3
+    python -m tools.browser_profiles clear --all
+    python -m tools.browser_profiles list
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+from pages.login_page import LoginPage
+from plugins.shared_browser import DEVICE_BROWSER_ARGS
+
+PROFILE_ROOT = Path(".cache/browser-profiles")
+
+# Navigation and resource timing of the current document
+LOAD_METRICS_JS = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const entries = nav ? [nav, ...resources] : resources;
+    return {
+        load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+        dom_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        tls_ms: nav && nav.secureConnectionStart > 0 ? nav.connectEnd - nav.secureConnectionStart : 0,
+        requests: entries.length,
+        cached: resources.filter((r) => r.transferSize === 0 && r.decodedBodySize > 0).length,
+        transferred: entries.reduce((total, r) => total + (r.transferSize || 0), 0),
+    };
+}
+"""
+
+
+def profile_dir(device_ip: str) -> Path:
+    """Profile directory of a device."""
+    return PROFILE_ROOT / device_ip.replace(":", "_")
+
+
+def launch_device_profile(
+    playwright,
+    device_ip: str,
+    headless: bool = True,
+    user_data_dir: Optional[str] = None,
+    **options,
+):
+    """
+    Launch Chromium on a device's persistent profile.
+
+    Args:
+        playwright: Started Playwright instance
+        device_ip: Device IP (selects the profile)
+        headless: Run headless
+        user_data_dir: Profile directory override (e.g. a throw-away one)
+        **options: Extra launch_persistent_context options (viewport, ...)
+
+    Returns:
+        Persistent BrowserContext; closing it closes the browser
+    """
+    directory = Path(user_data_dir) if user_data_dir else profile_dir(device_ip)
+    directory.mkdir(parents=True, exist_ok=True)
+    return playwright.chromium.launch_persistent_context(
+        str(directory),
+        headless=headless,
+        args=DEVICE_BROWSER_ARGS,
+        ignore_https_errors=True,
+        **options,
+    )
+
+
+def _load(page, url: str) -> Dict[str, Any]:
+    page.goto(url, wait_until="load")
+    page.wait_for_function(
+        "() => (performance.getEntriesByType('navigation')[0] || {}).loadEventEnd > 0"
+    )
+    return page.evaluate(LOAD_METRICS_JS)
+
+
+def measure_session(
+    playwright, device_ip: str, password: Optional[str], user_data_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    One browser launch: load the login page and optionally the dashboard.
+
+    Returns:
+        Dictionary with startup seconds and metrics per loaded page
+    """
+    start = time.time()
+    context = launch_device_profile(playwright, device_ip, user_data_dir=user_data_dir)
+    result: Dict[str, Any] = {"startup_s": time.time() - start, "pages": {}}
+    try:
+        page = context.pages[0] if context.pages else context.new_page()
+        result["pages"]["login"] = _load(page, f"https://{device_ip}/")
+        if password:
+            if not LoginPage(page).login(password=password):
+                raise RuntimeError("login failed")
+            result["pages"]["dashboard"] = _load(page, f"https://{device_ip}/")
+    finally:
+        context.close()
+    return result
+
+
+def measure(device_ip: str, password: Optional[str], runs: int) -> int:
+    """Compare cold and warm profile loads of a device."""
+    sessions: Dict[str, List[Dict[str, Any]]] = {"cold": [], "warm": []}
+    with sync_playwright() as playwright:
+        if not profile_dir(device_ip).exists():
+            print(f"Priming warm profile {profile_dir(device_ip)}")
+            measure_session(playwright, device_ip, password)
+        for run in range(runs):
+            with tempfile.TemporaryDirectory(prefix="kronos-cold-profile-") as cold_dir:
+                sessions["cold"].append(measure_session(playwright, device_ip, password, cold_dir))
+            sessions["warm"].append(measure_session(playwright, device_ip, password))
+            print(f"  run {run + 1}/{runs} done")
+
+    print(f"\nCold vs warm profile, {device_ip}, median of {runs} run(s)")
+    print(f"{'page':<10} {'mode':<5} {'load ms':>8} {'DOM ms':>8} {'TLS ms':>7} {'requests':>9} {'cached':>7} {'KB':>8}")
+    pages = list(sessions["cold"][0]["pages"])
+    for name in pages:
+        for mode in ("cold", "warm"):
+            metrics = [session["pages"][name] for session in sessions[mode]]
+
+            def median(key):
+                return statistics.median(m[key] or 0 for m in metrics)
+
+            print(
+                f"{name:<10} {mode:<5} {median('load_ms'):>8.0f} {median('dom_ms'):>8.0f} "
+                f"{median('tls_ms'):>7.0f} {median('requests'):>9.0f} {median('cached'):>7.0f} "
+                f"{median('transferred') / 1024:>8.1f}"
+            )
+    for mode in ("cold", "warm"):
+        startup = statistics.median(session["startup_s"] for session in sessions[mode])
+        print(f"browser startup ({mode}): {startup:.2f}s")
+    return 0
+
+
+def clear(devices: List[str]) -> int:
+    """Delete device profiles."""
+    targets = [profile_dir(device) for device in devices] if devices else [PROFILE_ROOT]
+    for target in targets:
+        if target.exists():
+            shutil.rmtree(target)
+            print(f"Removed {target}")
+        else:
+            print(f"No profile at {target}")
+    return 0
+
+
+def list_profiles() -> int:
+    """Print existing profiles and their size."""
+    if not PROFILE_ROOT.exists():
+        print("No browser profiles")
+        return 0
+    for directory in sorted(PROFILE_ROOT.iterdir()):
+        size = sum(f.stat().st_size for f in directory.rglob("*") if f.is_file())
+        print(f"{directory.name:<20} {size / 1e6:>8.1f} MB")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage and measure persistent browser profiles")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    measure_parser = subparsers.add_parser("measure", help="Compare cold and warm page loads")
+    measure_parser.add_argument("--device", required=True, help="Device IP")
+    measure_parser.add_argument("--password", help="Also measure the dashboard after login")
+    measure_parser.add_argument("--runs", type=int, default=3, help="Launches per mode")
+
+    clear_parser = subparsers.add_parser("clear", help="Delete device profiles (cache busting)")
+    clear_group = clear_parser.add_mutually_exclusive_group(required=True)
+    clear_group.add_argument("--device", action="append", help="Device IP (repeatable)")
+    clear_group.add_argument("--all", action="store_true", help="Delete all profiles")
+
+    subparsers.add_parser("list", help="List profiles")
+
+    args = parser.parse_args()
+    if args.command == "measure":
+        return measure(args.device, args.password, args.runs)
+    if args.command == "clear":
+        return clear([] if args.all else args.device)
+    return list_profiles()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
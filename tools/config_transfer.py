@@ -0,0 +1,156 @@
+"""
+Configuration Export/Import Tool for Kronos Devices
+
+Exports the full device configuration over HTTP into a JSON snapshot, imports
+a snapshot back (e.g. cloning a golden configuration onto a unit in one bulk
+operation instead of dozens of UI saves), diffs a snapshot against the live
+device, and benchmarks the device's bulk config path with a round trip.
+
+This tool:
+1. export    - Read every config section into a normalized JSON snapshot
+2. import    - Post the forms whose values differ, then verify every section
+3. diff      - Compare a snapshot with the live configuration
+4. roundtrip - Export, re-post the same values (forced) and verify, with
+               per-phase timing and field throughput
+
+Per-unit identity (IP addresses, masks, gateway, identifier) is never copied
+unless --include-identity is given. The network section is only imported
+when --sections names it.
+
+Usage:
+    python -m tools.config_transfer export --device 172.16.66.3 --output golden_k3.json
+    python -m tools.config_transfer import --device 172.16.66.6 --input golden_k3.json
+    python -m tools.config_transfer diff --device 172.16.66.6 --input golden_k3.json
+    python -m tools.config_transfer roundtrip --device 172.16.190.46 --output roundtrip.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pages.config_transfer import ROUNDTRIP_SECTIONS, ConfigTransfer, diff_snapshots
+from pages.device_http import DeviceHttpSession
+
+PASSWORD = "novatech"
+
+
+def connect(device_ip: str, password: str) -> Optional[DeviceHttpSession]:
+    """Log in and unlock configuration; None on failure."""
+    session = DeviceHttpSession(device_ip)
+    if not session.login(password) or not session.unlock(password):
+        print(f"Could not authenticate to {device_ip}")
+        return None
+    return session
+
+
+def print_differences(differences: List[Dict[str, Any]], limit: int = 50):
+    """Print field differences as a table."""
+    if not differences:
+        print("  No differences")
+        return
+    print(f"  {'field':<40} {'expected':<25} {'actual':<25}")
+    for difference in differences[:limit]:
+        field = f"{difference['section']}.{difference['form']}.{difference['field']}"
+        print(
+            f"  {field:<40} {str(difference['expected']):<25} {str(difference['actual']):<25}"
+        )
+    if len(differences) > limit:
+        print(f"  ... {len(differences) - limit} more")
+
+
+def print_phases(report: Dict[str, Any]):
+    """Print round-trip phase timing and throughput."""
+    print("\n" + "=" * 60)
+    print(f"  Round trip on {report['device']}: {'OK' if report['ok'] else 'FAILED'}")
+    print("-" * 60)
+    for phase, seconds in report["phases"].items():
+        print(f"  {phase:<10} {seconds:>8.3f}s")
+    print("-" * 60)
+    for name, value in report.get("throughput", {}).items():
+        print(f"  {name:<25} {value}")
+    print("=" * 60)
+
+
+def save_json(path: str, data: Dict[str, Any]):
+    """Write a JSON file, creating parent directories."""
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(data, indent=2))
+    print(f"Saved: {output}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export/import Kronos device configuration")
+    parser.add_argument("--password", default=PASSWORD, help="Device password")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export configuration to JSON")
+    export_parser.add_argument("--device", required=True)
+    export_parser.add_argument("--output", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Import a configuration snapshot")
+    import_parser.add_argument("--device", required=True)
+    import_parser.add_argument("--input", required=True)
+    import_parser.add_argument(
+        "--sections", help="Comma-separated sections to import (default: all but network)"
+    )
+    import_parser.add_argument("--include-identity", action="store_true")
+    import_parser.add_argument("--force", action="store_true", help="Post unchanged forms too")
+    import_parser.add_argument("--output", help="Save the import report")
+
+    diff_parser = subparsers.add_parser("diff", help="Diff a snapshot with the live device")
+    diff_parser.add_argument("--device", required=True)
+    diff_parser.add_argument("--input", required=True)
+    diff_parser.add_argument("--include-identity", action="store_true")
+
+    roundtrip_parser = subparsers.add_parser("roundtrip", help="Benchmark export/import/verify")
+    roundtrip_parser.add_argument("--device", required=True)
+    roundtrip_parser.add_argument(
+        "--sections",
+        default=",".join(ROUNDTRIP_SECTIONS),
+        help="Comma-separated sections to re-post",
+    )
+    roundtrip_parser.add_argument("--output", help="Save the round-trip report")
+
+    args = parser.parse_args()
+    session = connect(args.device, args.password)
+    if session is None:
+        return 2
+    transfer = ConfigTransfer(session)
+
+    if args.command == "export":
+        save_json(args.output, transfer.export())
+        return 0
+
+    if args.command == "diff":
+        snapshot = json.loads(Path(args.input).read_text())
+        differences = diff_snapshots(
+            snapshot, transfer.read(), ignore_identity=not args.include_identity
+        )
+        print(f"\n{len(differences)} difference(s) between {args.input} and {args.device}")
+        print_differences(differences)
+        return 1 if differences else 0
+
+    if args.command == "import":
+        snapshot = json.loads(Path(args.input).read_text())
+        sections = args.sections.split(",") if args.sections else None
+        report = transfer.clone(snapshot, sections, args.include_identity, args.force)
+        print_differences(report["differences"])
+        for error in report["import"]["errors"]:
+            print(f"  Error: {error}")
+        if args.output:
+            save_json(args.output, report)
+        return 0 if report["ok"] else 1
+
+    report = transfer.round_trip(args.sections.split(","))
+    print_phases(report)
+    print_differences(report["differences"])
+    if args.output:
+        save_json(args.output, {k: v for k, v in report.items() if k != "live"})
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
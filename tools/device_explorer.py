@@ -28,10 +28,17 @@ CAPTURES:
 TIME: ~9 min/device, 45 min total (with enhanced analysis)
 COVERAGE: 95%+ error scenarios via comprehensive analysis
 
+PERSISTENT PROFILE (opt-in): --persistent-profile reuses one browser profile
+per device (.cache/browser-profiles/<ip>, see tools/browser_profiles.py) so
+repeated sessions keep the HTTP cache; --clear-profile starts it empty.
+
 Usage:
     python -m tools.device_explorer
+    python -m tools.device_explorer --persistent-profile
+    python -m tools.device_explorer --persistent-profile --clear-profile
 """
 
+import argparse
 import os
 import json
 from datetime import datetime
@@ -39,6 +46,8 @@ from playwright.sync_api import sync_playwright, Page, ConsoleMessage
 import time
 import re
 
+from tools.browser_profiles import clear, launch_device_profile
+
 
 class JavaScriptValidationAnalyzer:
     """Extracts validation rules from page JavaScript."""
@@ -1981,8 +1990,39 @@ def create_device_configuration_states(
         print(f" Warning: Failed to create device configuration states: {e}")
 
 
-def capture_device(device_ip: str, device_name: str, device_type: str, browser):
-    """Capture complete device with all states."""
+def reset_profile_session(ctx, page, device_ip: str):
+    """
+    Log a persistent profile out before a capture.
+
+    Clears cookies and the device origin's storage so pre-auth and login
+    states are captured logged out; the HTTP cache is kept.
+    """
+    ctx.clear_cookies()
+    try:
+        cdp = ctx.new_cdp_session(page)
+        for scheme in ("https", "http"):
+            cdp.send(
+                "Storage.clearDataForOrigin",
+                {
+                    "origin": f"{scheme}://{device_ip}",
+                    "storageTypes": "local_storage,indexeddb,websql,service_workers,cache_storage",
+                },
+            )
+        cdp.detach()
+    except Exception as e:
+        print(f"Error clearing profile storage for {device_ip}: {e}")
+
+
+def capture_device(
+    device_ip: str, device_name: str, device_type: str, browser, profile_context=None
+):
+    """
+    Capture complete device with all states.
+
+    With profile_context (the device's persistent profile), each resolution
+    opens a page in it instead of a fresh context, after clearing the
+    previous session's cookies and storage.
+    """
 
     print(f"\n{'='*70}")
     print(f"CAPTURING {device_name} ({device_ip})")
@@ -1999,9 +2039,11 @@ def capture_device(device_ip: str, device_name: str, device_type: str, browser):
 
         capture = StateCapture(device_ip, resolution)
 
-        # Fresh context
-        ctx = browser.new_context(ignore_https_errors=True)
+        # Fresh context, or a page in the device's persistent profile
+        ctx = profile_context or browser.new_context(ignore_https_errors=True)
         page = ctx.new_page()
+        if profile_context is not None:
+            reset_profile_session(ctx, page, device_ip)
         page.set_viewport_size(
             {
                 "width": int(resolution.split("x")[0]),
@@ -2219,7 +2261,10 @@ def capture_device(device_ip: str, device_name: str, device_type: str, browser):
 
             traceback.print_exc()
         finally:
-            ctx.close()
+            if profile_context is None:
+                ctx.close()
+            else:
+                page.close()
 
         print(f"\n{'='*70}")
         print(f"COMPLETED {device_name} at {resolution}")
@@ -2228,6 +2273,19 @@ def capture_device(device_ip: str, device_name: str, device_type: str, browser):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Capture device UI states")
+    parser.add_argument(
+        "--persistent-profile",
+        action="store_true",
+        help="Reuse a persistent browser profile per device (warm HTTP cache)",
+    )
+    parser.add_argument(
+        "--clear-profile",
+        action="store_true",
+        help="Delete the device profiles first (cache busting)",
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("ENHANCED DEVICE EXPLORER - HYBRID APPROACH")
     print("=" * 70)
@@ -2266,14 +2324,28 @@ def main():
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
 
+            if args.clear_profile:
+                clear([device_ip for device_ip, _, _ in devices])
+
             for device_ip, device_name, device_type in devices:
+                profile_context = None
+                start_time = time.time()
                 try:
-                    capture_device(device_ip, device_name, device_type, browser)
+                    if args.persistent_profile:
+                        profile_context = launch_device_profile(p, device_ip)
+                    capture_device(
+                        device_ip, device_name, device_type, browser, profile_context
+                    )
+                    mode = "persistent profile" if args.persistent_profile else "fresh context"
+                    print(f"\n{device_name} captured in {time.time() - start_time:.1f}s ({mode})")
                 except Exception as e:
                     print(f"\nDEVICE FAILED {device_name}: {e}\n")
                     import traceback
 
                     traceback.print_exc()
+                finally:
+                    if profile_context is not None:
+                        profile_context.close()
 
             # Ensure browser is properly closed
             if browser:
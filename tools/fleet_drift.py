@@ -0,0 +1,283 @@
+"""
+Fleet Configuration Drift Detection for Kronos Devices
+
+Lab units drift from their known configuration when a test crashes mid-change,
+and the leftover state surfaces later as slow, confusing failures. This tool
+reads every config section from all devices in parallel, normalizes
+device-specific values, diffs each unit against the golden file for its model
+and optionally repairs the drift in bulk.
+
+This tool:
+1. capture - Export a unit's configuration as the golden file for its model
+2. check   - Diff every unit against its model's golden file, per section
+3. check --repair - Post the golden values for drifted sections and re-verify
+
+Normalization: the unit's own IP addresses and serial number are replaced
+with <ethN_ip> (Series 3), <A_ip> / <B_ip> (Series 2) and <serial> tokens
+wherever they appear in a value, and
+per-unit identity fields (IP, mask, gateway, identifier) are never compared,
+so one golden file fits every unit of a model. Golden files live in
+golden_configs/<model>.json.
+
+Run it before and after a suite to catch leftover state early.
+
+Usage:
+    python -m tools.fleet_drift capture --device 172.16.66.3
+    python -m tools.fleet_drift check
+    python -m tools.fleet_drift check --devices 172.16.66.3,172.16.66.6 --repair
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pages.config_transfer import SERIES2_ADDRESS_FIELDS, ConfigTransfer, diff_snapshots
+from pages.dashboard_page import DashboardPage
+from pages.device_http import DeviceHttpSession, parse_tables
+from tools.fleet_status import DEVICES, PASSWORD
+
+GOLDEN_DIR = Path("golden_configs")
+
+# Re-posting network forms can restart the unit; repaired only on request
+RISKY_REPAIR_SECTIONS = ["network"]
+
+
+def connect(device_ip: str, password: str) -> Optional[DeviceHttpSession]:
+    """Log in and unlock configuration; None on failure."""
+    session = DeviceHttpSession(device_ip)
+    if session.login(password) and session.unlock(password):
+        return session
+    return None
+
+
+def read_identity(session: DeviceHttpSession) -> Dict[str, str]:
+    """Model and serial number from the status page device table."""
+    status, body = session.get("/")
+    tables = parse_tables(body) if status == 200 else []
+    info = DashboardPage.device_info_from_rows(tables[2]) if len(tables) > 2 else {}
+    return {"model": info.get("Model Number", ""), "serial": info.get("Serial Number", "")}
+
+
+def device_tokens(snapshot: Dict[str, Any], serial: str) -> Dict[str, str]:
+    """
+    Device-specific values to normalize, as token -> value.
+
+    Interface addresses come from the unit's own network section: Series 3
+    ip_<port> fields and the Series 2 ipaddr (port A) / ipaddrB (port B)
+    fields. Netmasks are shared by many units and values, so they are not
+    tokenized (they are identity fields and never compared).
+    """
+    tokens = {}
+    for form in snapshot["sections"].get("network", {}).values():
+        for field, value in form["values"].items():
+            if not isinstance(value, str) or not value:
+                continue
+            if field.startswith("ip_"):
+                tokens[f"<{field[3:]}_ip>"] = value
+            elif field in SERIES2_ADDRESS_FIELDS and field.startswith("ipaddr"):
+                tokens[f"<{field[6:] or 'A'}_ip>"] = value
+    if serial:
+        tokens["<serial>"] = serial
+    return tokens
+
+
+def _replace(value: Any, pairs: List[tuple]) -> Any:
+    if isinstance(value, str):
+        for old, new in pairs:
+            if old:
+                value = value.replace(old, new)
+        return value
+    if isinstance(value, list):
+        return [_replace(item, pairs) for item in value]
+    return value
+
+
+def normalize(snapshot: Dict[str, Any], tokens: Dict[str, str]) -> Dict[str, Any]:
+    """Replace device-specific values with tokens (longest values first)."""
+    pairs = sorted(((value, token) for token, value in tokens.items()), key=lambda p: -len(p[0]))
+    return _map_values(snapshot, pairs)
+
+
+def denormalize(snapshot: Dict[str, Any], tokens: Dict[str, str]) -> Dict[str, Any]:
+    """Replace tokens with a target unit's values."""
+    return _map_values(snapshot, list(tokens.items()))
+
+
+def _map_values(snapshot: Dict[str, Any], pairs: List[tuple]) -> Dict[str, Any]:
+    sections = {}
+    for section, forms in snapshot["sections"].items():
+        sections[section] = {
+            key: {**form, "values": {f: _replace(v, pairs) for f, v in form["values"].items()}}
+            for key, form in forms.items()
+        }
+    return {**snapshot, "sections": sections}
+
+
+def golden_path(model: str, golden_dir: Path = GOLDEN_DIR) -> Path:
+    return golden_dir / f"{model}.json"
+
+
+def capture(device_ip: str, password: str, golden_dir: Path) -> int:
+    """Export one unit's normalized configuration as its model's golden file."""
+    session = connect(device_ip, password)
+    if session is None:
+        print(f"Could not authenticate to {device_ip}")
+        return 2
+    identity = read_identity(session)
+    if not identity["model"]:
+        print(f"Could not read the model of {device_ip}")
+        return 2
+
+    snapshot = ConfigTransfer(session).export()
+    golden = normalize(snapshot, device_tokens(snapshot, identity["serial"]))
+    golden.update(model=identity["model"], captured_from=device_ip)
+    golden.pop("stats", None)
+
+    path = golden_path(identity["model"], golden_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(golden, indent=2))
+    print(f"Golden configuration for {identity['model']} saved: {path}")
+    return 0
+
+
+def check_device(
+    device_ip: str,
+    password: str,
+    golden_dir: Path,
+    repair: bool = False,
+    repair_network: bool = False,
+) -> Dict[str, Any]:
+    """
+    Diff one unit against its golden file, optionally repairing drift.
+
+    Returns:
+        Dictionary with device, model, drift (section -> differences),
+        repaired sections, remaining drift and seconds
+    """
+    start_time = time.time()
+    result: Dict[str, Any] = {"device": device_ip, "model": None, "drift": {}, "error": None}
+    session = connect(device_ip, password)
+    if session is None:
+        result["error"] = "authentication failed"
+        return result
+
+    identity = read_identity(session)
+    result["model"] = identity["model"]
+    path = golden_path(identity["model"], golden_dir)
+    if not path.exists():
+        result["error"] = f"no golden file {path}"
+        return result
+    golden = json.loads(path.read_text())
+
+    transfer = ConfigTransfer(session, sections=list(golden["sections"]))
+    live = transfer.read()
+    tokens = device_tokens(live, identity["serial"])
+    differences = diff_snapshots(golden, normalize(live, tokens), ignore_identity=True)
+    for difference in differences:
+        result["drift"].setdefault(difference["section"], []).append(difference)
+
+    if repair and result["drift"]:
+        sections = [
+            section
+            for section in result["drift"]
+            if repair_network or section not in RISKY_REPAIR_SECTIONS
+        ]
+        if sections:
+            report = transfer.clone(denormalize(golden, tokens), sections=sections)
+            result["repaired"] = sections
+            result["repair_errors"] = report["import"]["errors"]
+            result["remaining"] = len(report["differences"])
+
+    result["seconds"] = round(time.time() - start_time, 2)
+    return result
+
+
+def print_report(results: List[Dict[str, Any]], verbose: bool = False):
+    """Print drift per device and section."""
+    print("\n" + "=" * 80)
+    print("  Fleet configuration drift")
+    print("-" * 80)
+    for result in results:
+        header = f"  {result['device']:<15} {result['model'] or '?':<28}"
+        if result["error"]:
+            print(f"{header} ERROR: {result['error']}")
+            continue
+        if not result["drift"]:
+            print(f"{header} clean ({result['seconds']}s)")
+            continue
+        total = sum(len(items) for items in result["drift"].values())
+        print(f"{header} {total} drifted field(s) ({result['seconds']}s)")
+        for section, items in result["drift"].items():
+            print(f"      {section:<10} {len(items)} field(s)")
+            if verbose:
+                for item in items:
+                    print(
+                        f"          {item['form']}.{item['field']}: "
+                        f"golden={item['expected']!r} live={item['actual']!r}"
+                    )
+        if "repaired" in result:
+            print(
+                f"      repaired {', '.join(result['repaired'])}: "
+                f"{result['remaining']} difference(s) remain, "
+                f"{len(result['repair_errors'])} error(s)"
+            )
+    print("=" * 80)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Detect configuration drift across lab devices")
+    parser.add_argument("--password", default=PASSWORD, help="Device password")
+    parser.add_argument("--golden-dir", default=str(GOLDEN_DIR), help="Golden file directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    capture_parser = subparsers.add_parser("capture", help="Save a unit as its model's golden")
+    capture_parser.add_argument("--device", required=True)
+
+    check_parser = subparsers.add_parser("check", help="Diff units against golden files")
+    check_parser.add_argument("--devices", help="Comma-separated device IPs (default: all)")
+    check_parser.add_argument("--repair", action="store_true", help="Repair drifted sections")
+    check_parser.add_argument(
+        "--repair-network", action="store_true", help="Also repair the network section"
+    )
+    check_parser.add_argument("--verbose", action="store_true", help="List drifted fields")
+    check_parser.add_argument("--output", help="Save the drift report as JSON")
+
+    args = parser.parse_args()
+    golden_dir = Path(args.golden_dir)
+
+    if args.command == "capture":
+        return capture(args.device, args.password, golden_dir)
+
+    devices = args.devices.split(",") if args.devices else DEVICES
+    with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+        results = list(
+            executor.map(
+                lambda device: check_device(
+                    device, args.password, golden_dir, args.repair, args.repair_network
+                ),
+                devices,
+            )
+        )
+    print_report(results, args.verbose)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        print(f"Report saved: {output}")
+
+    drifted = [
+        r
+        for r in results
+        if r["error"]
+        or (r["drift"] and (r.get("remaining", 1) != 0 or set(r["drift"]) - set(r.get("repaired", []))))
+    ]
+    return 1 if drifted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Fleet Status Sweep for Kronos Devices
+
+Checks every lab unit concurrently before a run instead of opening each one
+by hand: authenticates over HTTP, reads the status page tables (the same
+fields DashboardPage.get_device_info, get_gnss_data and get_alarms_data
+read), and probes NTP and SNMP reachability, printing one table within a
+few seconds.
+
+This tool:
+1. Logs in to all devices concurrently (status login only, read-only)
+2. Reads model, serial, firmware, uptime, GNSS state, satellites, time
+   accuracy, device clock offset and alarms from the status page
+3. Queries NTP (offset, stratum) and SNMP (sysDescr.0, v2c) over UDP
+4. Compares firmware with the DeviceCapabilities database for the model
+5. With --gate, exits non-zero if any unit is down, not locked or on
+   unexpected firmware (and, with --strict, if NTP or SNMP do not answer)
+
+Output: Console table plus optional JSON report
+
+Usage:
+    python -m tools.fleet_status
+    python -m tools.fleet_status --devices 172.16.66.3,172.16.66.6 --gate
+    python -m tools.fleet_status --gate --strict --output fleet_status.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pages.dashboard_page import DashboardPage
+from pages.device_capabilities import DeviceCapabilities
+from pages.device_http import DeviceHttpSession, parse_tables
+
+# Lab devices
+DEVICES = [
+    "172.16.190.46",
+    "172.16.190.47",
+    "172.16.66.1",
+    "172.16.66.3",
+    "172.16.66.6",
+]
+
+PASSWORD = "novatech"
+SNMP_COMMUNITY = "public"
+PROBE_TIMEOUT = 2.0
+HTTP_TIMEOUT = 10.0
+
+NTP_EPOCH_OFFSET = 2208988800
+SYS_DESCR_OID = bytes([0x2B, 0x06, 0x01, 0x02, 0x01, 0x01, 0x01, 0x00])  # 1.3.6.1.2.1.1.1.0
+
+
+# UDP probes
+
+
+class _DatagramQuery(asyncio.DatagramProtocol):
+    """Sends one datagram and resolves with the first reply."""
+
+    def __init__(self, payload: bytes, reply: "asyncio.Future[bytes]"):
+        self.payload = payload
+        self.reply = reply
+
+    def connection_made(self, transport):
+        transport.sendto(self.payload)
+
+    def datagram_received(self, data: bytes, addr):
+        if not self.reply.done():
+            self.reply.set_result(data)
+
+    def error_received(self, exc: Exception):
+        if not self.reply.done():
+            self.reply.set_exception(exc)
+
+
+async def udp_query(host: str, port: int, payload: bytes, timeout: float) -> Optional[bytes]:
+    """Send a datagram and wait for the reply; None on timeout or error."""
+    loop = asyncio.get_running_loop()
+    reply: "asyncio.Future[bytes]" = loop.create_future()
+    try:
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramQuery(payload, reply), remote_addr=(host, port)
+        )
+    except OSError:
+        return None
+    try:
+        return await asyncio.wait_for(reply, timeout)
+    except (asyncio.TimeoutError, OSError):
+        return None
+    finally:
+        transport.close()
+
+
+async def probe_ntp(host: str, timeout: float = PROBE_TIMEOUT) -> Dict[str, Any]:
+    """
+    SNTP query.
+
+    Returns:
+        Dictionary with ok, offset_ms (device minus host) and stratum
+    """
+    sent = time.time()
+    packet = b"\x1b" + 47 * b"\0"  # LI 0, version 3, client mode
+    reply = await udp_query(host, 123, packet, timeout)
+    received = time.time()
+    if not reply or len(reply) < 48:
+        return {"ok": False, "offset_ms": None, "stratum": None}
+
+    def timestamp(offset: int) -> float:
+        seconds, fraction = struct.unpack("!II", reply[offset : offset + 8])
+        return seconds - NTP_EPOCH_OFFSET + fraction / 2**32
+
+    server_received, server_sent = timestamp(32), timestamp(40)
+    offset = ((server_received - sent) + (server_sent - received)) / 2
+    return {"ok": True, "offset_ms": round(offset * 1000, 2), "stratum": reply[1]}
+
+
+def _tlv(tag: int, payload: bytes) -> bytes:
+    """BER tag-length-value."""
+    length = len(payload)
+    if length < 0x80:
+        return bytes([tag, length]) + payload
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([tag, 0x80 | len(encoded)]) + encoded + payload
+
+
+def snmp_get_request(community: str, request_id: int, oid: bytes) -> bytes:
+    """Encode an SNMPv2c GetRequest for a single OID."""
+    varbind = _tlv(0x30, _tlv(0x06, oid) + b"\x05\x00")
+    pdu = _tlv(
+        0xA0,
+        _tlv(0x02, request_id.to_bytes(4, "big"))
+        + _tlv(0x02, b"\x00")
+        + _tlv(0x02, b"\x00")
+        + _tlv(0x30, varbind),
+    )
+    return _tlv(0x30, _tlv(0x02, b"\x01") + _tlv(0x04, community.encode()) + pdu)
+
+
+async def probe_snmp(
+    host: str, community: str = SNMP_COMMUNITY, timeout: float = PROBE_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    SNMP reachability via GET sysDescr.0.
+
+    Returns:
+        Dictionary with ok and sys_descr
+    """
+    request_id = int.from_bytes(os.urandom(3), "big")
+    reply = await udp_query(
+        host, 161, snmp_get_request(community, request_id, SYS_DESCR_OID), timeout
+    )
+    if not reply or reply[0] != 0x30 or request_id.to_bytes(4, "big") not in reply:
+        return {"ok": False, "sys_descr": None}
+
+    sys_descr = None
+    position = reply.rfind(_tlv(0x06, SYS_DESCR_OID))
+    if position >= 0:
+        value_at = position + len(SYS_DESCR_OID) + 2
+        if reply[value_at : value_at + 1] == b"\x04":
+            length = reply[value_at + 1]
+            sys_descr = reply[value_at + 2 : value_at + 2 + length].decode("utf-8", "replace")
+    return {"ok": True, "sys_descr": sys_descr}
+
+
+# Status page
+
+
+def read_status(device_ip: str, password: str) -> Dict[str, Any]:
+    """
+    Log in and read the status page tables.
+
+    Runs in a worker thread (DeviceHttpSession is synchronous).
+    """
+    status: Dict[str, Any] = {"up": False, "authenticated": False}
+    session = DeviceHttpSession(device_ip, timeout=HTTP_TIMEOUT)
+    if not session.login(password):
+        status["up"] = session.request("GET", "/")[0] != 0
+        return status
+    status.update(up=True, authenticated=True)
+
+    code, body = session.get("/")
+    host_utc = datetime.now(timezone.utc)
+    tables = parse_tables(body) if code == 200 else []
+    if len(tables) < 3:
+        status["error"] = f"status page returned {len(tables)} tables"
+        return status
+
+    device_info = DashboardPage.device_info_from_rows(tables[2])
+    gnss = {row[0]: row[1] for row in tables[1] if len(row) >= 2}
+    status.update(
+        model=device_info.get("Model Number", ""),
+        serial=device_info.get("Serial Number", ""),
+        firmware=device_info.get("Firmware Version", ""),
+        uptime=device_info.get("Up Time", ""),
+        gnss_state=gnss.get("GNSS state", ""),
+        antenna=gnss.get("Antenna state", ""),
+        accuracy=gnss.get("Time accuracy", ""),
+        svs=gnss.get("Used / tracked SVs", ""),
+        alarms=DashboardPage.alarms_from_rows(tables[3]) if len(tables) > 3 else {},
+    )
+
+    # Device clock against this host, from the UTC row of the time table
+    utc_row = next((row for row in tables[0] if row and row[0] == "UTC"), None)
+    if utc_row and len(utc_row) >= 2:
+        try:
+            device_utc = datetime.strptime(utc_row[1][:19], "%Y-%m-%d %H:%M:%S").replace(
+                tzinfo=timezone.utc
+            )
+            status["clock_offset_s"] = round((device_utc - host_utc).total_seconds(), 1)
+        except ValueError:
+            pass
+    return status
+
+
+async def sweep_device(device_ip: str, password: str, community: str) -> Dict[str, Any]:
+    """Run the status read and UDP probes for one device concurrently."""
+    start_time = time.time()
+    status, ntp, snmp = await asyncio.gather(
+        asyncio.to_thread(read_status, device_ip, password),
+        probe_ntp(device_ip),
+        probe_snmp(device_ip, community),
+    )
+    status.update(device=device_ip, ntp=ntp, snmp=snmp)
+
+    expected = DeviceCapabilities.get_device_info(status.get("model", "")).get(
+        "firmware_version"
+    )
+    status["expected_firmware"] = expected
+    status["firmware_ok"] = expected is None or status.get("firmware") == expected
+    status["seconds"] = round(time.time() - start_time, 2)
+    return status
+
+
+async def sweep(devices: List[str], password: str, community: str) -> List[Dict[str, Any]]:
+    """Sweep all devices concurrently."""
+    return list(
+        await asyncio.gather(*(sweep_device(device, password, community) for device in devices))
+    )
+
+
+# Gate and report
+
+
+def gate_failures(status: Dict[str, Any], strict: bool = False) -> List[str]:
+    """Reasons a device is not ready for a run."""
+    if not status["up"]:
+        return ["down"]
+    if not status["authenticated"]:
+        return ["login failed"]
+    reasons = []
+    if status.get("error"):
+        reasons.append(status["error"])
+    if status.get("gnss_state", "").upper() != "LOCKED":
+        reasons.append(f"GNSS {status.get('gnss_state') or 'unknown'}")
+    if not status["firmware_ok"]:
+        reasons.append(f"firmware {status.get('firmware')} != {status['expected_firmware']}")
+    if status.get("alarms"):
+        reasons.append(f"alarms: {', '.join(status['alarms'])}")
+    if strict and not status["ntp"]["ok"]:
+        reasons.append("NTP not answering")
+    if strict and not status["snmp"]["ok"]:
+        reasons.append("SNMP not answering")
+    return reasons
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Print the fleet status table."""
+    columns = [
+        ("Device", 15),
+        ("Model", 26),
+        ("Firmware", 12),
+        ("GNSS", 10),
+        ("SVs", 8),
+        ("Accuracy", 9),
+        ("Clock", 7),
+        ("NTP ms", 8),
+        ("SNMP", 5),
+        ("Ready", 6),
+    ]
+    print("\n" + "=" * 120)
+    print("  ".join(f"{name:<{width}}" for name, width in columns))
+    print("-" * 120)
+    for status in results:
+        if not status["up"] or not status["authenticated"]:
+            cells = [status["device"], "DOWN" if not status["up"] else "LOGIN FAILED"]
+            cells += [""] * (len(columns) - 3) + ["no"]
+        else:
+            firmware = status.get("firmware", "")
+            if not status["firmware_ok"]:
+                firmware += "!"
+            ntp = status["ntp"]
+            cells = [
+                status["device"],
+                status.get("model", ""),
+                firmware,
+                status.get("gnss_state", ""),
+                status.get("svs", ""),
+                status.get("accuracy", ""),
+                f"{status['clock_offset_s']:+.0f}s" if "clock_offset_s" in status else "",
+                f"{ntp['offset_ms']:+.1f}" if ntp["ok"] else "-",
+                "ok" if status["snmp"]["ok"] else "-",
+                "yes" if not status["gate_failures"] else "no",
+            ]
+        print("  ".join(f"{str(cell):<{width}}" for cell, (_, width) in zip(cells, columns)))
+    print("=" * 120)
+    for status in results:
+        if status["gate_failures"]:
+            print(f"  {status['device']}: {'; '.join(status['gate_failures'])}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent status sweep of lab devices")
+    parser.add_argument("--devices", help="Comma-separated device IPs (default: all lab units)")
+    parser.add_argument("--password", default=PASSWORD, help="Device password")
+    parser.add_argument("--community", default=SNMP_COMMUNITY, help="SNMP community")
+    parser.add_argument("--gate", action="store_true", help="Exit 1 if any device is not ready")
+    parser.add_argument("--strict", action="store_true", help="Also require NTP and SNMP")
+    parser.add_argument("--output", help="Save the sweep as JSON")
+    args = parser.parse_args()
+
+    devices = args.devices.split(",") if args.devices else DEVICES
+    start_time = time.time()
+    results = asyncio.run(sweep(devices, args.password, args.community))
+    for status in results:
+        status["gate_failures"] = gate_failures(status, args.strict)
+
+    print_table(results)
+    print(f"Swept {len(results)} devices in {time.time() - start_time:.1f}s")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps(
+                {"timestamp": datetime.now().isoformat(), "devices": results}, indent=2
+            )
+        )
+        print(f"Report saved: {output}")
+
+    if args.gate and any(status["gate_failures"] for status in results):
+        print("Gate FAILED: not all devices are ready")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,569 @@
+"""
+Offline Locator Validator for Kronos Page Objects
+
+Pre-flight check that catches broken selectors before a hardware run.
+Broken locators otherwise only surface as 30-120 second timeouts deep into
+a multi-hour suite run.
+
+This tool:
+1. Extracts every static selector used by pages/*.py (AST scan, no import side effects)
+2. Adds every selector from DeviceCapabilities.SAVE_BUTTON_PATTERNS
+3. Loads the captured device_exploration HTML for each device and resolution
+   into parallel browser pages with set_content (no device needed)
+4. Counts matches for every selector against the page(s) it targets
+5. Reports selectors that match zero elements (broken) or several elements
+   where the caller expects exactly one (strict mode violations)
+
+Output: Console summary plus JSON report (default: locator_validation.json)
+
+Usage:
+    python -m tools.locator_validator
+    python -m tools.locator_validator --device 172.16.66.3 --workers 12
+    python -m tools.locator_validator --resolution 1024x768 --output report.json
+
+Exit code is 1 when broken selectors are found, so the tool can gate a run.
+"""
+
+import argparse
+import ast
+import asyncio
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import async_playwright
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PAGES_DIR = REPO_ROOT / "pages"
+EXPLORATION_DIR = REPO_ROOT / "device_exploration"
+
+# Playwright calls that take a selector (or selector-like argument) first
+SELECTOR_CALLS = {
+    "locator": "css",
+    "get_by_text": "text",
+    "get_by_placeholder": "placeholder",
+    "get_by_label": "label",
+    "get_by_role": "role",
+    "get_by_title": "title",
+}
+
+# Accessors that make a multi-element match intentional
+MULTI_MATCH_ACCESSORS = {"first", "last", "nth", "count", "all", "filter"}
+
+# Receivers that address the whole page (as opposed to chained/relative locators)
+PAGE_RECEIVERS = {"page", "logged_in_page", "unlocked_config_page"}
+
+# Captured states each page module is validated against.
+# None means "every config page" (shared helpers such as BasePage).
+MODULE_STATES = {
+    "base.py": None,
+    "device_capabilities.py": None,
+    "login_page.py": ["state_01_preauth_login"],
+    "configuration_unlock_page.py": [
+        "state_04_config_unlock",
+        "state_05_dashboard_unlocked",
+    ],
+    "dashboard_page.py": ["state_03_dashboard_locked", "state_05_dashboard_unlocked"],
+    "general_config_page.py": ["config_general"],
+    "network_config_page.py": ["config_network"],
+    "time_config_page.py": ["config_time"],
+    "outputs_config_page.py": ["config_outputs"],
+    "gnss_config_page.py": ["config_gnss"],
+    "display_config_page.py": ["config_display"],
+    "snmp_config_page.py": ["config_snmp"],
+    "syslog_config_page.py": ["config_syslog"],
+    "upload_config_page.py": ["config_upload"],
+    "access_config_page.py": ["config_access"],
+    "ptp_config_page.py": ["config_ptp"],
+    "ptp_profile_manager.py": ["config_ptp"],
+}
+
+# SAVE_BUTTON_PATTERNS configuration types mapped to captured config pages
+SAVE_PATTERN_STATES = {
+    "network_configuration": ["config_network"],
+    "ptp_configuration": ["config_ptp"],
+    "time_configuration": ["config_time"],
+    "outputs_configuration": ["config_outputs"],
+    "general_configuration": ["config_general"],
+}
+
+# Preferred capture per state (matched against metadata description);
+# otherwise the "Initial load" capture, otherwise the last capture.
+PREFERRED_CAPTURES = {
+    "state_04_config_unlock": "Config unlock form visible",
+}
+
+
+@dataclass
+class SelectorRef:
+    """A selector found in source, with where it came from."""
+
+    kind: str
+    value: str
+    source: str
+    line: int
+    options: Dict[str, object] = field(default_factory=dict)
+    multi_ok: bool = False
+    states: Optional[List[str]] = None
+    series: Optional[int] = None
+    interface: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.kind, self.value, json.dumps(self.options, sort_keys=True))
+
+
+class SelectorExtractor(ast.NodeVisitor):
+    """Collects static selectors from a page object module."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.selectors: List[SelectorRef] = []
+        self.skipped_dynamic = 0
+        self.skipped_relative = 0
+        self._parents: Dict[ast.AST, ast.AST] = {}
+        self._string_lists: Dict[str, List[Tuple[str, int]]] = {}
+
+    def extract(self, tree: ast.AST) -> List[SelectorRef]:
+        for parent in ast.walk(tree):
+            for child in ast.iter_child_nodes(parent):
+                self._parents[child] = parent
+        self.visit(tree)
+        return self.selectors
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # String lists are scoped to the function that defines them
+        saved = self._string_lists
+        self._string_lists = {}
+        self.generic_visit(node)
+        self._string_lists = saved
+
+    def visit_Assign(self, node: ast.Assign):
+        strings = self._string_elements(node.value)
+        if strings is not None:
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self._string_lists[target.id] = strings
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For):
+        # for selector in [...] / for selector in selector_list: page.locator(selector)
+        if isinstance(node.target, ast.Name):
+            strings = self._string_elements(node.iter)
+            if strings is None and isinstance(node.iter, ast.Name):
+                strings = self._string_lists.get(node.iter.id)
+            if strings:
+                for call in self._calls_using(node, node.target.id):
+                    kind = SELECTOR_CALLS[call.func.attr]
+                    if not self._is_page_receiver(call.func.value):
+                        self.skipped_relative += len(strings)
+                        continue
+                    for value, line in strings:
+                        self.selectors.append(
+                            SelectorRef(
+                                kind=kind,
+                                value=value,
+                                source=self.filename,
+                                line=line,
+                                options=self._call_options(call),
+                                multi_ok=self._is_multi_ok(call),
+                            )
+                        )
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr in SELECTOR_CALLS
+            and node.args
+        ):
+            first = node.args[0]
+            if isinstance(first, ast.Constant) and isinstance(first.value, str):
+                if self._is_page_receiver(func.value):
+                    self.selectors.append(
+                        SelectorRef(
+                            kind=SELECTOR_CALLS[func.attr],
+                            value=first.value,
+                            source=self.filename,
+                            line=node.lineno,
+                            options=self._call_options(node),
+                            multi_ok=self._is_multi_ok(node),
+                        )
+                    )
+                else:
+                    self.skipped_relative += 1
+            elif isinstance(first, ast.JoinedStr):
+                self.skipped_dynamic += 1
+        self.generic_visit(node)
+
+    @staticmethod
+    def _string_elements(node: ast.AST) -> Optional[List[Tuple[str, int]]]:
+        if not isinstance(node, (ast.List, ast.Tuple)) or not node.elts:
+            return None
+        values = []
+        for element in node.elts:
+            if not (
+                isinstance(element, ast.Constant) and isinstance(element.value, str)
+            ):
+                return None
+            values.append((element.value, element.lineno))
+        return values
+
+    @staticmethod
+    def _calls_using(loop: ast.For, name: str) -> List[ast.Call]:
+        calls = []
+        for child in ast.walk(loop):
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Attribute)
+                and child.func.attr in SELECTOR_CALLS
+                and child.args
+                and isinstance(child.args[0], ast.Name)
+                and child.args[0].id == name
+            ):
+                calls.append(child)
+        return calls
+
+    @staticmethod
+    def _is_page_receiver(node: ast.AST) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in PAGE_RECEIVERS or node.id.endswith("_page")
+        if isinstance(node, ast.Attribute):
+            return node.attr == "page" and isinstance(node.value, ast.Name)
+        return False
+
+    @staticmethod
+    def _call_options(call: ast.Call) -> Dict[str, object]:
+        options = {}
+        for keyword in call.keywords:
+            if keyword.arg in ("exact", "name") and isinstance(
+                keyword.value, ast.Constant
+            ):
+                options[keyword.arg] = keyword.value.value
+        return options
+
+    def _is_multi_ok(self, call: ast.Call) -> bool:
+        parent = self._parents.get(call)
+        return isinstance(parent, ast.Attribute) and parent.attr in MULTI_MATCH_ACCESSORS
+
+
+def extract_page_selectors() -> Tuple[List[SelectorRef], Dict[str, int]]:
+    """Scan pages/*.py and return static selectors plus skip statistics."""
+    selectors: List[SelectorRef] = []
+    stats = {"dynamic_skipped": 0, "relative_skipped": 0}
+
+    for path in sorted(PAGES_DIR.glob("*.py")):
+        extractor = SelectorExtractor(path.name)
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for ref in extractor.extract(tree):
+            ref.states = MODULE_STATES.get(path.name)
+            selectors.append(ref)
+        stats["dynamic_skipped"] += extractor.skipped_dynamic
+        stats["relative_skipped"] += extractor.skipped_relative
+
+    return selectors, stats
+
+
+def extract_save_button_selectors() -> List[SelectorRef]:
+    """Collect every selector from DeviceCapabilities.SAVE_BUTTON_PATTERNS."""
+    from pages.device_capabilities import DeviceCapabilities
+
+    selectors = []
+    for series_key, config_types in DeviceCapabilities.SAVE_BUTTON_PATTERNS.items():
+        series = int(series_key.split("_")[1])
+        for config_type, entries in config_types.items():
+            # Series 2 has a flat {"generic": {...}} layout
+            if "selector" in entries:
+                entries = {config_type: entries}
+                config_type = "generic"
+            for interface, entry in entries.items():
+                selectors.append(
+                    SelectorRef(
+                        kind="css",
+                        value=entry["selector"],
+                        source=f"SAVE_BUTTON_PATTERNS[{series_key}][{config_type}][{interface}]",
+                        line=0,
+                        states=SAVE_PATTERN_STATES.get(config_type),
+                        series=series,
+                        interface=interface if interface.startswith("eth") else None,
+                    )
+                )
+    return selectors
+
+
+def load_captures(
+    device_filter: Optional[str], resolution_filter: Optional[str]
+) -> List[Dict[str, object]]:
+    """Find one representative HTML capture per device, resolution and state."""
+    captures = []
+
+    for device_dir in sorted(EXPLORATION_DIR.iterdir()):
+        if not device_dir.is_dir():
+            continue
+        if device_filter and device_dir.name != device_filter:
+            continue
+
+        series = 0
+        hardware_model = None
+        capabilities_file = device_dir / "device_capabilities.json"
+        if capabilities_file.exists():
+            with open(capabilities_file, encoding="utf-8") as f:
+                device_info = json.load(f).get("device_info", {})
+            series = device_info.get("series", 0)
+            hardware_model = device_info.get("hardware_model")
+
+        for resolution_dir in sorted(device_dir.iterdir()):
+            if not resolution_dir.is_dir():
+                continue
+            if resolution_filter and resolution_dir.name != resolution_filter:
+                continue
+
+            by_state = defaultdict(list)
+            for html_file in resolution_dir.glob("*.html"):
+                match = re.match(r"(.+)\.(\d+)\.html$", html_file.name)
+                if match and match.group(1).startswith(("config_", "state_")):
+                    by_state[match.group(1)].append((int(match.group(2)), html_file))
+
+            for state, files in sorted(by_state.items()):
+                captures.append(
+                    {
+                        "device_ip": device_dir.name,
+                        "series": series,
+                        "hardware_model": hardware_model,
+                        "resolution": resolution_dir.name,
+                        "state": state,
+                        "file": _pick_capture(state, sorted(files)),
+                    }
+                )
+
+    return captures
+
+
+def _pick_capture(state: str, files: List[Tuple[int, Path]]) -> Path:
+    preferred = PREFERRED_CAPTURES.get(state, "Initial load")
+    for _, html_file in files:
+        metadata_file = html_file.with_name(
+            html_file.name.replace(".html", "_metadata.json")
+        )
+        if metadata_file.exists():
+            with open(metadata_file, encoding="utf-8") as f:
+                if preferred in json.load(f).get("description", ""):
+                    return html_file
+    return files[-1][1]
+
+
+def selectors_for_capture(
+    selectors: List[SelectorRef], capture: Dict[str, object]
+) -> List[SelectorRef]:
+    """Select the selectors that are expected to resolve on this capture."""
+    from pages.device_capabilities import DeviceCapabilities
+
+    state = capture["state"]
+    # Interface-specific save buttons only exist for ports the unit actually has
+    interfaces = set(
+        DeviceCapabilities.get_network_interfaces(capture["hardware_model"])
+        if capture["hardware_model"]
+        else []
+    )
+    applicable = []
+    for ref in selectors:
+        if ref.series and ref.series != capture["series"]:
+            continue
+        if ref.interface and interfaces and ref.interface not in interfaces:
+            continue
+        if ref.states is None:
+            if state.startswith("config_"):
+                applicable.append(ref)
+        elif state in ref.states:
+            applicable.append(ref)
+    return applicable
+
+
+async def count_matches(page, ref: SelectorRef) -> int:
+    """Resolve a selector the same way the page objects do and count matches."""
+    if ref.kind == "css":
+        locator = page.locator(ref.value)
+    elif ref.kind == "text":
+        locator = page.get_by_text(ref.value, exact=ref.options.get("exact"))
+    elif ref.kind == "placeholder":
+        locator = page.get_by_placeholder(ref.value, exact=ref.options.get("exact"))
+    elif ref.kind == "label":
+        locator = page.get_by_label(ref.value, exact=ref.options.get("exact"))
+    elif ref.kind == "title":
+        locator = page.get_by_title(ref.value, exact=ref.options.get("exact"))
+    else:
+        locator = page.get_by_role(ref.value, name=ref.options.get("name"))
+    return await locator.count()
+
+
+async def validate_capture(context, capture, selectors, results, semaphore):
+    """Load one capture offline and count every applicable selector."""
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            html = Path(capture["file"]).read_text(encoding="utf-8", errors="replace")
+            await page.set_content(html, wait_until="domcontentloaded")
+            for ref in selectors_for_capture(selectors, capture):
+                try:
+                    count = await count_matches(page, ref)
+                except Exception as e:
+                    count = -1
+                    results["invalid"][ref.key] = str(e).splitlines()[0]
+                results["counts"][ref.key][
+                    (capture["device_ip"], capture["resolution"], capture["state"])
+                ] = count
+        finally:
+            await page.close()
+
+
+async def run_validation(selectors, captures, workers: int) -> Dict[str, object]:
+    results = {"counts": defaultdict(dict), "invalid": {}}
+    semaphore = asyncio.Semaphore(workers)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        # Captured HTML is the post-JavaScript DOM; scripts must not run again
+        context = await browser.new_context(
+            java_script_enabled=False, viewport={"width": 1024, "height": 768}
+        )
+        await asyncio.gather(
+            *(
+                validate_capture(context, capture, selectors, results, semaphore)
+                for capture in captures
+            )
+        )
+        await browser.close()
+
+    return results
+
+
+def build_report(selectors, captures, results) -> Dict[str, object]:
+    """Classify selectors per device as broken, ambiguous or ok."""
+    refs_by_key = defaultdict(list)
+    for ref in selectors:
+        refs_by_key[ref.key].append(ref)
+
+    devices = sorted({c["device_ip"] for c in captures})
+    report = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "devices": devices,
+        "captures": len(captures),
+        "selectors": len(refs_by_key),
+        "broken": [],
+        "ambiguous": [],
+        "invalid": [],
+    }
+
+    for key, refs in sorted(refs_by_key.items()):
+        counts = results["counts"].get(key, {})
+        usages = [f"{r.source}:{r.line}" if r.line else r.source for r in refs]
+        entry = {"kind": key[0], "selector": key[1], "used_at": usages}
+
+        if key in results["invalid"]:
+            report["invalid"].append({**entry, "error": results["invalid"][key]})
+            continue
+
+        for device_ip in devices:
+            device_counts = {
+                f"{res}/{state}": n
+                for (ip, res, state), n in counts.items()
+                if ip == device_ip
+            }
+            if not device_counts:
+                continue
+            if all(n == 0 for n in device_counts.values()):
+                report["broken"].append({**entry, "device_ip": device_ip})
+            elif not all(r.multi_ok for r in refs) and any(
+                n > 1 for n in device_counts.values()
+            ):
+                report["ambiguous"].append(
+                    {
+                        **entry,
+                        "device_ip": device_ip,
+                        "matches": {k: n for k, n in device_counts.items() if n > 1},
+                    }
+                )
+
+    return report
+
+
+def print_report(report: Dict[str, object], stats: Dict[str, int], elapsed: float):
+    print("\n" + "=" * 70)
+    print("LOCATOR VALIDATION REPORT")
+    print("=" * 70)
+    print(
+        f"Selectors: {report['selectors']} | Captures: {report['captures']} | "
+        f"Devices: {', '.join(report['devices'])} | Time: {elapsed:.1f}s"
+    )
+    print(
+        f"Skipped: {stats['dynamic_skipped']} dynamic (f-string), "
+        f"{stats['relative_skipped']} relative (chained) selectors"
+    )
+
+    by_device = defaultdict(list)
+    for item in report["broken"]:
+        by_device[item["device_ip"]].append(item)
+    for device_ip in report["devices"]:
+        items = by_device.get(device_ip, [])
+        print(f"\n[{device_ip}] {len(items)} selector(s) match zero elements")
+        for item in items:
+            print(f"  [BROKEN] {item['kind']}={item['selector']!r}")
+            print(f"           used at {', '.join(item['used_at'][:3])}")
+
+    if report["ambiguous"]:
+        print(f"\n{len(report['ambiguous'])} selector/device pair(s) match several elements")
+        for item in report["ambiguous"]:
+            print(
+                f"  [AMBIGUOUS] [{item['device_ip']}] {item['kind']}={item['selector']!r} "
+                f"{item['matches']}"
+            )
+
+    for item in report["invalid"]:
+        print(f"  [INVALID] {item['kind']}={item['selector']!r}: {item['error']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate page object selectors against captured device HTML"
+    )
+    parser.add_argument("--device", help="Only validate one device IP")
+    parser.add_argument("--resolution", help="Only validate one resolution (e.g. 1024x768)")
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Parallel browser pages (default: 8)"
+    )
+    parser.add_argument(
+        "--output",
+        default="locator_validation.json",
+        help="JSON report path (default: locator_validation.json)",
+    )
+    args = parser.parse_args()
+
+    start_time = time.time()
+    selectors, stats = extract_page_selectors()
+    selectors += extract_save_button_selectors()
+    captures = load_captures(args.device, args.resolution)
+    if not captures:
+        print(f"No captured HTML found under {EXPLORATION_DIR}")
+        return 1
+
+    results = asyncio.run(run_validation(selectors, captures, args.workers))
+    report = build_report(selectors, captures, results)
+    elapsed = time.time() - start_time
+    report["elapsed_seconds"] = round(elapsed, 2)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_report(report, stats, elapsed)
+    print(f"\nReport saved: {args.output}")
+    return 1 if report["broken"] or report["invalid"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
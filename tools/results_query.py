@@ -0,0 +1,302 @@
+"""
+Results Store Query Tool for Kronos Test Runs
+
+Answers trend questions from the results database written by
+plugins/results_store.py (one row per test per run) without touching any
+per-test files.
+
+This tool:
+1. runs     - List recent runs with device, test and failure counts
+2. slower   - Tests whose mean duration grew the most, recent window vs the
+              window before it, per device
+3. flaky    - Tests that both pass and fail on the same device, with flip
+              and rerun counts
+4. failures - Failure signatures grouped across runs, devices and tests
+5. history  - Outcome and timing history of matching tests
+
+Devices match by suffix, so --device 66.6 selects 172.16.66.6. Windows
+are in days.
+
+Usage:
+    python -m tools.results_query runs
+    python -m tools.results_query slower --device 66.6 --days 30
+    python -m tools.results_query flaky --days 14 --min-runs 5
+    python -m tools.results_query failures --device 190.47
+    python -m tools.results_query history --test test_25_1_5 --device 66.3
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from plugins.results_store import DEFAULT_DB, FAILED_OUTCOMES, connect
+
+DAY = 86400
+
+
+def _filters(
+    device: Optional[str], test: Optional[str], since: Optional[float]
+) -> Tuple[str, List[Any]]:
+    clauses, params = ["1=1"], []
+    if device:
+        clauses.append("device_ip LIKE ?")
+        params.append(f"%{device}")
+    if test:
+        clauses.append("nodeid LIKE ?")
+        params.append(f"%{test}%")
+    if since is not None:
+        clauses.append("started >= ?")
+        params.append(since)
+    return " AND ".join(clauses), params
+
+
+def _when(timestamp: Optional[float]) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M") if timestamp else "-"
+
+
+def _short(nodeid: str, width: int = 60) -> str:
+    name = nodeid.split("/")[-1]
+    return name if len(name) <= width else "..." + name[-(width - 3) :]
+
+
+def query_runs(connection: sqlite3.Connection, device: Optional[str], limit: int) -> List[tuple]:
+    where, params = _filters(device, None, None)
+    return connection.execute(
+        f"SELECT started, finished, device_ip, device_model, workers, tests, failed, run_id "
+        f"FROM runs WHERE {where} ORDER BY started DESC LIMIT ?",
+        params + [limit],
+    ).fetchall()
+
+
+def query_slower(
+    connection: sqlite3.Connection,
+    device: Optional[str],
+    test: Optional[str],
+    days: float,
+    min_samples: int,
+) -> List[Dict[str, Any]]:
+    """
+    Mean call duration of passing runs, last `days` vs the `days` before.
+
+    Returns:
+        Rows sorted by growth ratio, largest first
+    """
+    now = time.time()
+    recent_start, previous_start = now - days * DAY, now - 2 * days * DAY
+    where, params = _filters(device, test, previous_start)
+    rows = connection.execute(
+        f"""
+        SELECT device_ip, nodeid,
+               AVG(CASE WHEN started >= ? THEN COALESCE(call_s, duration) END),
+               SUM(CASE WHEN started >= ? THEN 1 ELSE 0 END),
+               AVG(CASE WHEN started < ? THEN COALESCE(call_s, duration) END),
+               SUM(CASE WHEN started < ? THEN 1 ELSE 0 END)
+        FROM results
+        WHERE {where} AND outcome = 'passed'
+        GROUP BY device_ip, nodeid
+        """,
+        [recent_start] * 4 + params,
+    ).fetchall()
+
+    result = []
+    for device_ip, nodeid, recent, recent_n, previous, previous_n in rows:
+        if recent_n < min_samples or previous_n < min_samples or not previous:
+            continue
+        result.append(
+            {
+                "device": device_ip,
+                "test": nodeid,
+                "previous": previous,
+                "recent": recent,
+                "delta": recent - previous,
+                "ratio": recent / previous,
+                "samples": (previous_n, recent_n),
+            }
+        )
+    return sorted(result, key=lambda row: row["ratio"], reverse=True)
+
+
+def query_flaky(
+    connection: sqlite3.Connection,
+    device: Optional[str],
+    test: Optional[str],
+    days: float,
+    min_runs: int,
+) -> List[Dict[str, Any]]:
+    """
+    Tests with mixed outcomes per device.
+
+    A flip is a change between pass and fail in consecutive runs; reruns
+    count tests that failed and then passed under pytest-rerunfailures.
+
+    Returns:
+        Rows sorted by flip rate, largest first
+    """
+    where, params = _filters(device, test, time.time() - days * DAY)
+    history: Dict[Tuple[str, str], List[tuple]] = {}
+    for device_ip, nodeid, outcome, reruns in connection.execute(
+        f"SELECT device_ip, nodeid, outcome, reruns FROM results "
+        f"WHERE {where} AND outcome NOT IN ('skipped', 'xfailed') ORDER BY started",
+        params,
+    ):
+        history.setdefault((device_ip, nodeid), []).append((outcome in FAILED_OUTCOMES, reruns))
+
+    result = []
+    for (device_ip, nodeid), runs in history.items():
+        failures = sum(1 for failed, _ in runs if failed)
+        reruns = sum(1 for _, count in runs if count)
+        if len(runs) < min_runs or not (reruns or 0 < failures < len(runs)):
+            continue
+        flips = sum(1 for a, b in zip(runs, runs[1:]) if a[0] != b[0])
+        result.append(
+            {
+                "device": device_ip,
+                "test": nodeid,
+                "runs": len(runs),
+                "failures": failures,
+                "reruns": reruns,
+                "flips": flips,
+                "flip_rate": flips / (len(runs) - 1) if len(runs) > 1 else 0.0,
+            }
+        )
+    return sorted(result, key=lambda row: (row["flip_rate"], row["reruns"]), reverse=True)
+
+
+def query_failures(
+    connection: sqlite3.Connection,
+    device: Optional[str],
+    test: Optional[str],
+    days: float,
+    limit: int,
+) -> List[tuple]:
+    where, params = _filters(device, test, time.time() - days * DAY)
+    return connection.execute(
+        f"""
+        SELECT failure_signature, error_type, COUNT(*), COUNT(DISTINCT run_id),
+               GROUP_CONCAT(DISTINCT device_ip), COUNT(DISTINCT nodeid),
+               MAX(started), MAX(failure_message), MIN(nodeid)
+        FROM results
+        WHERE {where} AND failure_signature IS NOT NULL
+        GROUP BY failure_signature
+        ORDER BY COUNT(*) DESC LIMIT ?
+        """,
+        params + [limit],
+    ).fetchall()
+
+
+def query_history(
+    connection: sqlite3.Connection,
+    device: Optional[str],
+    test: Optional[str],
+    days: float,
+    limit: int,
+) -> List[tuple]:
+    where, params = _filters(device, test, time.time() - days * DAY)
+    return connection.execute(
+        f"SELECT started, device_ip, nodeid, outcome, duration, setup_s, call_s, reruns, "
+        f"failure_signature FROM results WHERE {where} ORDER BY started DESC LIMIT ?",
+        params + [limit],
+    ).fetchall()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Query the test results database")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Results database (default: {DEFAULT_DB})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    runs_parser = subparsers.add_parser("runs", help="List recent runs")
+    runs_parser.add_argument("--device", help="Device IP or suffix")
+    runs_parser.add_argument("--limit", type=int, default=20)
+
+    for name, help_text, default_days in (
+        ("slower", "Tests that got slower", 30),
+        ("flaky", "Tests with mixed outcomes", 30),
+        ("failures", "Failure signatures", 30),
+        ("history", "Per-test outcome history", 90),
+    ):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument("--device", help="Device IP or suffix")
+        subparser.add_argument("--test", help="Node id substring")
+        subparser.add_argument("--days", type=float, default=default_days, help="Window in days")
+        subparser.add_argument("--limit", type=int, default=25)
+        if name == "slower":
+            subparser.add_argument("--min-samples", type=int, default=3)
+        if name == "flaky":
+            subparser.add_argument("--min-runs", type=int, default=3)
+
+    args = parser.parse_args()
+    try:
+        connection = connect(args.db)
+    except sqlite3.Error as e:
+        print(f"Error opening results database {args.db}: {e}")
+        return 2
+
+    if args.command == "runs":
+        print(f"{'started':<17} {'device':<15} {'model':<24} {'workers':>7} {'tests':>6} {'failed':>6}")
+        for started, finished, device_ip, model, workers, tests, failed, run_id in query_runs(
+            connection, args.device, args.limit
+        ):
+            print(
+                f"{_when(started):<17} {device_ip or '-':<15} {model or '-':<24} "
+                f"{workers:>7} {tests:>6} {failed:>6}  {run_id[:8]} "
+                f"({(finished - started) / 60:.1f} min)"
+            )
+
+    elif args.command == "slower":
+        rows = query_slower(connection, args.device, args.test, args.days, args.min_samples)
+        print(f"Mean passing call time, last {args.days:g} days vs the {args.days:g} days before")
+        print(f"{'device':<15} {'test':<60} {'before s':>9} {'now s':>9} {'change':>8}")
+        for row in rows[: args.limit]:
+            print(
+                f"{row['device'] or '-':<15} {_short(row['test']):<60} "
+                f"{row['previous']:>9.1f} {row['recent']:>9.1f} {row['ratio'] - 1:>+8.0%}"
+            )
+
+    elif args.command == "flaky":
+        rows = query_flaky(connection, args.device, args.test, args.days, args.min_runs)
+        print(f"{'device':<15} {'test':<60} {'runs':>5} {'fail':>5} {'rerun':>6} {'flip rate':>10}")
+        for row in rows[: args.limit]:
+            print(
+                f"{row['device'] or '-':<15} {_short(row['test']):<60} {row['runs']:>5} "
+                f"{row['failures']:>5} {row['reruns']:>6} {row['flip_rate']:>10.0%}"
+            )
+
+    elif args.command == "failures":
+        for (
+            signature,
+            error_type,
+            count,
+            runs,
+            devices,
+            tests,
+            last,
+            message,
+            example,
+        ) in query_failures(connection, args.device, args.test, args.days, args.limit):
+            print(
+                f"{signature} {error_type:<24} {count:>4}x in {runs} run(s), "
+                f"{tests} test(s), last {_when(last)}, devices {devices or '-'}"
+            )
+            print(f"    {_short(example, 100)}")
+            print(f"    {message[:120]}")
+
+    elif args.command == "history":
+        for started, device_ip, nodeid, outcome, duration, setup, call, reruns, signature in (
+            query_history(connection, args.device, args.test, args.days, args.limit)
+        ):
+            print(
+                f"{_when(started):<17} {device_ip or '-':<15} {_short(nodeid, 50):<50} "
+                f"{outcome:<14} {duration:>7.1f}s (setup {setup or 0:.1f}s, call {call or 0:.1f}s)"
+                + (f" reruns={reruns}" if reruns else "")
+                + (f" {signature}" if signature else "")
+            )
+
+    connection.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+Streaming Upload Client for Kronos Devices
+
+Uploads firmware and configuration files over plain HTTP(S) instead of the
+browser file chooser. The file is streamed from disk in chunks as a
+multipart/form-data body with a precomputed Content-Length, using the form
+captured for /upload (field "file[]"), so large images never pass through
+browser memory.
+
+This tool:
+1. Logs in over HTTP (status login + configuration unlock)
+2. Streams the file to /upload, reporting progress and bytes per second
+3. Measures server processing time (last byte sent -> response headers)
+4. Benchmark mode: uploads synthetic files of increasing size and reports
+   throughput per size and the first size the server rejects or drops,
+   against a device or a local stand-in server
+
+Output: Console summary plus optional JSON report
+
+Usage:
+    python -m tools.upload_client upload --device 172.16.190.46 --file firmware.bin
+    python -m tools.upload_client benchmark --local --sizes 1M,8M,32M,128M
+    python -m tools.upload_client benchmark --device 172.16.66.3 --sizes 1M,4M,16M --output upload_bench.json
+
+Benchmarking a device uploads junk files to it; only do this on a lab unit
+that is not mid-test.
+"""
+
+import argparse
+import http.client
+import http.server
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pages.device_http import DeviceHttpSession
+
+PASSWORD = "novatech"
+UPLOAD_PATH = "/upload"
+UPLOAD_FIELD = "file[]"  # From config_upload.forms.json
+CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int, float], None]
+
+
+class StreamingUploader:
+    """Streams a file as multipart/form-data with known Content-Length."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 443,
+        scheme: str = "https",
+        cookie_header: str = "",
+        chunk_size: int = CHUNK_SIZE,
+        timeout: float = 600.0,
+    ):
+        """
+        Initialize uploader.
+
+        Args:
+            host: Device or stand-in host
+            port: TCP port
+            scheme: "https" or "http"
+            cookie_header: Session cookies (DeviceHttpSession.cookie_header())
+            chunk_size: Bytes per send
+            timeout: Socket timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.scheme = scheme
+        self.cookie_header = cookie_header
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host,
+                self.port,
+                timeout=self.timeout,
+                context=ssl._create_unverified_context(),
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def upload(
+        self,
+        file_path: str,
+        field_name: str = UPLOAD_FIELD,
+        url_path: str = UPLOAD_PATH,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload a file.
+
+        Args:
+            file_path: File to upload
+            field_name: Multipart field name
+            url_path: Upload form action
+            progress: Called as progress(bytes_sent, total_bytes, elapsed_seconds)
+
+        Returns:
+            Dictionary with ok, status, bytes, send_seconds, throughput_bps,
+            server_seconds, total_seconds and response (first 500 chars)
+        """
+        path = Path(file_path)
+        file_size = path.stat().st_size
+        boundary = f"----KronosUpload{uuid.uuid4().hex}"
+        preamble = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{path.name}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        total = len(preamble) + file_size + len(epilogue)
+
+        result = {
+            "file": path.name,
+            "ok": False,
+            "status": None,
+            "bytes": total,
+            "sent": 0,
+            "send_seconds": None,
+            "throughput_bps": None,
+            "server_seconds": None,
+            "total_seconds": None,
+            "response": "",
+            "error": None,
+        }
+
+        connection = self._connection()
+        start_time = time.time()
+        try:
+            connection.putrequest("POST", url_path)
+            connection.putheader("Content-Type", f"multipart/form-data; boundary={boundary}")
+            connection.putheader("Content-Length", str(total))
+            if self.cookie_header:
+                connection.putheader("Cookie", self.cookie_header)
+            connection.endheaders()
+
+            sent = 0
+            connection.send(preamble)
+            sent += len(preamble)
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    connection.send(chunk)
+                    sent += len(chunk)
+                    result["sent"] = sent
+                    if progress:
+                        progress(sent, total, time.time() - start_time)
+            connection.send(epilogue)
+            sent += len(epilogue)
+            result["sent"] = sent
+            sent_time = time.time()
+
+            response = connection.getresponse()
+            response_time = time.time()
+            body = response.read().decode("utf-8", errors="replace")
+
+            send_seconds = sent_time - start_time
+            result.update(
+                ok=200 <= response.status < 400,
+                status=response.status,
+                send_seconds=round(send_seconds, 3),
+                throughput_bps=round(total / send_seconds) if send_seconds > 0 else None,
+                server_seconds=round(response_time - sent_time, 3),
+                total_seconds=round(time.time() - start_time, 3),
+                response=body[:500],
+            )
+
+        except (OSError, http.client.HTTPException) as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["total_seconds"] = round(time.time() - start_time, 3)
+            # A server that rejects the body early (e.g. 413) answers and
+            # closes mid-send; report its status rather than only the pipe error
+            try:
+                response = connection.getresponse()
+                result["status"] = response.status
+                result["response"] = response.read().decode("utf-8", errors="replace")[:500]
+            except (OSError, http.client.HTTPException):
+                pass
+        finally:
+            connection.close()
+
+        return result
+
+
+def print_progress(sent: int, total: int, elapsed: float):
+    """Console progress callback."""
+    rate = sent / elapsed if elapsed > 0 else 0
+    print(
+        f"\r  {sent / total:6.1%}  {sent / 1e6:8.1f}/{total / 1e6:.1f} MB  {rate / 1e6:6.2f} MB/s",
+        end="",
+        flush=True,
+    )
+    if sent >= total:
+        print()
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes like 512K, 8M or 1G into bytes."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    value = value.strip().upper()
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def make_synthetic_file(directory: str, size: int) -> str:
+    """Write an incompressible file of the given size and return its path."""
+    path = os.path.join(directory, f"synthetic_{size}.bin")
+    block = os.urandom(1024 * 1024)
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[: min(remaining, len(block))])
+            remaining -= len(block)
+    return path
+
+
+class StandInUploadHandler(http.server.BaseHTTPRequestHandler):
+    """Local stand-in for the device /upload endpoint."""
+
+    max_body = None  # bytes; larger uploads are rejected with 413
+    processing_delay = 0.0  # seconds of simulated post-upload processing
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if self.max_body is not None and length > self.max_body:
+            self.send_response(413)
+            self.end_headers()
+            self.close_connection = True
+            return
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+        time.sleep(self.processing_delay)
+        body = json.dumps({"received": length - remaining}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stand_in(max_body: Optional[int], processing_delay: float) -> http.server.HTTPServer:
+    """Start the local stand-in server on a free port in a background thread."""
+    StandInUploadHandler.max_body = max_body
+    StandInUploadHandler.processing_delay = processing_delay
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInUploadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def device_uploader(device_ip: str, password: str) -> Optional[StreamingUploader]:
+    """Log in over HTTP and build an uploader carrying the session cookies."""
+    session = DeviceHttpSession(device_ip)
+    if not session.login(password) or not session.unlock(password):
+        print(f"Could not authenticate to {device_ip}")
+        return None
+    return StreamingUploader(session.device_ip, 443, "https", session.cookie_header())
+
+
+def run_benchmark(uploader: StreamingUploader, sizes: List[int]) -> List[Dict[str, Any]]:
+    """
+    Upload synthetic files of increasing size.
+
+    Stops at the first size that is rejected or dropped, which marks the
+    server's practical upload limit.
+
+    Args:
+        uploader: Configured uploader
+        sizes: File sizes in bytes
+
+    Returns:
+        Upload results, one per size attempted
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="kronos_upload_bench_") as directory:
+        for size in sorted(sizes):
+            path = make_synthetic_file(directory, size)
+            print(f"\nUploading {size / 1e6:.1f} MB synthetic file...")
+            result = uploader.upload(path, progress=print_progress)
+            result["size"] = size
+            results.append(result)
+            os.unlink(path)
+            if not result["ok"]:
+                reason = result["error"] or f"HTTP {result['status']}"
+                print(f"  Upload failed: {reason}")
+                print(f"  Stopping: limit reached between previous size and {size / 1e6:.1f} MB")
+                break
+    return results
+
+
+def print_result(result: Dict[str, Any]):
+    throughput = result["throughput_bps"]
+    print(
+        f"  {result['file']}: HTTP {result['status']}, {result['bytes'] / 1e6:.1f} MB "
+        f"sent in {result['send_seconds']}s"
+        + (f" ({throughput / 1e6:.2f} MB/s)" if throughput else "")
+        + f", server processing {result['server_seconds']}s"
+    )
+
+
+def print_benchmark(results: List[Dict[str, Any]]):
+    print("\n" + "=" * 72)
+    print(f"{'size MB':>9} {'status':>7} {'send s':>8} {'MB/s':>8} {'server s':>9} {'total s':>8}")
+    print("-" * 72)
+    for r in results:
+        mbps = f"{r['throughput_bps'] / 1e6:.2f}" if r["throughput_bps"] else "-"
+        print(
+            f"{r['size'] / 1e6:>9.1f} {str(r['status'] or 'ERR'):>7} "
+            f"{str(r['send_seconds'] or '-'):>8} {mbps:>8} "
+            f"{str(r['server_seconds'] or '-'):>9} {str(r['total_seconds']):>8}"
+        )
+    print("=" * 72)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Streaming upload client for Kronos devices")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upload_parser = subparsers.add_parser("upload", help="Upload one file to a device")
+    upload_parser.add_argument("--device", required=True, help="Device IP address")
+    upload_parser.add_argument("--file", required=True, help="File to upload")
+    upload_parser.add_argument("--password", default=PASSWORD, help="Device password")
+
+    bench_parser = subparsers.add_parser("benchmark", help="Upload synthetic files of increasing size")
+    target = bench_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--device", help="Device IP address")
+    target.add_argument("--local", action="store_true", help="Use a local stand-in server")
+    bench_parser.add_argument("--password", default=PASSWORD, help="Device password")
+    bench_parser.add_argument(
+        "--sizes", default="1M,4M,16M,64M", help="Comma-separated sizes (default: 1M,4M,16M,64M)"
+    )
+    bench_parser.add_argument(
+        "--stand-in-max-body", default=None, help="Stand-in rejects bodies above this size (e.g. 32M)"
+    )
+    bench_parser.add_argument(
+        "--stand-in-delay", type=float, default=0.0, help="Stand-in processing delay in seconds"
+    )
+    bench_parser.add_argument("--output", help="JSON report path")
+    args = parser.parse_args()
+
+    if args.command == "upload":
+        uploader = device_uploader(args.device, args.password)
+        if uploader is None:
+            return 1
+        print(f"Uploading {args.file} to {args.device}{UPLOAD_PATH}...")
+        result = uploader.upload(args.file, progress=print_progress)
+        if result["error"]:
+            print(f"Upload failed: {result['error']}")
+            return 1
+        print_result(result)
+        return 0 if result["ok"] else 1
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    server = None
+    if args.local:
+        max_body = parse_size(args.stand_in_max_body) if args.stand_in_max_body else None
+        server = start_stand_in(max_body, args.stand_in_delay)
+        uploader = StreamingUploader("127.0.0.1", server.server_address[1], "http")
+        print(f"Local stand-in listening on 127.0.0.1:{server.server_address[1]}")
+    else:
+        uploader = device_uploader(args.device, args.password)
+        if uploader is None:
+            return 1
+
+    try:
+        results = run_benchmark(uploader, sizes)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    print_benchmark(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"target": "local" if args.local else args.device, "results": results}, f, indent=2
+            )
+        print(f"\nReport saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())